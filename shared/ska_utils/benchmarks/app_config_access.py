@@ -0,0 +1,51 @@
+"""Cost of reading configuration in hot loops.
+
+Run from the ``shared/ska_utils`` directory with
+``python -m benchmarks.app_config_access``. ``AppConfig().get`` and
+``int(AppConfig().get(...))`` are the lookups request handlers do today,
+going through the singleton metaclass on every read. ``snapshot.get`` and
+``snapshot.get_int`` read a ``ConfigSnapshot`` held by the caller, whose
+typed values are converted once.
+"""
+
+import argparse
+import sys
+import timeit
+
+from ska_utils import AppConfig, Config
+
+ITERATIONS = 1_000_000
+KEY = "BENCHMARK_MAX_TOKENS"
+
+
+def run(iterations: int) -> list[tuple[str, float]]:
+    """Return ``(variant, nanoseconds per read)`` tuples."""
+    AppConfig.add_config(Config(env_name=KEY, is_required=False, default_value="4096"))
+    snapshot = AppConfig().snapshot()
+    variants = {
+        "AppConfig().get": lambda: AppConfig().get(KEY),
+        "int(AppConfig().get)": lambda: int(AppConfig().get(KEY)),
+        "snapshot.get": lambda: snapshot.get(KEY),
+        "snapshot.get_int": lambda: snapshot.get_int(KEY),
+    }
+    return [
+        (name, timeit.timeit(read, number=iterations) * 1e9 / iterations)
+        for name, read in variants.items()
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.app_config_access")
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations)
+    baseline = results[0][1]
+    print(f"{'variant':<22} {'ns/read':>8} {'speedup':>8}")
+    for name, ns_per_read in results:
+        print(f"{name:<22} {ns_per_read:>8.1f} {baseline / ns_per_read:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Event-loop latency under heavy logging.
+
+Run from the ``shared/ska_utils`` directory with
+``python -m benchmarks.logging_latency``. A task logs ``--records-per-tick``
+debug records every millisecond, like an agent logging SSE chunks, to a
+handler spending ``--write-us`` per record, a stand-in for writing to a
+slow pipe or collector. Another task measures how late the loop wakes it
+up from 1 ms sleeps. ``sync`` writes the records in the logging call, as
+loggers do today; ``async`` uses ``AsyncLogging``, and ``async+rate_limit``
+also limits each log site to 100 debug records per second.
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+
+from ska_utils import AsyncLogging
+
+DURATION_SECONDS = 1.0
+RECORDS_PER_TICK = 20
+WRITE_US = 50.0
+
+
+class _SlowHandler(logging.Handler):
+    def __init__(self, write_us: float):
+        super().__init__()
+        self.write_us = write_us
+        self.written = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+        time.sleep(self.write_us / 1_000_000)
+        self.written += 1
+
+
+async def _measure(logger: logging.Logger, duration: float, records_per_tick: int) -> list[float]:
+    lags = []
+    stop = time.perf_counter() + duration
+
+    async def produce() -> None:
+        chunk = 0
+        while time.perf_counter() < stop:
+            for _ in range(records_per_tick):
+                logger.debug("SSE chunk %d", chunk)
+                chunk += 1
+            await asyncio.sleep(0.001)
+
+    async def probe() -> None:
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append((time.perf_counter() - start - 0.001) * 1000)
+
+    await asyncio.gather(produce(), probe())
+    return lags
+
+
+def run(
+    duration: float, records_per_tick: int, write_us: float
+) -> list[tuple[str, float, float, int, int]]:
+    """Return ``(variant, p50 lag ms, p99 lag ms, records written, records dropped)`` tuples."""
+    results = []
+    for name in ("sync", "async", "async+rate_limit"):
+        handler = _SlowHandler(write_us)
+        logger = logging.getLogger(f"benchmarks.logging_latency.{name}")
+        logger.handlers.clear()
+        logger.setLevel(logging.DEBUG)
+        async_logging = None
+        if name == "sync":
+            logger.addHandler(handler)
+            logger.propagate = False
+        else:
+            async_logging = AsyncLogging(
+                [handler], rate_limit=100 if name == "async+rate_limit" else None
+            ).start()
+            async_logging.attach(logger)
+        lags = asyncio.run(_measure(logger, duration, records_per_tick))
+        dropped = async_logging.handler.dropped_records if async_logging else 0
+        if async_logging:
+            async_logging.stop()
+        quantiles = statistics.quantiles(lags, n=100)
+        results.append((name, quantiles[49], quantiles[98], handler.written, dropped))
+        logger.handlers.clear()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.logging_latency")
+    parser.add_argument("--duration", type=float, default=DURATION_SECONDS)
+    parser.add_argument("--records-per-tick", type=int, default=RECORDS_PER_TICK)
+    parser.add_argument("--write-us", type=float, default=WRITE_US)
+    args = parser.parse_args(argv)
+
+    results = run(args.duration, args.records_per_tick, args.write_us)
+    print(f"{'variant':<18} {'p50 lag ms':>10} {'p99 lag ms':>10} {'written':>8} {'dropped':>8}")
+    for name, p50, p99, written, dropped in results:
+        print(f"{name:<18} {p50:>10.2f} {p99:>10.2f} {written:>8} {dropped:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
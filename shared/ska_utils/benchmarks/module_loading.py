@@ -0,0 +1,77 @@
+"""Cost of loading the same custom module repeatedly.
+
+Run from the ``shared/ska_utils`` directory with
+``python -m benchmarks.module_loading``. Services call
+``ModuleLoader.load_module`` whenever they build a chat completion factory,
+plugin or persistence manager from a configured file. ``uncached`` executes
+the module on every call as before; ``cached`` returns the module loaded
+for the file's content. The module imports a few standard library modules
+and defines two classes, like a small plugin module.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ska_utils import ModuleLoader
+
+ITERATIONS = 2000
+MODULE_SOURCE = """
+import dataclasses
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class Settings:
+    name: str
+    retries: int = 3
+
+
+class CustomFactory:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+    def describe(self) -> str:
+        return json.dumps(dataclasses.asdict(self.settings))
+"""
+
+
+def run(iterations: int) -> list[tuple[str, float]]:
+    """Return ``(variant, microseconds per load)`` tuples."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "benchmark_custom_module.py")
+        Path(path).write_text(MODULE_SOURCE)
+        results = []
+        for name, load in (
+            ("uncached", ModuleLoader._exec_module),
+            ("cached", ModuleLoader.load_module),
+        ):
+            ModuleLoader.clear_cache()
+            start = time.perf_counter()
+            for _ in range(iterations):
+                load(path)
+            results.append((name, (time.perf_counter() - start) * 1e6 / iterations))
+        ModuleLoader.clear_cache()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.module_loading")
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations)
+    baseline = results[0][1]
+    print(f"{'variant':<10} {'us/load':>9} {'speedup':>8}")
+    for name, us_per_load in results:
+        print(f"{name:<10} {us_per_load:>9.1f} {baseline / us_per_load:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Events per second published with and without batching.
+
+Run from the ``shared/ska_utils`` directory with
+``python -m benchmarks.redis_streams_publish``. ``unbatched`` is
+``AsyncRedisStreamsEventPublisher`` with ``batch_size=1``, one ``XADD`` round
+trip per event like ``RedisStreamsEventPublisher``. ``batched[N]`` buffers up
+to N events per pipelined round trip. ``--producers`` tasks publish
+concurrently, as agents emitting progress events do. Streams live in
+fakeredis, with ``--rtt-ms`` of simulated network latency per round trip,
+unless ``--redis-url`` points at a Redis server.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+
+import redis.asyncio
+
+from ska_utils import AsyncRedisStreamsEventPublisher
+
+EVENTS = 5000
+PRODUCERS = 10
+RTT_MS = 0.5
+BATCH_SIZES = (1, 10, 100)
+EVENT_DATA = '{"task_id": "task-1", "message": "Calling the search tool"}'
+
+
+class _LatencyPipeline:
+    def __init__(self, pipeline, rtt_ms: float):
+        self._pipeline = pipeline
+        self._rtt_ms = rtt_ms
+
+    def __getattr__(self, name):
+        return getattr(self._pipeline, name)
+
+    async def execute(self):
+        await asyncio.sleep(self._rtt_ms / 1000)
+        return await self._pipeline.execute()
+
+
+class _LatencyRedis:
+    """fakeredis with a fixed round-trip time, for the commands the publisher uses."""
+
+    def __init__(self, r: redis.asyncio.Redis, rtt_ms: float):
+        self._r = r
+        self._rtt_ms = rtt_ms
+
+    async def xadd(self, *args, **kwargs):
+        await asyncio.sleep(self._rtt_ms / 1000)
+        return await self._r.xadd(*args, **kwargs)
+
+    def pipeline(self, transaction: bool = True) -> _LatencyPipeline:
+        return _LatencyPipeline(self._r.pipeline(transaction=transaction), self._rtt_ms)
+
+
+def _client(redis_url: str | None, rtt_ms: float) -> tuple[redis.asyncio.Redis, object]:
+    if redis_url:
+        r = redis.asyncio.Redis.from_url(redis_url)
+        return r, r
+    import fakeredis
+
+    r = fakeredis.aioredis.FakeRedis()
+    return r, _LatencyRedis(r, rtt_ms)
+
+
+async def _run(
+    events: int, producers: int, batch_size: int, rtt_ms: float, redis_url: str | None
+) -> float:
+    r, client = _client(redis_url, rtt_ms)
+    topic_name = f"benchmark-{uuid.uuid4().hex}"
+    publisher = AsyncRedisStreamsEventPublisher(client, batch_size=batch_size)
+
+    async def produce(count: int) -> None:
+        for _ in range(count):
+            await publisher.publish_event(topic_name, EVENT_DATA)
+
+    start = time.perf_counter()
+    async with publisher:
+        await asyncio.gather(*(produce(events // producers) for _ in range(producers)))
+    elapsed = time.perf_counter() - start
+
+    published = await r.xlen(topic_name)
+    await r.delete(topic_name)
+    await r.aclose()
+    if published != events // producers * producers:
+        raise RuntimeError(f"Published {published} of {events} events")
+    return published / elapsed
+
+
+def run(
+    events: int, producers: int, rtt_ms: float, redis_url: str | None = None
+) -> list[tuple[str, float]]:
+    """Return ``(variant, events per second)`` tuples."""
+    return [
+        (
+            "unbatched" if batch_size == 1 else f"batched[{batch_size}]",
+            asyncio.run(_run(events, producers, batch_size, rtt_ms, redis_url)),
+        )
+        for batch_size in BATCH_SIZES
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.redis_streams_publish")
+    parser.add_argument("--events", type=int, default=EVENTS)
+    parser.add_argument("--producers", type=int, default=PRODUCERS)
+    parser.add_argument("--rtt-ms", type=float, default=RTT_MS)
+    parser.add_argument("--redis-url", help="Redis server to use instead of fakeredis")
+    args = parser.parse_args(argv)
+    logging.disable(logging.INFO)
+
+    results = run(args.events, args.producers, args.rtt_ms, args.redis_url)
+    baseline = results[0][1]
+    print(f"{'variant':<14} {'events/s':>10} {'speedup':>8}")
+    for name, events_per_second in results:
+        print(f"{name:<14} {events_per_second:>10.0f} {events_per_second / baseline:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""Throughput of the Redis Streams event handlers.
+
+Run from the ``shared/ska_utils`` directory with
+``python -m benchmarks.redis_streams_throughput``. ``threaded`` is
+``RedisStreamsEventHandler``, which reads, acknowledges and processes one event
+at a time. ``async[batch=N]`` is ``AsyncRedisStreamsEventHandler`` reading N
+events per ``XREADGROUP`` and processing them with ``--concurrency`` workers.
+Every event is handled by awaiting ``--io-ms``, standing in for the I/O a real
+handler does. Streams live in fakeredis unless ``--redis-url`` points at a
+Redis server.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+
+import redis
+import redis.asyncio
+from pydantic import BaseModel
+
+from ska_utils import AsyncRedisStreamsEventHandler, RedisStreamsEventHandler
+
+EVENTS = 2000
+IO_MS = 1.0
+CONCURRENCY = 32
+BATCH_SIZES = (1, 10, 100)
+
+
+class BenchmarkEvent(BaseModel):
+    seq: int
+
+
+class _ThreadedHandler(RedisStreamsEventHandler[BenchmarkEvent]):
+    def __init__(self, topic_name: str, r: redis.Redis, events: int, io_ms: float):
+        super().__init__(topic_name, r, BenchmarkEvent)
+        self.remaining = events
+        self.io_ms = io_ms
+
+    async def process_event(self, event: BenchmarkEvent) -> None:
+        await asyncio.sleep(self.io_ms / 1000)
+        self.remaining -= 1
+        if not self.remaining:
+            self._shutdown = True
+
+
+class _AsyncHandler(AsyncRedisStreamsEventHandler[BenchmarkEvent]):
+    def __init__(self, topic_name: str, r: redis.asyncio.Redis, events: int, io_ms: float, **kw):
+        super().__init__(topic_name, r, BenchmarkEvent, block_ms=100, **kw)
+        self.remaining = events
+        self.io_ms = io_ms
+        self.done = asyncio.Event()
+
+    async def process_event(self, event: BenchmarkEvent) -> None:
+        await asyncio.sleep(self.io_ms / 1000)
+        self.remaining -= 1
+        if not self.remaining:
+            self.done.set()
+
+
+def _clients(redis_url: str | None) -> tuple[redis.Redis, redis.asyncio.Redis]:
+    if redis_url:
+        return redis.Redis.from_url(redis_url), redis.asyncio.Redis.from_url(redis_url)
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    return fakeredis.FakeRedis(server=server), fakeredis.aioredis.FakeRedis(server=server)
+
+
+def _publish(r: redis.Redis, topic_name: str, events: int) -> None:
+    pipeline = r.pipeline(transaction=False)
+    for seq in range(events):
+        pipeline.xadd(topic_name, {"event_data": BenchmarkEvent(seq=seq).model_dump_json()})
+    pipeline.execute()
+
+
+async def _run_threaded(r: redis.Redis, topic_name: str, events: int, io_ms: float) -> float:
+    handler = _ThreadedHandler(topic_name, r, events, io_ms)
+    start = time.perf_counter()
+    await handler._a_listen_and_process()
+    return time.perf_counter() - start
+
+
+async def _run_async(
+    r: redis.asyncio.Redis,
+    topic_name: str,
+    events: int,
+    io_ms: float,
+    batch_size: int,
+    concurrency: int,
+) -> float:
+    handler = _AsyncHandler(
+        topic_name, r, events, io_ms, batch_size=batch_size, concurrency=concurrency
+    )
+    start = time.perf_counter()
+    await handler.start()
+    await handler.done.wait()
+    elapsed = time.perf_counter() - start
+    await handler.stop()
+    await r.aclose()
+    return elapsed
+
+
+def run(
+    events: int, io_ms: float, concurrency: int, redis_url: str | None = None
+) -> list[tuple[str, float]]:
+    """Return ``(variant, events per second)`` tuples."""
+    variants = [("threaded", None)] + [(f"async[batch={size}]", size) for size in BATCH_SIZES]
+    results = []
+    for name, batch_size in variants:
+        sync_r, async_r = _clients(redis_url)
+        topic_name = f"benchmark-{uuid.uuid4().hex}"
+        _publish(sync_r, topic_name, events)
+        try:
+            if batch_size is None:
+                elapsed = asyncio.run(_run_threaded(sync_r, topic_name, events, io_ms))
+            else:
+                elapsed = asyncio.run(
+                    _run_async(async_r, topic_name, events, io_ms, batch_size, concurrency)
+                )
+        finally:
+            sync_r.delete(topic_name)
+            sync_r.close()
+        results.append((name, events / elapsed))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.redis_streams_throughput")
+    parser.add_argument("--events", type=int, default=EVENTS)
+    parser.add_argument("--io-ms", type=float, default=IO_MS)
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--redis-url", help="Redis server to use instead of fakeredis")
+    args = parser.parse_args(argv)
+    logging.disable(logging.INFO)
+
+    results = run(args.events, args.io_ms, args.concurrency, args.redis_url)
+    baseline = results[0][1]
+    print(f"{'variant':<18} {'events/s':>10} {'speedup':>8}")
+    for name, events_per_second in results:
+        print(f"{name:<18} {events_per_second:>10.0f} {events_per_second / baseline:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
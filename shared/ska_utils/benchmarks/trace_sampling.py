@@ -0,0 +1,85 @@
+"""Per-span tracing overhead with each sampling mode.
+
+Run from the ``shared/ska_utils`` directory with
+``python -m benchmarks.trace_sampling``. Each trace is a root span with
+``--children`` child spans, recorded by a ``TracerProvider`` set up like
+``Telemetry`` does: the sampler, optional tail sampling, the bounded export
+queue and a ``BatchSpanProcessor`` exporting to an in-memory exporter.
+``always_on`` is the current behaviour.
+"""
+
+import argparse
+import sys
+import time
+
+from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from ska_utils.trace_sampling import BoundedExportQueue, TailSamplingSpanProcessor, create_sampler
+
+TRACES = 5000
+CHILDREN = 4
+MODES = {
+    "always_on": (None, False),
+    "ratio[0.1]": ("ratio", False),
+    "rate_limited[100/s]": ("rate_limited", False),
+    "tail[errors,>1s]": (None, True),
+}
+
+
+def _provider(sampler_name: str | None, tail_sampling: bool) -> tuple[TracerProvider, object]:
+    exporter = InMemorySpanExporter()
+    queue = BoundedExportQueue(max_queue_size=2048)
+    processor: SpanProcessor = queue.processor(
+        BatchSpanProcessor(queue.exporter(exporter), max_queue_size=2048)
+    )
+    if tail_sampling:
+        processor = TailSamplingSpanProcessor(processor, latency_threshold_ms=1000)
+    sampler = create_sampler(sampler_name, ratio=0.1, rate=100)
+    provider = TracerProvider(sampler=sampler) if sampler else TracerProvider()
+    provider.add_span_processor(processor)
+    return provider, (exporter, queue)
+
+
+def run(traces: int, children: int) -> list[tuple[str, float, int, int]]:
+    """Return ``(mode, microseconds per span, spans exported, spans dropped)`` tuples."""
+    results = []
+    for name, (sampler_name, tail_sampling) in MODES.items():
+        provider, (exporter, queue) = _provider(sampler_name, tail_sampling)
+        tracer = provider.get_tracer(__name__)
+        start = time.perf_counter()
+        for _ in range(traces):
+            with tracer.start_as_current_span("request"):
+                for _ in range(children):
+                    with tracer.start_as_current_span("step"):
+                        pass
+        elapsed = time.perf_counter() - start
+        provider.force_flush()
+        provider.shutdown()
+        spans = traces * (children + 1)
+        results.append(
+            (name, elapsed * 1e6 / spans, len(exporter.get_finished_spans()), queue.dropped_spans)
+        )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.trace_sampling")
+    parser.add_argument("--traces", type=int, default=TRACES)
+    parser.add_argument("--children", type=int, default=CHILDREN)
+    args = parser.parse_args(argv)
+
+    results = run(args.traces, args.children)
+    baseline = results[0][1]
+    print(f"{'mode':<20} {'us/span':>8} {'exported':>9} {'dropped':>8} {'speedup':>8}")
+    for name, us_per_span, exported, dropped in results:
+        print(
+            f"{name:<20} {us_per_span:>8.2f} {exported:>9} {dropped:>8} "
+            f"{baseline / us_per_span:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
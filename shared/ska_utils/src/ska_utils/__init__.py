@@ -1,13 +1,41 @@
-from .app_config import AppConfig as AppConfig, Config as Config
+from .app_config import AppConfig as AppConfig, Config as Config, ConfigSnapshot as ConfigSnapshot
+from .async_logging import (
+    AsyncLogging as AsyncLogging,
+    BoundedQueueHandler as BoundedQueueHandler,
+    JsonFormatter as JsonFormatter,
+    RateLimitFilter as RateLimitFilter,
+)
+from .async_redis_streams_event_handler import (
+    AsyncRedisStreamsEventHandler as AsyncRedisStreamsEventHandler,
+    IdempotencyKeys as IdempotencyKeys,
+)
+from .async_redis_streams_event_publisher import (
+    AsyncRedisStreamsEventPublisher as AsyncRedisStreamsEventPublisher,
+)
 from .keepalive_executor import (
     KeepaliveMessage as KeepaliveMessage,
     TResponseType as TResponseType,
     execute_with_keepalive as execute_with_keepalive,
 )
+from .metrics import (
+    LLM_LATENCY_BUCKETS as LLM_LATENCY_BUCKETS,
+    PROMETHEUS_CONTENT_TYPE as PROMETHEUS_CONTENT_TYPE,
+    REQUEST_LATENCY_BUCKETS as REQUEST_LATENCY_BUCKETS,
+    TOKEN_COUNT_BUCKETS as TOKEN_COUNT_BUCKETS,
+    PrometheusMetricReader as PrometheusMetricReader,
+    ServiceMetrics as ServiceMetrics,
+    create_counter as create_counter,
+    create_histogram as create_histogram,
+    create_up_down_counter as create_up_down_counter,
+    get_service_metrics as get_service_metrics,
+    metrics_router as metrics_router,
+    record_request_from_scope as record_request_from_scope,
+)
 from .module_loader import ModuleLoader as ModuleLoader
 from .redis_streams_event_handler import (
     MaxWaitExceededError as MaxWaitExceededError,
     RedisStreamsEventHandler as RedisStreamsEventHandler,
+    decode_event_data as decode_event_data,
 )
 from .redis_streams_event_publisher import (
     RedisStreamsEventPublisher as RedisStreamsEventPublisher,
@@ -22,3 +50,8 @@ from .telemetry import (
     get_telemetry as get_telemetry,
     initialize_telemetry as initialize_telemetry,
 )
+from .trace_sampling import (
+    BoundedExportQueue as BoundedExportQueue,
+    RateLimitingSampler as RateLimitingSampler,
+    TailSamplingSpanProcessor as TailSamplingSpanProcessor,
+)
@@ -1,11 +1,18 @@
 import json
 import logging
 import os
-
-from dotenv import load_dotenv
+import signal
+import threading
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+
+from dotenv import dotenv_values, load_dotenv
 from pydantic import BaseModel
 
 from ska_utils.singleton import Singleton
+from ska_utils.strtobool import strtobool
 
 logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s", level=logging.INFO)
 
@@ -16,34 +23,117 @@ class Config(BaseModel):
     default_value: str | None
 
 
+@lru_cache(maxsize=8)
+def _parse_env_store(value: str) -> dict[str, str]:
+    return json.loads(value)
+
+
+class ConfigSnapshot:
+    """An immutable view of the configuration at one point in time.
+
+    Values are looked up in a dict and typed values are converted once per
+    snapshot, so reading configuration in hot paths costs a dict lookup.
+    ``AppConfig.refresh`` replaces the current snapshot with a new one;
+    existing snapshots never change.
+    """
+
+    __slots__ = ("_props", "_typed")
+
+    _props: Mapping[str, str | None]
+    _typed: dict[tuple[str, type], Any]
+
+    def __init__(self, props: Mapping[str, str | None]):
+        object.__setattr__(self, "_props", MappingProxyType(dict(props)))
+        object.__setattr__(self, "_typed", {})
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("ConfigSnapshot is immutable")
+
+    def __getitem__(self, key: str) -> str | None:
+        return self._props[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._props
+
+    @property
+    def props(self) -> Mapping[str, str | None]:
+        return self._props
+
+    def get(self, key: str) -> str | None:
+        return self._props[key]
+
+    def get_str(self, key: str, default: str | None = None) -> str | None:
+        value = self._props[key]
+        return default if value is None else value
+
+    def get_int(self, key: str, default: int | None = None) -> int | None:
+        try:
+            value = self._typed[key, int]
+        except KeyError:
+            value = self._convert(key, int)
+        return default if value is None else value
+
+    def get_float(self, key: str, default: float | None = None) -> float | None:
+        try:
+            value = self._typed[key, float]
+        except KeyError:
+            value = self._convert(key, float)
+        return default if value is None else value
+
+    def get_bool(self, key: str, default: bool | None = None) -> bool | None:
+        try:
+            value = self._typed[key, bool]
+        except KeyError:
+            value = self._convert(key, bool)
+        return default if value is None else value
+
+    def _convert(self, key: str, value_type: type) -> Any:
+        raw = self._props[key]
+        if raw is None:
+            value = None
+        elif value_type is bool:
+            value = strtobool(raw)
+        else:
+            value = value_type(raw)
+        # A race only converts the same value twice
+        self._typed[key, value_type] = value
+        return value
+
+
 class AppConfig(metaclass=Singleton):
     configs: list[Config] | None = None
+    props: dict[str, str | None] = {}
+    _snapshot: ConfigSnapshot = ConfigSnapshot({})
+    _dotenv_keys: frozenset[str] = frozenset()
+    _refresh_lock = threading.Lock()
 
     @staticmethod
     def add_config(config: Config):
-        AppConfig._add_config(config)
-        AppConfig()._reload_from_environment()
+        AppConfig.add_configs([config])
 
     @staticmethod
-    def _add_config(config: Config):
+    def _add_config(config: Config) -> Config:
         if AppConfig.configs is None:
             AppConfig.configs = []
 
-        found = False
         for c in AppConfig.configs:
             if c.env_name == config.env_name:
                 c.is_required = config.is_required
                 c.default_value = config.default_value
-                found = True
-                break
-        if not found:
-            AppConfig.configs.append(config)
+                return c
+        AppConfig.configs.append(config)
+        return config
 
     @staticmethod
     def add_configs(configs: list[Config]):
-        for config in configs:
-            AppConfig._add_config(config)
-        AppConfig()._reload_from_environment()
+        added = [AppConfig._add_config(config) for config in configs]
+        if AppConfig not in Singleton._instances:
+            # The first instance loads the stores, .env and every registered config
+            AppConfig()
+            return
+        # The stores were already exported to the environment by the last load or
+        # refresh, so only the added keys are read instead of reloading everything
+        AppConfig()._load_configs(added)
 
     # The following @classmethod is used for unit testing purposes
     @classmethod
@@ -58,14 +148,58 @@ class AppConfig(metaclass=Singleton):
         # Configure logging levels
         self.logger.setLevel(logging.INFO)
 
+        # Variables from .env may be reloaded by refresh, unlike the process environment
+        self._dotenv_keys = frozenset(dotenv_values()) - frozenset(os.environ)
         load_dotenv()
         self._reload_from_environment()
 
+    def snapshot(self) -> ConfigSnapshot:
+        """The current configuration, replaced when configs are added or refreshed."""
+        return self._snapshot
+
+    def refresh(self) -> ConfigSnapshot:
+        """Reload the configuration and atomically replace the current snapshot.
+
+        Reloads the ``.env`` file, ``TA_ENV_STORE`` and ``TA_ENV_GLOBAL_STORE``.
+        When a required key is missing the current configuration is kept.
+        """
+        with self._refresh_lock:
+            return self._refresh()
+
+    def refresh_on_signal(self, signum: int = signal.SIGHUP) -> None:
+        """Refresh the configuration when the process receives ``signum``.
+
+        The handler runs on the main thread, possibly in the middle of a
+        ``refresh``, so a signal received while a refresh is in progress is
+        skipped instead of waiting for a lock its own thread holds.
+        """
+
+        def handle(received_signum, frame):
+            if not self._refresh_lock.acquire(blocking=False):
+                self.logger.warning("Configuration refresh already in progress, signal ignored")
+                return
+            try:
+                self._refresh()
+                self.logger.info("Configuration refreshed")
+            except Exception as e:
+                self.logger.error(f"Error refreshing configuration - {e}")
+            finally:
+                self._refresh_lock.release()
+
+        signal.signal(signum, handle)
+
+    def _refresh(self) -> ConfigSnapshot:
+        for key, value in dotenv_values().items():
+            if value is not None and (key in self._dotenv_keys or key not in os.environ):
+                os.environ[key] = value
+        self._reload_from_environment()
+        return self._snapshot
+
     def _parse_ta_env_store(self):
         ta_env_store = os.getenv("TA_ENV_STORE")
         if ta_env_store:
             try:
-                env_dict = json.loads(ta_env_store)
+                env_dict = _parse_env_store(ta_env_store)
                 for key, value in env_dict.items():
                     os.environ[key] = value
             except json.JSONDecodeError as e:
@@ -76,7 +210,7 @@ class AppConfig(metaclass=Singleton):
         ta_env_global_store = os.getenv("TA_ENV_GLOBAL_STORE")
         if ta_env_global_store:
             try:
-                env_dict = json.loads(ta_env_global_store)
+                env_dict = _parse_env_store(ta_env_global_store)
                 for key, value in env_dict.items():
                     os.environ[key] = value
             except json.JSONDecodeError as e:
@@ -89,24 +223,32 @@ class AppConfig(metaclass=Singleton):
         try:
             self._parse_ta_env_store()
             self._parse_ta_env_global_store()
-            self.props = {}
             if AppConfig.configs is None:
                 AppConfig.configs = []
-            for config in AppConfig.configs:
-                self.props[config.env_name] = os.getenv(
-                    config.env_name,
-                    default=(config.default_value if config.default_value is not None else None),
-                )
-            self.__validate_required_keys()
+            self.__publish({}, AppConfig.configs)
         except json.JSONDecodeError as e:
             self.logger.exception(f"Error reloading from environment - {e}")
             raise
 
+    def _load_configs(self, configs: list[Config]):
+        self.__publish(self.props, configs)
+
+    def __publish(self, props: Mapping[str, str | None], configs: list[Config]):
+        new_props = dict(props)
+        for config in configs:
+            new_props[config.env_name] = os.getenv(config.env_name, default=config.default_value)
+        self.__validate_required_keys(new_props, configs)
+        # Both views are built before either is replaced, so readers see either
+        # the previous or the new configuration, never a mix
+        snapshot = ConfigSnapshot(new_props)
+        self._snapshot = snapshot
+        self.props = new_props
+
     def get(self, key):
         return self.props[key]
 
-    def __validate_required_keys(self):
-        for config in AppConfig.configs:
-            if config.is_required and self.props[config.env_name] is None:
+    def __validate_required_keys(self, props: Mapping[str, str | None], configs: list[Config]):
+        for config in configs:
+            if config.is_required and props[config.env_name] is None:
                 self.logger.exception(f"Missing required configuration key: {config.env_name}")
                 raise ValueError(f"Missing required configuration key: {config.env_name}")
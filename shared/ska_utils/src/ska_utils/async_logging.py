@@ -0,0 +1,178 @@
+import atexit
+import copy
+import json
+import logging
+import queue
+import threading
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Literal
+
+from opentelemetry import metrics
+
+_meter = metrics.get_meter(__name__)
+_dropped_records_counter = _meter.create_counter(
+    "ska_utils.logging.dropped_records",
+    unit="{record}",
+    description="Log records dropped because the logging queue was full",
+)
+_blocked_records_counter = _meter.create_counter(
+    "ska_utils.logging.blocked_records",
+    unit="{record}",
+    description="Log records which waited for room in the logging queue",
+)
+
+OverflowPolicy = Literal["drop", "block"]
+
+# Attributes of every LogRecord, the others were passed with ``extra``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Puts records on a bounded queue instead of writing them on the caller's thread.
+
+    When the queue is full the record is dropped with ``overflow="drop"``, or
+    the caller waits up to ``block_timeout`` seconds for room with
+    ``overflow="block"``. Both are counted, in ``dropped_records`` and
+    ``blocked_records`` and in the matching metrics.
+    """
+
+    def __init__(
+        self,
+        record_queue: queue.Queue[logging.LogRecord],
+        overflow: OverflowPolicy = "drop",
+        block_timeout: float = 1.0,
+    ):
+        if overflow not in ("drop", "block"):
+            raise ValueError(f"Unknown overflow policy {overflow!r}")
+        super().__init__(record_queue)
+        # QueueHandler only types its queue as having put_nowait
+        self._record_queue = record_queue
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.dropped_records = 0
+        self.blocked_records = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue stays in this process, so only the message is merged: the
+        # arguments might change before the record is written
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self._record_queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.overflow == "block":
+            self.blocked_records += 1
+            _blocked_records_counter.add(1)
+            try:
+                self._record_queue.put(record, timeout=self.block_timeout)
+                return
+            except queue.Full:
+                pass
+        self.dropped_records += 1
+        _dropped_records_counter.add(1)
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets at most ``max_records`` records per ``interval_seconds`` through from each
+    log site (file and line), for records at ``level`` or below."""
+
+    def __init__(self, max_records: int, interval_seconds: float = 1.0, level: int = logging.DEBUG):
+        super().__init__()
+        self.max_records = max_records
+        self.interval_seconds = interval_seconds
+        self.level = level
+        self.suppressed_records = 0
+        self._windows: dict[tuple[str, int], tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level:
+            return True
+        site = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            start, count = self._windows.get(site, (now, 0))
+            if now - start >= self.interval_seconds:
+                start, count = now, 0
+            if count >= self.max_records:
+                self.suppressed_records += 1
+                return False
+            self._windows[site] = (start, count + 1)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+class AsyncLogging:
+    """Writes log records to ``handlers`` from a background thread.
+
+    Loggers get ``handler``, which only puts records on a queue of at most
+    ``queue_size`` records; a ``QueueListener`` thread passes them to the
+    handlers doing the actual I/O. With ``rate_limit``, each log site may log
+    that many records per second at ``rate_limit_level`` or below.
+    Records still queued are written by ``stop``, which runs at exit.
+    """
+
+    def __init__(
+        self,
+        handlers: list[logging.Handler],
+        queue_size: int = 10_000,
+        overflow: OverflowPolicy = "drop",
+        rate_limit: int | None = None,
+        rate_limit_level: int = logging.DEBUG,
+    ):
+        self.queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+        self.handler = BoundedQueueHandler(self.queue, overflow)
+        if rate_limit is not None:
+            self.handler.addFilter(RateLimitFilter(rate_limit, level=rate_limit_level))
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self._started = False
+
+    def start(self) -> "AsyncLogging":
+        if not self._started:
+            self.listener.start()
+            atexit.register(self.stop)
+            self._started = True
+        return self
+
+    def stop(self) -> None:
+        """Write the queued records and stop the background thread."""
+        if self._started:
+            self._started = False
+            atexit.unregister(self.stop)
+            self.listener.stop()
+
+    def attach(self, logger: logging.Logger) -> logging.Logger:
+        """Send the logger's records through the queue instead of its parents' handlers."""
+        if self.handler not in logger.handlers:
+            logger.addHandler(self.handler)
+        logger.propagate = False
+        return logger
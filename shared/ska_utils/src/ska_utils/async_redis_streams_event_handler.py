@@ -0,0 +1,300 @@
+import asyncio
+import logging
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Generic
+
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from ska_utils.redis_streams_event_handler import (
+    RedisStreamsEventHandler,
+    StreamsType,
+    TEventType,
+    decode_event_data,
+)
+
+_STOP = object()
+
+# Fields are None for entries claimed after they were deleted from the stream
+EntriesType = Sequence[tuple[bytes, dict[bytes, bytes] | None]]
+
+
+class AsyncRedisStreamsEventHandler(ABC, Generic[TEventType]):
+    """Consumes a Redis stream with ``redis.asyncio`` and processes events concurrently.
+
+    Events are read ``batch_size`` at a time and handed to ``concurrency``
+    workers. Events for which ``ordering_key`` returns the same key always go
+    to the same worker, so they are processed one at a time in stream order;
+    other events go to the least busy worker. Each worker buffers at most
+    ``queue_size`` events: when the handlers fall behind, dispatching waits for
+    room, and no more events are read until there is.
+
+    By default events are acknowledged when they are read, like
+    ``RedisStreamsEventHandler``. With ``at_least_once`` an event is only
+    acknowledged once ``process_event`` returns, so events of a failed handler
+    or a crashed consumer stay pending. Every ``claim_interval`` seconds pending
+    entries idle for ``claim_idle_ms`` are claimed with XAUTOCLAIM and
+    processed again; ``claim_idle_ms`` must be longer than processing an event
+    takes. An event delivered more than ``max_deliveries`` times, or which
+    cannot be decoded, is moved to ``dead_letter_topic``. Events may be
+    processed more than once, see ``IdempotencyKeys``.
+    """
+
+    def __init__(
+        self,
+        topic_name: str,
+        r: Redis,
+        event_types: type[TEventType],
+        batch_size: int = 10,
+        concurrency: int = 10,
+        queue_size: int | None = None,
+        block_ms: int = 1000,
+        max_message_wait: int = -1,
+        at_least_once: bool = False,
+        claim_idle_ms: int = 60_000,
+        claim_interval: float = 10.0,
+        max_deliveries: int = 5,
+        dead_letter_topic: str | None = None,
+    ):
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("batch_size and concurrency must be at least 1")
+        if max_deliveries < 1:
+            raise ValueError("max_deliveries must be at least 1")
+        self._topic_name = topic_name
+        self._group_name = f"{self._topic_name}/consumers"
+        self._consumer_name = str(uuid.uuid4().hex)
+        self._r = r
+        self._batch_size = batch_size
+        self._concurrency = concurrency
+        self._queue_size = queue_size if queue_size is not None else batch_size
+        self._block_ms = block_ms
+        self._max_message_wait = max_message_wait
+        self._at_least_once = at_least_once
+        self._claim_idle_ms = claim_idle_ms
+        self._claim_interval = claim_interval
+        self._max_deliveries = max_deliveries
+        self._dead_letter_topic = dead_letter_topic or f"{self._topic_name}/dead-letter"
+        self._logger = logging.getLogger(__name__)
+        self._event_types = RedisStreamsEventHandler._validate_event_types(event_types)
+        self._type_adapter = RedisStreamsEventHandler._get_type_adapter_for_event_types(event_types)
+        self._queues: list[asyncio.Queue] = []
+        self._stopping = False
+        self._task: asyncio.Task | None = None
+
+    @abstractmethod
+    async def process_event(self, event: TEventType) -> None:
+        pass  # pragma: no cover
+
+    def ordering_key(self, event: TEventType) -> str | None:
+        """Key of the events which must be processed in order, or None for any order."""
+        return None
+
+    async def start(self) -> None:
+        """Create the consumer group and start consuming in a background task."""
+        if self._task is not None:
+            raise RuntimeError("Event handler is already started.")
+        await self._create_consumer_group()
+        self._stopping = False
+        self._task = asyncio.create_task(self._consume())
+        self._logger.info("Event handler started")
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Stop reading and wait for the events already read to be processed."""
+        if self._task is None:
+            raise RuntimeError("Event handler is not started.")
+        self._stopping = True
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except TimeoutError:
+            self._logger.warning("Timed out waiting for event handler shutdown.")
+            self._task.cancel()
+        self._task = None
+
+    async def run(self) -> None:
+        """Consume until stopped, or until no event arrives within ``max_message_wait``."""
+        await self._create_consumer_group()
+        await self._consume()
+
+    async def _create_consumer_group(self) -> None:
+        try:
+            await self._r.xgroup_create(self._topic_name, self._group_name, 0, True)
+            self._logger.info(f"Consumer group {self._group_name} created successfully")
+        except ResponseError as e:
+            if "BUSYGROUP Consumer Group name already exists" in str(e):
+                self._logger.info(f"Consumer group {self._group_name} already exists")
+            else:
+                raise e
+
+    async def _consume(self) -> None:
+        self._queues = [asyncio.Queue(maxsize=self._queue_size) for _ in range(self._concurrency)]
+        workers = [asyncio.create_task(self._work(queue)) for queue in self._queues]
+        next_claim = time.monotonic()
+        cancelled = False
+        try:
+            while not self._stopping:
+                if self._at_least_once and time.monotonic() >= next_claim:
+                    await self._claim_pending()
+                    next_claim = time.monotonic() + self._claim_interval
+                entries = await self._read_batch()
+                if entries is None:
+                    self._logger.info("Max wait time exceeded, no message received")
+                    break
+                if not entries:
+                    # Let the workers run even when the client returns without waiting
+                    await asyncio.sleep(0)
+                    continue
+                await self._dispatch_entries(entries)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            for worker, queue in zip(workers, self._queues, strict=True):
+                if cancelled:
+                    worker.cancel()
+                else:
+                    await queue.put(_STOP)
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._logger.info("Event handler shutdown completed")
+
+    async def _read_batch(self) -> EntriesType | None:
+        """The next entries, empty after ``block_ms`` without any, or None when the
+        ``max_message_wait`` was exceeded."""
+        block = (self._max_message_wait * 1000) if self._max_message_wait > -1 else self._block_ms
+        result: StreamsType = await self._r.xreadgroup(
+            streams={self._topic_name: ">"},
+            groupname=self._group_name,
+            consumername=self._consumer_name,
+            count=self._batch_size,
+            block=block,
+        )
+        if not result:
+            return None if self._max_message_wait > -1 else []
+        return result[0][1]
+
+    async def _claim_pending(self) -> None:
+        """Claim and process the pending entries of failed handlers and dead consumers."""
+        cursor: bytes | str = "0-0"
+        while True:
+            cursor, entries, *_ = await self._r.xautoclaim(
+                self._topic_name,
+                self._group_name,
+                self._consumer_name,
+                self._claim_idle_ms,
+                start_id=cursor,
+                count=self._batch_size,
+            )
+            if entries:
+                self._logger.info(f"Claimed {len(entries)} pending events")
+                await self._dispatch_entries(entries, await self._delivery_counts(entries))
+            if cursor in (b"0-0", "0-0"):
+                return
+
+    async def _delivery_counts(self, entries: EntriesType) -> dict[bytes, int]:
+        pipeline = self._r.pipeline(transaction=False)
+        for entry_id, _ in entries:
+            pipeline.xpending_range(
+                self._topic_name,
+                self._group_name,
+                min=entry_id,
+                max=entry_id,
+                count=1,
+                consumername=self._consumer_name,
+            )
+        counts = {}
+        for pending in await pipeline.execute():
+            for entry in pending:
+                counts[entry["message_id"]] = entry["times_delivered"]
+        return counts
+
+    async def _dispatch_entries(
+        self, entries: EntriesType, delivery_counts: dict[bytes, int] | None = None
+    ) -> None:
+        acks = []
+        events = []
+        for entry_id, fields in entries:
+            if fields is None:
+                # Deleted from the stream while it was pending
+                acks.append(entry_id)
+                continue
+            deliveries = (delivery_counts or {}).get(entry_id, 1)
+            if self._at_least_once and deliveries > self._max_deliveries:
+                await self._dead_letter(entry_id, fields, f"delivered {deliveries} times")
+                acks.append(entry_id)
+                continue
+            try:
+                events.append(
+                    (entry_id, self._type_adapter.validate_json(decode_event_data(fields)))
+                )
+            except Exception as e:
+                self._logger.error(f"Error decoding event {entry_id!r}: {e}")
+                if self._at_least_once:
+                    await self._dead_letter(entry_id, fields, f"cannot be decoded: {e}")
+                    acks.append(entry_id)
+                continue
+            if not self._at_least_once:
+                acks.append(entry_id)
+        if acks:
+            await self._r.xack(self._topic_name, self._group_name, *acks)
+        for entry_id, event in events:
+            await self._dispatch(entry_id, event)
+
+    async def _dead_letter(self, entry_id: bytes, fields: dict[bytes, bytes], reason: str) -> None:
+        self._logger.warning(f"Moving event {entry_id!r} to {self._dead_letter_topic}: {reason}")
+        await self._r.xadd(
+            self._dead_letter_topic,
+            {**fields, b"original_id": entry_id, b"reason": reason.encode()},
+        )
+
+    async def _dispatch(self, entry_id: bytes, event: TEventType) -> None:
+        key = self.ordering_key(event)
+        if key is None:
+            queue = min(self._queues, key=lambda q: q.qsize())
+        else:
+            queue = self._queues[zlib.crc32(key.encode()) % len(self._queues)]
+        # Waits while the worker's queue is full, which stops reading
+        await queue.put((entry_id, event))
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        while True:
+            item = await queue.get()
+            if item is _STOP:
+                return
+            entry_id, event = item
+            try:
+                await self.process_event(event)
+            except Exception as e:
+                self._logger.exception(f"Error processing event: {e}")
+                continue
+            if self._at_least_once:
+                try:
+                    await self._r.xack(self._topic_name, self._group_name, entry_id)
+                except Exception as e:
+                    self._logger.error(f"Error acknowledging event {entry_id!r}: {e}")
+
+
+class IdempotencyKeys:
+    """Remembers which events were processed, for handlers of at-least-once events.
+
+    A handler checks ``is_processed`` with a key identifying the event before
+    doing its work and calls ``mark_processed`` after it succeeds. Keys expire
+    after ``ttl_seconds``, which must be longer than events can be redelivered.
+    """
+
+    def __init__(self, r: Redis, namespace: str, ttl_seconds: int = 24 * 60 * 60):
+        self._r = r
+        self._namespace = namespace
+        self._ttl_seconds = ttl_seconds
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}/processed/{key}"
+
+    async def is_processed(self, key: str) -> bool:
+        return bool(await self._r.exists(self._key(key)))
+
+    async def mark_processed(self, key: str) -> bool:
+        """Mark the key processed; False if it already was."""
+        return bool(await self._r.set(self._key(key), 1, ex=self._ttl_seconds, nx=True))
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time
+import zlib
+from typing import Any
+
+from redis.asyncio import Redis
+
+from ska_utils.redis_streams_event_handler import ENCODING_FIELD, ZLIB_ENCODING
+
+
+class AsyncRedisStreamsEventPublisher:
+    """Publishes events with ``redis.asyncio``, sending them to Redis in batches.
+
+    Published events are buffered and written with one pipelined round trip
+    when ``batch_size`` events are buffered, or ``flush_interval`` seconds
+    after the first of them was published. With ``batch_size=1`` every event
+    is written when it is published.
+
+    Streams are trimmed approximately on every write, to about ``max_len``
+    entries or to entries younger than ``max_age_ms``. ``event_data`` larger
+    than ``compress_threshold`` bytes is compressed with zlib; the event
+    handlers decompress it.
+
+    Buffered events are only guaranteed to be written by ``flush``, ``close``
+    or leaving ``async with``.
+    """
+
+    def __init__(
+        self,
+        r: Redis,
+        batch_size: int = 100,
+        flush_interval: float = 0.01,
+        max_len: int | None = None,
+        max_age_ms: int | None = None,
+        compress_threshold: int | None = None,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_len is not None and max_age_ms is not None:
+            raise ValueError("Only one of max_len and max_age_ms can be set")
+        self._r = r
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_len = max_len
+        self._max_age_ms = max_age_ms
+        self._compress_threshold = compress_threshold
+        self._logger = logging.getLogger(__name__)
+        self._buffer: list[tuple[str, dict[bytes, bytes]]] = []
+        self._lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncRedisStreamsEventPublisher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def publish_event(self, topic_name: str, event_data: str | bytes) -> None:
+        if self._closed:
+            raise RuntimeError("Event publisher is closed.")
+        self._buffer.append((topic_name, self._fields(event_data)))
+        if len(self._buffer) >= self._batch_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Write the buffered events; on failure they stay buffered and the error is raised."""
+        async with self._lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return
+            try:
+                await self._write(batch)
+            except Exception:
+                self._buffer = batch + self._buffer
+                raise
+
+    async def close(self) -> None:
+        """Stop accepting events and write the buffered ones."""
+        self._closed = True
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            self._logger.error(f"Error publishing events: {e}")
+
+    def _fields(self, event_data: str | bytes) -> dict[bytes, bytes]:
+        data = event_data.encode() if isinstance(event_data, str) else event_data
+        if self._compress_threshold is not None and len(data) > self._compress_threshold:
+            return {b"event_data": zlib.compress(data), ENCODING_FIELD: ZLIB_ENCODING}
+        return {b"event_data": data}
+
+    def _trim_args(self) -> dict[str, Any]:
+        if self._max_len is not None:
+            return {"maxlen": self._max_len, "approximate": True}
+        if self._max_age_ms is not None:
+            min_id = int(time.time() * 1000) - self._max_age_ms
+            return {"minid": f"{min_id}-0", "approximate": True}
+        return {}
+
+    async def _write(self, batch: list[tuple[str, dict[bytes, bytes]]]) -> None:
+        trim_args = self._trim_args()
+        if len(batch) == 1:
+            topic_name, fields = batch[0]
+            await self._r.xadd(name=topic_name, fields=fields, **trim_args)
+            return
+        pipeline = self._r.pipeline(transaction=False)
+        for topic_name, fields in batch:
+            pipeline.xadd(name=topic_name, fields=fields, **trim_args)
+        await pipeline.execute()
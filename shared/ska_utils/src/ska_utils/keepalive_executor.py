@@ -1,5 +1,8 @@
 import asyncio
+import heapq
 import logging
+import math
+import weakref
 from collections.abc import AsyncGenerator, Coroutine
 from typing import Any, TypeVar
 
@@ -13,6 +16,68 @@ class KeepaliveMessage(BaseModel):
 TResponseType = TypeVar("TResponseType")  # Return type of the main task
 
 
+class _TimerWheel:
+    """Timers shared by all keepalive streams of an event loop.
+
+    Deadlines are rounded up to 1% of their delay, at most 100ms, so streams
+    with the same interval share slots, and only the earliest slot has a
+    timer scheduled on the loop, however many streams are idle.
+    """
+
+    MAX_RESOLUTION_SECONDS = 0.1
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._slots: dict[float, list[asyncio.Future[None]]] = {}
+        self._deadlines: list[float] = []
+        self._handle: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        return sum(not f.done() for waiters in self._slots.values() for f in waiters)
+
+    def sleep(self, delay: float) -> asyncio.Future[None]:
+        """A future completed ``delay`` seconds from now, slightly later at most."""
+        resolution = min(max(delay, 0.0) / 100, self.MAX_RESOLUTION_SECONDS) or 1e-6
+        deadline = math.ceil((self._loop.time() + delay) / resolution) * resolution
+        future = self._loop.create_future()
+        if deadline not in self._slots:
+            self._slots[deadline] = []
+            heapq.heappush(self._deadlines, deadline)
+            if self._deadlines[0] == deadline:
+                self._schedule()
+        self._slots[deadline].append(future)
+        return future
+
+    def _schedule(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._loop.call_at(self._deadlines[0], self._fire)
+
+    def _fire(self) -> None:
+        self._handle = None
+        # The loop runs timers up to its clock resolution early
+        now = self._loop.time() + 0.001
+        while self._deadlines and self._deadlines[0] <= now:
+            for future in self._slots.pop(heapq.heappop(self._deadlines)):
+                if not future.done():
+                    future.set_result(None)
+        if self._deadlines:
+            self._schedule()
+
+
+_wheels: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _TimerWheel] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_timer_wheel() -> _TimerWheel:
+    loop = asyncio.get_running_loop()
+    wheel = _wheels.get(loop)
+    if wheel is None:
+        wheel = _wheels[loop] = _TimerWheel(loop)
+    return wheel
+
+
 async def execute_with_keepalive(
     task_coro: Coroutine[Any, Any, TResponseType],
     keepalive_interval_seconds: float = 30.0,
@@ -22,52 +87,41 @@ async def execute_with_keepalive(
     """
     Executes a long-running coroutine while periodically yielding keepalive messages.
 
+    The result is yielded as soon as the task completes, and a keepalive only
+    after ``keepalive_interval_seconds`` without any message.
+
     Args:
         task_coro: The coroutine to execute
         keepalive_interval_seconds: Seconds between keepalive messages
-        keepalive_poll_interval_seconds: How frequently to check the queue
+        keepalive_poll_interval_seconds: Unused, kept for compatibility
         logger: Optional logger for error reporting
 
     Yields:
         Keepalive messages while the task is running and the final task result when complete
     """
-    keepalive_queue: asyncio.Queue[KeepaliveMessage] = asyncio.Queue()
-
-    async def run_keepalive() -> None:
-        try:
-            while True:
-                await asyncio.sleep(keepalive_interval_seconds)
-                keepalive_queue.put_nowait(KeepaliveMessage())
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            if logger:
-                logger.error(f"Keepalive exception: {e}")
-
-    keepalive_task: asyncio.Task[None] | None = asyncio.create_task(run_keepalive())
+    wheel = _get_timer_wheel()
     try:
         main_task: asyncio.Task[TResponseType] = asyncio.create_task(task_coro)
-        while not main_task.done():
+        while True:
+            timer = wheel.sleep(keepalive_interval_seconds)
             try:
-                message: KeepaliveMessage = await asyncio.wait_for(
-                    keepalive_queue.get(), keepalive_poll_interval_seconds
-                )
-                yield message
-            except TimeoutError:
-                pass
+                await asyncio.wait((main_task, timer), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                timer.cancel()
+            if main_task.done():
+                break
+            try:
+                message = KeepaliveMessage()
+            except Exception as e:
+                if logger:
+                    logger.error(f"Keepalive exception: {e}")
+                continue
+            yield message
 
         # Get and yield the final result
-        result: TResponseType = await main_task
+        result: TResponseType = main_task.result()
         yield result
     except Exception as e:
         if logger:
             logger.error(f"Task exception: {e}")
         raise
-    finally:
-        # Always ensure keepalive task is cancelled
-        if keepalive_task and not keepalive_task.done():
-            keepalive_task.cancel()
-            try:
-                await asyncio.wait_for(keepalive_task, 1.0)
-            except (asyncio.CancelledError, TimeoutError):
-                pass
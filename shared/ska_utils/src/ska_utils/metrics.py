@@ -0,0 +1,383 @@
+import math
+import re
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from opentelemetry import metrics
+from opentelemetry.metrics import Counter, Histogram, Meter, MeterProvider, UpDownCounter
+from opentelemetry.sdk.metrics.export import (
+    Gauge,
+    Histogram as HistogramData,
+    Metric,
+    MetricReader,
+    MetricsData,
+    Sum,
+)
+from opentelemetry.util.types import Attributes
+
+if TYPE_CHECKING:
+    from fastapi import APIRouter
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+    from ska_utils.telemetry import Telemetry
+
+# Seconds; model calls take from a fraction of a second to minutes for long generations
+LLM_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.0,
+    4.0,
+    8.0,
+    15.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+# Seconds; HTTP requests which do not wait for a model
+REQUEST_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+TOKEN_COUNT_BUCKETS: tuple[float, ...] = (
+    16,
+    64,
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_METER_NAME = "ska_utils.metrics"
+
+
+def _get_meter(meter: Meter | None) -> Meter:
+    return meter if meter is not None else metrics.get_meter(_METER_NAME)
+
+
+def create_counter(
+    name: str, unit: str = "", description: str = "", meter: Meter | None = None
+) -> Counter:
+    return _get_meter(meter).create_counter(name, unit=unit, description=description)
+
+
+def create_up_down_counter(
+    name: str, unit: str = "", description: str = "", meter: Meter | None = None
+) -> UpDownCounter:
+    return _get_meter(meter).create_up_down_counter(name, unit=unit, description=description)
+
+
+def create_histogram(
+    name: str,
+    unit: str = "s",
+    description: str = "",
+    boundaries: Sequence[float] = LLM_LATENCY_BUCKETS,
+    meter: Meter | None = None,
+) -> Histogram:
+    """A histogram with explicit bucket ``boundaries``, by default ``LLM_LATENCY_BUCKETS``."""
+    return _get_meter(meter).create_histogram(
+        name,
+        unit=unit,
+        description=description,
+        explicit_bucket_boundaries_advisory=boundaries,
+    )
+
+
+class ServiceMetrics:
+    """The request, model, token, tool call, stream and token budget metrics of an agent service.
+
+    Instruments are created on the global meter provider unless
+    ``meter_provider`` is given, so they can be created before telemetry is
+    initialized.
+    """
+
+    def __init__(self, meter_provider: MeterProvider | None = None):
+        meter = metrics.get_meter(_METER_NAME, meter_provider=meter_provider)
+        self.requests = create_counter(
+            "tealagents.requests",
+            unit="{request}",
+            description="Requests handled, by method, route and status code",
+            meter=meter,
+        )
+        self.request_duration = create_histogram(
+            "tealagents.request.duration",
+            description="Time until the response started, by method, route and status code",
+            boundaries=REQUEST_LATENCY_BUCKETS,
+            meter=meter,
+        )
+        self.llm_duration = create_histogram(
+            "tealagents.llm.duration",
+            description="Duration of model calls, by model",
+            meter=meter,
+        )
+        self.tokens = create_counter(
+            "tealagents.tokens",
+            unit="{token}",
+            description="Tokens used by model calls, by model and token type",
+            meter=meter,
+        )
+        self.tool_calls = create_counter(
+            "tealagents.tool_calls",
+            unit="{call}",
+            description="Tool calls, by tool and outcome",
+            meter=meter,
+        )
+        self.tool_call_duration = create_histogram(
+            "tealagents.tool_call.duration",
+            description="Duration of tool calls, by tool and outcome",
+            meter=meter,
+        )
+        self.active_streams = create_up_down_counter(
+            "tealagents.streams.active",
+            unit="{stream}",
+            description="Streaming responses in progress, by kind",
+            meter=meter,
+        )
+        self.token_budget_limits = create_counter(
+            "tealagents.token_budget.limits",
+            unit="{request}",
+            description="Requests which reached a token budget limit, by limit",
+            meter=meter,
+        )
+
+    def record_request(
+        self, method: str, route: str, status_code: int, duration_seconds: float
+    ) -> None:
+        attributes = {"method": method, "route": route, "status_code": status_code}
+        self.requests.add(1, attributes)
+        self.request_duration.record(duration_seconds, attributes)
+
+    def record_tokens(self, model: str, prompt_tokens: int, completion_tokens: int) -> None:
+        self.tokens.add(prompt_tokens, {"model": model, "token_type": "prompt"})
+        self.tokens.add(completion_tokens, {"model": model, "token_type": "completion"})
+
+    def record_token_budget_limit(self, limit: str) -> None:
+        self.token_budget_limits.add(1, {"limit": limit})
+
+    @contextmanager
+    def track_llm_call(self, model: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.llm_duration.record(time.perf_counter() - start, {"model": model})
+
+    @contextmanager
+    def track_tool_call(self, tool: str) -> Iterator[None]:
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            yield
+            outcome = "success"
+        finally:
+            attributes = {"tool": tool, "outcome": outcome}
+            self.tool_calls.add(1, attributes)
+            self.tool_call_duration.record(time.perf_counter() - start, attributes)
+
+    @contextmanager
+    def track_stream(self, kind: str) -> Iterator[None]:
+        attributes = {"kind": kind}
+        self.active_streams.add(1, attributes)
+        try:
+            yield
+        finally:
+            self.active_streams.add(-1, attributes)
+
+
+_service_metrics: ServiceMetrics | None = None
+
+
+def get_service_metrics() -> ServiceMetrics:
+    global _service_metrics
+    if _service_metrics is None:
+        _service_metrics = ServiceMetrics()
+    return _service_metrics
+
+
+def record_request_from_scope(request: "Request", response: "Response", start: float) -> None:
+    """Record a request handled by an HTTP middleware in the service metrics.
+
+    ``start`` is the ``time.perf_counter()`` value from when the request was
+    received. Requests are recorded by route template rather than path, whose
+    IDs would make a series per request. The duration ends when the endpoint
+    returned its response, so for streaming (SSE) routes it excludes the
+    stream; ``ServiceMetrics.track_stream`` counts the streams in progress.
+    """
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    get_service_metrics().record_request(
+        request.method, route, response.status_code, time.perf_counter() - start
+    )
+
+
+def metrics_router(telemetry: "Telemetry | None" = None) -> "APIRouter":
+    """The Prometheus scrape endpoint, ``/metrics``, for FastAPI apps.
+
+    The endpoint answers 404 unless TA_METRICS_PROMETHEUS is enabled. Without
+    ``telemetry``, the one set up by ``initialize_telemetry`` is looked up on
+    each scrape, for apps which include the router before initializing it.
+    FastAPI is imported here as it is not a dependency of ska_utils.
+    """
+    from fastapi import APIRouter, HTTPException, Response
+
+    router = APIRouter()
+
+    @router.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint() -> Response:
+        if telemetry is None:
+            from ska_utils.telemetry import get_telemetry
+
+            text = get_telemetry().render_prometheus_metrics()
+        else:
+            text = telemetry.render_prometheus_metrics()
+        if text is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+        return Response(text, media_type=PROMETHEUS_CONTENT_TYPE)
+
+    return router
+
+
+class PrometheusMetricReader(MetricReader):
+    """Collects metrics in the process, for a Prometheus scrape endpoint.
+
+    ``render`` collects the current values and returns them in the Prometheus
+    text exposition format, to be served with ``PROMETHEUS_CONTENT_TYPE``.
+    Metric names get the unit and, for counters, a ``_total`` suffix.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._metrics_data: MetricsData | None = None
+        self._lock = threading.Lock()
+
+    def _receive_metrics(
+        self, metrics_data: MetricsData, timeout_millis: float = 10_000, **kwargs
+    ) -> None:
+        self._metrics_data = metrics_data
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        pass
+
+    def render(self) -> str:
+        with self._lock:
+            self._metrics_data = None
+            self.collect()
+            metrics_data = self._metrics_data
+        families: dict[str, tuple[str, str, list[str]]] = {}
+        if metrics_data is not None:
+            for resource_metrics in metrics_data.resource_metrics:
+                for scope_metrics in resource_metrics.scope_metrics:
+                    for metric in scope_metrics.metrics:
+                        _add_family(families, metric)
+        lines = []
+        for name, (kind, description, samples) in families.items():
+            if description:
+                lines.append(f"# HELP {name} {_escape_help(description)}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+_UNIT_SUFFIXES = {
+    "s": "seconds",
+    "ms": "milliseconds",
+    "By": "bytes",
+    "1": "ratio",
+}
+_INVALID_NAME_CHARACTERS = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def _metric_name(name: str, unit: str | None) -> str:
+    name = _INVALID_NAME_CHARACTERS.sub("_", name)
+    # Annotations like {token} are not units
+    suffix = _UNIT_SUFFIXES.get(unit or "")
+    if suffix and not name.endswith(f"_{suffix}"):
+        name = f"{name}_{suffix}"
+    return name
+
+
+def _add_family(families: dict[str, tuple[str, str, list[str]]], metric: Metric) -> None:
+    data = metric.data
+    name = _metric_name(metric.name, metric.unit)
+    samples: list[str]
+    if isinstance(data, Sum):
+        if data.is_monotonic:
+            name = name if name.endswith("_total") else f"{name}_total"
+            kind = "counter"
+        else:
+            kind = "gauge"
+        samples = [
+            f"{name}{_labels(point.attributes)} {_value(point.value)}" for point in data.data_points
+        ]
+    elif isinstance(data, Gauge):
+        kind = "gauge"
+        samples = [
+            f"{name}{_labels(point.attributes)} {_value(point.value)}" for point in data.data_points
+        ]
+    elif isinstance(data, HistogramData):
+        kind = "histogram"
+        samples = []
+        for point in data.data_points:
+            cumulative = 0
+            for bound, count in zip(point.explicit_bounds, point.bucket_counts, strict=False):
+                cumulative += count
+                labels = _labels(point.attributes, {"le": _value(bound)})
+                samples.append(f"{name}_bucket{labels} {cumulative}")
+            labels = _labels(point.attributes, {"le": "+Inf"})
+            samples.append(f"{name}_bucket{labels} {point.count}")
+            samples.append(f"{name}_sum{_labels(point.attributes)} {_value(point.sum)}")
+            samples.append(f"{name}_count{_labels(point.attributes)} {point.count}")
+    else:
+        # Exponential histograms have no Prometheus text representation
+        return
+    family = families.get(name)
+    if family is None:
+        families[name] = (kind, metric.description or "", samples)
+    elif family[0] == kind:
+        family[2].extend(samples)
+
+
+def _labels(attributes: Attributes, extra: Mapping[str, str] | None = None) -> str:
+    labels = {
+        _INVALID_NAME_CHARACTERS.sub("_", key): str(value)
+        for key, value in (attributes or {}).items()
+    }
+    labels.update(extra or {})
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+def _value(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if math.isnan(value):
+            return "NaN"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
@@ -1,15 +1,91 @@
+import hashlib
 import importlib.util
+import os
 import sys
+import threading
+from types import ModuleType
 from typing import Any
 
 
 class ModuleLoader:
+    # Modules loaded in this process, by resolved path and hash of the file's content
+    _modules: dict[tuple[str, str], ModuleType] = {}
+    _hashes: dict[str, tuple[int, int, str]] = {}
+    _locks: dict[tuple[str, str], threading.Lock] = {}
+    _lock = threading.Lock()
+
     @staticmethod
     def _parse_module_name(types_module: str) -> str:
         return types_module.split("/")[-1].split(".")[0]
 
     @staticmethod
     def load_module(module: str) -> Any:
+        """Load a module from a file path, once per process for the same file content.
+
+        Concurrent loads of the same file wait for a single execution of the
+        module. A file whose content changed is loaded again, replacing the
+        module loaded for its previous content.
+        """
+        key = ModuleLoader._cache_key(module)
+        if key is None:
+            return ModuleLoader._exec_module(module)
+        cached = ModuleLoader._modules.get(key)
+        if cached is None:
+            with ModuleLoader._lock:
+                lock = ModuleLoader._locks.setdefault(key, threading.Lock())
+            with lock:
+                cached = ModuleLoader._modules.get(key)
+                if cached is None:
+                    cached = ModuleLoader._exec_module(module)
+                    ModuleLoader._store(key, cached)
+        sys.modules[ModuleLoader._parse_module_name(module)] = cached
+        return cached
+
+    @staticmethod
+    def reload_module(module: str) -> Any:
+        """Execute the module again, replacing the cached module for its current content."""
+        key = ModuleLoader._cache_key(module)
+        loaded = ModuleLoader._exec_module(module)
+        if key is not None:
+            ModuleLoader._store(key, loaded)
+        return loaded
+
+    @staticmethod
+    def _store(key: tuple[str, str], loaded: ModuleType) -> None:
+        """Cache the module loaded for ``key``, dropping those of other content of its path."""
+        with ModuleLoader._lock:
+            for stale_key in [k for k in ModuleLoader._modules if k[0] == key[0] and k != key]:
+                del ModuleLoader._modules[stale_key]
+            for stale_key in [k for k in ModuleLoader._locks if k[0] == key[0] and k != key]:
+                del ModuleLoader._locks[stale_key]
+            ModuleLoader._modules[key] = loaded
+
+    # The following @classmethod is used for unit testing purposes
+    @classmethod
+    def clear_cache(cls):
+        with cls._lock:
+            cls._modules.clear()
+            cls._hashes.clear()
+            cls._locks.clear()
+
+    @staticmethod
+    def _cache_key(module: str) -> tuple[str, str] | None:
+        """The resolved path and content hash, or None if the file cannot be read."""
+        path = os.path.realpath(module)
+        try:
+            stat = os.stat(path)
+            cached = ModuleLoader._hashes.get(path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return path, cached[2]
+            with open(path, "rb") as f:
+                content_hash = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+        ModuleLoader._hashes[path] = (stat.st_mtime_ns, stat.st_size, content_hash)
+        return path, content_hash
+
+    @staticmethod
+    def _exec_module(module: str) -> ModuleType:
         module_name = ModuleLoader._parse_module_name(module)
         spec = importlib.util.spec_from_file_location(module_name, module)
         if spec:
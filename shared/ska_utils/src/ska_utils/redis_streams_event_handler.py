@@ -3,6 +3,7 @@ import logging
 import threading
 import typing
 import uuid
+import zlib
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
@@ -14,6 +15,20 @@ StreamsType = list[tuple[bytes, list[tuple[bytes, dict[bytes, bytes]]]]]
 
 TEventType = TypeVar("TEventType")
 
+ENCODING_FIELD = b"encoding"
+ZLIB_ENCODING = b"zlib"
+
+
+def decode_event_data(fields: dict[bytes, bytes]) -> bytes:
+    """The ``event_data`` of a stream entry, decompressed if it was published compressed."""
+    event_data = fields[b"event_data"]
+    encoding = fields.get(ENCODING_FIELD)
+    if encoding is None:
+        return event_data
+    if encoding == ZLIB_ENCODING:
+        return zlib.decompress(event_data)
+    raise ValueError(f"Unsupported event encoding {encoding!r}")
+
 
 class MaxWaitExceededError(Exception):
     pass
@@ -112,7 +127,7 @@ class RedisStreamsEventHandler(ABC, Generic[TEventType]):
     def _decode_event(self, event: StreamsType) -> tuple[str, TEventType]:
         try:
             event_id = event[0][1][0][0].decode()
-            event_data_str = event[0][1][0][1][b"event_data"].decode()
+            event_data_str = decode_event_data(event[0][1][0][1]).decode()
             invoke_event = self._type_adapter.validate_json(event_data_str)
             return event_id, invoke_event
         except Exception as e:
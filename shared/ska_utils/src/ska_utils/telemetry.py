@@ -16,11 +16,12 @@ from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import (
     ConsoleMetricExporter,
     MetricExporter,
+    MetricReader,
     PeriodicExportingMetricReader,
 )
 from opentelemetry.sdk.metrics.view import DropAggregation, View
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import (
     BatchSpanProcessor,
     ConsoleSpanExporter,
@@ -29,7 +30,10 @@ from opentelemetry.sdk.trace.export import (
 from opentelemetry.semconv.resource import ResourceAttributes
 
 from ska_utils.app_config import AppConfig, Config
+from ska_utils.async_logging import AsyncLogging, JsonFormatter, OverflowPolicy
+from ska_utils.metrics import PrometheusMetricReader
 from ska_utils.strtobool import strtobool
+from ska_utils.trace_sampling import BoundedExportQueue, TailSamplingSpanProcessor, create_sampler
 
 TA_TELEMETRY_ENABLED = Config(
     env_name="TA_TELEMETRY_ENABLED", is_required=True, default_value="true"
@@ -45,9 +49,48 @@ TA_OTEL_METRICS_ENDPOINT = Config(
 TA_LOG_LEVEL = Config(env_name="TA_LOG_LEVEL", is_required=False, default_value="info")
 
 TA_METRICS_ENABLED = Config(env_name="TA_METRICS_ENABLED", is_required=True, default_value="false")
+# Also keep metrics in the process, for apps to serve on a Prometheus /metrics endpoint
+TA_METRICS_PROMETHEUS = Config(
+    env_name="TA_METRICS_PROMETHEUS", is_required=False, default_value="false"
+)
+TA_METRICS_EXPORT_INTERVAL_MS = Config(
+    env_name="TA_METRICS_EXPORT_INTERVAL_MS", is_required=False, default_value="5000"
+)
 
 TA_LOGGING_ENABLED = Config(env_name="TA_LOGGING_ENABLED", is_required=True, default_value="false")
 
+# "ratio" or "rate_limited"; unset uses the OpenTelemetry default (OTEL_TRACES_SAMPLER)
+TA_TRACE_SAMPLER = Config(env_name="TA_TRACE_SAMPLER", is_required=False, default_value=None)
+# Share of new traces sampled by the "ratio" sampler
+TA_TRACE_SAMPLER_RATIO = Config(
+    env_name="TA_TRACE_SAMPLER_RATIO", is_required=False, default_value="1.0"
+)
+# New traces per second sampled by the "rate_limited" sampler
+TA_TRACE_SAMPLER_RATE = Config(
+    env_name="TA_TRACE_SAMPLER_RATE", is_required=False, default_value="100"
+)
+# Export only traces with an error or a root span slower than TA_TRACE_TAIL_LATENCY_MS
+TA_TRACE_TAIL_SAMPLING = Config(
+    env_name="TA_TRACE_TAIL_SAMPLING", is_required=False, default_value="false"
+)
+TA_TRACE_TAIL_LATENCY_MS = Config(
+    env_name="TA_TRACE_TAIL_LATENCY_MS", is_required=False, default_value="1000"
+)
+# Spans waiting for export; further spans are dropped and counted
+TA_TRACE_EXPORT_QUEUE_SIZE = Config(
+    env_name="TA_TRACE_EXPORT_QUEUE_SIZE", is_required=False, default_value="2048"
+)
+
+# Write log records from a background thread instead of the logging call site
+TA_LOG_ASYNC = Config(env_name="TA_LOG_ASYNC", is_required=False, default_value="false")
+TA_LOG_QUEUE_SIZE = Config(env_name="TA_LOG_QUEUE_SIZE", is_required=False, default_value="10000")
+# "drop" or "block" when the queue of log records is full
+TA_LOG_OVERFLOW = Config(env_name="TA_LOG_OVERFLOW", is_required=False, default_value="drop")
+# "text" or "json", for logs written to stderr
+TA_LOG_FORMAT = Config(env_name="TA_LOG_FORMAT", is_required=False, default_value="text")
+# Debug records per second allowed from each log site; unset for no limit
+TA_LOG_RATE_LIMIT = Config(env_name="TA_LOG_RATE_LIMIT", is_required=False, default_value=None)
+
 TELEMETRY_CONFIGS: list[Config] = [
     TA_TELEMETRY_ENABLED,
     TA_OTEL_ENDPOINT,
@@ -55,11 +98,36 @@ TELEMETRY_CONFIGS: list[Config] = [
     TA_OTEL_LOGGING_ENDPOINT,
     TA_OTEL_METRICS_ENDPOINT,
     TA_METRICS_ENABLED,
-    TA_LOGGING_ENABLED
+    TA_METRICS_PROMETHEUS,
+    TA_METRICS_EXPORT_INTERVAL_MS,
+    TA_LOGGING_ENABLED,
+    TA_TRACE_SAMPLER,
+    TA_TRACE_SAMPLER_RATIO,
+    TA_TRACE_SAMPLER_RATE,
+    TA_TRACE_TAIL_SAMPLING,
+    TA_TRACE_TAIL_LATENCY_MS,
+    TA_TRACE_EXPORT_QUEUE_SIZE,
+    TA_LOG_ASYNC,
+    TA_LOG_QUEUE_SIZE,
+    TA_LOG_OVERFLOW,
+    TA_LOG_FORMAT,
+    TA_LOG_RATE_LIMIT,
 ]
 
 AppConfig.add_configs(TELEMETRY_CONFIGS)
 
+# Prefixes of the instruments exported; those of instrumented libraries are dropped.
+# Meters added by the services must use one of them, or add theirs here, to be exported.
+METRIC_INSTRUMENT_PREFIXES: list[str] = ["semantic_kernel", "tealagents", "a2a", "ska_utils"]
+
+
+def _get_value(app_config: AppConfig, config: Config) -> str:
+    """The value of ``config``, or its default when it is unset or empty."""
+    value = app_config.get(config.env_name) or config.default_value
+    if value is None:
+        raise ValueError(f"Missing configuration value: {config.env_name}")
+    return value
+
 
 class Telemetry:
     def __init__(self, service_name: str, app_config: AppConfig):
@@ -72,6 +140,30 @@ class Telemetry:
         self.endpoint = app_config.get(TA_OTEL_ENDPOINT.env_name)
         self.logging_endpoint = app_config.get(TA_OTEL_LOGGING_ENDPOINT.env_name)
         self.metrics_endpoint = app_config.get(TA_OTEL_METRICS_ENDPOINT.env_name)
+        self._metrics_prometheus = strtobool(
+            str(app_config.get(TA_METRICS_PROMETHEUS.env_name) or "false")
+        )
+        self._metrics_export_interval_ms = int(
+            _get_value(app_config, TA_METRICS_EXPORT_INTERVAL_MS)
+        )
+        self.prometheus_reader: PrometheusMetricReader | None = None
+        self._trace_sampler = app_config.get(TA_TRACE_SAMPLER.env_name)
+        self._trace_sampler_ratio = float(_get_value(app_config, TA_TRACE_SAMPLER_RATIO))
+        self._trace_sampler_rate = float(_get_value(app_config, TA_TRACE_SAMPLER_RATE))
+        self._tail_sampling = strtobool(
+            str(app_config.get(TA_TRACE_TAIL_SAMPLING.env_name) or "false")
+        )
+        self._tail_latency_ms = float(_get_value(app_config, TA_TRACE_TAIL_LATENCY_MS))
+        self.export_queue = BoundedExportQueue(
+            int(_get_value(app_config, TA_TRACE_EXPORT_QUEUE_SIZE))
+        )
+        self._log_async = strtobool(str(app_config.get(TA_LOG_ASYNC.env_name) or "false"))
+        self._log_queue_size = int(_get_value(app_config, TA_LOG_QUEUE_SIZE))
+        self._log_overflow = self._get_log_overflow(app_config)
+        self._log_format = app_config.get(TA_LOG_FORMAT.env_name) or "text"
+        log_rate_limit = app_config.get(TA_LOG_RATE_LIMIT.env_name)
+        self._log_rate_limit = int(log_rate_limit) if log_rate_limit else None
+        self._async_logging: AsyncLogging | None = None
         self._check_enable_telemetry()
         self.tracer: trace.Tracer | None = self._get_tracer()
 
@@ -115,13 +207,33 @@ class Telemetry:
         else:
             exporter = ConsoleSpanExporter()
 
-        provider = TracerProvider(resource=self.resource)
-        processor = BatchSpanProcessor(exporter)
+        sampler = create_sampler(
+            self._trace_sampler, self._trace_sampler_ratio, self._trace_sampler_rate
+        )
+        if sampler is None:
+            provider = TracerProvider(resource=self.resource)
+        else:
+            provider = TracerProvider(resource=self.resource, sampler=sampler)
+        max_queue_size = self.export_queue.max_queue_size
+        processor: SpanProcessor = self.export_queue.processor(
+            BatchSpanProcessor(
+                self.export_queue.exporter(exporter),
+                max_queue_size=max_queue_size,
+                max_export_batch_size=min(512, max_queue_size),
+            )
+        )
+        if self._tail_sampling:
+            processor = TailSamplingSpanProcessor(processor, self._tail_latency_ms)
         provider.add_span_processor(processor)
 
         trace.set_tracer_provider(provider)
 
     def get_logger(self, name: str) -> logging.Logger:
+        if self._log_async:
+            logger = self._get_async_logging().attach(logging.getLogger(name))
+            logger.setLevel(self._log_level)
+            return logger
+
         if not self._telemetry_enabled:
             logger = logging.getLogger(name)
             logger.setLevel(self._log_level)
@@ -133,6 +245,37 @@ class Telemetry:
         logger.propagate = False
         return logger
 
+    @staticmethod
+    def _get_log_overflow(app_config: AppConfig) -> OverflowPolicy:
+        match app_config.get(TA_LOG_OVERFLOW.env_name) or "drop":
+            case "drop":
+                return "drop"
+            case "block":
+                return "block"
+            case overflow:
+                raise ValueError(
+                    f"Invalid {TA_LOG_OVERFLOW.env_name} {overflow!r}, expected 'drop' or 'block'"
+                )
+
+    def _get_async_logging(self) -> AsyncLogging:
+        if self._async_logging is None:
+            handler: logging.Handler
+            if self._telemetry_enabled:
+                handler = self._get_handler()
+            else:
+                handler = logging.StreamHandler()
+                if self._log_format == "json":
+                    handler.setFormatter(JsonFormatter())
+                else:
+                    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+            self._async_logging = AsyncLogging(
+                [handler],
+                queue_size=self._log_queue_size,
+                overflow=self._log_overflow,
+                rate_limit=self._log_rate_limit,
+            ).start()
+        return self._async_logging
+
     def _get_handler(self) -> LoggingHandler:
         if self._handler is None:
             self._handler = LoggingHandler()
@@ -154,24 +297,41 @@ class Telemetry:
         logger.setLevel(logging.INFO)
 
     def _enable_metrics(self) -> None:
-        exporter: MetricExporter
+        readers: list[MetricReader] = []
+        exporter: MetricExporter | None = None
         if self.metrics_endpoint:
             exporter = OTLPMetricExporter(endpoint=self.metrics_endpoint)
-        else:
+        elif not self._metrics_prometheus:
             exporter = ConsoleMetricExporter()
+        if exporter is not None:
+            readers.append(
+                PeriodicExportingMetricReader(
+                    exporter, export_interval_millis=self._metrics_export_interval_ms
+                )
+            )
+        if self._metrics_prometheus:
+            self.prometheus_reader = PrometheusMetricReader()
+            readers.append(self.prometheus_reader)
 
         meter_provider = MeterProvider(
-            metric_readers=[PeriodicExportingMetricReader(exporter, export_interval_millis=5000)],
+            metric_readers=readers,
             resource=self.resource,
             views=[
                 # Dropping all instrument names except
-                # for those starting with "semantic_kernel"
+                # for those starting with one of METRIC_INSTRUMENT_PREFIXES
                 View(instrument_name="*", aggregation=DropAggregation()),
-                View(instrument_name="semantic_kernel*"),
+                *(View(instrument_name=f"{prefix}*") for prefix in METRIC_INSTRUMENT_PREFIXES),
             ],
         )
         set_meter_provider(meter_provider)
 
+    def render_prometheus_metrics(self) -> str | None:
+        """The current metrics in the Prometheus text format, or None unless
+        ``TA_METRICS_PROMETHEUS`` is enabled."""
+        if self.prometheus_reader is None:
+            return None
+        return self.prometheus_reader.render()
+
 
 _services_telemetry: Telemetry | None = None
 
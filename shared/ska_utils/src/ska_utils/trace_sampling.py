@@ -0,0 +1,242 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from opentelemetry import metrics, trace
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    ParentBased,
+    ParentBasedTraceIdRatio,
+    Sampler,
+    SamplingResult,
+)
+from opentelemetry.trace import Link, SpanKind, StatusCode
+from opentelemetry.trace.span import TraceState
+from opentelemetry.util.types import Attributes
+
+_meter = metrics.get_meter(__name__)
+_dropped_spans_counter = _meter.create_counter(
+    "ska_utils.telemetry.dropped_spans",
+    unit="{span}",
+    description="Spans dropped because the export queue was full",
+)
+_tail_sampling_counter = _meter.create_counter(
+    "ska_utils.telemetry.tail_sampled_traces",
+    unit="{trace}",
+    description="Traces by tail sampling decision",
+)
+
+
+class RateLimitingSampler(Sampler):
+    """Samples at most ``traces_per_second`` traces per second, with bursts up to as many."""
+
+    def __init__(self, traces_per_second: float):
+        if traces_per_second < 0:
+            raise ValueError("traces_per_second must not be negative")
+        self._rate = traces_per_second
+        self._tokens = traces_per_second
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._rate, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            sampled = self._tokens >= 1
+            if sampled:
+                self._tokens -= 1
+        parent = trace.get_current_span(parent_context).get_span_context()
+        return SamplingResult(
+            Decision.RECORD_AND_SAMPLE if sampled else Decision.DROP,
+            attributes if sampled else None,
+            parent.trace_state if parent.is_valid else None,
+        )
+
+    def get_description(self) -> str:
+        return f"RateLimitingSampler{{{self._rate}}}"
+
+
+def create_sampler(name: str | None, ratio: float = 1.0, rate: float = 100.0) -> Sampler | None:
+    """The sampler configured by ``TA_TRACE_SAMPLER``, or None for the OpenTelemetry default.
+
+    Sampled parents are always followed, so traces crossing services stay complete.
+    """
+    match name:
+        case None | "":
+            return None
+        case "ratio":
+            return ParentBasedTraceIdRatio(ratio)
+        case "rate_limited":
+            return ParentBased(RateLimitingSampler(rate))
+        case _:
+            raise ValueError(f"Unknown trace sampler {name!r}")
+
+
+class BoundedExportQueue:
+    """Bounds the spans waiting to be exported and counts the ones dropped.
+
+    ``BatchSpanProcessor`` drops spans silently when its queue is full. Spans
+    pass through ``processor`` before the batch processor and are counted
+    until ``exporter`` has exported them, so once ``max_queue_size`` spans are
+    waiting further spans are dropped and counted in ``dropped_spans``.
+    """
+
+    def __init__(self, max_queue_size: int):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        self.max_queue_size = max_queue_size
+        self.dropped_spans = 0
+        self._queued = 0
+        self._lock = threading.Lock()
+
+    def processor(self, processor: SpanProcessor) -> SpanProcessor:
+        return _BoundedSpanProcessor(self, processor)
+
+    def exporter(self, exporter: SpanExporter) -> SpanExporter:
+        return _DequeuingSpanExporter(self, exporter)
+
+    def _enqueue(self) -> bool:
+        with self._lock:
+            if self._queued >= self.max_queue_size:
+                self.dropped_spans += 1
+                dropped = True
+            else:
+                self._queued += 1
+                dropped = False
+        if dropped:
+            _dropped_spans_counter.add(1)
+        return not dropped
+
+    def _dequeue(self, count: int) -> None:
+        with self._lock:
+            self._queued = max(0, self._queued - count)
+
+
+class _BoundedSpanProcessor(SpanProcessor):
+    def __init__(self, queue: BoundedExportQueue, processor: SpanProcessor):
+        self._queue = queue
+        self._processor = processor
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        self._processor.on_start(span, parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.context.trace_flags.sampled and self._queue._enqueue():
+            self._processor.on_end(span)
+
+    def shutdown(self) -> None:
+        self._processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._processor.force_flush(timeout_millis)
+
+
+class _DequeuingSpanExporter(SpanExporter):
+    def __init__(self, queue: BoundedExportQueue, exporter: SpanExporter):
+        self._queue = queue
+        self._exporter = exporter
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        try:
+            return self._exporter.export(spans)
+        finally:
+            self._queue._dequeue(len(spans))
+
+    def shutdown(self) -> None:
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Forwards only the traces with an error or a slow root span to ``processor``.
+
+    Ended spans are held per trace until the trace's local root span ends,
+    then the whole trace is kept or dropped. At most ``max_traces`` traces are
+    held; the oldest is dropped when another one starts. Spans ending after
+    their root follow the trace's decision.
+    """
+
+    def __init__(
+        self, processor: SpanProcessor, latency_threshold_ms: float, max_traces: int = 10_000
+    ):
+        self._processor = processor
+        self._latency_threshold_ns = int(latency_threshold_ms * 1_000_000)
+        self._max_traces = max_traces
+        self._pending: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        self._decisions: OrderedDict[int, bool] = OrderedDict()
+        self._lock = threading.Lock()
+        self.kept_traces = 0
+        self.dropped_traces = 0
+        self.evicted_traces = 0
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        self._processor.on_start(span, parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        is_root = span.parent is None or span.parent.is_remote
+        with self._lock:
+            decision = self._decisions.get(trace_id)
+            if decision is None:
+                if not is_root:
+                    spans = self._pending.get(trace_id)
+                    if spans is None:
+                        spans = self._pending[trace_id] = []
+                        self._evict()
+                    spans.append(span)
+                    return
+                spans = self._pending.pop(trace_id, [])
+                spans.append(span)
+                decision = self._keep(span, spans)
+                self._record(trace_id, decision)
+            elif decision:
+                spans = [span]
+            else:
+                return
+        if decision:
+            for ended in spans:
+                self._processor.on_end(ended)
+
+    def _keep(self, root: ReadableSpan, spans: list[ReadableSpan]) -> bool:
+        if any(span.status.status_code is StatusCode.ERROR for span in spans):
+            return True
+        duration = (root.end_time or 0) - (root.start_time or 0)
+        return duration >= self._latency_threshold_ns
+
+    def _record(self, trace_id: int, keep: bool) -> None:
+        self._decisions[trace_id] = keep
+        if len(self._decisions) > self._max_traces:
+            self._decisions.popitem(last=False)
+        if keep:
+            self.kept_traces += 1
+        else:
+            self.dropped_traces += 1
+        _tail_sampling_counter.add(1, {"decision": "kept" if keep else "dropped"})
+
+    def _evict(self) -> None:
+        while len(self._pending) > self._max_traces:
+            self._pending.popitem(last=False)
+            self.evicted_traces += 1
+            _tail_sampling_counter.add(1, {"decision": "evicted"})
+
+    def shutdown(self) -> None:
+        self._processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._processor.force_flush(timeout_millis)
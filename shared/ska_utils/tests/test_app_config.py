@@ -1,10 +1,13 @@
 import json
 import os
+import signal
+import threading
 from unittest.mock import patch
 
 import pytest
+from dotenv import dotenv_values
 
-from ska_utils import AppConfig, Config
+from ska_utils import AppConfig, Config, ConfigSnapshot
 
 
 def test_init_without_configs():
@@ -103,3 +106,173 @@ def test_reload_from_environment_invalid_json():
         app_config = AppConfig()
         with pytest.raises(json.JSONDecodeError):
             app_config._reload_from_environment()
+
+
+def test_snapshot_is_built_once_until_configs_change():
+    AppConfig.add_config(Config(env_name="SNAPSHOT_KEY", is_required=False, default_value="1"))
+    app_config = AppConfig()
+
+    snapshot = app_config.snapshot()
+    assert app_config.snapshot() is snapshot
+    assert snapshot.get("SNAPSHOT_KEY") == "1"
+
+    AppConfig.add_config(Config(env_name="OTHER_KEY", is_required=False, default_value="2"))
+    assert app_config.snapshot() is not snapshot
+    assert "OTHER_KEY" not in snapshot
+    assert app_config.snapshot()["OTHER_KEY"] == "2"
+
+
+def test_add_config_reads_only_the_added_key():
+    AppConfig.add_config(Config(env_name="LOADED_KEY", is_required=False, default_value="1"))
+    app_config = AppConfig()
+    snapshot = app_config.snapshot()
+
+    with (
+        patch.object(app_config, "_parse_ta_env_store") as parse_store,
+        patch("ska_utils.app_config.load_dotenv") as load,
+        patch.dict(os.environ, {"ADDED_KEY": "from-env"}),
+    ):
+        AppConfig.add_configs(
+            [
+                Config(env_name="ADDED_KEY", is_required=False, default_value="default"),
+                Config(env_name="LOADED_KEY", is_required=False, default_value="2"),
+            ]
+        )
+
+    parse_store.assert_not_called()
+    load.assert_not_called()
+    assert snapshot.get("LOADED_KEY") == "1"
+    assert app_config.snapshot().get("ADDED_KEY") == "from-env"
+    assert app_config.snapshot().get("LOADED_KEY") == "2"
+    assert app_config.get("ADDED_KEY") == "from-env"
+
+
+def test_snapshot_typed_accessors():
+    snapshot = ConfigSnapshot(
+        {"INT": "42", "FLOAT": "0.5", "BOOL": "yes", "STR": "text", "UNSET": None}
+    )
+
+    assert snapshot.get_int("INT") == 42
+    assert snapshot.get_int("INT") == 42
+    assert snapshot.get_float("FLOAT") == 0.5
+    assert snapshot.get_bool("BOOL") is True
+    assert snapshot.get_str("STR") == "text"
+    assert snapshot.get_int("UNSET") is None
+    assert snapshot.get_int("UNSET", 7) == 7
+    assert snapshot.get_bool("UNSET", False) is False
+    assert snapshot.get_str("UNSET", "default") == "default"
+    with pytest.raises(KeyError):
+        snapshot.get("MISSING")
+    with pytest.raises(ValueError):
+        snapshot.get_int("STR")
+
+
+def test_snapshot_is_immutable():
+    snapshot = ConfigSnapshot({"KEY": "value"})
+
+    with pytest.raises(AttributeError):
+        snapshot._props = {}
+    with pytest.raises(TypeError):
+        snapshot.props["KEY"] = "other"
+
+
+def test_refresh_swaps_snapshots():
+    AppConfig.add_config(Config(env_name="REFRESH_KEY", is_required=False, default_value="old"))
+    app_config = AppConfig()
+    old = app_config.snapshot()
+
+    with patch.dict(os.environ, {"TA_ENV_STORE": '{"REFRESH_KEY": "new"}'}):
+        new = app_config.refresh()
+
+    assert old.get("REFRESH_KEY") == "old"
+    assert new.get("REFRESH_KEY") == "new"
+    assert app_config.snapshot() is new
+    assert app_config.get("REFRESH_KEY") == "new"
+
+
+def test_refresh_keeps_configuration_when_a_required_key_is_missing():
+    with patch.dict(os.environ, {"REQUIRED_KEY": "set"}):
+        AppConfig.add_config(Config(env_name="REQUIRED_KEY", is_required=True, default_value=None))
+    app_config = AppConfig()
+    snapshot = app_config.snapshot()
+
+    try:
+        with pytest.raises(ValueError, match="REQUIRED_KEY"):
+            app_config.refresh()
+        assert app_config.snapshot() is snapshot
+        assert app_config.get("REQUIRED_KEY") == "set"
+    finally:
+        AppConfig.configs = [c for c in AppConfig.configs if c.env_name != "REQUIRED_KEY"]
+        app_config.refresh()
+
+
+def test_snapshots_stay_consistent_during_refresh():
+    AppConfig.add_configs(
+        [
+            Config(env_name="PAIR_A", is_required=False, default_value="0"),
+            Config(env_name="PAIR_B", is_required=False, default_value="0"),
+        ]
+    )
+    app_config = AppConfig()
+    stop = threading.Event()
+    mismatches = []
+
+    def read():
+        while not stop.is_set():
+            snapshot = app_config.snapshot()
+            if snapshot.get("PAIR_A") != snapshot.get("PAIR_B"):
+                mismatches.append(snapshot)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    with patch.dict(os.environ, {}):
+        for i in range(200):
+            os.environ["TA_ENV_STORE"] = json.dumps({"PAIR_A": str(i), "PAIR_B": str(i)})
+            app_config.refresh()
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert mismatches == []
+    assert app_config.snapshot().get("PAIR_A") == "199"
+
+
+def test_refresh_reloads_dotenv_values(tmp_path, monkeypatch):
+    dotenv_path = tmp_path / ".env"
+    dotenv_path.write_text("DOTENV_KEY=first\n")
+    monkeypatch.setattr("ska_utils.app_config.dotenv_values", lambda: dotenv_values(dotenv_path))
+    AppConfig.add_config(Config(env_name="DOTENV_KEY", is_required=False, default_value=None))
+    app_config = AppConfig()
+    monkeypatch.setattr(app_config, "_dotenv_keys", frozenset({"DOTENV_KEY"}))
+    monkeypatch.delenv("DOTENV_KEY", raising=False)
+
+    assert app_config.refresh().get("DOTENV_KEY") == "first"
+    dotenv_path.write_text("DOTENV_KEY=second\n")
+    assert app_config.refresh().get("DOTENV_KEY") == "second"
+
+
+def test_refresh_on_sighup():
+    AppConfig.add_config(Config(env_name="SIGNAL_KEY", is_required=False, default_value="old"))
+    app_config = AppConfig()
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        app_config.refresh_on_signal()
+        with patch.dict(os.environ, {"SIGNAL_KEY": "new"}):
+            os.kill(os.getpid(), signal.SIGHUP)
+            assert app_config.snapshot().get("SIGNAL_KEY") == "new"
+    finally:
+        signal.signal(signal.SIGHUP, previous)
+
+
+def test_sighup_during_refresh_is_skipped():
+    AppConfig.add_config(Config(env_name="SIGNAL_KEY", is_required=False, default_value="old"))
+    app_config = AppConfig()
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        app_config.refresh_on_signal()
+        with patch.dict(os.environ, {"SIGNAL_KEY": "new"}), app_config._refresh_lock:
+            os.kill(os.getpid(), signal.SIGHUP)
+            assert app_config.snapshot().get("SIGNAL_KEY") == "old"
+    finally:
+        signal.signal(signal.SIGHUP, previous)
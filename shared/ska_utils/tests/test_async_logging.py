@@ -0,0 +1,136 @@
+import json
+import logging
+import queue
+import threading
+
+import pytest
+
+from ska_utils import AsyncLogging, BoundedQueueHandler, JsonFormatter, RateLimitFilter
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+def _logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(f"test_async_logging.{name}")
+    logger.handlers.clear()
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_records_are_written_by_the_listener_thread():
+    recording = RecordingHandler()
+    async_logging = AsyncLogging([recording]).start()
+    logger = async_logging.attach(_logger("listener"))
+    items = ["a"]
+
+    logger.info("items %s", items)
+    items.append("b")
+    async_logging.stop()
+
+    assert [record.getMessage() for record in recording.records] == ["items ['a']"]
+    assert threading.current_thread().name not in recording.threads
+    assert logger.propagate is False
+
+
+def test_records_are_dropped_when_the_queue_is_full():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2), overflow="drop")
+    logger = _logger("drop")
+    logger.addHandler(handler)
+
+    for i in range(5):
+        logger.info("record %d", i)
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped_records == 3
+    assert handler.blocked_records == 0
+
+
+def test_blocked_records_wait_for_room():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), overflow="block", block_timeout=0.5)
+    logger = _logger("block")
+    logger.addHandler(handler)
+    logger.info("first")
+    threading.Timer(0.05, handler.queue.get).start()
+
+    logger.info("second")
+
+    assert handler.blocked_records == 1
+    assert handler.dropped_records == 0
+    assert handler.queue.get_nowait().getMessage() == "second"
+
+    handler.block_timeout = 0.01
+    logger.info("third")
+    logger.info("fourth")
+    assert handler.dropped_records == 1
+
+
+def test_invalid_overflow_policy():
+    with pytest.raises(ValueError, match="Unknown overflow policy"):
+        BoundedQueueHandler(queue.Queue(), overflow="spill")
+
+
+def test_rate_limit_applies_per_log_site():
+    recording = RecordingHandler()
+    recording.addFilter(RateLimitFilter(max_records=3, interval_seconds=60))
+    logger = _logger("rate_limit")
+    logger.addHandler(recording)
+
+    for i in range(10):
+        logger.debug("chunk %d", i)
+    for i in range(10):
+        logger.debug("tool call %d", i)
+    for i in range(5):
+        logger.info("request %d", i)
+
+    messages = [record.getMessage() for record in recording.records]
+    assert messages[:6] == [
+        "chunk 0",
+        "chunk 1",
+        "chunk 2",
+        "tool call 0",
+        "tool call 1",
+        "tool call 2",
+    ]
+    assert len(messages) == 11
+    assert recording.filters[0].suppressed_records == 14
+
+
+def test_json_formatter():
+    logger = _logger("json")
+    recording = RecordingHandler()
+    logger.addHandler(recording)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed for %s", "user", extra={"task_id": "task-1"})
+
+    entry = json.loads(JsonFormatter().format(recording.records[0]))
+
+    assert entry["level"] == "ERROR"
+    assert entry["logger"] == "test_async_logging.json"
+    assert entry["message"] == "failed for user"
+    assert entry["task_id"] == "task-1"
+    assert "ValueError: boom" in entry["exception"]
+    assert entry["timestamp"].endswith("+00:00")
+
+
+def test_stop_writes_queued_records():
+    recording = RecordingHandler()
+    async_logging = AsyncLogging([recording], queue_size=1000)
+    logger = async_logging.attach(_logger("stop"))
+    for i in range(100):
+        logger.info("record %d", i)
+
+    async_logging.start()
+    async_logging.stop()
+
+    assert len(recording.records) == 100
@@ -0,0 +1,283 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from ska_utils import (
+    AsyncRedisStreamsEventHandler,
+    AsyncRedisStreamsEventPublisher,
+    IdempotencyKeys,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+
+TOPIC = "test_topic"
+GROUP = f"{TOPIC}/consumers"
+
+
+class KeyedEvent(BaseModel):
+    key: str
+    seq: int
+
+
+class RecordingHandler(AsyncRedisStreamsEventHandler[KeyedEvent]):
+    def __init__(self, r, delay: float = 0.0, keyed: bool = False, **kwargs):
+        super().__init__(TOPIC, r, KeyedEvent, **kwargs)
+        self.delay = delay
+        self.keyed = keyed
+        self.processed: list[KeyedEvent] = []
+        self.active = 0
+        self.max_active = 0
+
+    def ordering_key(self, event: KeyedEvent) -> str | None:
+        return event.key if self.keyed else None
+
+    async def process_event(self, event: KeyedEvent) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        # Later events of a key finish sooner, so only ordering keeps them in order
+        await asyncio.sleep(self.delay / (1 + event.seq % 3))
+        self.processed.append(event)
+        self.active -= 1
+
+
+async def _publish(r, count: int, keys: int = 4) -> None:
+    for seq in range(count):
+        event = KeyedEvent(key=f"k{seq % keys}", seq=seq)
+        await r.xadd(TOPIC, {"event_data": event.model_dump_json()})
+
+
+async def _wait_for(condition, timeout: float = 5.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.005)
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis()
+
+
+@pytest.mark.asyncio
+async def test_processes_every_event_concurrently(redis):
+    await _publish(redis, 50)
+    handler = RecordingHandler(redis, delay=0.01, batch_size=10, concurrency=5, block_ms=10)
+
+    await handler.start()
+    await _wait_for(lambda: len(handler.processed) == 50)
+    await handler.stop()
+
+    assert sorted(event.seq for event in handler.processed) == list(range(50))
+    assert 1 < handler.max_active <= 5
+    assert (await redis.xpending(TOPIC, GROUP))["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_events_with_the_same_key_are_processed_in_order(redis):
+    await _publish(redis, 60)
+    handler = RecordingHandler(
+        redis, delay=0.005, keyed=True, batch_size=20, concurrency=4, block_ms=10
+    )
+
+    await handler.start()
+    await _wait_for(lambda: len(handler.processed) == 60)
+    await handler.stop()
+
+    for key in ("k0", "k1", "k2", "k3"):
+        sequence = [event.seq for event in handler.processed if event.key == key]
+        assert sequence == sorted(sequence)
+
+
+@pytest.mark.asyncio
+async def test_reading_stops_while_handlers_are_behind(redis):
+    await _publish(redis, 100)
+    release = asyncio.Event()
+    reads = 0
+
+    class BlockedHandler(RecordingHandler):
+        async def process_event(self, event):
+            await release.wait()
+            self.processed.append(event)
+
+        async def _read_batch(self):
+            nonlocal reads
+            reads += 1
+            return await super()._read_batch()
+
+    handler = BlockedHandler(redis, batch_size=5, concurrency=2, queue_size=3, block_ms=10)
+    await handler.start()
+    await asyncio.sleep(0.1)
+
+    # 2 events in the handlers, 2 x 3 queued and the rest of the batch being dispatched
+    assert reads <= 3
+    release.set()
+    await _wait_for(lambda: len(handler.processed) == 100)
+    await handler.stop()
+
+
+@pytest.mark.asyncio
+async def test_undecodable_events_are_skipped(redis):
+    await redis.xadd(TOPIC, {"event_data": "not json"})
+    await _publish(redis, 1)
+    handler = RecordingHandler(redis, block_ms=10)
+
+    await handler.start()
+    await _wait_for(lambda: len(handler.processed) == 1)
+    await handler.stop()
+
+    assert handler.processed[0].seq == 0
+
+
+@pytest.mark.asyncio
+async def test_compressed_events_are_decompressed(redis):
+    async with AsyncRedisStreamsEventPublisher(redis, compress_threshold=10) as publisher:
+        for seq in range(3):
+            await publisher.publish_event(
+                TOPIC, KeyedEvent(key="k" * 20, seq=seq).model_dump_json()
+            )
+    handler = RecordingHandler(redis, block_ms=10)
+
+    await handler.start()
+    await _wait_for(lambda: len(handler.processed) == 3)
+    await handler.stop()
+
+    assert [event.seq for event in handler.processed] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_run_returns_when_max_message_wait_is_exceeded(redis):
+    await _publish(redis, 3)
+    handler = RecordingHandler(redis, max_message_wait=0)
+
+    async with asyncio.timeout(5):
+        await handler.run()
+
+    assert len(handler.processed) == 3
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop_are_checked(redis):
+    handler = RecordingHandler(redis, block_ms=10)
+    with pytest.raises(RuntimeError, match="not started"):
+        await handler.stop()
+    await handler.start()
+    with pytest.raises(RuntimeError, match="already started"):
+        await handler.start()
+    await handler.stop()
+
+
+def test_invalid_batch_size(redis):
+    with pytest.raises(ValueError):
+        RecordingHandler(redis, batch_size=0)
+
+
+class CrashingHandler(RecordingHandler):
+    """Processes events one at a time and hangs on ``crash_at`` until it is killed."""
+
+    def __init__(self, *args, crash_at: int | None = None, at_least_once: bool = True, **kwargs):
+        super().__init__(*args, concurrency=1, at_least_once=at_least_once, **kwargs)
+        self.crash_at = crash_at
+        self.crashed = asyncio.Event()
+
+    async def process_event(self, event: KeyedEvent) -> None:
+        if event.seq == self.crash_at:
+            self.crashed.set()
+            await asyncio.Event().wait()
+        self.processed.append(event)
+
+
+async def _kill(handler: AsyncRedisStreamsEventHandler) -> None:
+    task = handler._task
+    assert task is not None
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_events_of_a_killed_consumer_are_reclaimed(redis):
+    await _publish(redis, 10)
+    crashed = CrashingHandler(redis, crash_at=3, batch_size=10, block_ms=10)
+    await crashed.start()
+    await crashed.crashed.wait()
+    await _kill(crashed)
+
+    assert [event.seq for event in crashed.processed] == [0, 1, 2]
+    assert (await redis.xpending(TOPIC, GROUP))["pending"] == 7
+
+    recovered = CrashingHandler(redis, batch_size=10, block_ms=10, claim_idle_ms=0)
+    await recovered.start()
+    await _wait_for(lambda: len(recovered.processed) == 7)
+    await recovered.stop()
+
+    assert [event.seq for event in recovered.processed] == list(range(3, 10))
+    assert (await redis.xpending(TOPIC, GROUP))["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_events_are_lost_when_acknowledged_on_read(redis):
+    await _publish(redis, 10)
+    crashed = CrashingHandler(redis, crash_at=3, at_least_once=False, batch_size=10, block_ms=10)
+    await crashed.start()
+    await crashed.crashed.wait()
+    await _kill(crashed)
+
+    assert (await redis.xpending(TOPIC, GROUP))["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failing_events_are_retried_then_dead_lettered(redis):
+    await _publish(redis, 3)
+    attempts = []
+
+    class FailingHandler(RecordingHandler):
+        async def process_event(self, event):
+            attempts.append(event.seq)
+            if event.seq == 1:
+                raise ValueError("poison")
+            self.processed.append(event)
+
+    handler = FailingHandler(
+        redis,
+        block_ms=10,
+        at_least_once=True,
+        claim_idle_ms=0,
+        claim_interval=0.01,
+        max_deliveries=3,
+    )
+    await handler.start()
+    await _wait_for(lambda: len(handler.processed) == 2)
+    await _wait_for(lambda: attempts.count(1) == 3)
+    await asyncio.sleep(0.1)
+    await handler.stop()
+
+    assert attempts.count(1) == 3
+    assert (await redis.xpending(TOPIC, GROUP))["pending"] == 0
+    [(_, fields)] = await redis.xrange(f"{TOPIC}/dead-letter")
+    assert KeyedEvent.model_validate_json(fields[b"event_data"]).seq == 1
+    assert fields[b"reason"] == b"delivered 4 times"
+
+
+@pytest.mark.asyncio
+async def test_undecodable_events_are_dead_lettered(redis):
+    await redis.xadd(TOPIC, {"event_data": "not json"})
+    handler = RecordingHandler(redis, block_ms=10, at_least_once=True)
+
+    await handler.start()
+    await asyncio.sleep(0.05)
+    await handler.stop()
+
+    [(_, fields)] = await redis.xrange(f"{TOPIC}/dead-letter")
+    assert fields[b"event_data"] == b"not json"
+    assert (await redis.xpending(TOPIC, GROUP))["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_idempotency_keys(redis):
+    keys = IdempotencyKeys(redis, "handler", ttl_seconds=60)
+
+    assert not await keys.is_processed("event-1")
+    assert await keys.mark_processed("event-1")
+    assert await keys.is_processed("event-1")
+    assert not await keys.mark_processed("event-1")
+    assert 0 < await redis.ttl("handler/processed/event-1") <= 60
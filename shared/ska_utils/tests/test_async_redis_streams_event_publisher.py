@@ -0,0 +1,122 @@
+import asyncio
+import zlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ska_utils import AsyncRedisStreamsEventPublisher, decode_event_data
+
+fakeredis = pytest.importorskip("fakeredis")
+
+TOPIC = "test_topic"
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis()
+
+
+@pytest.mark.asyncio
+async def test_events_are_written_when_the_batch_is_full(redis):
+    publisher = AsyncRedisStreamsEventPublisher(redis, batch_size=3, flush_interval=60)
+
+    await publisher.publish_event(TOPIC, "1")
+    await publisher.publish_event(TOPIC, "2")
+    assert await redis.xlen(TOPIC) == 0
+    await publisher.publish_event(TOPIC, "3")
+
+    entries = await redis.xrange(TOPIC)
+    assert [fields[b"event_data"] for _, fields in entries] == [b"1", b"2", b"3"]
+    await publisher.close()
+
+
+@pytest.mark.asyncio
+async def test_events_are_written_after_the_flush_interval(redis):
+    publisher = AsyncRedisStreamsEventPublisher(redis, batch_size=100, flush_interval=0.01)
+
+    await publisher.publish_event(TOPIC, "1")
+    await publisher.publish_event("other_topic", "2")
+    assert await redis.xlen(TOPIC) == 0
+    await asyncio.sleep(0.05)
+
+    assert await redis.xlen(TOPIC) == 1
+    assert await redis.xlen("other_topic") == 1
+
+
+@pytest.mark.asyncio
+async def test_unbatched_events_are_written_when_published(redis):
+    publisher = AsyncRedisStreamsEventPublisher(redis, batch_size=1)
+
+    await publisher.publish_event(TOPIC, "1")
+
+    assert await redis.xlen(TOPIC) == 1
+
+
+@pytest.mark.asyncio
+async def test_close_writes_buffered_events(redis):
+    async with AsyncRedisStreamsEventPublisher(redis, flush_interval=60) as publisher:
+        for i in range(10):
+            await publisher.publish_event(TOPIC, str(i))
+        assert await redis.xlen(TOPIC) == 0
+
+    assert await redis.xlen(TOPIC) == 10
+    with pytest.raises(RuntimeError, match="closed"):
+        await publisher.publish_event(TOPIC, "late")
+
+
+@pytest.mark.asyncio
+async def test_failed_writes_stay_buffered():
+    r = MagicMock()
+    pipeline = r.pipeline.return_value
+    pipeline.execute = AsyncMock(side_effect=[ConnectionError("down"), [b"1-0", b"1-1"]])
+    publisher = AsyncRedisStreamsEventPublisher(r, batch_size=10, flush_interval=60)
+    await publisher.publish_event(TOPIC, "1")
+    await publisher.publish_event(TOPIC, "2")
+
+    with pytest.raises(ConnectionError):
+        await publisher.flush()
+    await publisher.close()
+
+    assert pipeline.xadd.call_count == 4
+    assert pipeline.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_streams_are_trimmed_approximately():
+    r = MagicMock()
+    r.xadd = AsyncMock()
+    by_length = AsyncRedisStreamsEventPublisher(r, batch_size=1, max_len=1000)
+    by_age = AsyncRedisStreamsEventPublisher(r, batch_size=1, max_age_ms=60_000)
+
+    await by_length.publish_event(TOPIC, "1")
+    with patch("ska_utils.async_redis_streams_event_publisher.time.time", return_value=1000.0):
+        await by_age.publish_event(TOPIC, "2")
+
+    assert r.xadd.await_args_list[0].kwargs["maxlen"] == 1000
+    assert r.xadd.await_args_list[0].kwargs["approximate"] is True
+    assert r.xadd.await_args_list[1].kwargs["minid"] == "940000-0"
+    assert r.xadd.await_args_list[1].kwargs["approximate"] is True
+    with pytest.raises(ValueError):
+        AsyncRedisStreamsEventPublisher(r, max_len=1000, max_age_ms=60_000)
+
+
+@pytest.mark.asyncio
+async def test_large_events_are_compressed(redis):
+    publisher = AsyncRedisStreamsEventPublisher(redis, batch_size=1, compress_threshold=100)
+    large = '{"text": "' + "x" * 1000 + '"}'
+
+    await publisher.publish_event(TOPIC, "small")
+    await publisher.publish_event(TOPIC, large)
+
+    (_, small_fields), (_, large_fields) = await redis.xrange(TOPIC)
+    assert small_fields == {b"event_data": b"small"}
+    assert large_fields[b"encoding"] == b"zlib"
+    assert len(large_fields[b"event_data"]) < 100
+    assert decode_event_data(small_fields) == b"small"
+    assert decode_event_data(large_fields) == large.encode()
+
+
+def test_decode_event_data_rejects_unknown_encodings():
+    fields = {b"event_data": zlib.compress(b"data"), b"encoding": b"gzip"}
+    with pytest.raises(ValueError, match="Unsupported event encoding"):
+        decode_event_data(fields)
@@ -0,0 +1,64 @@
+import pytest
+
+
+def test_redis_streams_benchmark_processes_every_event():
+    pytest.importorskip("fakeredis")
+    from benchmarks.redis_streams_throughput import run
+
+    results = dict(run(events=50, io_ms=0, concurrency=4))
+
+    assert list(results) == [
+        "threaded",
+        "async[batch=1]",
+        "async[batch=10]",
+        "async[batch=100]",
+    ]
+    assert all(events_per_second > 0 for events_per_second in results.values())
+
+
+def test_redis_streams_publish_benchmark_publishes_every_event():
+    pytest.importorskip("fakeredis")
+    from benchmarks.redis_streams_publish import run
+
+    results = dict(run(events=100, producers=4, rtt_ms=0))
+
+    assert list(results) == ["unbatched", "batched[10]", "batched[100]"]
+    assert all(events_per_second > 0 for events_per_second in results.values())
+
+
+def test_app_config_access_benchmark():
+    from benchmarks.app_config_access import run
+
+    results = dict(run(iterations=100))
+
+    assert list(results) == [
+        "AppConfig().get",
+        "int(AppConfig().get)",
+        "snapshot.get",
+        "snapshot.get_int",
+    ]
+
+
+def test_trace_sampling_benchmark_exports_fewer_spans_when_sampling():
+    from benchmarks.trace_sampling import run
+
+    results = {name: exported for name, _, exported, _ in run(traces=50, children=1)}
+
+    assert results["always_on"] == 100
+    assert results["ratio[0.1]"] < 100
+    assert results["tail[errors,>1s]"] == 0
+
+
+def test_logging_latency_benchmark():
+    from benchmarks.logging_latency import run
+
+    results = {name: written for name, _, _, written, _ in run(0.05, 2, 0)}
+
+    assert list(results) == ["sync", "async", "async+rate_limit"]
+    assert all(written > 0 for written in results.values())
+
+
+def test_module_loading_benchmark():
+    from benchmarks.module_loading import run
+
+    assert [name for name, _ in run(iterations=5)] == ["uncached", "cached"]
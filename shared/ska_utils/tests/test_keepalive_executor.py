@@ -5,6 +5,8 @@ import pytest
 
 from ska_utils.keepalive_executor import (
     KeepaliveMessage,
+    _get_timer_wheel,
+    _TimerWheel,
     execute_with_keepalive,
 )
 
@@ -56,7 +58,9 @@ async def test_execute_with_keepalive_keepalive_exception():
         await asyncio.sleep(0.02)
         return "done"
 
-    with patch("asyncio.Queue.put_nowait", side_effect=RuntimeError("keepalive fail")):
+    with patch(
+        "ska_utils.keepalive_executor.KeepaliveMessage", side_effect=RuntimeError("keepalive fail")
+    ):
         gen = execute_with_keepalive(
             task(),
             keepalive_interval_seconds=0.005,  # keepalive fires quickly
@@ -100,3 +104,170 @@ async def test_execute_with_keepalive_cancel_keepalive():
         async for value in gen:
             results.append(value)
         assert results[-1] == "done"
+
+
+class FakeClockLoop:
+    """The running loop's futures with a clock and timers advanced by the test."""
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self.now = 0.0
+        self.timers: list[asyncio.TimerHandle] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def create_future(self) -> asyncio.Future:
+        return self._loop.create_future()
+
+    def call_at(self, when, callback, *args) -> asyncio.TimerHandle:
+        handle = asyncio.TimerHandle(when, callback, args, self._loop)
+        self.timers.append(handle)
+        return handle
+
+    def scheduled(self) -> list[float]:
+        return [handle.when() for handle in self.timers if not handle.cancelled()]
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+        for handle in list(self.timers):
+            if not handle.cancelled() and handle.when() <= self.now:
+                self.timers.remove(handle)
+                handle._run()
+
+
+class ManualTimers:
+    """Stands in for the timer wheel, the test completes the keepalive timers."""
+
+    def __init__(self):
+        self.timers: list[asyncio.Future[None]] = []
+
+    def sleep(self, delay: float) -> asyncio.Future[None]:
+        self.timers.append(asyncio.get_running_loop().create_future())
+        return self.timers[-1]
+
+    def fire(self) -> None:
+        self.timers[-1].set_result(None)
+
+
+@pytest.fixture
+def manual_timers():
+    timers = ManualTimers()
+    with patch("ska_utils.keepalive_executor._get_timer_wheel", return_value=timers):
+        yield timers
+
+
+@pytest.mark.asyncio
+async def test_result_is_yielded_as_soon_as_the_task_completes(manual_timers):
+    done = asyncio.Event()
+
+    async def task():
+        await done.wait()
+        return "done"
+
+    gen = execute_with_keepalive(task(), keepalive_interval_seconds=30.0)
+    next_value = asyncio.ensure_future(gen.__anext__())
+    await asyncio.sleep(0)
+    [timer] = manual_timers.timers
+    assert not next_value.done()
+
+    done.set()
+
+    assert await next_value == "done"
+    # The keepalive timer never fired, it was cancelled with the result
+    assert timer.cancelled()
+    with pytest.raises(StopAsyncIteration):
+        await gen.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_keepalives_are_sent_after_idle_intervals(manual_timers):
+    done = asyncio.Event()
+
+    async def task():
+        await done.wait()
+        return "done"
+
+    gen = execute_with_keepalive(task(), keepalive_interval_seconds=0.05)
+    results = []
+    for _ in range(3):
+        next_value = asyncio.ensure_future(gen.__anext__())
+        await asyncio.sleep(0)
+        assert not next_value.done()
+        manual_timers.fire()
+        results.append(await next_value)
+    next_value = asyncio.ensure_future(gen.__anext__())
+    await asyncio.sleep(0)
+    done.set()
+    results.append(await next_value)
+
+    assert results == [KeepaliveMessage()] * 3 + ["done"]
+    # One timer per idle interval, each started once the previous message was sent
+    assert len(manual_timers.timers) == 4
+    assert [t.cancelled() for t in manual_timers.timers] == [False] * 3 + [True]
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_schedules_only_the_earliest_slot():
+    loop = FakeClockLoop()
+    wheel = _TimerWheel(loop)
+
+    first = wheel.sleep(1.0)
+    second = wheel.sleep(1.0)
+    assert len(wheel._slots) == 1
+    assert loop.scheduled() == [1.0]
+
+    earlier = wheel.sleep(0.5)
+    assert len(wheel) == 3
+    assert loop.scheduled() == [0.5]
+
+    loop.advance(0.5)
+    assert earlier.done()
+    assert not first.done() and not second.done()
+    assert loop.scheduled() == [1.0]
+
+    loop.advance(0.5)
+    assert first.done() and second.done()
+    assert loop.scheduled() == []
+    assert len(wheel) == 0
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_rounds_deadlines_up_to_shared_slots():
+    loop = FakeClockLoop()
+    wheel = _TimerWheel(loop)
+
+    loop.now = 0.01
+    wheel.sleep(30.0)
+    loop.now = 0.09
+    wheel.sleep(30.0)
+    loop.now = 0.15
+    wheel.sleep(30.0)
+
+    # The resolution of a 30s delay is 100ms: the first two share a slot
+    assert [len(waiters) for waiters in wheel._slots.values()] == [2, 1]
+    assert loop.scheduled() == [pytest.approx(30.1)]
+
+
+@pytest.mark.asyncio
+async def test_streams_share_one_timer_wheel():
+    release = asyncio.Event()
+
+    async def task(i: int):
+        await release.wait()
+        return i
+
+    async def stream(i: int):
+        return [value async for value in execute_with_keepalive(task(i), 30.0)]
+
+    streams = [asyncio.create_task(stream(i)) for i in range(100)]
+    await asyncio.sleep(0)
+    wheel = _get_timer_wheel()
+    assert len(wheel) == 100
+    assert len(wheel._slots) <= 2
+
+    release.set()
+    results = await asyncio.gather(*streams)
+
+    assert results == [[i] for i in range(100)]
+    assert len(wheel) == 0
@@ -0,0 +1,218 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from ska_utils import (
+    LLM_LATENCY_BUCKETS,
+    REQUEST_LATENCY_BUCKETS,
+    PrometheusMetricReader,
+    ServiceMetrics,
+    create_counter,
+    create_histogram,
+    create_up_down_counter,
+    get_service_metrics,
+    record_request_from_scope,
+)
+
+
+@pytest.fixture
+def reader():
+    return InMemoryMetricReader()
+
+
+@pytest.fixture
+def meter_provider(reader):
+    provider = MeterProvider(metric_readers=[reader])
+    yield provider
+    provider.shutdown()
+
+
+@pytest.fixture
+def service_metrics(meter_provider):
+    return ServiceMetrics(meter_provider=meter_provider)
+
+
+def _metrics(reader):
+    data = reader.get_metrics_data()
+    return {
+        metric.name: metric
+        for resource_metrics in data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+def _points(reader, name):
+    return {
+        tuple(sorted(point.attributes.items())): point
+        for point in _metrics(reader)[name].data.data_points
+    }
+
+
+def test_create_instruments(reader, meter_provider):
+    meter = meter_provider.get_meter("test")
+    create_counter("test.counter", unit="{call}", meter=meter).add(2)
+    create_up_down_counter("test.gauge", meter=meter).add(-1)
+    create_histogram("test.latency", meter=meter).record(3.0)
+
+    metrics = _metrics(reader)
+
+    assert metrics["test.counter"].unit == "{call}"
+    assert metrics["test.counter"].data.data_points[0].value == 2
+    assert metrics["test.gauge"].data.data_points[0].value == -1
+    histogram = metrics["test.latency"].data.data_points[0]
+    assert histogram.explicit_bounds == LLM_LATENCY_BUCKETS
+    assert histogram.bucket_counts[LLM_LATENCY_BUCKETS.index(4.0)] == 1
+
+
+def test_record_request(reader, service_metrics):
+    service_metrics.record_request("POST", "/agent/1.0", 200, 0.2)
+    service_metrics.record_request("POST", "/agent/1.0", 200, 0.3)
+    service_metrics.record_request("POST", "/agent/1.0", 500, 0.1)
+
+    requests = _points(reader, "tealagents.requests")
+    ok = (("method", "POST"), ("route", "/agent/1.0"), ("status_code", 200))
+    error = (("method", "POST"), ("route", "/agent/1.0"), ("status_code", 500))
+    assert requests[ok].value == 2
+    assert requests[error].value == 1
+    duration = _points(reader, "tealagents.request.duration")[ok]
+    assert duration.explicit_bounds == REQUEST_LATENCY_BUCKETS
+    assert duration.count == 2
+    assert duration.sum == pytest.approx(0.5)
+
+
+def test_record_request_from_scope_uses_the_route_template(mocker, reader, service_metrics):
+    mocker.patch("ska_utils.metrics.get_service_metrics", return_value=service_metrics)
+    matched = SimpleNamespace(method="GET", scope={"route": SimpleNamespace(path="/items/{id}")})
+    unmatched = SimpleNamespace(method="GET", scope={})
+
+    record_request_from_scope(matched, SimpleNamespace(status_code=200), time.perf_counter())
+    record_request_from_scope(unmatched, SimpleNamespace(status_code=404), time.perf_counter())
+
+    requests = _points(reader, "tealagents.requests")
+    assert requests[(("method", "GET"), ("route", "/items/{id}"), ("status_code", 200))].value == 1
+    assert requests[(("method", "GET"), ("route", "unmatched"), ("status_code", 404))].value == 1
+
+
+def test_record_tokens(reader, service_metrics):
+    service_metrics.record_tokens("gpt-4o", prompt_tokens=100, completion_tokens=20)
+    service_metrics.record_tokens("gpt-4o", prompt_tokens=50, completion_tokens=10)
+
+    tokens = _points(reader, "tealagents.tokens")
+    assert tokens[(("model", "gpt-4o"), ("token_type", "prompt"))].value == 150
+    assert tokens[(("model", "gpt-4o"), ("token_type", "completion"))].value == 30
+
+
+def test_record_token_budget_limit(reader, service_metrics):
+    service_metrics.record_token_budget_limit("soft_limit")
+    service_metrics.record_token_budget_limit("hard_limit")
+    service_metrics.record_token_budget_limit("hard_limit")
+
+    limits = _points(reader, "tealagents.token_budget.limits")
+    assert limits[(("limit", "soft_limit"),)].value == 1
+    assert limits[(("limit", "hard_limit"),)].value == 2
+
+
+def test_track_llm_call(reader, service_metrics):
+    with service_metrics.track_llm_call("gpt-4o"):
+        pass
+
+    duration = _points(reader, "tealagents.llm.duration")[(("model", "gpt-4o"),)]
+    assert duration.count == 1
+    assert duration.explicit_bounds == LLM_LATENCY_BUCKETS
+
+
+def test_track_tool_call(reader, service_metrics):
+    with service_metrics.track_tool_call("search"):
+        pass
+    with pytest.raises(RuntimeError), service_metrics.track_tool_call("search"):
+        raise RuntimeError("failed")
+
+    calls = _points(reader, "tealagents.tool_calls")
+    assert calls[(("outcome", "success"), ("tool", "search"))].value == 1
+    assert calls[(("outcome", "error"), ("tool", "search"))].value == 1
+    durations = _points(reader, "tealagents.tool_call.duration")
+    assert durations[(("outcome", "success"), ("tool", "search"))].count == 1
+
+
+def test_track_stream(reader, service_metrics):
+    with service_metrics.track_stream("sse"):
+        with service_metrics.track_stream("sse"):
+            assert _points(reader, "tealagents.streams.active")[(("kind", "sse"),)].value == 2
+        assert _points(reader, "tealagents.streams.active")[(("kind", "sse"),)].value == 1
+    with pytest.raises(RuntimeError), service_metrics.track_stream("sse"):
+        raise RuntimeError("disconnected")
+
+    assert _points(reader, "tealagents.streams.active")[(("kind", "sse"),)].value == 0
+
+
+def test_get_service_metrics():
+    assert get_service_metrics() is get_service_metrics()
+
+
+@pytest.fixture
+def prometheus_reader():
+    return PrometheusMetricReader()
+
+
+@pytest.fixture
+def prometheus_metrics(prometheus_reader):
+    provider = MeterProvider(metric_readers=[prometheus_reader])
+    yield ServiceMetrics(meter_provider=provider)
+    provider.shutdown()
+
+
+def test_prometheus_render_empty(prometheus_reader, prometheus_metrics):
+    assert prometheus_reader.render() == ""
+
+
+def test_prometheus_render(prometheus_reader, prometheus_metrics):
+    prometheus_metrics.record_request("GET", "/items", 200, 0.02)
+    prometheus_metrics.record_request("GET", "/items", 200, 0.2)
+    with prometheus_metrics.track_stream("websocket"):
+        pass
+
+    lines = prometheus_reader.render().splitlines()
+
+    labels = 'method="GET",route="/items",status_code="200"'
+    assert "# TYPE tealagents_requests_total counter" in lines
+    assert f"tealagents_requests_total{{{labels}}} 2" in lines
+    assert "# TYPE tealagents_request_duration_seconds histogram" in lines
+    assert f'tealagents_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in lines
+    assert f'tealagents_request_duration_seconds_bucket{{{labels},le="0.25"}} 2' in lines
+    assert f'tealagents_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"tealagents_request_duration_seconds_count{{{labels}}} 2" in lines
+    assert any(
+        line.startswith(f"tealagents_request_duration_seconds_sum{{{labels}}} 0.22")
+        for line in lines
+    )
+    assert "# TYPE tealagents_streams_active gauge" in lines
+    assert 'tealagents_streams_active{kind="websocket"} 0' in lines
+
+
+def test_prometheus_render_escapes_labels(prometheus_reader, prometheus_metrics):
+    prometheus_metrics.record_tokens('model "a"\\b\n', prompt_tokens=1, completion_tokens=0)
+
+    text = prometheus_reader.render()
+
+    assert 'model="model \\"a\\"\\\\b\\n"' in text
+
+
+def test_prometheus_render_concurrently(prometheus_reader, prometheus_metrics):
+    def record():
+        for _ in range(100):
+            prometheus_metrics.record_tokens("gpt-4o", prompt_tokens=1, completion_tokens=1)
+            prometheus_reader.render()
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    text = prometheus_reader.render()
+    assert 'tealagents_tokens_total{model="gpt-4o",token_type="prompt"} 400' in text
@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -52,3 +54,90 @@ def test_load_module_loader_is_none():
             ImportError, match="Module spec.loader is None. Unable to load the module."
         ):
             ModuleLoader.load_module("/path/to/module.py")
+
+
+@pytest.fixture
+def module_file(tmp_path):
+    ModuleLoader.clear_cache()
+    side_effects = tmp_path / "side_effects.txt"
+    path = tmp_path / "custom_module.py"
+    path.write_text(
+        "import time\n"
+        f"with open({str(side_effects)!r}, 'a') as f:\n"
+        "    f.write('loaded\\n')\n"
+        "time.sleep(0.05)\n"
+        "VALUE = 1\n"
+    )
+    yield path, side_effects
+    ModuleLoader.clear_cache()
+
+
+def test_load_module_runs_module_code_once(module_file):
+    path, side_effects = module_file
+
+    first = ModuleLoader.load_module(str(path))
+    second = ModuleLoader.load_module(str(path))
+
+    assert first is second
+    assert first.VALUE == 1
+    assert side_effects.read_text() == "loaded\n"
+
+
+def test_concurrent_loads_run_module_code_once(module_file):
+    path, side_effects = module_file
+    barrier = threading.Barrier(100)
+
+    def load():
+        barrier.wait()
+        return ModuleLoader.load_module(str(path))
+
+    with ThreadPoolExecutor(max_workers=100) as executor:
+        modules = list(executor.map(lambda _: load(), range(100)))
+
+    assert all(module is modules[0] for module in modules)
+    assert side_effects.read_text() == "loaded\n"
+
+
+def test_changed_module_is_loaded_again(module_file):
+    path, side_effects = module_file
+    first = ModuleLoader.load_module(str(path))
+
+    path.write_text(path.read_text().replace("VALUE = 1", "VALUE = 2"))
+    second = ModuleLoader.load_module(str(path))
+
+    assert second is not first
+    assert second.VALUE == 2
+    assert side_effects.read_text() == "loaded\nloaded\n"
+
+
+def test_changed_module_replaces_the_previous_version(module_file):
+    path, _ = module_file
+    ModuleLoader.load_module(str(path))
+
+    path.write_text(path.read_text().replace("VALUE = 1", "VALUE = 2"))
+    second = ModuleLoader.load_module(str(path))
+
+    assert list(ModuleLoader._modules.values()) == [second]
+    assert list(ModuleLoader._locks) == list(ModuleLoader._modules)
+
+
+def test_reload_module(module_file):
+    path, side_effects = module_file
+    first = ModuleLoader.load_module(str(path))
+
+    reloaded = ModuleLoader.reload_module(str(path))
+
+    assert reloaded is not first
+    assert ModuleLoader.load_module(str(path)) is reloaded
+    assert side_effects.read_text() == "loaded\nloaded\n"
+
+
+def test_failed_load_is_not_cached(tmp_path):
+    ModuleLoader.clear_cache()
+    path = tmp_path / "broken_module.py"
+    path.write_text("raise RuntimeError('broken')\n")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="broken"):
+            ModuleLoader.load_module(str(path))
+    assert ModuleLoader._modules == {}
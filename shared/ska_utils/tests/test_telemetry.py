@@ -2,9 +2,20 @@ import logging
 from unittest.mock import MagicMock, patch
 
 import pytest
+from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
 from opentelemetry.trace import Tracer
 
-from ska_utils import AppConfig, Telemetry, get_telemetry, initialize_telemetry
+from ska_utils import (
+    AppConfig,
+    BoundedQueueHandler,
+    JsonFormatter,
+    RateLimitFilter,
+    ServiceMetrics,
+    TailSamplingSpanProcessor,
+    Telemetry,
+    get_telemetry,
+    initialize_telemetry,
+)
 
 
 @pytest.fixture
@@ -147,6 +158,37 @@ def test_enable_tracing_without_endpoint(app_config):
         mock_set_tracer_provider.assert_called_once()
 
 
+def test_enable_tracing_with_sampling(app_config):
+    app_config.get.side_effect = {
+        "TA_TELEMETRY_ENABLED": "true",
+        "TA_METRICS_ENABLED": "false",
+        "TA_LOGGING_ENABLED": "false",
+        "TA_OTEL_ENDPOINT": "http://localhost:4317",
+        "TA_LOG_LEVEL": "info",
+        "TA_TRACE_SAMPLER": "ratio",
+        "TA_TRACE_SAMPLER_RATIO": "0.1",
+        "TA_TRACE_TAIL_SAMPLING": "true",
+        "TA_TRACE_TAIL_LATENCY_MS": "250",
+        "TA_TRACE_EXPORT_QUEUE_SIZE": "100",
+    }.get
+    telemetry = Telemetry("test_service", app_config)
+    with (
+        patch("ska_utils.telemetry.OTLPSpanExporter"),
+        patch("ska_utils.telemetry.TracerProvider") as mock_tracer_provider,
+        patch("ska_utils.telemetry.BatchSpanProcessor") as mock_batch_processor,
+        patch("opentelemetry.trace.set_tracer_provider"),
+    ):
+        telemetry._enable_tracing()
+        sampler = mock_tracer_provider.call_args.kwargs["sampler"]
+        assert isinstance(sampler, ParentBasedTraceIdRatio)
+        assert mock_batch_processor.call_args.kwargs["max_queue_size"] == 100
+        assert mock_batch_processor.call_args.kwargs["max_export_batch_size"] == 100
+        [processor] = mock_tracer_provider.return_value.add_span_processor.call_args.args
+        assert isinstance(processor, TailSamplingSpanProcessor)
+        assert processor._latency_threshold_ns == 250_000_000
+    assert telemetry.export_queue.max_queue_size == 100
+
+
 def test_get_logger(app_config):
     telemetry = Telemetry("test_service", app_config)
     logger = telemetry.get_logger("test-logger")
@@ -166,6 +208,50 @@ def test_get_logger_telemetry_disabled(app_config):
     assert isinstance(logger, logging.Logger)
 
 
+def test_get_logger_async(app_config):
+    app_config.get.side_effect = {
+        "TA_TELEMETRY_ENABLED": "false",
+        "TA_METRICS_ENABLED": "false",
+        "TA_LOGGING_ENABLED": "false",
+        "TA_LOG_LEVEL": "debug",
+        "TA_LOG_ASYNC": "true",
+        "TA_LOG_QUEUE_SIZE": "100",
+        "TA_LOG_OVERFLOW": "block",
+        "TA_LOG_FORMAT": "json",
+        "TA_LOG_RATE_LIMIT": "5",
+    }.get
+    telemetry = Telemetry("test_service", app_config)
+
+    logger = telemetry.get_logger("test-async-logger")
+    other = telemetry.get_logger("test-async-logger-2")
+    try:
+        [handler] = logger.handlers
+        assert isinstance(handler, BoundedQueueHandler)
+        assert other.handlers == [handler]
+        assert handler.overflow == "block"
+        assert handler.queue.maxsize == 100
+        assert isinstance(handler.filters[0], RateLimitFilter)
+        assert logger.propagate is False
+        assert logger.level == logging.DEBUG
+        [stream_handler] = telemetry._async_logging.listener.handlers
+        assert isinstance(stream_handler.formatter, JsonFormatter)
+    finally:
+        telemetry._async_logging.stop()
+        logger.handlers.clear()
+        other.handlers.clear()
+
+
+def test_invalid_log_overflow(app_config):
+    app_config.get.side_effect = {
+        "TA_TELEMETRY_ENABLED": "false",
+        "TA_METRICS_ENABLED": "false",
+        "TA_LOGGING_ENABLED": "false",
+        "TA_LOG_OVERFLOW": "spill",
+    }.get
+    with pytest.raises(ValueError, match="Invalid TA_LOG_OVERFLOW 'spill'"):
+        Telemetry("test_service", app_config)
+
+
 def test_enable_metrics(app_config):
     telemetry = Telemetry("test_service", app_config)
     with (
@@ -190,3 +276,70 @@ def test_initialize_telemetry(app_config):
     initialize_telemetry("test_service", app_config)
     telemetry = get_telemetry()
     assert telemetry.service_name == "test_service"
+
+
+def test_enable_metrics_prometheus(app_config):
+    app_config.get.side_effect = {
+        "TA_TELEMETRY_ENABLED": "true",
+        "TA_METRICS_ENABLED": "true",
+        "TA_METRICS_PROMETHEUS": "true",
+        "TA_LOGGING_ENABLED": "false",
+        "TA_LOG_LEVEL": "info",
+    }.get
+    with (
+        patch("ska_utils.telemetry.ConsoleMetricExporter") as mock_console_exporter,
+        patch("ska_utils.telemetry.set_meter_provider") as mock_set_meter_provider,
+        patch("ska_utils.telemetry.TracerProvider"),
+        patch("opentelemetry.trace.set_tracer_provider"),
+    ):
+        telemetry = Telemetry("test_service", app_config)
+    mock_console_exporter.assert_not_called()
+    assert telemetry.prometheus_reader is not None
+    meter_provider = mock_set_meter_provider.call_args.args[0]
+    service_metrics = ServiceMetrics(meter_provider=meter_provider)
+    service_metrics.record_request("GET", "/health", 200, 0.01)
+    meter_provider.get_meter("other").create_counter("http.server.requests").add(1)
+
+    text = telemetry.render_prometheus_metrics()
+
+    assert 'tealagents_requests_total{method="GET",route="/health",status_code="200"} 1' in text
+    assert "http_server_requests" not in text
+    meter_provider.shutdown()
+
+
+@pytest.mark.parametrize(
+    "instrument",
+    [
+        "tealagents.token_budget.limits",
+        "tealagents.prompt_prefix.requests",
+        "a2a.response_classifications",
+        "ska_utils.telemetry.dropped_spans",
+    ],
+)
+def test_enable_metrics_exports_the_counters_of_the_services(app_config, instrument):
+    app_config.get.side_effect = {
+        "TA_TELEMETRY_ENABLED": "true",
+        "TA_METRICS_ENABLED": "true",
+        "TA_METRICS_PROMETHEUS": "true",
+        "TA_LOGGING_ENABLED": "false",
+        "TA_LOG_LEVEL": "info",
+    }.get
+    with (
+        patch("ska_utils.telemetry.set_meter_provider") as mock_set_meter_provider,
+        patch("ska_utils.telemetry.TracerProvider"),
+        patch("opentelemetry.trace.set_tracer_provider"),
+    ):
+        telemetry = Telemetry("test_service", app_config)
+    meter_provider = mock_set_meter_provider.call_args.args[0]
+    meter_provider.get_meter("service").create_counter(instrument).add(1)
+
+    text = telemetry.render_prometheus_metrics()
+
+    assert f"{instrument.replace('.', '_')}_total 1" in text
+    meter_provider.shutdown()
+
+
+def test_render_prometheus_metrics_disabled(app_config):
+    telemetry = Telemetry("test_service", app_config)
+    assert telemetry.prometheus_reader is None
+    assert telemetry.render_prometheus_metrics() is None
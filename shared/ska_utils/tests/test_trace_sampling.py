@@ -0,0 +1,129 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, ParentBasedTraceIdRatio
+from opentelemetry.trace import Status, StatusCode
+
+from ska_utils import BoundedExportQueue, RateLimitingSampler, TailSamplingSpanProcessor
+from ska_utils.trace_sampling import create_sampler
+
+
+def _tracer(processor, sampler=None) -> trace.Tracer:
+    provider = TracerProvider(sampler=sampler) if sampler else TracerProvider()
+    provider.add_span_processor(processor)
+    return provider.get_tracer(__name__)
+
+
+def test_create_sampler():
+    assert create_sampler(None) is None
+    assert isinstance(create_sampler("ratio", ratio=0.1), ParentBasedTraceIdRatio)
+    sampler = create_sampler("rate_limited", rate=5)
+    assert isinstance(sampler, ParentBased)
+    assert "RateLimitingSampler{5}" in sampler.get_description()
+    with pytest.raises(ValueError, match="Unknown trace sampler"):
+        create_sampler("sometimes")
+
+
+def test_ratio_sampler_follows_the_parent():
+    exporter = InMemorySpanExporter()
+    tracer = _tracer(SimpleSpanProcessor(exporter), create_sampler("ratio", ratio=0.25))
+
+    for _ in range(400):
+        with tracer.start_as_current_span("root"):
+            with tracer.start_as_current_span("child"):
+                pass
+
+    spans = exporter.get_finished_spans()
+    roots = [span for span in spans if span.parent is None]
+    assert 50 < len(roots) < 150
+    # Children of sampled roots are always sampled, the others never
+    assert len(spans) == 2 * len(roots)
+
+
+def test_rate_limiting_sampler():
+    sampler = RateLimitingSampler(10)
+    decisions = [sampler.should_sample(None, i, "span").decision.is_sampled() for i in range(50)]
+    assert decisions.count(True) == 10
+
+    with patch("ska_utils.trace_sampling.time.monotonic", return_value=time.monotonic() + 0.5):
+        decisions = [
+            sampler.should_sample(None, i, "span").decision.is_sampled() for i in range(50)
+        ]
+    assert decisions.count(True) == 5
+
+
+def test_tail_sampling_keeps_error_and_slow_traces():
+    exporter = InMemorySpanExporter()
+    processor = TailSamplingSpanProcessor(SimpleSpanProcessor(exporter), latency_threshold_ms=20)
+    tracer = _tracer(processor)
+
+    with tracer.start_as_current_span("fast"):
+        with tracer.start_as_current_span("fast-child"):
+            pass
+    with tracer.start_as_current_span("failed"):
+        with tracer.start_as_current_span("failed-child") as child:
+            child.set_status(Status(StatusCode.ERROR))
+    with pytest.raises(ValueError):
+        with tracer.start_as_current_span("raised"):
+            raise ValueError("boom")
+    with tracer.start_as_current_span("slow"):
+        time.sleep(0.03)
+
+    names = sorted(span.name for span in exporter.get_finished_spans())
+    assert names == ["failed", "failed-child", "raised", "slow"]
+    assert (processor.kept_traces, processor.dropped_traces) == (3, 1)
+
+
+def test_tail_sampling_spans_ending_after_their_root_follow_the_decision():
+    exporter = InMemorySpanExporter()
+    tracer = _tracer(TailSamplingSpanProcessor(SimpleSpanProcessor(exporter), 0))
+
+    root = tracer.start_span("root")
+    child = tracer.start_span("late-child", context=trace.set_span_in_context(root))
+    root.end()
+    child.end()
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["root", "late-child"]
+
+
+def test_tail_sampling_holds_a_bounded_number_of_traces():
+    exporter = InMemorySpanExporter()
+    processor = TailSamplingSpanProcessor(SimpleSpanProcessor(exporter), 0, max_traces=2)
+    tracer = _tracer(processor)
+
+    roots = [tracer.start_span(f"root-{i}") for i in range(3)]
+    for i, root in enumerate(roots):
+        tracer.start_span(f"child-{i}", context=trace.set_span_in_context(root)).end()
+    for root in roots:
+        root.end()
+
+    assert processor.evicted_traces == 1
+    names = sorted(span.name for span in exporter.get_finished_spans())
+    assert names == ["child-1", "child-2", "root-0", "root-1", "root-2"]
+
+
+def test_bounded_export_queue_counts_dropped_spans():
+    queue = BoundedExportQueue(max_queue_size=5)
+    pending = []
+
+    class DeferredProcessor(SimpleSpanProcessor):
+        def on_end(self, span):
+            pending.append(span)
+
+    exporter = queue.exporter(InMemorySpanExporter())
+    tracer = _tracer(queue.processor(DeferredProcessor(exporter)))
+    for i in range(8):
+        tracer.start_span(f"span-{i}").end()
+
+    assert len(pending) == 5
+    assert queue.dropped_spans == 3
+
+    exporter.export(pending)
+    tracer.start_span("after-export").end()
+    assert len(pending) == 6
+    assert queue.dropped_spans == 3
@@ -4,11 +4,11 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncIterable
 
 import requests
-import websockets
 from opentelemetry.propagate import inject
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from ska_utils import strtobool
 
+from connection_pool import WebSocketConnectionPool
 from model import Conversation
 
 logger = logging.getLogger(__name__)
@@ -86,11 +86,31 @@ class BaseAgent(ABC, BaseModel):
     endpoint: str
     endpoint_api: str
     api_key: str
+    max_idle_connections: int = 4
+    idle_timeout: float = 60.0
+
+    _connection_pool: WebSocketConnectionPool | None = PrivateAttr(default=None)
 
     @abstractmethod
     def get_invoke_input(self, agent_input: AgentInput) -> str:
         pass
 
+    @property
+    def connection_pool(self) -> WebSocketConnectionPool:
+        """The agent's WebSocket connections, kept open between turns."""
+        if self._connection_pool is None:
+            self._connection_pool = WebSocketConnectionPool(
+                self.endpoint,
+                max_idle=self.max_idle_connections,
+                idle_timeout=self.idle_timeout,
+            )
+        return self._connection_pool
+
+    async def close(self) -> None:
+        """Close the connections kept open between turns."""
+        if self._connection_pool is not None:
+            await self._connection_pool.close()
+
     async def invoke_stream(
         self, conv: Conversation, authorization: str | None = None
     ) -> AsyncIterable[str]:
@@ -101,11 +121,13 @@ class BaseAgent(ABC, BaseModel):
             "taAgwKey": self.api_key,
             "Authorization": authorization,
         }
-        inject(headers)
-        async with websockets.connect(self.endpoint, additional_headers=headers) as ws:
-            await ws.send(input_message)
-            async for message in ws:
-                yield message
+        # Sent with each turn, as a pooled connection was opened for an earlier one
+        trace_headers: dict[str, str] = {}
+        inject(trace_headers)
+        async for message in self.connection_pool.invoke_stream(
+            input_message, headers, trace_headers
+        ):
+            yield message
 
     # Origianl
     def invoke_api(
@@ -219,9 +241,17 @@ class OpenApiResponse(BaseModel):
 
 
 class AgentBuilder:
-    def __init__(self, agpt_gw_host: str, agpt_gw_secure: str):
+    def __init__(
+        self,
+        agpt_gw_host: str,
+        agpt_gw_secure: str,
+        max_idle_connections: int = 4,
+        idle_timeout: float = 60.0,
+    ):
         self.agpt_gw_host = agpt_gw_host
         self.agpt_gw_secure = strtobool(agpt_gw_secure)
+        self.max_idle_connections = max_idle_connections
+        self.idle_timeout = idle_timeout
 
     def _http_or_https(self) -> str:
         return "https" if self.agpt_gw_secure else "http"
@@ -287,6 +317,8 @@ class AgentBuilder:
             endpoint=f"{self._ws_or_wss()}://{self.agpt_gw_host}/{agent_path}/stream",
             endpoint_api=f"{self._http_or_https()}://{self.agpt_gw_host}/{agent_path}",
             api_key=api_key,
+            max_idle_connections=self.max_idle_connections,
+            idle_timeout=self.idle_timeout,
         )
 
     def build_fallback_agent(
@@ -308,6 +340,8 @@ class AgentBuilder:
             endpoint_api=f"{self._http_or_https()}://{self.agpt_gw_host}/{agent_path}",
             api_key=api_key,
             agent_catalog=agent_catalog,
+            max_idle_connections=self.max_idle_connections,
+            idle_timeout=self.idle_timeout,
         )
 
     def build_recipient_chooser_agent(
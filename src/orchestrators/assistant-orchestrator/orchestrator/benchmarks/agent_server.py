@@ -0,0 +1,97 @@
+"""A local agent streaming endpoint, for the connection pool's tests and benchmark.
+
+``AgentServer`` answers each input with the messages in ``chunks``, like the
+``/stream`` route of an agent. With ``persistent`` it accepts
+``STREAM_SUBPROTOCOL`` and serves any number of invocations per connection,
+otherwise it closes the connection after each response. ``handshake_delay``
+seconds are spent on each opening handshake, a stand-in for TLS and a
+gateway between the orchestrator and the agent. While ``failing`` is set,
+it closes the connection with an internal error instead of answering, as an
+agent whose handler raised does.
+"""
+
+import asyncio
+import json
+from collections.abc import Sequence
+
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.frames import CloseCode
+from websockets.http11 import Request
+
+from connection_pool import STREAM_SUBPROTOCOL
+
+
+class AgentServer:
+    def __init__(
+        self,
+        persistent: bool = True,
+        chunks: Sequence[str] = ("Hello", " world"),
+        handshake_delay: float = 0.0,
+    ):
+        self.persistent = persistent
+        self.chunks = chunks
+        self.handshake_delay = handshake_delay
+        self.url = ""
+        self.failing = False
+        self.connections = 0
+        self.inputs: list[str] = []
+        self.handshake_headers: list[dict[str, str]] = []
+        self.trace_headers: list[dict[str, str]] = []
+        self._server: Server | None = None
+        self._stalled: list[ServerConnection] = []
+
+    async def __aenter__(self) -> "AgentServer":
+        self._server = await serve(
+            self._handle,
+            "127.0.0.1",
+            0,
+            subprotocols=[STREAM_SUBPROTOCOL] if self.persistent else None,
+            process_request=self._process_request,
+        )
+        host, port = self._server.sockets[0].getsockname()[:2]
+        self.url = f"ws://{host}:{port}/stream"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._server is not None:
+            # Stalled connections would not see the close frames otherwise
+            for ws in self._stalled:
+                ws.transport.resume_reading()
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def drop_connections(self) -> None:
+        """Close the open connections, as an agent restarting would."""
+        assert self._server is not None
+        await asyncio.gather(*(ws.close() for ws in self._server.connections))
+
+    def stall(self) -> None:
+        """Stop reading from the open connections, so they no longer answer pings."""
+        assert self._server is not None
+        for ws in self._server.connections:
+            ws.transport.pause_reading()
+            self._stalled.append(ws)
+
+    async def _process_request(self, ws: ServerConnection, request: Request) -> None:
+        self.handshake_headers.append(dict(request.headers))
+        if self.handshake_delay:
+            await asyncio.sleep(self.handshake_delay)
+
+    async def _handle(self, ws: ServerConnection) -> None:
+        self.connections += 1
+        async for message in ws:
+            if ws.subprotocol != STREAM_SUBPROTOCOL:
+                self.inputs.append(str(message))
+                for chunk in self.chunks:
+                    await ws.send(chunk)
+                await ws.close()
+                return
+            envelope = json.loads(message)
+            self.inputs.append(envelope["input"])
+            self.trace_headers.append(envelope["headers"])
+            if self.failing:
+                await ws.close(CloseCode.INTERNAL_ERROR, "Agent invocation failed")
+                return
+            for chunk in self.chunks:
+                await ws.send(chunk)
+            await ws.send(b"")
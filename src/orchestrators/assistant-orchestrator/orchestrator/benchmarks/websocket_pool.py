@@ -0,0 +1,69 @@
+"""Per-turn latency of streaming agent responses over WebSockets.
+
+Run from the ``orchestrator`` directory with
+``python -m benchmarks.websocket_pool``. A local ``AgentServer`` answers
+each turn with ``--chunks`` messages and spends ``--handshake-ms`` on each
+opening handshake, a stand-in for TLS and the gateway in front of agents.
+``per-turn connection`` streams from an agent without the persistent
+subprotocol, opening a connection for every turn as the orchestrator did
+before; ``pooled`` reuses one connection from ``WebSocketConnectionPool``.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from benchmarks.agent_server import AgentServer
+from connection_pool import WebSocketConnectionPool
+
+TURNS = 200
+CHUNKS = 20
+HANDSHAKE_MS = 5.0
+
+_HEADERS = {"taAgwKey": "benchmark-key", "Authorization": "Bearer benchmark-token"}
+
+
+async def _measure(persistent: bool, turns: int, chunks: int, handshake_ms: float) -> float:
+    server = AgentServer(
+        persistent=persistent,
+        chunks=[f"chunk {chunk}" for chunk in range(chunks)],
+        handshake_delay=handshake_ms / 1000,
+    )
+    async with server:
+        pool = WebSocketConnectionPool(server.url)
+        start = time.perf_counter()
+        for _ in range(turns):
+            async for _ in pool.invoke_stream("benchmark", _HEADERS):
+                pass
+        elapsed = time.perf_counter() - start
+        await pool.close()
+    return elapsed * 1000 / turns
+
+
+def run(turns: int, chunks: int, handshake_ms: float) -> list[tuple[str, float]]:
+    """Return ``(variant, milliseconds per turn)`` tuples."""
+    variants = {"per-turn connection": False, "pooled": True}
+    return [
+        (name, asyncio.run(_measure(persistent, turns, chunks, handshake_ms)))
+        for name, persistent in variants.items()
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.websocket_pool")
+    parser.add_argument("--turns", type=int, default=TURNS)
+    parser.add_argument("--chunks", type=int, default=CHUNKS)
+    parser.add_argument("--handshake-ms", type=float, default=HANDSHAKE_MS)
+    args = parser.parse_args(argv)
+
+    results = run(args.turns, args.chunks, args.handshake_ms)
+    baseline = results[0][1]
+    print(f"{'variant':<20} {'ms/turn':>8} {'speedup':>8}")
+    for name, ms_per_turn in results:
+        print(f"{name:<20} {ms_per_turn:>8.3f} {baseline / ms_per_turn:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
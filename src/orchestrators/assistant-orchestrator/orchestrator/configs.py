@@ -33,6 +33,13 @@ TA_CUSTOM_USER_CONTEXT_MODULE = Config(
 TA_CUSTOM_USER_CONTEXT_CLASS_NAME = Config(
     env_name="TA_CUSTOM_USER_CONTEXT_CLASS_NAME", is_required=False, default_value=None
 )
+# WebSocket connections to each agent kept open between turns; 0 opens one per turn
+TA_AGENT_MAX_IDLE_CONNECTIONS = Config(
+    env_name="TA_AGENT_MAX_IDLE_CONNECTIONS", is_required=False, default_value="4"
+)
+TA_AGENT_IDLE_TIMEOUT = Config(
+    env_name="TA_AGENT_IDLE_TIMEOUT", is_required=False, default_value="60"
+)
 
 CONFIGS = [
     TA_AGW_KEY,
@@ -54,4 +61,6 @@ CONFIGS = [
     TA_CUSTOM_USER_CONTEXT_ENABLED,
     TA_CUSTOM_USER_CONTEXT_MODULE,
     TA_CUSTOM_USER_CONTEXT_CLASS_NAME,
+    TA_AGENT_MAX_IDLE_CONNECTIONS,
+    TA_AGENT_IDLE_TIMEOUT,
 ]
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+import websockets
+from websockets.asyncio.client import ClientConnection
+from websockets.exceptions import ConnectionClosed
+from websockets.frames import CloseCode
+from websockets.protocol import State
+from websockets.typing import Subprotocol
+
+logger = logging.getLogger(__name__)
+
+# Agents accepting this subprotocol serve one invocation after another on a
+# connection: each request is a JSON envelope with the input and the
+# invocation's trace headers, and each response ends with an empty binary frame
+STREAM_SUBPROTOCOL = Subprotocol("tealagents.stream.v1")
+
+# Close codes of an agent closing a connection it was not serving, e.g. when restarting
+_IDLE_CLOSE_CODES = (CloseCode.NORMAL_CLOSURE, CloseCode.GOING_AWAY)
+
+HeadersKey = tuple[tuple[str, str | None], ...]
+
+
+@dataclass
+class _IdleConnection:
+    key: HeadersKey
+    ws: ClientConnection
+    since: float
+
+
+class WebSocketConnectionPool:
+    """Keeps the WebSocket connections to one agent open between invocations.
+
+    A connection serves one invocation at a time; connections are only shared
+    between invocations with the same handshake headers, which carry the
+    caller's credentials. At most ``max_idle`` connections are kept open
+    while idle, for at most ``idle_timeout`` seconds. A connection idle for
+    more than ``health_check_after`` seconds is pinged before it is reused
+    and replaced when no pong arrives within ``ping_timeout`` seconds. If a
+    reused connection turns out to be closed before the agent took the
+    request, because sending it failed or the agent closed the connection
+    normally without answering, the invocation is retried on a new
+    connection. Other closes, such as the agent's handler failing, are raised
+    so the invocation never runs twice.
+
+    Agents which do not accept ``STREAM_SUBPROTOCOL`` close the connection
+    after each response, so their connections are never kept.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        max_idle: int = 4,
+        idle_timeout: float = 60.0,
+        health_check_after: float = 5.0,
+        ping_timeout: float = 5.0,
+        connect: Callable = websockets.connect,
+    ):
+        self.endpoint = endpoint
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.ping_timeout = ping_timeout
+        self._connect = connect
+        # Oldest first, reused newest first
+        self._idle: list[_IdleConnection] = []
+        self._closing: set[asyncio.Task] = set()
+        self.connections_opened = 0
+
+    @property
+    def idle_connections(self) -> int:
+        return len(self._idle)
+
+    async def invoke_stream(
+        self,
+        message: str,
+        headers: dict[str, str | None],
+        trace_headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[str]:
+        """Send ``message`` and yield the agent's response messages."""
+        key = tuple(sorted(headers.items()))
+        reused = await self._acquire(key)
+        ws = reused or await self._open(headers, trace_headers)
+        while True:
+            sent = False
+            received = False
+            released = False
+            try:
+                if ws.subprotocol != STREAM_SUBPROTOCOL:
+                    await ws.send(message)
+                    sent = True
+                    async for response in ws:
+                        received = True
+                        yield str(response)
+                    return
+                await ws.send(json.dumps({"input": message, "headers": trace_headers or {}}))
+                sent = True
+                while True:
+                    response = await ws.recv()
+                    if isinstance(response, bytes):
+                        break
+                    received = True
+                    yield response
+                self._release(key, ws)
+                released = True
+                return
+            except ConnectionClosed as err:
+                if reused is None or received or (sent and not _closed_when_idle(err)):
+                    raise
+                logger.info(f"Pooled connection to {self.endpoint} was closed, reconnecting")
+            finally:
+                if not released:
+                    await ws.close()
+            reused = None
+            ws = await self._open(headers, trace_headers)
+
+    async def close(self) -> None:
+        """Close the idle connections."""
+        idle, self._idle = self._idle, []
+        await asyncio.gather(
+            *(conn.ws.close() for conn in idle), *self._closing, return_exceptions=True
+        )
+
+    async def _open(
+        self, headers: dict[str, str | None], trace_headers: dict[str, str] | None
+    ) -> ClientConnection:
+        ws = await self._connect(
+            self.endpoint,
+            additional_headers={**headers, **(trace_headers or {})},
+            subprotocols=[STREAM_SUBPROTOCOL],
+        )
+        self.connections_opened += 1
+        return ws
+
+    async def _acquire(self, key: HeadersKey) -> ClientConnection | None:
+        """A healthy idle connection opened with the same headers, if any."""
+        self._close_expired()
+        for index in range(len(self._idle) - 1, -1, -1):
+            conn = self._idle[index]
+            if conn.key != key:
+                continue
+            del self._idle[index]
+            if await self._healthy(conn):
+                return conn.ws
+            self._discard(conn)
+        return None
+
+    async def _healthy(self, conn: _IdleConnection) -> bool:
+        if conn.ws.state is not State.OPEN:
+            return False
+        if time.monotonic() - conn.since < self.health_check_after:
+            return True
+        try:
+            pong = await conn.ws.ping()
+            await asyncio.wait_for(pong, self.ping_timeout)
+            return True
+        except (ConnectionClosed, TimeoutError):
+            logger.info(f"Pooled connection to {self.endpoint} failed its health check")
+            return False
+
+    def _release(self, key: HeadersKey, ws: ClientConnection) -> None:
+        self._idle.append(_IdleConnection(key, ws, time.monotonic()))
+        while len(self._idle) > self.max_idle:
+            self._discard(self._idle.pop(0))
+        self._close_expired()
+
+    def _close_expired(self) -> None:
+        deadline = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0].since <= deadline:
+            self._discard(self._idle.pop(0))
+
+    def _discard(self, conn: _IdleConnection) -> None:
+        # Closing waits for the agent's close frame, which no invocation needs to wait for
+        task = asyncio.create_task(conn.ws.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+
+def _closed_when_idle(err: ConnectionClosed) -> bool:
+    return err.rcvd is not None and err.rcvd.code in _IDLE_CLOSE_CODES
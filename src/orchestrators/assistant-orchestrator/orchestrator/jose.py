@@ -1,12 +1,25 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from ska_utils import metrics_router
 
 from routes import apis, deps, sse, websockets
 
 # Get configurations
 config = deps.get_config()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Close the connections to agents kept open between turns
+    await deps.close_agent_connections()
+
+
 # Instance of FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     openapi_url=f"/{config.service_name}/{str(config.version)}/openapi.json",
     docs_url=f"/{config.service_name}/{str(config.version)}/docs",
     redoc_url=f"/{config.service_name}/{str(config.version)}/redoc",
@@ -20,3 +33,5 @@ app.include_router(apis.router, prefix=f"/{config.service_name}/{str(config.vers
 app.include_router(sse.router, prefix=f"/{config.service_name}/{str(config.version)}")
 # WebSocket router for handling WebSocket connections
 app.include_router(websockets.router, prefix=f"/{config.service_name}/{str(config.version)}")
+# Prometheus scrape endpoint, when TA_METRICS_PROMETHEUS is enabled
+app.include_router(metrics_router())
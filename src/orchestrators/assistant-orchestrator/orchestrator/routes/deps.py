@@ -1,11 +1,14 @@
+import asyncio
 import logging
 
 from pydantic_yaml import parse_yaml_file_as
 from ska_utils import AppConfig, initialize_telemetry
 
-from agents import Agent, AgentBuilder, AgentCatalog
+from agents import Agent, AgentBuilder, AgentCatalog, BaseAgent
 from configs import (
     CONFIGS,
+    TA_AGENT_IDLE_TIMEOUT,
+    TA_AGENT_MAX_IDLE_CONNECTIONS,
     TA_AGW_HOST,
     TA_AGW_KEY,
     TA_AGW_SECURE,
@@ -65,6 +68,13 @@ def initialize() -> None:
     agent_builder = AgentBuilder(
         app_config.get(TA_AGW_HOST.env_name),
         app_config.get(TA_AGW_SECURE.env_name),
+        max_idle_connections=int(
+            app_config.get(TA_AGENT_MAX_IDLE_CONNECTIONS.env_name)
+            or TA_AGENT_MAX_IDLE_CONNECTIONS.default_value
+        ),
+        idle_timeout=float(
+            app_config.get(TA_AGENT_IDLE_TIMEOUT.env_name) or TA_AGENT_IDLE_TIMEOUT.default_value
+        ),
     )
     agents: dict[str, Agent] = {}
     failed_agents: list[str] = []
@@ -129,6 +139,14 @@ def initialize() -> None:
     _user_context = _user_context_helper.get_user_context()
 
 
+async def close_agent_connections() -> None:
+    """Close the WebSocket connections kept open to the agents."""
+    agents: list[BaseAgent] = list(_agent_catalog.agents.values()) if _agent_catalog else []
+    if _fallback_agent is not None:
+        agents.append(_fallback_agent)
+    await asyncio.gather(*(agent.close() for agent in agents))
+
+
 def get_conv_manager() -> ConversationManager:
     if _conv_manager is None:
         initialize()
@@ -7,7 +7,7 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from fastapi.security import APIKeyHeader
-from ska_utils import get_telemetry
+from ska_utils import get_service_metrics, get_telemetry
 
 from agents import Conversation
 from context_directive import parse_context_directives
@@ -64,9 +64,10 @@ async def sse_event_response(
         await conv_manager.add_transient_context(conv, in_memory_user_context)
 
     with (
+        get_service_metrics().track_stream("sse"),
         jt.tracer.start_as_current_span("conversation-turn")
         if jt.telemetry_enabled()
-        else nullcontext()
+        else nullcontext(),
     ):
         # --- Call Agent Selector Agent ---
         with (
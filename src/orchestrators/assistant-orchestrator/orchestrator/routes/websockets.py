@@ -5,7 +5,7 @@ from fastapi import (
     WebSocket,
     WebSocketDisconnect,
 )
-from ska_utils import get_telemetry
+from ska_utils import get_service_metrics, get_telemetry
 
 from context_directive import parse_context_directives
 from jose_types import ExtraData
@@ -96,9 +96,10 @@ async def invoke_stream(
                 )
 
                 with (
+                    get_service_metrics().track_stream("websocket"),
                     jt.tracer.start_as_current_span("stream-response")
                     if jt.telemetry_enabled()
-                    else nullcontext()
+                    else nullcontext(),
                 ):
                     # Stream agent response to client
                     response = ""
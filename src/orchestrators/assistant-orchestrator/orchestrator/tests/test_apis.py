@@ -12,6 +12,7 @@ mock_config_instance.version = "v1"
 mock_deps_module = MagicMock()
 mock_deps_module.get_config.return_value = mock_config_instance
 mock_deps_module.initialize = MagicMock()
+mock_deps_module.close_agent_connections = AsyncMock()
 
 # Setup sys for mock dependencies
 sys.modules["routes.deps"] = mock_deps_module
@@ -135,6 +136,25 @@ def test_healthcheck_endpoint(client: TestClient):
     )
 
 
+def test_metrics_endpoint_uses_the_initialized_telemetry(client: TestClient):
+    """
+    Test the /metrics endpoint, which looks up the telemetry set up by deps.initialize.
+
+    Args:
+        client (TestClient): The synchronous test client.
+    """
+    telemetry = MagicMock()
+    telemetry.render_prometheus_metrics.return_value = "tealagents_requests_total 1\n"
+    with patch("ska_utils.telemetry.get_telemetry", return_value=telemetry):
+        response = client.get("/metrics")
+        telemetry.render_prometheus_metrics.return_value = None
+        disabled_response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.text == "tealagents_requests_total 1\n"
+    assert disabled_response.status_code == 404
+
+
 def test_new_conversation_endpoint(client: TestClient):
     """
     Test the /conversations endpoint to start a new conversation.
@@ -0,0 +1,213 @@
+import asyncio
+
+import pytest
+from websockets.exceptions import ConnectionClosedError
+
+from agents import Agent
+from benchmarks.agent_server import AgentServer
+from connection_pool import WebSocketConnectionPool
+from model import Conversation
+
+HEADERS = {"taAgwKey": "test-key", "Authorization": "Bearer test-token"}
+
+
+async def _invoke(pool: WebSocketConnectionPool, message: str = "Hi", headers=None) -> str:
+    return "".join([response async for response in pool.invoke_stream(message, headers or HEADERS)])
+
+
+async def test_sequential_invocations_reuse_one_connection():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url)
+
+        responses = [await _invoke(pool, f"turn {turn}") for turn in range(3)]
+        await pool.close()
+
+    assert responses == ["Hello world"] * 3
+    assert server.inputs == ["turn 0", "turn 1", "turn 2"]
+    assert server.connections == 1
+    assert pool.connections_opened == 1
+
+
+async def test_trace_headers_are_sent_with_each_invocation():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url)
+
+        for trace_id in ("1", "2"):
+            async for _ in pool.invoke_stream("Hi", HEADERS, {"traceparent": trace_id}):
+                pass
+        await pool.close()
+
+    assert server.trace_headers == [{"traceparent": "1"}, {"traceparent": "2"}]
+    assert server.connections == 1
+
+
+async def test_connections_are_not_shared_between_credentials():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url)
+
+        await _invoke(pool, headers={"Authorization": "Bearer alice"})
+        await _invoke(pool, headers={"Authorization": "Bearer bob"})
+        await _invoke(pool, headers={"Authorization": "Bearer alice"})
+        await pool.close()
+
+    assert server.connections == 2
+    assert [headers["authorization"] for headers in server.handshake_headers] == [
+        "Bearer alice",
+        "Bearer bob",
+    ]
+
+
+async def test_reconnects_when_the_agent_closed_an_idle_connection():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url)
+        await _invoke(pool)
+
+        await server.drop_connections()
+        response = await _invoke(pool)
+        await pool.close()
+
+    assert response == "Hello world"
+    assert server.connections == 2
+
+
+async def test_failed_invocations_on_a_reused_connection_are_not_retried():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url)
+        await _invoke(pool, "turn 0")
+
+        server.failing = True
+        with pytest.raises(ConnectionClosedError):
+            await _invoke(pool, "turn 1")
+        await pool.close()
+
+    assert server.inputs == ["turn 0", "turn 1"]
+    assert server.connections == 1
+
+
+async def test_replaces_connections_failing_the_health_check():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url, health_check_after=0, ping_timeout=0.1)
+        await _invoke(pool)
+
+        server.stall()
+        response = await _invoke(pool)
+        assert pool.idle_connections == 1
+    await pool.close()
+
+    assert response == "Hello world"
+    assert server.connections == 2
+
+
+async def test_keeps_at_most_max_idle_connections():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url, max_idle=2)
+
+        await asyncio.gather(*(_invoke(pool) for _ in range(4)))
+        assert pool.idle_connections == 2
+        await asyncio.gather(*(_invoke(pool) for _ in range(2)))
+        await pool.close()
+
+    assert server.connections == 4
+
+
+async def test_no_idle_connections_are_kept_with_max_idle_zero():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url, max_idle=0)
+
+        await _invoke(pool)
+        await _invoke(pool)
+        await pool.close()
+
+    assert server.connections == 2
+
+
+async def test_closes_connections_idle_for_longer_than_idle_timeout():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url, idle_timeout=0.05)
+        await _invoke(pool)
+
+        await asyncio.sleep(0.1)
+        await _invoke(pool)
+        await pool.close()
+
+    assert server.connections == 2
+
+
+async def test_agents_without_the_subprotocol_get_a_connection_per_invocation():
+    async with AgentServer(persistent=False) as server:
+        pool = WebSocketConnectionPool(server.url)
+
+        responses = [await _invoke(pool) for _ in range(2)]
+
+    assert responses == ["Hello world"] * 2
+    assert server.inputs == ["Hi", "Hi"]
+    assert server.connections == 2
+    assert pool.idle_connections == 0
+
+
+async def test_abandoned_responses_close_the_connection():
+    async with AgentServer() as server:
+        pool = WebSocketConnectionPool(server.url)
+
+        stream = pool.invoke_stream("Hi", HEADERS)
+        assert await anext(stream) == "Hello"
+        await stream.aclose()
+        response = await _invoke(pool)
+        await pool.close()
+
+    assert response == "Hello world"
+    assert server.connections == 2
+
+
+async def test_agent_invoke_stream_reuses_pooled_connection():
+    conversation = Conversation(
+        conversation_id="test-id", user_id="test-user", history=[], user_context={}
+    )
+    async with AgentServer() as server:
+        agent = Agent(
+            name="test agent",
+            description="test",
+            endpoint=server.url,
+            endpoint_api="http://test",
+            api_key="test-key",
+        )
+
+        for _ in range(2):
+            responses = [
+                response
+                async for response in agent.invoke_stream(conversation, "Bearer test-token")
+            ]
+            assert responses == ["Hello", " world"]
+        await agent.connection_pool.close()
+
+    assert server.connections == 1
+    assert server.handshake_headers[0]["authorization"] == "Bearer test-token"
+
+
+async def test_agent_close_closes_its_idle_connections():
+    conversation = Conversation(
+        conversation_id="test-id", user_id="test-user", history=[], user_context={}
+    )
+    async with AgentServer() as server:
+        agent = Agent(
+            name="test agent",
+            description="test",
+            endpoint=server.url,
+            endpoint_api="http://test",
+            api_key="test-key",
+        )
+        async for _ in agent.invoke_stream(conversation):
+            pass
+
+        await agent.close()
+
+        assert agent.connection_pool.idle_connections == 0
+
+
+def test_websocket_pool_benchmark():
+    from benchmarks.websocket_pool import run
+
+    results = dict(run(turns=5, chunks=2, handshake_ms=0))
+
+    assert list(results) == ["per-turn connection", "pooled"]
+    assert all(ms_per_turn > 0 for ms_per_turn in results.values())
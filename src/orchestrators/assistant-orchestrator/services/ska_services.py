@@ -3,7 +3,7 @@ import logging
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from pynamodb.exceptions import DeleteError, DoesNotExist
-from ska_utils import AppConfig, get_telemetry, initialize_telemetry, strtobool
+from ska_utils import AppConfig, get_telemetry, initialize_telemetry, metrics_router, strtobool
 
 from auth import Authenticator, CustomAuthHelper
 from configs import CONFIGS, TA_KONG_ENABLED
@@ -74,6 +74,11 @@ async def global_exception_handler(request: Request, ex: Exception):
 # noinspection PyTypeChecker
 app.add_middleware(TelemetryMiddleware, st=get_telemetry())
 
+
+# Prometheus scrape endpoint, when TA_METRICS_PROMETHEUS is enabled
+app.include_router(metrics_router(get_telemetry()))
+
+
 conversation_manager: ConversationManager = ConversationManager(get_chat_history_manager())
 ticket_manager: TicketManager = get_ticket_manager()
 context_manager: ContextManager = get_context_manager()
@@ -9,7 +9,14 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from opentelemetry.propagate import Context, extract
 from pydantic_yaml import parse_yaml_file_as
-from ska_utils import AppConfig, get_telemetry, initialize_telemetry, strtobool
+from ska_utils import (
+    AppConfig,
+    get_service_metrics,
+    get_telemetry,
+    initialize_telemetry,
+    metrics_router,
+    strtobool,
+)
 
 from collab_orchestrator.agents import (
     AgentGateway,
@@ -134,14 +141,19 @@ app = FastAPI(
 app.add_event_handler("startup", initialize)
 
 
+# Prometheus scrape endpoint, when TA_METRICS_PROMETHEUS is enabled
+app.include_router(metrics_router(t))
+
+
 # ----------------------------------------------------------------- helper to run handler in a span
 async def invoke_with_span(
     context: Context, chat_history: BaseMultiModalInput, request: str
 ) -> AsyncIterable:
     with (
+        get_service_metrics().track_stream("sse"),
         t.tracer.start_as_current_span(name="invoke-sse", context=context)
         if t.telemetry_enabled()
-        else nullcontext()
+        else nullcontext(),
     ):
         async for event in handler.invoke(chat_history, request):
             yield event
@@ -5,7 +5,7 @@ from dapr.ext.workflow import WorkflowRuntime
 from fastapi import FastAPI, HTTPException
 from pydantic_yaml import parse_yaml_file_as
 from ska_utils import AppConfig
-from ska_utils import get_telemetry, initialize_telemetry
+from ska_utils import get_telemetry, initialize_telemetry, metrics_router
 
 from workflow_orchestrator import WorkflowClient, WorkflowNotFoundException
 from workflow_orchestrator.configs import (
@@ -71,6 +71,11 @@ app = FastAPI()
 # noinspection PyTypeChecker
 app.add_middleware(TelemetryMiddleware, get_telemetry())
 
+
+# Prometheus scrape endpoint, when TA_METRICS_PROMETHEUS is enabled
+app.include_router(metrics_router(get_telemetry()))
+
+
 workflow_class.setup()
 
 
@@ -0,0 +1,5 @@
+"""Benchmark suite for the sk-agents request path.
+
+Run from the ``src/sk-agents`` directory with ``python -m benchmarks``. See
+``benchmarks/README.md`` for the available options.
+"""
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import logging
+import sys
+
+from benchmarks.cases import build_cases
+from benchmarks.runner import (
+    BenchmarkReport,
+    compare_with_baseline,
+    format_regressions,
+    format_report,
+    measure,
+    parse_thresholds,
+)
+from benchmarks.stubs import StubAppConfig, benchmark_environment
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the sk-agents request path."
+    )
+    parser.add_argument("--iterations", type=int, default=50, help="Timed runs per benchmark")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed runs per benchmark")
+    parser.add_argument("--filter", default=None, help="Only run benchmarks containing this text")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    parser.add_argument("--baseline", default=None, help="JSON report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed median slowdown as a fraction of the baseline (default: 0.2)",
+    )
+    parser.add_argument(
+        "--benchmark-threshold",
+        action="append",
+        default=[],
+        metavar="NAME=FRACTION",
+        help="Per-benchmark threshold override, may be repeated",
+    )
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> BenchmarkReport:
+    report = BenchmarkReport()
+    with benchmark_environment():
+        cases = await build_cases(StubAppConfig())
+        for name, fn in cases.items():
+            if args.filter and args.filter not in name:
+                continue
+            report.results.append(await measure(name, fn, args.iterations, args.warmup))
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    # Keep per-request info logging from dominating the measurements
+    logging.disable(logging.INFO)
+    try:
+        report = asyncio.run(_run(args))
+    finally:
+        logging.disable(logging.NOTSET)
+    print(format_report(report))
+    if args.output:
+        report.save(args.output)
+
+    if args.baseline:
+        regressions = compare_with_baseline(
+            report,
+            BenchmarkReport.load(args.baseline),
+            args.threshold,
+            parse_thresholds(args.benchmark_threshold),
+        )
+        if regressions:
+            print(f"Performance regressions detected:\n{format_regressions(regressions)}")
+            return 1
+        print("No performance regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Latency of classifying A2A responses with and without the local tiers.
+
+Run from the ``src/sk-agents`` directory with
+``python -m benchmarks.a2a_classifier``. ``model-only`` is what
+``A2AResponseClassifier`` did before: call the classifier model for every
+response. ``tiered`` decides from structured signals first and only calls the
+model, whose results are cached, for responses without one.
+``tiered+keywords`` also lets keyword patterns decide, with
+``TA_A2A_CLASSIFIER_MIN_CONFIDENCE`` lowered to 0.7.
+The classifier model is a ``FakeChatCompletion`` answering after
+``--model-latency-ms``, standing in for a full model round trip.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from unittest.mock import MagicMock
+
+from sk_agents.a2a.response_classifier import A2AResponseClassifier
+from sk_agents.chat_completion.fake_chat_completion_factory import (
+    FakeChatCompletion,
+    FakeLlmScript,
+    FakeLlmSettings,
+    FakeScenario,
+    FakeStep,
+)
+from sk_agents.configs import (
+    TA_A2A_CLASSIFIER_CACHE_SIZE,
+    TA_A2A_CLASSIFIER_MIN_CONFIDENCE,
+    TA_A2A_OUTPUT_CLASSIFIER_MODEL,
+)
+
+MODEL_LATENCY_MS = 300.0
+RESPONSES = (
+    "Here is the quarterly report you asked for. Revenue grew 12% over the last quarter.",
+    "I have updated the ticket and assigned it to the platform team.",
+    "The meeting has been scheduled for Tuesday at 10am.",
+    "Could you please tell me which date range you are interested in?",
+    "I'm sorry, I encountered an unexpected error and cannot process your request.",
+    "You need to sign in to continue.",
+    "Sure.",
+    "I could not retrieve the file. Do you want me to search the archive instead?",
+    "The export finished with 3 files. [a2a-status: completed]",
+)
+
+
+class _CountingChatCompletion(FakeChatCompletion):
+    calls: int = 0
+
+    async def _inner_get_chat_message_contents(self, chat_history, settings):
+        self.calls += 1
+        return await super()._inner_get_chat_message_contents(chat_history, settings)
+
+
+def build_classifier(
+    min_confidence: str, cache_size: str, model_latency_ms: float
+) -> tuple[A2AResponseClassifier, _CountingChatCompletion]:
+    service = _CountingChatCompletion(
+        service_id=A2AResponseClassifier.NAME,
+        ai_model_id="classifier-model",
+        script=FakeLlmScript(
+            scenarios=[FakeScenario(steps=[FakeStep(content='{"status": "completed"}')])]
+        ),
+        fake_settings=FakeLlmSettings(first_token_delay_ms=model_latency_ms),
+    )
+    app_config = MagicMock()
+    app_config.get.side_effect = {
+        TA_A2A_OUTPUT_CLASSIFIER_MODEL.env_name: "classifier-model",
+        TA_A2A_CLASSIFIER_MIN_CONFIDENCE.env_name: min_confidence,
+        TA_A2A_CLASSIFIER_CACHE_SIZE.env_name: cache_size,
+    }.get
+    chat_completion_builder = MagicMock()
+    chat_completion_builder.get_chat_completion_for_model.return_value = service
+    return A2AResponseClassifier(app_config, chat_completion_builder), service
+
+
+# Minimum confidence and cache size; model-only calls the model directly, as before signals
+_VARIANTS = {
+    "model-only": ("2", "0"),
+    "tiered": ("0.8", "1024"),
+    "tiered+keywords": ("0.7", "1024"),
+}
+
+
+async def _run(variant: str, iterations: int, model_latency_ms: float) -> tuple[float, int]:
+    classifier, service = build_classifier(*_VARIANTS[variant], model_latency_ms)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for response in RESPONSES:
+            if variant == "model-only":
+                await classifier.classify_with_model(response)
+            else:
+                await classifier.classify_response(response)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / (iterations * len(RESPONSES)), service.calls
+
+
+def run(iterations: int, model_latency_ms: float) -> list[tuple[str, float, int]]:
+    """Return ``(variant, milliseconds per response, model calls)`` tuples."""
+    return [(name, *asyncio.run(_run(name, iterations, model_latency_ms))) for name in _VARIANTS]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.a2a_classifier")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--model-latency-ms", type=float, default=MODEL_LATENCY_MS)
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations, args.model_latency_ms)
+    total = args.iterations * len(RESPONSES)
+    baseline = results[0][1]
+    print(f"{'variant':<16} {'ms/response':>12} {'model calls':>12} {'speedup':>8}")
+    for name, ms_per_response, calls in results:
+        print(
+            f"{name:<16} {ms_per_response:>12.2f} {f'{calls}/{total}':>12} "
+            f"{baseline / ms_per_response:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""Latency of A2A requests to a skagents/v1 agent with a stub LLM.
+
+Run from the ``src/sk-agents`` directory with ``python -m benchmarks.a2a_request``.
+Each request goes through the A2A ``DefaultRequestHandler``, the
+``A2AAgentExecutor`` and a ``RedisTaskStore`` backed by an in-memory stand-in
+which waits ``--redis-rtt-ms`` per round trip. ``per-request`` is what the
+executor did before: create the chat completion builder, remote plugin catalog
+and kernel builder on every request and write every task update in its own
+round trip. ``shared`` uses the executor's handler factory and the pipelined
+task store.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.types import Message, MessageSendParams, Part, Role, TextPart
+from ska_utils import initialize_telemetry
+from ska_utils.telemetry import TA_LOGGING_ENABLED, TA_METRICS_ENABLED, TA_TELEMETRY_ENABLED
+
+import sk_agents
+from benchmarks.stubs import StubAppConfig, benchmark_environment
+from sk_agents.a2a import A2AAgentExecutor, RedisTaskStore
+from sk_agents.chat_completion.fake_chat_completion_factory import FakeChatCompletionFactory
+from sk_agents.configs import (
+    TA_A2A_CLASSIFIER_MIN_CONFIDENCE,
+    TA_CUSTOM_CHAT_COMPLETION_FACTORY_CLASS_NAME,
+    TA_CUSTOM_CHAT_COMPLETION_FACTORY_MODULE,
+)
+from sk_agents.ska_types import BaseConfig
+from sk_agents.skagents import handler_factory
+from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
+from sk_agents.state.in_memory_state_manager import InMemoryStateManager
+
+REDIS_RTT_MS = 1.0
+BENCH_MODEL = "bench-model"
+FAKE_FACTORY_MODULE = str(
+    Path(sk_agents.__file__).parent / "chat_completion" / "fake_chat_completion_factory.py"
+)
+
+
+class LatencyRedis:
+    """The subset of ``redis.asyncio.Redis`` used by ``RedisTaskStore``, with a fixed RTT."""
+
+    def __init__(self, rtt_ms: float):
+        self.rtt = rtt_ms / 1000
+        self.store: dict[str, str] = {}
+        self.round_trips = 0
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt)
+
+    async def get(self, key):
+        await self._round_trip()
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        await self._round_trip()
+        self.store[key] = value
+
+    async def delete(self, key):
+        await self._round_trip()
+        self.store.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return _LatencyPipeline(self)
+
+
+class _LatencyPipeline:
+    def __init__(self, redis: LatencyRedis):
+        self.redis = redis
+        self.commands: list[tuple[str, str]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value))
+        return self
+
+    async def execute(self):
+        await self.redis._round_trip()
+        for key, value in self.commands:
+            self.redis.store[key] = value
+
+
+def agent_config() -> BaseConfig:
+    return BaseConfig(
+        apiVersion="skagents/v1",
+        kind="Agent",
+        name="BenchAgent",
+        version=0.1,
+        description="benchmark agent",
+        spec={
+            "agent": {
+                "name": "BenchAgent",
+                "model": BENCH_MODEL,
+                "system_prompt": "You are a benchmark agent.",
+            }
+        },
+    )
+
+
+def app_config() -> StubAppConfig:
+    return StubAppConfig(
+        {
+            TA_CUSTOM_CHAT_COMPLETION_FACTORY_MODULE.env_name: FAKE_FACTORY_MODULE,
+            TA_CUSTOM_CHAT_COMPLETION_FACTORY_CLASS_NAME.env_name: "FakeChatCompletionFactory",
+            FakeChatCompletionFactory.TA_FAKE_LLM_COMPLETION_TOKENS.env_name: "16",
+            # Classify the fake responses locally, the fake LLM does not answer as a classifier
+            TA_A2A_CLASSIFIER_MIN_CONFIDENCE.env_name: "0.7",
+        }
+    )
+
+
+class _PerRequestHandlers:
+    """Creates all builders on every request, as the executor did before."""
+
+    def __init__(self, config: BaseConfig, stub_app_config: StubAppConfig):
+        self.config = config
+        self.app_config = stub_app_config
+
+    def handler(self, authorization: str | None = None):
+        return handler_factory(self.config, self.app_config).handler(authorization)
+
+
+def build_request_handler(shared: bool, redis: LatencyRedis) -> DefaultRequestHandler:
+    config = agent_config()
+    stub_app_config = app_config()
+    executor = A2AAgentExecutor(
+        config, stub_app_config, ChatCompletionBuilder(stub_app_config), InMemoryStateManager()
+    )
+    if not shared:
+        executor.handler_factory = _PerRequestHandlers(config, stub_app_config)
+    task_store = RedisTaskStore(redis, flush_interval=0.05 if shared else 0)
+    return DefaultRequestHandler(agent_executor=executor, task_store=task_store)
+
+
+def _params() -> MessageSendParams:
+    return MessageSendParams(
+        message=Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text="Say hello."))],
+            messageId=str(uuid.uuid4()),
+        )
+    )
+
+
+async def _run(shared: bool, iterations: int, rtt_ms: float) -> tuple[float, float]:
+    disabled = {c.env_name: "false" for c in (TA_TELEMETRY_ENABLED, TA_METRICS_ENABLED)}
+    disabled[TA_LOGGING_ENABLED.env_name] = "false"
+    initialize_telemetry("a2a-benchmark", StubAppConfig(disabled))
+    redis = LatencyRedis(rtt_ms)
+    request_handler = build_request_handler(shared, redis)
+    await request_handler.on_message_send(_params())  # warm up
+    redis.round_trips = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        task = await request_handler.on_message_send(_params())
+        assert task.status.state.value == "completed", task.status
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / iterations, redis.round_trips / iterations
+
+
+def run(iterations: int, rtt_ms: float) -> list[tuple[str, float, float]]:
+    """Return ``(variant, milliseconds per request, Redis round trips per request)`` tuples."""
+    # ChatCompletionBuilder registers its configs with the global AppConfig
+    with benchmark_environment():
+        return [
+            (name, *asyncio.run(_run(shared, iterations, rtt_ms)))
+            for name, shared in (("per-request", False), ("shared", True))
+        ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.a2a_request")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--redis-rtt-ms", type=float, default=REDIS_RTT_MS)
+    args = parser.parse_args(argv)
+    # The A2A server and handlers log every request
+    logging.disable(logging.INFO)
+
+    results = run(args.iterations, args.redis_rtt_ms)
+    baseline = results[0][1]
+    print(f"{'variant':<12} {'ms/request':>11} {'redis RTs':>10} {'speedup':>8}")
+    for name, ms_per_request, round_trips in results:
+        print(
+            f"{name:<12} {ms_per_request:>11.2f} {round_trips:>10.1f} "
+            f"{baseline / ms_per_request:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
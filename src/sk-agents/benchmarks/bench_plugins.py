@@ -0,0 +1,9 @@
+from semantic_kernel.functions import kernel_function
+
+from sk_agents.ska_types import BasePlugin
+
+
+class BenchPlugin(BasePlugin):
+    @kernel_function(description="Echo the provided text back to the caller")
+    def echo(self, text: str) -> str:
+        return text
@@ -0,0 +1,112 @@
+import uuid
+from collections.abc import Awaitable, Callable
+
+from benchmarks.stubs import (
+    BENCH_MODEL,
+    TOOL_ROUNDS,
+    StubAppConfig,
+    agent_config,
+    agent_task,
+    build_handler,
+    build_kernel_builder,
+    mcp_discovery_manager,
+)
+from sk_agents.extra_data_collector import ExtraDataCollector
+from sk_agents.mcp_plugin_registry import McpPluginRegistry
+from sk_agents.persistence.in_memory_persistence_manager import InMemoryPersistenceManager
+from sk_agents.ska_types import (
+    InvokeResponse,
+    MultiModalItem,
+    PartialResponse,
+    TokenUsage,
+)
+from sk_agents.tealagents.models import UserMessage
+from sk_agents.tealagents.v1alpha1.agent_builder import AgentBuilder
+from sk_agents.utils import get_sse_event_for_response
+
+BenchmarkFn = Callable[[], Awaitable[object]]
+
+TASK_SIZES = (10, 100, 1000)
+MCP_TOOL_COUNTS = (10, 100)
+
+
+async def build_cases(app_config: StubAppConfig) -> dict[str, BenchmarkFn]:
+    """Create every benchmark, keyed by its stable name used in reports and baselines.
+
+    The cases are to be built and run within ``benchmark_environment``.
+    """
+    cases: dict[str, BenchmarkFn] = {}
+
+    kernel_builder = build_kernel_builder(app_config)
+
+    async def build_kernel():
+        return await kernel_builder.build_kernel(
+            BENCH_MODEL, "BenchAgent", ["BenchPlugin"], [], None, None, ExtraDataCollector()
+        )
+
+    cases["kernel_builder.build_kernel"] = build_kernel
+
+    agent_builder = AgentBuilder(kernel_builder)
+
+    async def build_agent():
+        return await agent_builder.build_agent(agent_config(), ExtraDataCollector())
+
+    cases["agent_builder.build_agent"] = build_agent
+
+    handler = build_handler(app_config)
+    for rounds in TOOL_ROUNDS:
+
+        async def invoke(rounds=rounds):
+            message = UserMessage(items=[MultiModalItem(content=f"rounds={rounds}")])
+            return await handler.invoke("Bearer bench", message)
+
+        cases[f"handler.invoke[tool_rounds={rounds}]"] = invoke
+
+    for size in TASK_SIZES:
+        manager = InMemoryPersistenceManager()
+        task = agent_task("bench-task", size)
+        await manager.create(task)
+
+        async def create(manager=manager, size=size):
+            await manager.create(agent_task(str(uuid.uuid4()), size))
+
+        async def load(manager=manager):
+            return await manager.load("bench-task")
+
+        async def update(manager=manager, task=task):
+            await manager.update(task)
+
+        cases[f"persistence.create[items={size}]"] = create
+        cases[f"persistence.load[items={size}]"] = load
+        cases[f"persistence.update[items={size}]"] = update
+
+    for tool_count in MCP_TOOL_COUNTS:
+        discovery_manager = await mcp_discovery_manager(app_config, tool_count)
+
+        async def deserialize(discovery_manager=discovery_manager):
+            return await McpPluginRegistry.get_tools_for_session(
+                "benchuser", "bench-session", discovery_manager
+            )
+
+        cases[f"mcp.deserialize_tools[tools={tool_count}]"] = deserialize
+
+    partial = PartialResponse(
+        session_id="bench-session", request_id="bench-request", output_partial="token "
+    )
+    final = InvokeResponse(
+        session_id="bench-session",
+        request_id="bench-request",
+        token_usage=TokenUsage(completion_tokens=100, prompt_tokens=900, total_tokens=1000),
+        output_raw="lorem ipsum " * 500,
+    )
+
+    async def sse_partial():
+        return get_sse_event_for_response(partial)
+
+    async def sse_final():
+        return get_sse_event_for_response(final)
+
+    cases["sse.serialize[partial-response]"] = sse_partial
+    cases["sse.serialize[final-response]"] = sse_final
+
+    return cases
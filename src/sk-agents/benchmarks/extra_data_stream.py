@@ -0,0 +1,87 @@
+"""Per-token cost of telling extra data apart from output in a streamed response.
+
+Run from the ``src/sk-agents`` directory with
+``python -m benchmarks.extra_data_stream``. ``parse-every-chunk`` is what the
+streaming handlers did before extra data was sent as typed items: attempt
+``ExtraDataPartial.new_from_json`` on every chunk. The other variants use
+``ExtraDataPartial.from_chunk`` with and without the legacy JSON detection.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from sk_agents.extra_data_collector import (
+    ExtraData,
+    ExtraDataElement,
+    ExtraDataPartial,
+)
+
+TOKEN_COUNT = 5000
+WORDS = ("The", " agent", " returned", " {", '"items"', ":", " [1, 2]", "}", ".", "\n")
+
+
+def sample_stream(token_count: int = TOKEN_COUNT) -> list[str | ExtraDataPartial]:
+    """Text tokens followed by one typed extra data item."""
+    tokens: list[str | ExtraDataPartial] = [
+        WORDS[index % len(WORDS)] for index in range(token_count)
+    ]
+    extra_data = ExtraData(items=[ExtraDataElement(key="source", value="benchmark")])
+    tokens.append(ExtraDataPartial(extra_data=extra_data))
+    return tokens
+
+
+def _parse_every_chunk(chunk: str | ExtraDataPartial) -> ExtraDataPartial | None:
+    if isinstance(chunk, ExtraDataPartial):
+        return chunk
+    try:
+        return ExtraDataPartial.new_from_json(chunk)
+    except Exception:
+        return None
+
+
+Classifier = Callable[[str | ExtraDataPartial], ExtraDataPartial | None]
+
+
+def _time_stream(classify: Classifier, tokens, iterations) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for token in tokens:
+            classify(token)
+    return time.perf_counter() - start
+
+
+def run(token_count: int, iterations: int) -> list[tuple[str, float]]:
+    """Return ``(variant, microseconds per token)`` tuples."""
+    tokens = sample_stream(token_count)
+    variants: dict[str, Classifier] = {
+        "parse-every-chunk": _parse_every_chunk,
+        "typed+legacy-json": lambda chunk: ExtraDataPartial.from_chunk(chunk),
+        "typed": lambda chunk: ExtraDataPartial.from_chunk(chunk, legacy_json=False),
+    }
+    return [
+        (name, _time_stream(classify, tokens, iterations) * 1e6 / (iterations * len(tokens)))
+        for name, classify in variants.items()
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.extra_data_stream")
+    parser.add_argument("--tokens", type=int, default=TOKEN_COUNT)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    results = run(args.tokens, args.iterations)
+    baseline = results[0][1]
+    print(f"{'variant':<20} {'us/token':>9} {'ms/stream':>10} {'speedup':>8}")
+    for name, us_per_token in results:
+        print(
+            f"{name:<20} {us_per_token:>9.3f} {us_per_token * args.tokens / 1000:>10.2f} "
+            f"{baseline / us_per_token:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
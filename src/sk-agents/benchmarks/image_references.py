@@ -0,0 +1,133 @@
+"""Memory and payload size of chat histories which repeat the same image.
+
+Compares image items stored as base64 data URIs (the previous behaviour) with
+references into the image store, and with references to a downscaled copy
+when Pillow is installed. Run from the ``src/sk-agents`` directory with
+``python -m benchmarks.image_references``.
+"""
+
+import argparse
+import base64
+import io
+import json
+import os
+import sys
+import tracemalloc
+from collections.abc import Callable
+
+from pydantic import BaseModel
+from semantic_kernel.contents import AuthorRole, ChatMessageContent, ImageContent, TextContent
+from semantic_kernel.contents.chat_history import ChatHistory
+
+from sk_agents.skagents.v1.image_store import ImageStore
+
+TURN_COUNTS = (1, 10)
+IMAGE_SIZE = (2048, 1536)
+MAX_PIXELS = 1024 * 768
+
+
+class ImageResult(BaseModel):
+    variant: str
+    turns: int
+    retained_bytes: int
+    peak_bytes: int
+    request_bytes: int
+
+
+def sample_data_uri(size: tuple[int, int] = IMAGE_SIZE) -> str:
+    """A noisy PNG image if Pillow is installed, otherwise random bytes of a similar size."""
+    try:
+        from PIL import Image
+    except ImportError:
+        data = os.urandom(size[0] * size[1] * 3)
+    else:
+        image = Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3))
+        output = io.BytesIO()
+        image.save(output, format="PNG")
+        data = output.getvalue()
+    return f"data:image/png;base64,{base64.b64encode(data).decode()}"
+
+
+def _history(to_image: Callable[[], ImageContent], turns: int) -> ChatHistory:
+    history = ChatHistory()
+    for turn in range(turns):
+        history.add_message(
+            ChatMessageContent(
+                role=AuthorRole.USER,
+                items=[TextContent(text=f"Describe image {turn}"), to_image()],
+            )
+        )
+    return history
+
+
+def _measure(variant: str, to_image: Callable[[], ImageContent], turns: int) -> ImageResult:
+    tracemalloc.start()
+    try:
+        history = _history(to_image, turns)
+        retained_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    request = json.dumps([message.to_dict() for message in history.messages])
+    return ImageResult(
+        variant=variant,
+        turns=turns,
+        retained_bytes=retained_bytes,
+        peak_bytes=peak_bytes,
+        request_bytes=len(request),
+    )
+
+
+def _pillow_installed() -> bool:
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def run(turn_counts: tuple[int, ...], data_uri: str) -> list[ImageResult]:
+    results = []
+    for turns in turn_counts:
+        results.append(
+            _measure("data-uri", lambda: ImageContent(data_uri=data_uri), turns),
+        )
+        store = ImageStore()
+        results.append(
+            _measure(
+                "reference",
+                lambda store=store: store.reference_data_uri(data_uri),
+                turns,
+            )
+        )
+        if _pillow_installed():
+            downscaling_store = ImageStore(max_pixels=MAX_PIXELS, image_format="JPEG")
+            results.append(
+                _measure(
+                    "reference+downscale",
+                    lambda store=downscaling_store: store.reference_data_uri(data_uri),
+                    turns,
+                )
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.image_references")
+    parser.add_argument("--output", default=None, help="Write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = run(TURN_COUNTS, sample_data_uri())
+    print(f"{'variant':<20} {'turns':>5} {'retained MB':>12} {'peak MB':>10} {'request MB':>11}")
+    for result in results:
+        print(
+            f"{result.variant:<20} {result.turns:>5} {result.retained_bytes / 1e6:>12.2f} "
+            f"{result.peak_bytes / 1e6:>10.2f} {result.request_bytes / 1e6:>11.2f}"
+        )
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump([result.model_dump() for result in results], output, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
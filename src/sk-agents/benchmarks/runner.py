@@ -0,0 +1,141 @@
+import gc
+import json
+import platform
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+
+class BenchmarkResult(BaseModel):
+    name: str
+    iterations: int
+    mean_ms: float
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    stdev_ms: float
+    ops_per_sec: float
+
+
+class BenchmarkReport(BaseModel):
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    python_version: str = Field(default_factory=platform.python_version)
+    platform: str = Field(default_factory=platform.platform)
+    results: list[BenchmarkResult] = Field(default_factory=list)
+
+    def get(self, name: str) -> BenchmarkResult | None:
+        for result in self.results:
+            if result.name == name:
+                return result
+        return None
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(self.model_dump_json(indent=2))
+
+    @staticmethod
+    def load(path: str | Path) -> "BenchmarkReport":
+        return BenchmarkReport.model_validate_json(Path(path).read_text())
+
+
+class Regression(BaseModel):
+    name: str
+    baseline_median_ms: float
+    current_median_ms: float
+    change: float
+    threshold: float
+
+
+def summarize(name: str, durations_s: list[float]) -> BenchmarkResult:
+    durations_ms = sorted(d * 1000 for d in durations_s)
+    p95_index = min(len(durations_ms) - 1, int(round(0.95 * (len(durations_ms) - 1))))
+    mean_ms = statistics.fmean(durations_ms)
+    return BenchmarkResult(
+        name=name,
+        iterations=len(durations_ms),
+        mean_ms=mean_ms,
+        median_ms=statistics.median(durations_ms),
+        p95_ms=durations_ms[p95_index],
+        min_ms=durations_ms[0],
+        max_ms=durations_ms[-1],
+        stdev_ms=statistics.stdev(durations_ms) if len(durations_ms) > 1 else 0.0,
+        ops_per_sec=1000 / mean_ms if mean_ms else 0.0,
+    )
+
+
+async def measure(
+    name: str,
+    fn: Callable[[], Awaitable[object]],
+    iterations: int,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """Time ``iterations`` sequential awaits of ``fn`` after ``warmup`` untimed runs."""
+    for _ in range(warmup):
+        await fn()
+    gc.collect()
+    durations: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        durations.append(time.perf_counter() - start)
+    return summarize(name, durations)
+
+
+def compare_with_baseline(
+    current: BenchmarkReport,
+    baseline: BenchmarkReport,
+    default_threshold: float,
+    thresholds: dict[str, float] | None = None,
+) -> list[Regression]:
+    """Return benchmarks whose median slowed down by more than their threshold.
+
+    Thresholds are fractions, e.g. ``0.2`` allows a 20% slowdown. Benchmarks
+    missing from either report are ignored.
+    """
+    thresholds = thresholds or {}
+    regressions = []
+    for baseline_result in baseline.results:
+        result = current.get(baseline_result.name)
+        if result is None or baseline_result.median_ms <= 0:
+            continue
+        threshold = thresholds.get(baseline_result.name, default_threshold)
+        change = result.median_ms / baseline_result.median_ms - 1
+        if change > threshold:
+            regressions.append(
+                Regression(
+                    name=baseline_result.name,
+                    baseline_median_ms=baseline_result.median_ms,
+                    current_median_ms=result.median_ms,
+                    change=change,
+                    threshold=threshold,
+                )
+            )
+    return regressions
+
+
+def parse_thresholds(values: list[str]) -> dict[str, float]:
+    thresholds = {}
+    for value in values:
+        name, sep, threshold = value.rpartition("=")
+        if not sep or not name:
+            raise ValueError(f"Invalid threshold '{value}', expected <benchmark>=<fraction>")
+        thresholds[name] = float(threshold)
+    return thresholds
+
+
+def format_report(report: BenchmarkReport) -> str:
+    lines = [f"{'benchmark':<45} {'median ms':>10} {'p95 ms':>10} {'ops/s':>10}"]
+    for result in report.results:
+        lines.append(
+            f"{result.name:<45} {result.median_ms:>10.3f} {result.p95_ms:>10.3f} "
+            f"{result.ops_per_sec:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_regressions(regressions: list[Regression]) -> str:
+    return json.dumps([r.model_dump() for r in regressions], indent=2)
@@ -0,0 +1,119 @@
+"""Bytes and CPU time used to save and load large ``TaskState`` records.
+
+Run from the ``src/sk-agents`` directory with
+``python -m benchmarks.state_serialization``. Encodings whose optional
+dependency is not installed are skipped.
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+import warnings
+from collections.abc import Callable
+
+from pydantic import BaseModel
+
+from sk_agents.stateful import StateEncoding, StateSerializer, TaskState
+
+MESSAGE_COUNTS = (100, 1000, 10000)
+
+
+class SerializationResult(BaseModel):
+    encoding: str
+    messages: int
+    bytes: int
+    save_cpu_ms: float
+    load_cpu_ms: float
+
+
+def large_task_state(message_count: int) -> TaskState:
+    return TaskState(
+        task_id=uuid.uuid4(),
+        session_id=uuid.uuid4(),
+        user_id="benchuser",
+        messages=[
+            {
+                "role": "user" if index % 2 == 0 else "assistant",
+                "content": f"message {index} " + "lorem ipsum dolor sit amet " * 10,
+                "metadata": {"index": index, "tokens": 64},
+            }
+            for index in range(message_count)
+        ],
+    )
+
+
+def _cpu_ms(fn: Callable[[], object], iterations: int) -> float:
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) * 1000 / iterations
+
+
+def _legacy_codec() -> tuple[Callable[[TaskState], bytes], Callable[[bytes], TaskState]]:
+    def dumps(state: TaskState) -> bytes:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return state.json().encode()
+
+    def loads(data: bytes) -> TaskState:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return TaskState.parse_raw(data)
+
+    return dumps, loads
+
+
+def run(message_counts: tuple[int, ...], iterations: int) -> list[SerializationResult]:
+    codecs: dict[str, tuple[Callable[[TaskState], bytes], Callable[[bytes], TaskState]]] = {
+        "legacy-pydantic-v1": _legacy_codec()
+    }
+    for encoding in StateEncoding:
+        try:
+            serializer = StateSerializer(encoding)
+        except ImportError:
+            continue
+        codecs[encoding.value] = (
+            serializer.dumps,
+            lambda data, serializer=serializer: serializer.loads(TaskState, data),
+        )
+
+    results = []
+    for message_count in message_counts:
+        state = large_task_state(message_count)
+        for name, (dumps, loads) in codecs.items():
+            data = dumps(state)
+            results.append(
+                SerializationResult(
+                    encoding=name,
+                    messages=message_count,
+                    bytes=len(data),
+                    save_cpu_ms=_cpu_ms(lambda dumps=dumps, state=state: dumps(state), iterations),
+                    load_cpu_ms=_cpu_ms(lambda loads=loads, data=data: loads(data), iterations),
+                )
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.state_serialization")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--output", default=None, help="Write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = run(MESSAGE_COUNTS, args.iterations)
+    print(f"{'encoding':<20} {'messages':>8} {'bytes':>12} {'save ms':>10} {'load ms':>10}")
+    for result in results:
+        print(
+            f"{result.encoding:<20} {result.messages:>8} {result.bytes:>12} "
+            f"{result.save_cpu_ms:>10.3f} {result.load_cpu_ms:>10.3f}"
+        )
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump([result.model_dump() for result in results], output, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
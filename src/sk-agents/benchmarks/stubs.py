@@ -0,0 +1,208 @@
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from ska_utils import ConfigSnapshot
+
+import sk_agents
+from sk_agents.chat_completion.fake_chat_completion_factory import (
+    FakeChatCompletionFactory,
+    FakeLlmScript,
+    FakeScenario,
+    FakeStep,
+    FakeToolCall,
+)
+from sk_agents.configs import (
+    TA_API_KEY,
+    TA_AUTHORIZER_CLASS,
+    TA_AUTHORIZER_MODULE,
+    TA_PLUGIN_CATALOG_FILE,
+    TA_PLUGIN_CATALOG_MODULE,
+    configs,
+)
+from sk_agents.mcp_client import McpTool
+from sk_agents.mcp_discovery.in_memory_discovery_manager import InMemoryStateManager
+from sk_agents.mcp_discovery.mcp_discovery_manager import McpState
+from sk_agents.mcp_plugin_registry import McpPluginRegistry
+from sk_agents.persistence.in_memory_persistence_manager import InMemoryPersistenceManager
+from sk_agents.plugin_loader import get_plugin_loader
+from sk_agents.ska_types import BaseConfig, ContentType, MultiModalItem
+from sk_agents.tealagents.chat_completion_builder import ChatCompletionBuilder
+from sk_agents.tealagents.kernel_builder import KernelBuilder
+from sk_agents.tealagents.models import AgentTask, AgentTaskItem
+from sk_agents.tealagents.remote_plugin_loader import RemotePluginCatalog, RemotePluginLoader
+from sk_agents.tealagents.v1alpha1.agent.config import Spec
+from sk_agents.tealagents.v1alpha1.agent.handler import TealAgentsV1Alpha1Handler
+from sk_agents.tealagents.v1alpha1.agent_builder import AgentBuilder
+from sk_agents.tealagents.v1alpha1.config import AgentConfig, McpServerConfig
+
+SK_AGENTS_DIR = Path(sk_agents.__file__).parent
+BENCH_PLUGIN_MODULE = str(Path(__file__).parent / "bench_plugins.py")
+BENCH_MODEL = "bench-model"
+TOOL_ROUNDS = (0, 1, 5)
+
+
+class StubAppConfig:
+    """Dict-backed stand-in for ``AppConfig`` which avoids the global singleton."""
+
+    def __init__(self, overrides: dict[str, str | None] | None = None):
+        self.props: dict[str, str | None] = {c.env_name: c.default_value for c in configs}
+        self.props.update(
+            {c.env_name: c.default_value for c in FakeChatCompletionFactory.get_configs()}
+        )
+        self.props[TA_AUTHORIZER_MODULE.env_name] = str(
+            SK_AGENTS_DIR / "authorization" / "dummy_authorizer.py"
+        )
+        self.props[TA_AUTHORIZER_CLASS.env_name] = "DummyAuthorizer"
+        self.props.update(overrides or {})
+
+    def get(self, key: str) -> str | None:
+        return self.props.get(key)
+
+    def snapshot(self) -> ConfigSnapshot:
+        return ConfigSnapshot(self.props)
+
+
+@contextmanager
+def benchmark_environment() -> Iterator[None]:
+    """Provide the process environment needed by code paths which read the global AppConfig.
+
+    The HITL check in the tool-calling loop goes through ``PluginCatalogFactory``,
+    which always uses ``AppConfig()``, so the stub app config alone is not enough.
+    Variables which were not set before are removed again on exit.
+    """
+    defaults = {
+        TA_API_KEY.env_name: "unused",
+        TA_PLUGIN_CATALOG_MODULE.env_name: str(
+            SK_AGENTS_DIR / "plugin_catalog" / "local_plugin_catalog.py"
+        ),
+        TA_PLUGIN_CATALOG_FILE.env_name: str(SK_AGENTS_DIR / "plugin_catalog" / "catalog.json"),
+    }
+    added = [key for key in defaults if key not in os.environ]
+    for key in added:
+        os.environ[key] = defaults[key]
+    try:
+        yield
+    finally:
+        for key in added:
+            os.environ.pop(key, None)
+
+
+def tool_round_script() -> FakeLlmScript:
+    """One scenario per entry in ``TOOL_ROUNDS``, selected by a ``rounds=N`` prompt."""
+    scenarios = []
+    for rounds in TOOL_ROUNDS:
+        tool_step = FakeStep(
+            tool_calls=[
+                FakeToolCall(
+                    plugin_name="BenchPlugin", function_name="echo", arguments={"text": "ping"}
+                )
+            ]
+        )
+        scenarios.append(
+            FakeScenario(
+                match=f"^rounds={rounds}$",
+                steps=[tool_step] * rounds + [FakeStep(content="The benchmark is complete.")],
+            )
+        )
+    return FakeLlmScript(scenarios=scenarios)
+
+
+def build_kernel_builder(app_config: StubAppConfig) -> KernelBuilder:
+    plugin_loader = get_plugin_loader(BENCH_PLUGIN_MODULE)
+    if plugin_loader.plugin_module != BENCH_PLUGIN_MODULE:
+        plugin_loader.set_plugin_module(BENCH_PLUGIN_MODULE)
+
+    chat_completion_builder = ChatCompletionBuilder(app_config)
+    fake_factory = FakeChatCompletionFactory(app_config)
+    fake_factory.script = tool_round_script()
+    chat_completion_builder.ccc_factory = fake_factory
+
+    remote_plugin_loader = RemotePluginLoader(RemotePluginCatalog(app_config))
+    return KernelBuilder(chat_completion_builder, remote_plugin_loader, app_config)
+
+
+def agent_config() -> AgentConfig:
+    return AgentConfig(
+        name="BenchAgent",
+        model=BENCH_MODEL,
+        system_prompt="You are a benchmark agent.",
+        temperature=0.0,
+        plugins=["BenchPlugin"],
+    )
+
+
+def build_handler(app_config: StubAppConfig) -> TealAgentsV1Alpha1Handler:
+    config = BaseConfig(
+        apiVersion="tealagents/v1alpha1",
+        name="BenchAgent",
+        version=0.1,
+        description="benchmark agent",
+        spec=Spec(agent=agent_config()),
+    )
+    return TealAgentsV1Alpha1Handler(
+        config=config,
+        app_config=app_config,
+        agent_builder=AgentBuilder(build_kernel_builder(app_config)),
+        state_manager=InMemoryPersistenceManager(),
+    )
+
+
+def agent_task(task_id: str, item_count: int) -> AgentTask:
+    now = datetime.now()
+    items = [
+        AgentTaskItem(
+            task_id=task_id,
+            request_id=f"{task_id}-request-{index // 2}",
+            role="user" if index % 2 == 0 else "assistant",
+            item=MultiModalItem(
+                content_type=ContentType.TEXT, content=f"message {index} " + "lorem ipsum " * 20
+            ),
+            updated=now,
+        )
+        for index in range(item_count)
+    ]
+    return AgentTask(
+        task_id=task_id,
+        session_id=f"{task_id}-session",
+        user_id="benchuser",
+        items=items,
+        created_at=now,
+        last_updated=now,
+    )
+
+
+def stub_mcp_server() -> McpServerConfig:
+    return McpServerConfig(name="stub-server", transport="stdio", command="stub-mcp-server")
+
+
+async def mcp_discovery_manager(app_config: StubAppConfig, tool_count: int) -> InMemoryStateManager:
+    server_config = stub_mcp_server()
+    tools = [
+        McpTool(
+            tool_name=f"tool_{index}",
+            description=f"Stub tool number {index}",
+            input_schema={
+                "type": "object",
+                "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}},
+                "required": ["query"],
+            },
+            output_schema=None,
+            server_config=server_config,
+            server_name=server_config.name,
+        )
+        for index in range(tool_count)
+    ]
+    plugin_data = McpPluginRegistry._serialize_plugin_data(tools, server_config.name)
+    manager = InMemoryStateManager(app_config)
+    await manager.create_discovery(
+        McpState(
+            user_id="benchuser",
+            session_id="bench-session",
+            discovered_servers={server_config.name: {"plugin_data": plugin_data}},
+            discovery_completed=True,
+        )
+    )
+    return manager
@@ -0,0 +1,79 @@
+"""Render cost of sequential task instructions, uncached vs. cached templates.
+
+Run from the ``src/sk-agents`` directory with
+``python -m benchmarks.template_render``. The uncached case is what
+``Task`` did before templates were cached: ``Template(instructions).render()``.
+Since recompiling is slow the uncached case runs fewer iterations by default;
+both are reported as the mean cost per render and extrapolated to
+``--iterations`` renders.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from jinja2 import Template
+
+from sk_agents.skagents.v1.sequential.template_cache import TemplateCache
+
+SECTION_COUNTS = (10, 100)
+
+
+def large_instructions(section_count: int) -> str:
+    sections = [
+        f"## Section {index}\n"
+        f"Consider {{{{ topic }}}} from perspective {index}. "
+        "{% for item in items %}- {{ item }}\n{% endfor %}"
+        f"{{% if _previous %}}Previous result: {{{{ _previous }}}}{{% endif %}}\n"
+        for index in range(section_count)
+    ]
+    return "\n".join(sections)
+
+
+def _time_renders(render: Callable[[], str], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return time.perf_counter() - start
+
+
+def run(iterations: int, uncached_iterations: int) -> list[tuple[int, float, float]]:
+    """Return ``(sections, uncached ms per render, cached ms per render)`` tuples."""
+    inputs = {"topic": "caching", "items": ["a", "b", "c"], "_previous": "done"}
+    results = []
+    for section_count in SECTION_COUNTS:
+        instructions = large_instructions(section_count)
+        cache = TemplateCache()
+        uncached_s = _time_renders(
+            lambda i=instructions: Template(i).render(inputs), uncached_iterations
+        )
+        cached_s = _time_renders(lambda i=instructions, c=cache: c.render(i, inputs), iterations)
+        results.append(
+            (section_count, uncached_s * 1000 / uncached_iterations, cached_s * 1000 / iterations)
+        )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.template_render")
+    parser.add_argument("--iterations", type=int, default=10_000)
+    parser.add_argument("--uncached-iterations", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    total = f"{args.iterations} renders"
+    print(
+        f"{'sections':>8} {'uncached ms':>12} {'cached ms':>10} "
+        f"{'uncached s/' + total:>26} {'cached s/' + total:>24} {'speedup':>8}"
+    )
+    for section_count, uncached_ms, cached_ms in run(args.iterations, args.uncached_iterations):
+        print(
+            f"{section_count:>8} {uncached_ms:>12.3f} {cached_ms:>10.4f} "
+            f"{uncached_ms * args.iterations / 1000:>26.2f} "
+            f"{cached_ms * args.iterations / 1000:>24.2f} {uncached_ms / cached_ms:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,7 +18,7 @@ from sk_agents.ska_types import (
     BaseConfig,
     BaseHandler,
 )
-from sk_agents.skagents import handle as skagents_handle
+from sk_agents.skagents import handler_factory as skagents_handler_factory
 from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
 from sk_agents.state.state_manager import StateManager
 
@@ -37,10 +37,13 @@ class A2AAgentExecutor(AgentExecutor):
             app_config=app_config, chat_completion_builder=chat_completion_builder
         )
         self.state_manager = state_manager
+        # Builders are shared by all requests, only the handler is created per request
+        self.handler_factory = skagents_handler_factory(config, app_config, chat_completion_builder)
 
     async def execute(self, context: RequestContext, event_queue: EventQueue):
         try:
-            handler: BaseHandler = skagents_handle(self.config, self.app_config, None)
+            # A2A requests carry no authorization for the agent's plugins
+            handler: BaseHandler = self.handler_factory.handler(None)
             processor = RequestProcessor(
                 handler,
                 self.response_classifier,
@@ -7,29 +7,67 @@ Redis implementation of the TaskStore interface.
 This implementation uses Redis as the persistent store for Task objects.
 """
 
+import asyncio
 import json
+import logging
 
 from a2a.server.tasks.task_store import TaskStore
-from a2a.types import Task
+from a2a.types import Task, TaskState
 from redis.asyncio import Redis
 
+logger = logging.getLogger(__name__)
+
+# States in which the agent stops or waits for the client; saving a task in one
+# of them writes it, and any other pending task, immediately
+FLUSH_STATES = frozenset(
+    {
+        TaskState.input_required,
+        TaskState.auth_required,
+        TaskState.completed,
+        TaskState.canceled,
+        TaskState.failed,
+        TaskState.rejected,
+        TaskState.unknown,
+    }
+)
+
 
 class RedisTaskStore(TaskStore):
     """Redis implementation of the TaskStore interface.
 
     This class provides Redis-based persistence for Task objects.
+
+    A task is saved on every status update and artifact emitted while the
+    agent works. Saves of tasks which are still working are buffered for up to
+    ``flush_interval`` seconds and written together in one pipeline, so a
+    burst of updates costs one round trip; the latest buffered version of a
+    task is returned by ``get``. Saves in one of ``FLUSH_STATES`` are written
+    immediately.
     """
 
-    def __init__(self, redis_client: Redis, ttl: int | None = None, key_prefix: str = "task:"):
+    def __init__(
+        self,
+        redis_client: Redis,
+        ttl: int | None = None,
+        key_prefix: str = "task:",
+        flush_interval: float = 0.05,
+    ):
         """Initialize the RedisTaskStore with a Redis client.
 
         Args:
             redis_client: An instance of Redis client
             key_prefix: Prefix used for Redis keys (default: "task:")
+            flush_interval: Seconds a working task's saves are buffered for, 0 to write
+                every save immediately (default: 0.05)
         """
         self._redis = redis_client
         self._ttl = ttl
         self._key_prefix = key_prefix
+        self._flush_interval = flush_interval
+        self._pending: dict[str, str] = {}
+        self._flush_task: asyncio.Task | None = None
+        # Pipelines are written one at a time so an older version never overwrites a newer one
+        self._flush_lock = asyncio.Lock()
 
     def _get_key(self, task_id: str) -> str:
         """Generate a Redis key for a given task ID.
@@ -54,8 +92,37 @@ class RedisTaskStore(TaskStore):
         # Serialize the task dictionary to JSON
         task_json = json.dumps(task_dict)
 
-        # Store the serialized task in Redis using the task ID as the key
-        await self._redis.set(self._get_key(task.id), task_json, ex=self._ttl)
+        self._pending[task.id] = task_json
+        if self._flush_interval <= 0 or task.status.state in FLUSH_STATES:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self):
+        """Writes all buffered saves in one pipeline."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for task_id, task_json in pending.items():
+                        pipe.set(self._get_key(task_id), task_json, ex=self._ttl)
+                    await pipe.execute()
+            except Exception:
+                # Keep the saves for the next flush, unless the task was saved again since
+                for task_id, task_json in pending.items():
+                    self._pending.setdefault(task_id, task_json)
+                raise
+
+    async def _flush_later(self):
+        await asyncio.sleep(self._flush_interval)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            # The saves stay buffered until the next flush
+            logger.warning(f"Failed to write buffered tasks: {e}")
 
     async def get(self, task_id: str) -> Task | None:
         """Retrieves a task from the Redis store by ID.
@@ -66,8 +133,11 @@ class RedisTaskStore(TaskStore):
         Returns:
             The Task object if found, None otherwise
         """
-        # Get the serialized task from Redis
-        task_json = await self._redis.get(self._get_key(task_id))
+        # A buffered save is newer than what is in Redis
+        task_json = self._pending.get(task_id)
+        if task_json is None:
+            # Get the serialized task from Redis
+            task_json = await self._redis.get(self._get_key(task_id))
 
         if task_json is None:
             return None
@@ -84,5 +154,6 @@ class RedisTaskStore(TaskStore):
         Args:
             task_id: The ID of the task to delete
         """
+        self._pending.pop(task_id, None)
         # Delete the task from Redis
         await self._redis.delete(self._get_key(task_id))
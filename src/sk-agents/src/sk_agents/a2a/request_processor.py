@@ -98,7 +98,9 @@ class RequestProcessor:
                 items=[MultiModalItem(content_type=ContentType.TEXT, content=response.output_raw)],
             ),
         )
-        classification = await self.response_classifier.classify_response(response.output_raw)
+        classification = await self.response_classifier.classify_response(
+            response.output_raw, response
+        )
         if await self.state_manager.is_canceled(self.context.task_id):
             self._handle_canceled()
             return
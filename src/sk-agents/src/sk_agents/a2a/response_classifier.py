@@ -2,9 +2,15 @@
 # as part of the framework migration evaluation. This module is maintained for
 # backward compatibility only. New development should avoid using A2A functionality.
 
+import hashlib
 import json
+import logging
+import re
+from collections import OrderedDict
 from enum import Enum
+from typing import Any
 
+from opentelemetry import metrics
 from pydantic import ConfigDict
 from semantic_kernel.agents import ChatCompletionAgent
 from semantic_kernel.contents.chat_history import ChatHistory
@@ -13,9 +19,32 @@ from semantic_kernel.kernel import Kernel
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 from ska_utils import AppConfig
 
-from sk_agents.configs import TA_A2A_OUTPUT_CLASSIFIER_MODEL
+from sk_agents.configs import (
+    TA_A2A_CLASSIFIER_CACHE_SIZE,
+    TA_A2A_CLASSIFIER_MIN_CONFIDENCE,
+    TA_A2A_OUTPUT_CLASSIFIER_MODEL,
+)
 from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
 
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_classification_counter = _meter.create_counter(
+    "a2a.response_classifications",
+    unit="{response}",
+    description="A2A responses classified, by the tier which decided and the status",
+)
+
+# An agent can state the task status explicitly with e.g. "[a2a-status: input-required]"
+STATUS_MARKER = re.compile(
+    r"\[a2a-status:\s*(completed|failed|input-required|auth-required)\s*\]", re.IGNORECASE
+)
+# ...and a plugin can set it with the ExtraDataCollector under this key
+STATUS_EXTRA_DATA_KEY = "a2a_status"
+
+# The most confidence a keyword match gets, below the default TA_A2A_CLASSIFIER_MIN_CONFIDENCE
+KEYWORD_CONFIDENCE = 0.7
+
 
 class A2AResponseStatus(Enum):
     completed = "completed"
@@ -34,9 +63,110 @@ class A2AResponseClassification(KernelBaseModel):
     auth_details: ConcreteAuthDetails | None = None
 
 
+def _patterns(*patterns: str) -> list[re.Pattern]:
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+_AUTH_PATTERNS = _patterns(
+    r"\b(log|sign) ?in\b.{0,40}\b(to (continue|access|proceed)|required|first)\b",
+    r"\bauthenticat(e|ion)\b.{0,40}\b(required|needed|failed)\b",
+    r"\b(unauthori[sz]ed|access denied|invalid credentials|permission denied)\b",
+    r"\b(api key|access token|bearer token)\b.{0,40}\b(required|needed|missing|invalid)\b",
+    r"\bprovide an? (valid )?(api key|access token|bearer token|credentials)\b",
+)
+_FAILED_PATTERNS = _patterns(
+    r"\b(i'?m sorry|i apologi[sz]e|unfortunately)\b.{0,60}\b(can ?not|can'?t|unable|"
+    r"could ?n[o']t|failed)\b",
+    r"\b(unable to|can ?not|can'?t|could ?n[o']t) (complete|process|fulfil|perform|"
+    r"finish|retrieve|access)\b",
+    r"\b(encountered|ran into) an? (unexpected )?(error|problem|issue)\b",
+    r"\b(an? )?(unexpected |internal )?error (occurred|has occurred|was encountered)\b",
+    r"\b(task|request|operation) (has )?(failed|was aborted)\b",
+)
+_INPUT_PATTERNS = _patterns(
+    r"\b(could|can|would) you (please )?(tell|specify|provide|clarify|confirm|share|let me "
+    r"know|choose|select)\b",
+    r"\bplease (provide|specify|clarify|confirm|let me know|choose|select)\b",
+    r"\b(which|what) (one|option|date|time|format|version)\b[^.?!]*\?",
+    r"\bdo you want (me )?to\b",
+    r"\bwould you like (me )?to\b[^.?!]*\?",
+    r"\bi need (more|additional|some) (information|details|input)\b",
+)
+
+
+def _matches(patterns: list[re.Pattern], text: str) -> bool:
+    return any(pattern.search(text) for pattern in patterns)
+
+
+def classify_heuristic(response: str) -> tuple[A2AResponseClassification, float]:
+    """Classify a response with keyword patterns, returning the classification and
+    a confidence between 0 and 1.
+
+    The patterns follow the keywords and priorities of the classifier model's
+    prompt: authentication before input before failure. Keywords also appear
+    in ordinary completed answers ("let me know if you have questions", an
+    explanation of HTTP 401), so no match is more than ``KEYWORD_CONFIDENCE``
+    confident, below the default ``TA_A2A_CLASSIFIER_MIN_CONFIDENCE``.
+    Responses asking for input which also report a failure, or only ending
+    with a question, get a lower confidence still.
+    """
+    text = response.strip()
+    auth = _matches(_AUTH_PATTERNS, text)
+    needs_input = _matches(_INPUT_PATTERNS, text)
+    failed = _matches(_FAILED_PATTERNS, text)
+    asks = text.endswith("?")
+
+    if auth:
+        # Authentication is a blocker whatever else the response says
+        confidence = KEYWORD_CONFIDENCE if not (needs_input or failed) else 0.65
+        return A2AResponseClassification(status=A2AResponseStatus.auth_required), confidence
+    if needs_input:
+        confidence = KEYWORD_CONFIDENCE if not failed else 0.5
+        return A2AResponseClassification(status=A2AResponseStatus.input_required), confidence
+    if failed:
+        confidence = KEYWORD_CONFIDENCE if not asks else 0.5
+        return A2AResponseClassification(status=A2AResponseStatus.failed), confidence
+    if asks:
+        return A2AResponseClassification(status=A2AResponseStatus.input_required), 0.6
+    if not text:
+        return A2AResponseClassification(status=A2AResponseStatus.failed), 0.5
+    return A2AResponseClassification(status=A2AResponseStatus.completed), KEYWORD_CONFIDENCE
+
+
+def classify_signals(
+    response: str, invoke_response: Any | None = None
+) -> A2AResponseClassification | None:
+    """Classify a response from structured signals alone, or return None.
+
+    The signals are, in order: a status set by a plugin in the response's
+    extra data, a status marker in the text and structured output.
+    """
+    extra_data = getattr(invoke_response, "extra_data", None)
+    if extra_data is not None:
+        for item in extra_data.items:
+            if item.key == STATUS_EXTRA_DATA_KEY:
+                try:
+                    return A2AResponseClassification(status=A2AResponseStatus(item.value))
+                except ValueError:
+                    logger.warning(f"Ignoring unknown {STATUS_EXTRA_DATA_KEY} {item.value!r}")
+    marker = STATUS_MARKER.search(response)
+    if marker is not None:
+        return A2AResponseClassification(status=A2AResponseStatus(marker.group(1).lower()))
+    if getattr(invoke_response, "output_pydantic", None) is not None:
+        return A2AResponseClassification(status=A2AResponseStatus.completed)
+    return None
+
+
 class A2AResponseClassifier:
     """
     A class to classify responses from the A2A agent.
+
+    Responses are classified by the first of these tiers to decide:
+    structured signals (see ``classify_signals``), local keyword patterns
+    (see ``classify_heuristic``) when at least ``TA_A2A_CLASSIFIER_MIN_CONFIDENCE``
+    confident, and finally the classifier model, whose results are cached by
+    response hash. With the default minimum confidence, keyword matches never
+    decide; lowering it trades accuracy for fewer model calls.
     """
 
     NAME = "a2a-response-classifier"
@@ -220,6 +350,9 @@ class A2AResponseClassifier:
     )
 
     def __init__(self, app_config: AppConfig, chat_completion_builder: ChatCompletionBuilder):
+        self.min_confidence = float(app_config.get(TA_A2A_CLASSIFIER_MIN_CONFIDENCE.env_name))
+        self.cache_size = int(app_config.get(TA_A2A_CLASSIFIER_CACHE_SIZE.env_name))
+        self._cache: OrderedDict[str, A2AResponseClassification] = OrderedDict()
         model_name = app_config.get(TA_A2A_OUTPUT_CLASSIFIER_MODEL.env_name)
         chat_completion = chat_completion_builder.get_chat_completion_for_model(
             service_id=self.NAME, model_name=model_name
@@ -235,16 +368,46 @@ class A2AResponseClassifier:
             arguments=KernelArguments(settings=settings),
         )
 
-    async def classify_response(self, response: str) -> A2AResponseClassification:
+    async def classify_response(
+        self, response: str, invoke_response: Any | None = None
+    ) -> A2AResponseClassification:
         """
         Classify the response from the A2A agent.
 
         Args:
             response (str): The response from the A2A agent.
+            invoke_response: The handler's full response, for its structured signals.
 
         Returns:
             str: The classification of the response.
         """
+        classification = classify_signals(response, invoke_response)
+        if classification is not None:
+            return self._counted(classification, "signal")
+
+        classification, confidence = classify_heuristic(response)
+        if confidence >= self.min_confidence:
+            return self._counted(classification, "heuristic")
+
+        key = hashlib.sha256(response.encode()).hexdigest()
+        classification = self._cache.get(key)
+        if classification is not None:
+            self._cache.move_to_end(key)
+            return self._counted(classification, "cache")
+        classification = await self.classify_with_model(response)
+        if self.cache_size > 0:
+            self._cache[key] = classification
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return self._counted(classification, "model")
+
+    @staticmethod
+    def _counted(classification: A2AResponseClassification, tier: str) -> A2AResponseClassification:
+        _classification_counter.add(1, {"tier": tier, "status": classification.status.value})
+        return classification
+
+    async def classify_with_model(self, response: str) -> A2AResponseClassification:
+        """Classify the response with the classifier model."""
         chat_history = ChatHistory()
         chat_history.add_user_message(f"Please classify the following response:\n\n{response}")
         async for content in self.agent.invoke(messages=chat_history):
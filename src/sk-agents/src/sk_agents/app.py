@@ -3,19 +3,14 @@ from enum import Enum
 
 from fastapi import FastAPI
 from pydantic_yaml import parse_yaml_file_as
-from ska_utils import AppConfig, get_telemetry, initialize_telemetry
+from ska_utils import AppConfig, get_telemetry, initialize_telemetry, metrics_router
 
-from sk_agents.appv1 import AppV1
-from sk_agents.appv2 import AppV2
-from sk_agents.appv3 import AppV3
 from sk_agents.configs import (
     TA_SERVICE_CONFIG,
     configs,
 )
 from sk_agents.middleware import TelemetryMiddleware
-from sk_agents.ska_types import (
-    BaseConfig,
-)
+from sk_agents.startup import get_startup_profiler
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,14 +23,21 @@ class AppVersion(Enum):
 
 
 try:
-    AppConfig.add_configs(configs)
-    app_config = AppConfig()
+    profiler = get_startup_profiler()
+
+    with profiler.phase("import sk_agents.ska_types", "import"):
+        from sk_agents.ska_types import BaseConfig
+
+    with profiler.phase("AppConfig", "config"):
+        AppConfig.add_configs(configs)
+        app_config = AppConfig()
 
     config_file = app_config.get(TA_SERVICE_CONFIG.env_name)
     if not config_file:
         raise FileNotFoundError(f"Configuration file not found for {TA_SERVICE_CONFIG.env_name}")
     try:
-        config: BaseConfig = parse_yaml_file_as(BaseConfig, config_file)
+        with profiler.phase("service configuration", "config"):
+            config: BaseConfig = parse_yaml_file_as(BaseConfig, config_file)
     except Exception as e:
         logger.exception(f"Failed to parse YAML configuration. -{e}")
         raise
@@ -69,26 +71,42 @@ try:
     if not version:
         raise ValueError("Service version is not defined in the configuration file.")
 
-    initialize_telemetry(f"{name}-{version}", app_config)
+    with profiler.phase("telemetry", "config"):
+        initialize_telemetry(f"{name}-{version}", app_config)
 
     app = FastAPI(
         openapi_url=f"/{name}/{version}/openapi.json",
         docs_url=f"/{name}/{version}/docs",
         redoc_url=f"/{name}/{version}/redoc",
     )
+    st = get_telemetry()
     # noinspection PyTypeChecker
-    app.add_middleware(TelemetryMiddleware, st=get_telemetry())
+    app.add_middleware(TelemetryMiddleware, st=st)
+    app.include_router(metrics_router(st))
 
+    # Only the selected app version (and the handlers it depends on) is imported
     match app_version:
         case AppVersion.V1:
+            profiler.import_module("sk_agents.appv1")
+            from sk_agents.appv1 import AppV1
+
             AppV1.run(name, version, app_config, config, app)
         case AppVersion.V2:
             # DEPRECATION NOTICE: AppV2 and its A2A functionality is deprecated.
             # Maintained for backward compatibility only. Avoid A2A for new development.
+            profiler.import_module("sk_agents.appv2")
+            from sk_agents.appv2 import AppV2
+
             AppV2.run(name, version, app_config, config, app)
         case AppVersion.V3:
+            profiler.import_module("sk_agents.appv3")
+            from sk_agents.appv3 import AppV3
+
             AppV3.run(name, version, app_config, config, app)
 
+    app.state.startup_report = profiler.report
+    profiler.log_report()
+
 except Exception as e:
     logger.exception(f"Application failed to start due to an error. -{e}")
     raise
@@ -13,6 +13,8 @@ from sk_agents.routes import Routes
 from sk_agents.ska_types import (
     BaseConfig,
 )
+from sk_agents.skagents.v1.image_store import initialize_image_store
+from sk_agents.skagents.v1.sequential.config import Config as SequentialConfig
 from sk_agents.type_loader import get_type_loader
 from sk_agents.utility_routes import UtilityRoutes
 from sk_agents.utils import initialize_plugin_loader
@@ -35,6 +37,12 @@ class AppV1:
         type_loader = get_type_loader(types_module)
 
         initialize_plugin_loader(agents_path=agents_path, app_config=app_config)
+        initialize_image_store(app_config)
+
+        # Validating the task configs precompiles their instruction templates, so
+        # template syntax errors fail at startup instead of on the first request
+        if getattr(config, "kind", None) == "Sequential":
+            SequentialConfig(config)
 
         root_handler = config.apiVersion.split("/")[0]
 
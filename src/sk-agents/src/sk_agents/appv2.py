@@ -23,6 +23,7 @@ from sk_agents.configs import (
     TA_REDIS_SSL,
     TA_REDIS_TTL,
     TA_SERVICE_CONFIG,
+    TA_STATE_ENCODING,
     TA_STATE_MANAGEMENT,
 )
 from sk_agents.routes import Routes
@@ -32,6 +33,7 @@ from sk_agents.ska_types import (
 )
 from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
 from sk_agents.state import InMemoryStateManager, RedisStateManager, StateManager
+from sk_agents.stateful import StateSerializer
 from sk_agents.utils import initialize_plugin_loader
 
 
@@ -127,9 +129,12 @@ class AppV2:
     def _get_redis_state_manager(app_config: AppConfig) -> StateManager:
         redis_ttl = app_config.get(TA_REDIS_TTL.env_name)
 
+        state_encoding = app_config.get(TA_STATE_ENCODING.env_name)
+
         return RedisStateManager(
             redis_client=AppV2._get_redis_client(app_config),
             ttl=int(redis_ttl) if redis_ttl else None,
+            serializer=StateSerializer(state_encoding or TA_STATE_ENCODING.default_value),
         )
 
     @staticmethod
@@ -26,6 +26,7 @@ from sk_agents.persistence.persistence_factory import PersistenceFactory
 from sk_agents.routes import Routes
 from sk_agents.ska_types import BaseConfig
 from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
+from sk_agents.startup import StartupWarmup, get_startup_profiler
 from sk_agents.stateful import MockAuthenticationManager
 from sk_agents.tealagents.kernel_builder import KernelBuilder
 from sk_agents.tealagents.models import UserMessage
@@ -108,26 +109,30 @@ class AppV3:
                 f"AppV3 only supports 'tealagents/v1alpha1' API version, got: {config.apiVersion}"
             )
 
+        profiler = get_startup_profiler()
+
         config_file = app_config.get(TA_SERVICE_CONFIG.env_name)
         agents_path = str(os.path.dirname(config_file))
 
-        initialize_plugin_loader(agents_path=agents_path, app_config=app_config)
+        with profiler.phase("plugin loader", "plugins"):
+            initialize_plugin_loader(agents_path=agents_path, app_config=app_config)
 
         # Create state and auth managers
-        state_manager = AppV3._get_state_manager(app_config)
-        auth_manager = AppV3._get_auth_manager(app_config)
-        auth_storage_manager = AppV3._get_auth_storage_manager(app_config)
-
-        # Only create MCP discovery manager if MCP servers are configured
-        mcp_servers = (
-            getattr(config.spec.agent, "mcp_servers", None)
-            if hasattr(config, "spec") and hasattr(config.spec, "agent")
-            else None
-        )
-        if mcp_servers and len(mcp_servers) > 0:
-            mcp_discovery_manager = AppV3._get_mcp_discovery_manager(app_config)
-        else:
-            mcp_discovery_manager = None  # No MCP servers → No discovery manager needed
+        with profiler.phase("state, auth and discovery managers", "config"):
+            state_manager = AppV3._get_state_manager(app_config)
+            auth_manager = AppV3._get_auth_manager(app_config)
+            auth_storage_manager = AppV3._get_auth_storage_manager(app_config)
+
+            # Only create MCP discovery manager if MCP servers are configured
+            mcp_servers = (
+                getattr(config.spec.agent, "mcp_servers", None)
+                if hasattr(config, "spec") and hasattr(config.spec, "agent")
+                else None
+            )
+            if mcp_servers and len(mcp_servers) > 0:
+                mcp_discovery_manager = AppV3._get_mcp_discovery_manager(app_config)
+            else:
+                mcp_discovery_manager = None  # No MCP servers → No discovery manager needed
 
         # Get description from metadata if available
         if config.metadata is not None and config.metadata.description is not None:
@@ -136,43 +141,53 @@ class AppV3:
             description = f"{config.name} API"
 
         # Include only REST routes - No Websockets in V3
-        app.include_router(
-            Routes.get_stateful_routes(
-                name=name,
-                version=version,
-                description=description,
-                config=config,
-                app_config=app_config,
-                state_manager=state_manager,
-                authorizer=auth_manager,
-                auth_storage_manager=auth_storage_manager,
-                mcp_discovery_manager=mcp_discovery_manager,
-                input_class=UserMessage,
-            ),
-            prefix=f"/{name}/{version}",
-        )
+        with profiler.phase("stateful routes", "routes"):
+            app.include_router(
+                Routes.get_stateful_routes(
+                    name=name,
+                    version=version,
+                    description=description,
+                    config=config,
+                    app_config=app_config,
+                    state_manager=state_manager,
+                    authorizer=auth_manager,
+                    auth_storage_manager=auth_storage_manager,
+                    mcp_discovery_manager=mcp_discovery_manager,
+                    input_class=UserMessage,
+                ),
+                prefix=f"/{name}/{version}",
+            )
 
         # Include the new resume routes
-        app.include_router(
-            Routes.get_resume_routes(
-                config=config,
-                app_config=app_config,
-                state_manager=state_manager,
-                mcp_discovery_manager=mcp_discovery_manager,
-            ),
-            prefix=f"/{name}/{version}",
-        )
+        with profiler.phase("resume routes", "routes"):
+            app.include_router(
+                Routes.get_resume_routes(
+                    config=config,
+                    app_config=app_config,
+                    state_manager=state_manager,
+                    mcp_discovery_manager=mcp_discovery_manager,
+                ),
+                prefix=f"/{name}/{version}",
+            )
+
+        # With lazy initialization, plugin modules and chat completion clients are
+        # resolved by the warm-up endpoint or the first request instead of here
+        warmup = StartupWarmup(config, app_config, profiler)
+        if not warmup.lazy:
+            warmup.run()
 
         # Include utility routes for health checks
-        utility_routes = UtilityRoutes(start_time=datetime.now())
-        app.include_router(
-            utility_routes.get_health_routes(
-                config=config,
-                app_config=app_config,
-            ),
-            prefix=f"/{name}/{version}",
-        )
+        with profiler.phase("health routes", "routes"):
+            utility_routes = UtilityRoutes(start_time=datetime.now(), warmup=warmup)
+            app.include_router(
+                utility_routes.get_health_routes(
+                    config=config,
+                    app_config=app_config,
+                ),
+                prefix=f"/{name}/{version}",
+            )
 
         # Make config and other essentials available to request handlers
         app.state.config = config
         app.state.app_config = app_config
+        app.state.startup_warmup = warmup
@@ -1,12 +1,26 @@
 from semantic_kernel.connectors.ai.chat_completion_client_base import (
     ChatCompletionClientBase,
 )
-from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion
 from ska_utils import Config as UtilConfig
 
 from sk_agents.configs import TA_API_KEY
 from sk_agents.ska_types import ChatCompletionFactory, ModelType
 
+# The OpenAI connector is the slowest import on the startup path, so it is
+# resolved on first use (or during warm-up) rather than at module import.
+OpenAIChatCompletion: type[ChatCompletionClientBase] | None = None
+
+
+def openai_chat_completion_type() -> type[ChatCompletionClientBase]:
+    global OpenAIChatCompletion
+    if OpenAIChatCompletion is None:
+        from semantic_kernel.connectors.ai.open_ai import (
+            OpenAIChatCompletion as open_ai_chat_completion,
+        )
+
+        OpenAIChatCompletion = open_ai_chat_completion
+    return OpenAIChatCompletion
+
 
 class DefaultChatCompletionFactory(ChatCompletionFactory):
     _OPENAI_MODELS: list[str] = ["gpt-4o", "gpt-4o-mini"]
@@ -19,7 +33,7 @@ class DefaultChatCompletionFactory(ChatCompletionFactory):
         self, model_name: str, service_id: str
     ) -> ChatCompletionClientBase:
         if model_name in self._OPENAI_MODELS:
-            return OpenAIChatCompletion(
+            return openai_chat_completion_type()(
                 service_id=service_id,
                 ai_model_id=model_name,
                 api_key=self.app_config.get(TA_API_KEY.env_name),
@@ -0,0 +1,339 @@
+"""Deterministic, network-free chat completion for offline load testing.
+
+Enable it through the custom chat completion factory hook::
+
+    TA_CUSTOM_CHAT_COMPLETION_FACTORY_MODULE=src/sk_agents/chat_completion/fake_chat_completion_factory.py
+    TA_CUSTOM_CHAT_COMPLETION_FACTORY_CLASS_NAME=FakeChatCompletionFactory
+
+Responses are served from a script (YAML or JSON, see `FakeLlmScript`) which
+can be hand written or recorded from real traffic. The step that is served is
+derived from the chat history itself (the number of tool-call rounds since the
+last user message), so concurrent requests and the per-recursion kernel
+rebuilds in the handlers all see the same deterministic sequence.
+"""
+
+import asyncio
+import json
+import random
+import re
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from openai.types import CompletionUsage
+from pydantic import BaseModel, Field
+from pydantic_yaml import parse_yaml_file_as
+from semantic_kernel.connectors.ai.chat_completion_client_base import (
+    ChatCompletionClientBase,
+)
+from semantic_kernel.connectors.ai.open_ai import OpenAIChatPromptExecutionSettings
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents import ChatMessageContent, TextContent
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.streaming_chat_message_content import (
+    StreamingChatMessageContent,
+)
+from semantic_kernel.contents.streaming_text_content import StreamingTextContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.contents.utils.finish_reason import FinishReason
+from semantic_kernel.exceptions import ServiceResponseException
+from ska_utils import AppConfig, Config as UtilConfig
+
+from sk_agents.ska_types import ChatCompletionFactory, ModelType
+
+_TOKEN_PATTERN = re.compile(r"\S+\s*|\s+")
+
+
+class FakeToolCall(BaseModel):
+    plugin_name: str
+    function_name: str
+    arguments: dict[str, Any] = Field(default_factory=dict)
+
+
+class FakeStep(BaseModel):
+    """A single scripted LLM response."""
+
+    content: str | None = None
+    tool_calls: list[FakeToolCall] = Field(default_factory=list)
+    completion_tokens: int | None = None
+    prompt_tokens: int | None = None
+    error: str | None = None
+
+
+class FakeScenario(BaseModel):
+    """An ordered list of steps, optionally selected by matching the last user message."""
+
+    match: str | None = None
+    steps: list[FakeStep]
+
+
+class FakeLlmScript(BaseModel):
+    scenarios: list[FakeScenario] = Field(default_factory=list)
+
+
+class FakeLlmSettings(BaseModel):
+    first_token_delay_ms: float = 0.0
+    inter_token_delay_ms: float = 0.0
+    completion_tokens: int = 32
+    failure_rate: float = 0.0
+    seed: int = 0
+
+
+class FakeCompletion(BaseModel):
+    """Stand-in for a provider response, carrying OpenAI-style usage."""
+
+    usage: CompletionUsage
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text)
+
+
+def _default_content(completion_tokens: int) -> str:
+    return " ".join(f"token{i}" for i in range(completion_tokens))
+
+
+class FakeChatCompletion(ChatCompletionClientBase):
+    """Chat completion client that replays a `FakeLlmScript` without network access."""
+
+    script: FakeLlmScript = Field(default_factory=FakeLlmScript)
+    fake_settings: FakeLlmSettings = Field(default_factory=FakeLlmSettings)
+    rng: random.Random = Field(default_factory=random.Random, exclude=True)
+
+    def __init__(
+        self,
+        service_id: str,
+        ai_model_id: str,
+        script: FakeLlmScript | None = None,
+        fake_settings: FakeLlmSettings | None = None,
+        rng: random.Random | None = None,
+    ):
+        fake_settings = fake_settings or FakeLlmSettings()
+        super().__init__(
+            service_id=service_id,
+            ai_model_id=ai_model_id,
+            script=script or FakeLlmScript(),
+            fake_settings=fake_settings,
+            rng=rng or random.Random(fake_settings.seed),
+        )
+
+    def get_prompt_execution_settings_class(self) -> type[PromptExecutionSettings]:
+        # OpenAI settings so agents can set e.g. response_format as they would for a real model
+        return OpenAIChatPromptExecutionSettings
+
+    @staticmethod
+    def _last_user_message(chat_history: ChatHistory) -> tuple[int, str]:
+        for index in range(len(chat_history.messages) - 1, -1, -1):
+            message = chat_history.messages[index]
+            if message.role == AuthorRole.USER:
+                return index, message.content or ""
+        return -1, ""
+
+    def _select_step(self, chat_history: ChatHistory) -> FakeStep:
+        user_index, user_text = self._last_user_message(chat_history)
+        tool_rounds = sum(
+            1
+            for message in chat_history.messages[user_index + 1 :]
+            if message.role == AuthorRole.ASSISTANT
+            and any(isinstance(item, FunctionCallContent) for item in message.items)
+        )
+        for scenario in self.script.scenarios:
+            if scenario.steps and (scenario.match is None or re.search(scenario.match, user_text)):
+                return scenario.steps[min(tool_rounds, len(scenario.steps) - 1)]
+        return FakeStep(content=_default_content(self.fake_settings.completion_tokens))
+
+    def _check_failure(self, step: FakeStep) -> None:
+        if step.error:
+            raise ServiceResponseException(step.error)
+        if self.fake_settings.failure_rate and self.rng.random() < self.fake_settings.failure_rate:
+            raise ServiceResponseException("Injected failure from fake chat completion")
+
+    @staticmethod
+    def _estimate_prompt_tokens(chat_history: ChatHistory) -> int:
+        return sum(len(_tokenize(str(message.content or ""))) for message in chat_history)
+
+    def _usage_for(self, step: FakeStep, chat_history: ChatHistory, tokens: list[str]) -> Any:
+        completion_tokens = (
+            step.completion_tokens
+            if step.completion_tokens is not None
+            else len(tokens) + len(step.tool_calls)
+        )
+        prompt_tokens = (
+            step.prompt_tokens
+            if step.prompt_tokens is not None
+            else self._estimate_prompt_tokens(chat_history)
+        )
+        return FakeCompletion(
+            usage=CompletionUsage(
+                completion_tokens=completion_tokens,
+                prompt_tokens=prompt_tokens,
+                total_tokens=completion_tokens + prompt_tokens,
+            )
+        )
+
+    @staticmethod
+    def _function_calls(step: FakeStep, call_prefix: str) -> list[FunctionCallContent]:
+        return [
+            FunctionCallContent(
+                id=f"{call_prefix}-{index}",
+                plugin_name=tool_call.plugin_name,
+                function_name=tool_call.function_name,
+                arguments=json.dumps(tool_call.arguments),
+            )
+            for index, tool_call in enumerate(step.tool_calls)
+        ]
+
+    async def _inner_get_chat_message_contents(
+        self,
+        chat_history: ChatHistory,
+        settings: PromptExecutionSettings,
+    ) -> list[ChatMessageContent]:
+        step = self._select_step(chat_history)
+        tokens = _tokenize(step.content or "")
+        delay = (
+            self.fake_settings.first_token_delay_ms
+            + self.fake_settings.inter_token_delay_ms * (max(len(tokens) - 1, 0))
+        )
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        self._check_failure(step)
+
+        items: list[Any] = []
+        if step.content:
+            items.append(TextContent(text=step.content))
+        items.extend(self._function_calls(step, f"call-{len(chat_history.messages)}"))
+        return [
+            ChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                items=items,
+                ai_model_id=self.ai_model_id,
+                inner_content=self._usage_for(step, chat_history, tokens),
+                finish_reason=FinishReason.TOOL_CALLS if step.tool_calls else FinishReason.STOP,
+            )
+        ]
+
+    async def _inner_get_streaming_chat_message_contents(
+        self,
+        chat_history: ChatHistory,
+        settings: PromptExecutionSettings,
+        function_invoke_attempt: int = 0,
+    ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
+        step = self._select_step(chat_history)
+        tokens = _tokenize(step.content or "")
+        if self.fake_settings.first_token_delay_ms:
+            await asyncio.sleep(self.fake_settings.first_token_delay_ms / 1000)
+        self._check_failure(step)
+
+        for index, token in enumerate(tokens):
+            if index and self.fake_settings.inter_token_delay_ms:
+                await asyncio.sleep(self.fake_settings.inter_token_delay_ms / 1000)
+            yield [
+                StreamingChatMessageContent(
+                    role=AuthorRole.ASSISTANT,
+                    choice_index=0,
+                    items=[StreamingTextContent(choice_index=0, text=token)],
+                    ai_model_id=self.ai_model_id,
+                    function_invoke_attempt=function_invoke_attempt,
+                )
+            ]
+
+        yield [
+            StreamingChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                choice_index=0,
+                items=self._function_calls(step, f"call-{len(chat_history.messages)}"),
+                ai_model_id=self.ai_model_id,
+                inner_content=self._usage_for(step, chat_history, tokens),
+                finish_reason=FinishReason.TOOL_CALLS if step.tool_calls else FinishReason.STOP,
+                function_invoke_attempt=function_invoke_attempt,
+            )
+        ]
+
+
+class FakeChatCompletionFactory(ChatCompletionFactory):
+    TA_FAKE_LLM_MODELS = UtilConfig(
+        env_name="TA_FAKE_LLM_MODELS", is_required=False, default_value=None
+    )
+    TA_FAKE_LLM_SCRIPT = UtilConfig(
+        env_name="TA_FAKE_LLM_SCRIPT", is_required=False, default_value=None
+    )
+    TA_FAKE_LLM_FIRST_TOKEN_DELAY_MS = UtilConfig(
+        env_name="TA_FAKE_LLM_FIRST_TOKEN_DELAY_MS", is_required=False, default_value="0"
+    )
+    TA_FAKE_LLM_INTER_TOKEN_DELAY_MS = UtilConfig(
+        env_name="TA_FAKE_LLM_INTER_TOKEN_DELAY_MS", is_required=False, default_value="0"
+    )
+    TA_FAKE_LLM_COMPLETION_TOKENS = UtilConfig(
+        env_name="TA_FAKE_LLM_COMPLETION_TOKENS", is_required=False, default_value="32"
+    )
+    TA_FAKE_LLM_FAILURE_RATE = UtilConfig(
+        env_name="TA_FAKE_LLM_FAILURE_RATE", is_required=False, default_value="0"
+    )
+    TA_FAKE_LLM_SEED = UtilConfig(env_name="TA_FAKE_LLM_SEED", is_required=False, default_value="0")
+
+    _CONFIGS: list[UtilConfig] = [
+        TA_FAKE_LLM_MODELS,
+        TA_FAKE_LLM_SCRIPT,
+        TA_FAKE_LLM_FIRST_TOKEN_DELAY_MS,
+        TA_FAKE_LLM_INTER_TOKEN_DELAY_MS,
+        TA_FAKE_LLM_COMPLETION_TOKENS,
+        TA_FAKE_LLM_FAILURE_RATE,
+        TA_FAKE_LLM_SEED,
+    ]
+
+    def __init__(self, app_config: AppConfig):
+        super().__init__(app_config)
+        models = app_config.get(FakeChatCompletionFactory.TA_FAKE_LLM_MODELS.env_name)
+        self.models: list[str] | None = (
+            [model.strip() for model in models.split(",") if model.strip()] if models else None
+        )
+        script_file = app_config.get(FakeChatCompletionFactory.TA_FAKE_LLM_SCRIPT.env_name)
+        self.script = (
+            parse_yaml_file_as(FakeLlmScript, script_file) if script_file else FakeLlmScript()
+        )
+        self.fake_settings = FakeLlmSettings(
+            first_token_delay_ms=float(
+                app_config.get(FakeChatCompletionFactory.TA_FAKE_LLM_FIRST_TOKEN_DELAY_MS.env_name)
+            ),
+            inter_token_delay_ms=float(
+                app_config.get(FakeChatCompletionFactory.TA_FAKE_LLM_INTER_TOKEN_DELAY_MS.env_name)
+            ),
+            completion_tokens=int(
+                app_config.get(FakeChatCompletionFactory.TA_FAKE_LLM_COMPLETION_TOKENS.env_name)
+            ),
+            failure_rate=float(
+                app_config.get(FakeChatCompletionFactory.TA_FAKE_LLM_FAILURE_RATE.env_name)
+            ),
+            seed=int(app_config.get(FakeChatCompletionFactory.TA_FAKE_LLM_SEED.env_name)),
+        )
+        # Shared across clients so injected failures follow one seeded sequence per process
+        self.rng = random.Random(self.fake_settings.seed)
+
+    @staticmethod
+    def get_configs() -> list[UtilConfig]:
+        return FakeChatCompletionFactory._CONFIGS
+
+    def _check_model(self, model_name: str) -> None:
+        if self.models is not None and model_name not in self.models:
+            raise ValueError(f"Unknown model name {model_name}")
+
+    def get_chat_completion_for_model_name(
+        self, model_name: str, service_id: str
+    ) -> ChatCompletionClientBase:
+        self._check_model(model_name)
+        return FakeChatCompletion(
+            service_id=service_id,
+            ai_model_id=model_name,
+            script=self.script,
+            fake_settings=self.fake_settings,
+            rng=self.rng,
+        )
+
+    def get_model_type_for_name(self, model_name: str) -> ModelType:
+        self._check_model(model_name)
+        # Usage is reported in the OpenAI shape so token accounting works unchanged
+        return ModelType.OPENAI
+
+    def model_supports_structured_output(self, model_name: str) -> bool:
+        self._check_model(model_name)
+        return False
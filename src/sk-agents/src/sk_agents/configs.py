@@ -9,6 +9,12 @@ TA_REMOTE_PLUGIN_PATH = Config(
 )
 TA_TYPES_MODULE = Config(env_name="TA_TYPES_MODULE", is_required=False, default_value=None)
 TA_PLUGIN_MODULE = Config(env_name="TA_PLUGIN_MODULE", is_required=False, default_value=None)
+# Defer plugin module loading and chat completion client imports until first use or warm-up
+TA_LAZY_INIT = Config(env_name="TA_LAZY_INIT", is_required=False, default_value="false")
+# Read directly from the environment since profiling starts before AppConfig is built
+TA_STARTUP_PROFILING = Config(
+    env_name="TA_STARTUP_PROFILING", is_required=False, default_value="false"
+)
 TA_CUSTOM_CHAT_COMPLETION_FACTORY_MODULE = Config(
     env_name="TA_CUSTOM_CHAT_COMPLETION_FACTORY_MODULE",
     is_required=False,
@@ -24,6 +30,20 @@ TA_STRUCTURED_OUTPUT_TRANSFORMER_MODEL = Config(
     is_required=False,
     default_value="gpt-4o",
 )
+# Images sent to skagents/v1 agents are kept once in a local blob cache and
+# referenced by hash from the chat history
+TA_IMAGE_CACHE_MAX_BYTES = Config(
+    env_name="TA_IMAGE_CACHE_MAX_BYTES", is_required=False, default_value="268435456"
+)
+# Optional downscaling (requires Pillow): maximum width x height of an image
+TA_IMAGE_MAX_PIXELS = Config(env_name="TA_IMAGE_MAX_PIXELS", is_required=False, default_value=None)
+# Optional recompression (requires Pillow), e.g. JPEG or WEBP, and its quality
+TA_IMAGE_FORMAT = Config(env_name="TA_IMAGE_FORMAT", is_required=False, default_value=None)
+TA_IMAGE_QUALITY = Config(env_name="TA_IMAGE_QUALITY", is_required=False, default_value="85")
+# Also treat unframed {"extra_data": ...} JSON chunks in skagents/v1 streams as extra data
+TA_EXTRA_DATA_LEGACY_JSON = Config(
+    env_name="TA_EXTRA_DATA_LEGACY_JSON", is_required=False, default_value="true"
+)
 
 # DEPRECATION NOTICE: A2A (Agent-to-Agent) configuration options are deprecated
 # as part of the framework migration evaluation. These configs are maintained for
@@ -45,6 +65,15 @@ TA_A2A_OUTPUT_CLASSIFIER_MODEL = Config(
     is_required=False,
     default_value="gpt-4o-mini",
 )
+# Responses classified locally with less confidence than this go to the classifier model;
+# keyword matches are at most 0.7 confident, so by default only explicit signals skip it
+TA_A2A_CLASSIFIER_MIN_CONFIDENCE = Config(
+    env_name="TA_A2A_CLASSIFIER_MIN_CONFIDENCE", is_required=False, default_value="0.8"
+)
+# Number of classifier model results cached by response hash
+TA_A2A_CLASSIFIER_CACHE_SIZE = Config(
+    env_name="TA_A2A_CLASSIFIER_CACHE_SIZE", is_required=False, default_value="1024"
+)
 TA_STATE_MANAGEMENT = Config(
     env_name="TA_STATE_MANAGEMENT",
     is_required=True,
@@ -68,6 +97,8 @@ TA_REDIS_DB = Config(env_name="TA_REDIS_DB", is_required=False, default_value=No
 TA_REDIS_TTL = Config(env_name="TA_REDIS_TTL", is_required=False, default_value=None)
 TA_REDIS_SSL = Config(env_name="TA_REDIS_SSL", is_required=False, default_value="true")
 TA_REDIS_PWD = Config(env_name="TA_REDIS_PWD", is_required=False, default_value=None)
+# Encoding of the task messages written by the Redis state manager: json, msgpack or zstd
+TA_STATE_ENCODING = Config(env_name="TA_STATE_ENCODING", is_required=False, default_value="json")
 
 TA_PERSISTENCE_MODULE = Config(
     env_name="TA_PERSISTENCE_MODULE",
@@ -183,14 +214,23 @@ configs: list[Config] = [
     TA_REMOTE_PLUGIN_PATH,
     TA_TYPES_MODULE,
     TA_PLUGIN_MODULE,
+    TA_LAZY_INIT,
+    TA_STARTUP_PROFILING,
     TA_CUSTOM_CHAT_COMPLETION_FACTORY_MODULE,
     TA_CUSTOM_CHAT_COMPLETION_FACTORY_CLASS_NAME,
     TA_STRUCTURED_OUTPUT_TRANSFORMER_MODEL,
+    TA_IMAGE_CACHE_MAX_BYTES,
+    TA_IMAGE_MAX_PIXELS,
+    TA_IMAGE_FORMAT,
+    TA_IMAGE_QUALITY,
+    TA_EXTRA_DATA_LEGACY_JSON,
     TA_A2A_ENABLED,
     TA_AGENT_BASE_URL,
     TA_PROVIDER_ORG,
     TA_PROVIDER_URL,
     TA_A2A_OUTPUT_CLASSIFIER_MODEL,
+    TA_A2A_CLASSIFIER_MIN_CONFIDENCE,
+    TA_A2A_CLASSIFIER_CACHE_SIZE,
     TA_STATE_MANAGEMENT,
     TA_REDIS_HOST,
     TA_REDIS_PORT,
@@ -198,6 +238,7 @@ configs: list[Config] = [
     TA_REDIS_TTL,
     TA_REDIS_SSL,
     TA_REDIS_PWD,
+    TA_STATE_ENCODING,
     TA_PERSISTENCE_MODULE,
     TA_PERSISTENCE_CLASS,
     TA_AUTHORIZER_CLASS,
@@ -1,4 +1,5 @@
 import json
+from typing import Any
 
 from pydantic import BaseModel
 
@@ -19,6 +20,27 @@ class ExtraDataPartial(BaseModel):
     def new_from_json(json_str: str) -> "ExtraDataPartial":
         return ExtraDataPartial(**json.loads(json_str))
 
+    @staticmethod
+    def from_chunk(chunk: Any, legacy_json: bool = True) -> "ExtraDataPartial | None":
+        """Return the extra data carried by a streamed chunk, or None for regular output.
+
+        Producers send extra data as an ``ExtraDataPartial`` item alongside the
+        text chunks. With ``legacy_json``, ``{"extra_data": ...}`` JSON strings are
+        recognized as well, but are only parsed when the chunk starts with ``{``
+        and mentions ``extra_data``.
+        """
+        if isinstance(chunk, ExtraDataPartial):
+            return chunk
+        content = chunk if isinstance(chunk, str) else getattr(chunk, "content", None)
+        if not content or not isinstance(content, str):
+            return None
+        if legacy_json and content[0] == "{" and '"extra_data"' in content:
+            try:
+                return ExtraDataPartial.new_from_json(content)
+            except ValueError:
+                return None
+        return None
+
 
 class ExtraDataCollector:
     def __init__(self):
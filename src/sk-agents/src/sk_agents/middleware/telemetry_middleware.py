@@ -1,8 +1,9 @@
+import time
 from contextlib import nullcontext
 
 from fastapi import FastAPI, Request, Response
 from opentelemetry.propagate import extract
-from ska_utils import Telemetry
+from ska_utils import Telemetry, record_request_from_scope
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
 
@@ -14,6 +15,7 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
         self.st = st
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        start = time.perf_counter()
         context = extract(request.headers)
         with (
             self.st.tracer.start_as_current_span(
@@ -27,4 +29,5 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
             else nullcontext()
         ):
             response = await call_next(request)
+        record_request_from_scope(request, response, start)
         return response
@@ -1,32 +1,47 @@
 import logging
+import threading
 from typing import Any
 
 from ska_utils import ModuleLoader
 
 
 class PluginLoader:
-    def __init__(self, plugin_module: str | None = None):
+    def __init__(self, plugin_module: str | None = None, lazy: bool = False):
         self.plugin_module = None
         self.custom_module = None
+        self._lock = threading.Lock()
 
-        self.set_plugin_module(plugin_module)
+        self.set_plugin_module(plugin_module, lazy)
 
     @staticmethod
     def _parse_module_name(types_module: str) -> str:
         return types_module.split("/")[-1].split(".")[0]
 
-    def set_plugin_module(self, plugin_module: str | None):
+    def set_plugin_module(self, plugin_module: str | None, lazy: bool = False):
         self.plugin_module = plugin_module
-        if self.plugin_module:
+        self.custom_module = None
+        if self.plugin_module and not lazy:
+            self.load()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.plugin_module is None or self.custom_module is not None
+
+    def load(self):
+        """Load the plugin module if it has not been loaded yet (lazy mode)."""
+        if self.is_loaded:
+            return
+        with self._lock:
+            if self.is_loaded:
+                return
             try:
-                self.custom_module = ModuleLoader.load_module(plugin_module)
+                self.custom_module = ModuleLoader.load_module(self.plugin_module)
             except (FileNotFoundError, ImportError, AttributeError, SyntaxError) as e:
-                logging.exception(f"Failed to load module '{plugin_module}': {e}")
-                raise ImportError(f"Cannot load plugin module '{plugin_module}': {e}") from e
-        else:
-            self.custom_module = None
+                logging.exception(f"Failed to load module '{self.plugin_module}': {e}")
+                raise ImportError(f"Cannot load plugin module '{self.plugin_module}': {e}") from e
 
     def get_plugins(self, plugin_names: list[str]) -> dict[str, Any]:
+        self.load()
         if not self.custom_module:
             raise RuntimeError("Custom module not loaded; cannot retrieve plugins.")
         plugins = {}
@@ -41,8 +56,8 @@ class PluginLoader:
 _plugin_loader: PluginLoader | None = None
 
 
-def get_plugin_loader(plugin_module: str | None = None) -> PluginLoader:
+def get_plugin_loader(plugin_module: str | None = None, lazy: bool = False) -> PluginLoader:
     global _plugin_loader
     if not _plugin_loader:
-        _plugin_loader = PluginLoader(plugin_module)
+        _plugin_loader = PluginLoader(plugin_module, lazy)
     return _plugin_loader
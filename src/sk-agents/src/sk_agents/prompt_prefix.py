@@ -0,0 +1,99 @@
+"""Stable request prefixes for provider-side prompt caching.
+
+Providers only reuse a cached prompt when the start of the request is
+byte-identical to an earlier one. The start of a request is the system prompt
+followed by the tool definitions, so both have to be the same on every
+request: plugins and their functions are put in name order (plugin loading,
+remote plugins and MCP discovery do not guarantee an order), and JSON schema
+keys are sorted. Content which changes between requests belongs after it.
+
+The hash of the tool definitions is computed once per kernel, when it is
+canonicalized; canonicalize the kernel again after changing its plugins.
+"""
+
+import hashlib
+import json
+import logging
+import weakref
+from typing import Any
+
+from opentelemetry import metrics
+from semantic_kernel.connectors.ai.function_calling_utils import (
+    kernel_function_metadata_to_function_call_format,
+)
+from semantic_kernel.kernel import Kernel
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_prefix_counter = _meter.create_counter(
+    "tealagents.prompt_prefix.requests",
+    unit="{request}",
+    description="Model requests by agent and hash of their system prompt and tool definitions",
+)
+
+# id(kernel) -> (weak reference to the kernel, hash of its tool definitions)
+_tool_hashes: dict[int, tuple[weakref.ref, str]] = {}
+
+
+def _sort_keys(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _sort_keys(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return [_sort_keys(item) for item in value]
+    return value
+
+
+def canonicalize_kernel(kernel: Kernel) -> Kernel:
+    """Order the kernel's plugins, functions and parameter schemas deterministically."""
+    for plugin in kernel.plugins.values():
+        plugin.functions = dict(sorted(plugin.functions.items()))
+        for function in plugin.functions.values():
+            for parameter in function.metadata.parameters:
+                if parameter.schema_data:
+                    parameter.schema_data = _sort_keys(parameter.schema_data)
+    kernel.plugins = dict(sorted(kernel.plugins.items()))
+    key = id(kernel)
+    _tool_hashes[key] = (
+        weakref.ref(kernel, lambda _: _tool_hashes.pop(key, None)),
+        _hash_tools(kernel),
+    )
+    return kernel
+
+
+def _tools(kernel: Kernel) -> list[dict[str, Any]]:
+    return [
+        kernel_function_metadata_to_function_call_format(metadata)
+        for metadata in kernel.get_full_list_of_function_metadata()
+    ]
+
+
+def _hash_tools(kernel: Kernel) -> str:
+    return hashlib.sha256(json.dumps(_tools(kernel), sort_keys=True).encode()).hexdigest()
+
+
+def serialize_prefix(instructions: str | None, kernel: Kernel) -> str:
+    """The system prompt and tool definitions, in the order they are sent."""
+    return json.dumps({"instructions": instructions or "", "tools": _tools(kernel)}, sort_keys=True)
+
+
+def prefix_hash(instructions: str | None, kernel: Kernel) -> str:
+    cached = _tool_hashes.get(id(kernel))
+    tools_hash = cached[1] if cached is not None and cached[0]() is kernel else _hash_tools(kernel)
+    prefix = f"{tools_hash}\n{instructions or ''}"
+    return hashlib.sha256(prefix.encode()).hexdigest()[:16]
+
+
+def record_prefix(agent_name: str, instructions: str | None, kernel: Kernel) -> str | None:
+    """Count a model request against the hash of its prefix and return the hash.
+
+    A stable agent has one hash per deployment; more hashes than deployments
+    means the prefix changes between requests and prompt caching cannot hit.
+    """
+    try:
+        hash_value = prefix_hash(instructions, kernel)
+    except Exception as e:
+        logger.warning(f"Could not hash the prompt prefix of {agent_name}: {e}")
+        return None
+    _prefix_counter.add(1, {"agent": agent_name, "prefix_hash": hash_value})
+    return hash_value
@@ -1,3 +1,4 @@
+import json
 import logging
 from contextlib import nullcontext
 
@@ -17,7 +18,7 @@ from fastapi import (
 )
 from fastapi.responses import StreamingResponse
 from opentelemetry.propagate import extract
-from ska_utils import AppConfig, get_telemetry
+from ska_utils import AppConfig, get_service_metrics, get_telemetry
 
 from sk_agents.a2a import A2AAgentExecutor
 from sk_agents.auth_storage.secure_auth_storage_manager import SecureAuthStorageManager
@@ -52,6 +53,11 @@ from sk_agents.utils import docstring_parameter, get_sse_event_for_response
 
 logger = logging.getLogger(__name__)
 
+# Subprotocol of the streaming WebSocket for clients which keep the connection open: each
+# request is a JSON envelope with the input (as a JSON string) and the trace headers of the
+# invocation, and each response ends with an empty binary frame
+STREAM_SUBPROTOCOL = "tealagents.stream.v1"
+
 
 class Routes:
     @staticmethod
@@ -254,12 +260,13 @@ class Routes:
 
             async def event_generator():
                 with (
+                    get_service_metrics().track_stream("sse"),
                     st.tracer.start_as_current_span(
                         f"{config.service_name}-{str(config.version)}-invoke_sse",
                         context=context,
                     )
                     if st.telemetry_enabled()
-                    else nullcontext()
+                    else nullcontext(),
                 ):
                     match root_handler_name:
                         case "skagents":
@@ -292,37 +299,55 @@ class Routes:
 
         @router.websocket("/stream")
         async def invoke_stream(websocket: WebSocket) -> None:
-            await websocket.accept()
+            # Clients offering STREAM_SUBPROTOCOL keep the connection for further invocations
+            subprotocols = websocket.headers.get("sec-websocket-protocol", "").split(",")
+            persistent = STREAM_SUBPROTOCOL in (p.strip() for p in subprotocols)
+            await websocket.accept(subprotocol=STREAM_SUBPROTOCOL if persistent else None)
             st = get_telemetry()
-            context = extract(websocket.headers)
 
             authorization = websocket.headers.get("authorization", None)
             try:
-                data = await websocket.receive_json()
-                with (
-                    st.tracer.start_as_current_span(
-                        f"{name}-{str(version)}-invoke_stream",
-                        context=context,
-                    )
-                    if st.telemetry_enabled()
-                    else nullcontext()
-                ):
-                    inputs = input_class(**data)
-                    inv_inputs = inputs.__dict__
-                    match root_handler_name:
-                        case "skagents":
-                            handler: BaseHandler = skagents_handle(
-                                config, app_config, authorization
-                            )
-                            async for content in handler.invoke_stream(inputs=inv_inputs):
-                                if isinstance(content, PartialResponse):
-                                    await websocket.send_text(content.output_partial)
-                            await websocket.close()
-                        case _:
-                            logger.exception(
-                                "Unknown apiVersion: %s", config.apiVersion, exc_info=True
-                            )
-                            raise ValueError(f"Unknown apiVersion %s: {config.apiVersion}")
+                while True:
+                    if persistent:
+                        try:
+                            envelope = await websocket.receive_json()
+                        except WebSocketDisconnect:
+                            # The client closed its idle connection
+                            return
+                        data = json.loads(envelope["input"])
+                        context = extract(envelope.get("headers") or websocket.headers)
+                    else:
+                        data = await websocket.receive_json()
+                        context = extract(websocket.headers)
+                    with (
+                        get_service_metrics().track_stream("websocket"),
+                        st.tracer.start_as_current_span(
+                            f"{name}-{str(version)}-invoke_stream",
+                            context=context,
+                        )
+                        if st.telemetry_enabled()
+                        else nullcontext(),
+                    ):
+                        inputs = input_class(**data)
+                        inv_inputs = inputs.__dict__
+                        match root_handler_name:
+                            case "skagents":
+                                handler: BaseHandler = skagents_handle(
+                                    config, app_config, authorization
+                                )
+                                async for content in handler.invoke_stream(inputs=inv_inputs):
+                                    if isinstance(content, PartialResponse):
+                                        await websocket.send_text(content.output_partial)
+                            case _:
+                                logger.exception(
+                                    "Unknown apiVersion: %s", config.apiVersion, exc_info=True
+                                )
+                                raise ValueError(f"Unknown apiVersion %s: {config.apiVersion}")
+                    if not persistent:
+                        await websocket.close()
+                        return
+                    # An empty binary frame ends the response
+                    await websocket.send_bytes(b"")
             except WebSocketDisconnect:
                 logger.exception("websocket disconnected")
                 print("websocket disconnected")
@@ -411,14 +436,15 @@ class Routes:
             )
 
             async def event_generator():
-                try:
-                    async for content in teal_handler.resume_task(
-                        authorization, request_id, body, stream=True
-                    ):
-                        yield get_sse_event_for_response(content)
-                except Exception as e:
-                    logger.exception(f"Error in resume_sse: {e}")
-                    raise HTTPException(status_code=500, detail="Internal Server Error") from e
+                with get_service_metrics().track_stream("sse"):
+                    try:
+                        async for content in teal_handler.resume_task(
+                            authorization, request_id, body, stream=True
+                        ):
+                            yield get_sse_event_for_response(content)
+                    except Exception as e:
+                        logger.exception(f"Error in resume_sse: {e}")
+                        raise HTTPException(status_code=500, detail="Internal Server Error") from e
 
             return StreamingResponse(event_generator(), media_type="text/event-stream")
 
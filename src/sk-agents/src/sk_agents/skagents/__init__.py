@@ -1,7 +1,8 @@
 from ska_utils import AppConfig
 
 from sk_agents.ska_types import BaseConfig, BaseHandler
-from sk_agents.skagents.v1 import handle as skagents_v1_handle
+from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
+from sk_agents.skagents.v1 import HandlerFactory as V1HandlerFactory, handle as skagents_v1_handle
 
 
 def handle(
@@ -16,3 +17,20 @@ def handle(
             return skagents_v1_handle(config, app_config, authorization)
         case _:
             raise ValueError(f"Unknown apiVersion: {config.apiVersion}")
+
+
+def handler_factory(
+    config: BaseConfig,
+    app_config: AppConfig,
+    chat_completion_builder: ChatCompletionBuilder | None = None,
+) -> V1HandlerFactory:
+    """A factory creating per-request handlers which share request-independent builders."""
+    api, version = config.apiVersion.split("/")
+    if api != "skagents":
+        raise ValueError(f"Unknown apiVersion: {config.apiVersion}")
+
+    match version:
+        case "v1" | "v2alpha1":
+            return V1HandlerFactory(config, app_config, chat_completion_builder)
+        case _:
+            raise ValueError(f"Unknown apiVersion: {config.apiVersion}")
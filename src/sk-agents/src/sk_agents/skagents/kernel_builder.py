@@ -5,6 +5,7 @@ from ska_utils import AppConfig
 
 from sk_agents.extra_data_collector import ExtraDataCollector
 from sk_agents.plugin_loader import get_plugin_loader
+from sk_agents.prompt_prefix import canonicalize_kernel
 from sk_agents.ska_types import ModelType
 from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
 from sk_agents.skagents.remote_plugin_loader import RemotePluginLoader
@@ -36,7 +37,8 @@ class KernelBuilder:
         try:
             kernel = self._create_base_kernel(model_name, service_id)
             kernel = self._parse_plugins(plugins, kernel, authorization, extra_data_collector)
-            return self._load_remote_plugins(remote_plugins, kernel)
+            kernel = self._load_remote_plugins(remote_plugins, kernel)
+            return canonicalize_kernel(kernel)
         except Exception as e:
             self.logger.exception(f"Could build kernel with service ID {service_id}. - {e}")
             raise
@@ -1,5 +1,6 @@
-from ska_utils import AppConfig
+from ska_utils import AppConfig, strtobool
 
+from sk_agents.configs import TA_EXTRA_DATA_LEGACY_JSON
 from sk_agents.ska_types import (
     BaseConfig,
     BaseHandler,
@@ -31,27 +32,82 @@ def handle(config: BaseConfig, app_config: AppConfig, authorization: str | None
             raise ValueError(f"Unknown kind: {config.kind}")
 
 
+def _legacy_extra_data(app_config: AppConfig) -> bool:
+    # Read on every request, so the snapshot's converted value is used
+    legacy = app_config.snapshot().get_bool(TA_EXTRA_DATA_LEGACY_JSON.env_name)
+    return strtobool(TA_EXTRA_DATA_LEGACY_JSON.default_value) if legacy is None else legacy
+
+
+def _build_kernel_builder(
+    app_config: AppConfig, chat_completion_builder: ChatCompletionBuilder | None = None
+) -> KernelBuilder:
+    remote_plugin_loader = RemotePluginLoader(RemotePluginCatalog(app_config))
+    chat_completion_builder = chat_completion_builder or ChatCompletionBuilder(app_config)
+    return KernelBuilder(chat_completion_builder, remote_plugin_loader, app_config)
+
+
 def _handle_chat(
     config: BaseConfig,
     app_config: AppConfig,
     authorization: str | None = None,
     is_v2: bool = False,
+    kernel_builder: KernelBuilder | None = None,
 ) -> BaseHandler:
-    remote_plugin_loader = RemotePluginLoader(RemotePluginCatalog(app_config))
-    chat_completion_builder = ChatCompletionBuilder(app_config)
-    kernel_builder = KernelBuilder(chat_completion_builder, remote_plugin_loader, app_config)
+    kernel_builder = kernel_builder or _build_kernel_builder(app_config)
     agent_builder = AgentBuilder(kernel_builder, authorization)
-    chat_agents = ChatAgents(config, agent_builder, is_v2)
+    chat_agents = ChatAgents(config, agent_builder, is_v2, _legacy_extra_data(app_config))
     return chat_agents
 
 
 def _handle_sequential(
-    config: BaseConfig, app_config: AppConfig, authorization: str | None = None
+    config: BaseConfig,
+    app_config: AppConfig,
+    authorization: str | None = None,
+    kernel_builder: KernelBuilder | None = None,
 ) -> BaseHandler:
-    remote_plugin_loader = RemotePluginLoader(RemotePluginCatalog(app_config))
-    chat_completion_builder = ChatCompletionBuilder(app_config)
-    kernel_builder = KernelBuilder(chat_completion_builder, remote_plugin_loader, app_config)
+    kernel_builder = kernel_builder or _build_kernel_builder(app_config)
     agent_builder = AgentBuilder(kernel_builder, authorization)
     task_builder = TaskBuilder(agent_builder)
-    seq_skagents = SequentialSkagents(config, kernel_builder, task_builder)
+    seq_skagents = SequentialSkagents(
+        config, kernel_builder, task_builder, _legacy_extra_data(app_config)
+    )
     return seq_skagents
+
+
+class HandlerFactory:
+    """Creates the handlers of one agent configuration, one per request.
+
+    The chat completion builder, remote plugin catalog and kernel builder do
+    not depend on the request, so they are created once and shared; only the
+    agent builder, which carries the request's authorization, and the handler
+    itself are created per request.
+    """
+
+    def __init__(
+        self,
+        config: BaseConfig,
+        app_config: AppConfig,
+        chat_completion_builder: ChatCompletionBuilder | None = None,
+    ):
+        if config.apiVersion != "skagents/v1" and config.apiVersion != "skagents/v2alpha1":
+            raise ValueError(f"Unknown apiVersion: {config.apiVersion}")
+        if config.kind not in ("Sequential", "Chat", "Agent"):
+            raise ValueError(f"Unknown kind: {config.kind}")
+        self.config = config
+        self.app_config = app_config
+        self.kernel_builder = _build_kernel_builder(app_config, chat_completion_builder)
+
+    def handler(self, authorization: str | None = None) -> BaseHandler:
+        match self.config.kind:
+            case "Sequential":
+                return _handle_sequential(
+                    self.config, self.app_config, authorization, self.kernel_builder
+                )
+            case "Chat":
+                return _handle_chat(
+                    self.config, self.app_config, authorization, False, self.kernel_builder
+                )
+            case _:
+                return _handle_chat(
+                    self.config, self.app_config, authorization, True, self.kernel_builder
+                )
@@ -29,8 +29,15 @@ logger = logging.getLogger(__name__)
 
 
 class ChatAgents(BaseHandler):
-    def __init__(self, config: BaseConfig, agent_builder: AgentBuilder, is_v2: bool = False):
+    def __init__(
+        self,
+        config: BaseConfig,
+        agent_builder: AgentBuilder,
+        is_v2: bool = False,
+        legacy_extra_data: bool = True,
+    ):
         self.version = config.version
+        self.legacy_extra_data = legacy_extra_data
         if not is_v2:
             self.name = config.service_name
             if config.input_type not in [
@@ -100,6 +107,10 @@ class ChatAgents(BaseHandler):
                     first_token_time = time.time()
                     titme_to_first_token_ms = (first_token_time - start_time) * 1000
                     first_token_received = True
+                extra_data_partial = ExtraDataPartial.from_chunk(chunk, self.legacy_extra_data)
+                if extra_data_partial is not None:
+                    extra_data_collector.add_extra_data_items(extra_data_partial.extra_data)
+                    continue
                 # Initialize content as the partial message in chunk
                 content = chunk.content
                 # Calculate usage metrics
@@ -107,20 +118,15 @@ class ChatAgents(BaseHandler):
                 completion_tokens += call_usage.completion_tokens
                 prompt_tokens += call_usage.prompt_tokens
                 total_tokens += call_usage.total_tokens
-                try:
-                    # Attempt to parse as ExtraDataPartial
-                    extra_data_partial: ExtraDataPartial = ExtraDataPartial.new_from_json(content)
-                    extra_data_collector.add_extra_data_items(extra_data_partial.extra_data)
-                except Exception:
-                    if len(content) > 0:
-                        # Handle and return partial response
-                        final_response.append(content)
-                        yield PartialResponse(
-                            session_id=session_id,
-                            source=f"{self.name}:{self.version}",
-                            request_id=request_id,
-                            output_partial=content,
-                        )
+                if len(content) > 0:
+                    # Handle and return partial response
+                    final_response.append(content)
+                    yield PartialResponse(
+                        session_id=session_id,
+                        source=f"{self.name}:{self.version}",
+                        request_id=request_id,
+                        output_partial=content,
+                    )
             # Build the final response with InvokeResponse
             logger.info("Building the final response with InvokeRespons")
             if stream_span:
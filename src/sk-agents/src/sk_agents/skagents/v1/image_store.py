@@ -0,0 +1,203 @@
+import base64
+import binascii
+import hashlib
+import importlib
+import io
+import logging
+import math
+import threading
+from collections import OrderedDict
+from functools import cache
+from types import ModuleType
+
+from pydantic import PrivateAttr
+from semantic_kernel.contents import ImageContent
+from semantic_kernel.contents.utils.data_uri import DataUri
+from ska_utils import AppConfig
+
+from sk_agents.configs import (
+    TA_IMAGE_CACHE_MAX_BYTES,
+    TA_IMAGE_FORMAT,
+    TA_IMAGE_MAX_PIXELS,
+    TA_IMAGE_QUALITY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+def _pillow() -> ModuleType:
+    try:
+        return importlib.import_module("PIL.Image")
+    except ImportError as err:
+        raise ImportError(
+            "Image downscaling and recompression require the optional 'Pillow' package. "
+            "Install the 'images' extra to use them."
+        ) from err
+
+
+class ImageBlob:
+    """Decoded image bytes stored once, however many messages reference them."""
+
+    __slots__ = ("blob_hash", "data", "mime_type")
+
+    def __init__(self, blob_hash: str, data: bytes, mime_type: str):
+        self.blob_hash = blob_hash
+        self.data = data
+        self.mime_type = mime_type
+
+
+class ImageReference(ImageContent):
+    """Image content which holds a reference to an image in the image store.
+
+    The base64 data URI is only produced when it is read, i.e. when a chat
+    completion service formats the request, so chat histories holding the
+    same image (or copies of a history) share one decoded copy of it.
+    """
+
+    blob_hash: str
+    _blob: ImageBlob | None = PrivateAttr(default=None)
+
+    @property
+    def _data_uri(self) -> DataUri | None:
+        blob = self._blob or get_image_store().get(self.blob_hash)
+        if blob is None:
+            return None
+        return DataUri(data_bytes=blob.data, data_format="base64", mime_type=blob.mime_type)
+
+    @_data_uri.setter
+    def _data_uri(self, value: DataUri | None):
+        # Set to None by BinaryContent.__init__; the data always comes from the blob
+        pass
+
+    @classmethod
+    def from_blob(cls, blob: ImageBlob) -> "ImageReference":
+        reference = cls(blob_hash=blob.blob_hash)
+        reference._blob = blob
+        return reference
+
+
+class ImageStore:
+    """Content-addressed cache of the images sent to agents.
+
+    Images are decoded once and keyed by the SHA-256 of their original bytes,
+    so the same image sent again (in later requests, or in the chat history)
+    reuses the stored blob. The cache is bounded by the total size of the
+    stored images and evicts the least recently used first; messages keep a
+    reference to their blob, so an evicted image stays readable by them.
+
+    When ``max_pixels`` or ``image_format`` is set, images are downscaled to at
+    most ``max_pixels`` pixels and/or recompressed before they are stored.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = int(TA_IMAGE_CACHE_MAX_BYTES.default_value),
+        max_pixels: int | None = None,
+        image_format: str | None = None,
+        quality: int = int(TA_IMAGE_QUALITY.default_value),
+    ):
+        self.max_bytes = max_bytes
+        self.max_pixels = max_pixels
+        self.image_format = image_format.upper() if image_format else None
+        self.quality = quality
+        self.size = 0
+        self._blobs: OrderedDict[str, ImageBlob] = OrderedDict()
+        self._lock = threading.Lock()
+        if max_pixels or image_format:
+            _pillow()
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def get(self, blob_hash: str) -> ImageBlob | None:
+        with self._lock:
+            blob = self._blobs.get(blob_hash)
+            if blob is not None:
+                self._blobs.move_to_end(blob_hash)
+            return blob
+
+    def put(self, data: bytes, mime_type: str) -> ImageBlob:
+        """Store an image, returning the existing blob if it is already cached."""
+        blob_hash = hashlib.sha256(data).hexdigest()
+        blob = self.get(blob_hash)
+        if blob is not None:
+            return blob
+        if self.max_pixels or self.image_format:
+            data, mime_type = self._resize(data, mime_type)
+        blob = ImageBlob(blob_hash, data, mime_type)
+        with self._lock:
+            if blob_hash not in self._blobs:
+                self._blobs[blob_hash] = blob
+                self.size += len(data)
+                while self.size > self.max_bytes and len(self._blobs) > 1:
+                    _, evicted = self._blobs.popitem(last=False)
+                    self.size -= len(evicted.data)
+        return blob
+
+    def reference(self, data: str, mime_type: str) -> ImageReference:
+        """Store base64 encoded image data and return a reference to it."""
+        try:
+            decoded = base64.b64decode(data, validate=True)
+        except binascii.Error:
+            # MIME encoders wrap base64 in lines, which strict decoding rejects
+            try:
+                decoded = base64.b64decode("".join(data.split()), validate=True)
+            except binascii.Error as e:
+                raise ValueError(f"Invalid base64 image data: {e}") from e
+        return ImageReference.from_blob(self.put(decoded, mime_type))
+
+    def reference_data_uri(self, data_uri: str) -> ImageReference | ImageContent:
+        """Reference the image of a base64 data URI; other URIs are left as they are."""
+        header, separator, data = data_uri.partition(",")
+        mime_type = header.removeprefix("data:").removesuffix(";base64").split(";")[0]
+        if separator and header.startswith("data:") and header.endswith(";base64") and mime_type:
+            return self.reference(data, mime_type)
+        return ImageContent(data_uri=data_uri)
+
+    def _resize(self, data: bytes, mime_type: str) -> tuple[bytes, str]:
+        image_module = _pillow()
+        with image_module.open(io.BytesIO(data)) as image:
+            image_format = self.image_format or image.format
+            pixels = image.width * image.height
+            if self.max_pixels and pixels > self.max_pixels:
+                scale = math.sqrt(self.max_pixels / pixels)
+                size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+                image = image.resize(size, image_module.Resampling.LANCZOS)
+            elif image_format == image.format:
+                return data, mime_type
+            if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            output = io.BytesIO()
+            image.save(output, format=image_format, quality=self.quality)
+        resized = output.getvalue()
+        if len(resized) >= len(data) and pixels <= (self.max_pixels or pixels):
+            # Recompressing alone did not make the image smaller
+            return data, mime_type
+        logger.debug(f"Image of {len(data)} bytes stored as {image_format} of {len(resized)} bytes")
+        return resized, image_module.MIME.get(image_format, mime_type)
+
+
+_image_store: ImageStore | None = None
+
+
+def get_image_store() -> ImageStore:
+    global _image_store
+    if _image_store is None:
+        _image_store = ImageStore()
+    return _image_store
+
+
+def initialize_image_store(app_config: AppConfig) -> ImageStore:
+    global _image_store
+    max_pixels = app_config.get(TA_IMAGE_MAX_PIXELS.env_name)
+    _image_store = ImageStore(
+        max_bytes=int(
+            app_config.get(TA_IMAGE_CACHE_MAX_BYTES.env_name)
+            or TA_IMAGE_CACHE_MAX_BYTES.default_value
+        ),
+        max_pixels=int(max_pixels) if max_pixels else None,
+        image_format=app_config.get(TA_IMAGE_FORMAT.env_name),
+        quality=int(app_config.get(TA_IMAGE_QUALITY.env_name) or TA_IMAGE_QUALITY.default_value),
+    )
+    return _image_store
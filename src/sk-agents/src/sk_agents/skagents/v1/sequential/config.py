@@ -1,7 +1,9 @@
-from pydantic import BaseModel, ConfigDict
+from jinja2 import TemplateSyntaxError
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from sk_agents.ska_types import BaseConfig
 from sk_agents.skagents.v1.config import AgentConfig
+from sk_agents.skagents.v1.sequential.template_cache import get_template_cache
 
 
 class TaskConfig(BaseModel):
@@ -10,11 +12,27 @@ class TaskConfig(BaseModel):
     description: str
     instructions: str
     agent: str
+    # Raise an error when the instructions reference an input that was not provided
+    strict_undefined: bool = False
+
+    @model_validator(mode="after")
+    def precompile_instructions(self) -> "TaskConfig":
+        # Surfaces template syntax errors at config load and warms the template cache
+        try:
+            get_template_cache().get_template(self.instructions, self.strict_undefined)
+        except TemplateSyntaxError as e:
+            raise ValueError(
+                f"Invalid instructions template for task {self.name} (line {e.lineno}): {e}"
+            ) from e
+        return self
 
 
 class Spec(BaseModel):
     agents: list[AgentConfig]
     tasks: list[TaskConfig]
+    # Tasks whose instructions do not reference each other's outputs may run
+    # concurrently, up to this many at a time. 1 keeps strictly sequential execution.
+    max_parallel_tasks: int = Field(default=1, ge=1)
 
 
 class V1Config(BaseConfig):
@@ -40,3 +58,6 @@ class Config:
 
     def get_tasks(self) -> list[TaskConfig]:
         return self.config.spec.tasks
+
+    def get_max_parallel_tasks(self) -> int:
+        return self.config.spec.max_parallel_tasks
@@ -6,6 +6,7 @@ from semantic_kernel.connectors.ai.function_choice_behavior import (
 )
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.kernel_pydantic import KernelBaseModel
 from ska_utils import AppConfig
 
 from sk_agents.configs import TA_STRUCTURED_OUTPUT_TRANSFORMER_MODEL
@@ -20,15 +21,28 @@ class OutputTransformer:
         "Convert the given text into a structured output. Do not summarize or paraphrase the text."
     )
 
+    # Transformer agents only depend on the model and output type, so they are
+    # shared across requests instead of building a new kernel for every call
+    _agents: dict[tuple[str, str], ChatCompletionAgent] = {}
+
     def __init__(self, kernel_builder: KernelBuilder):
         self.kernel_builder = kernel_builder
 
-    async def transform_output(self, output: str, output_type_str: str) -> InvokeResponse:
-        type_loader = get_type_loader()
-        output_type = type_loader.get_type(output_type_str)
+    @classmethod
+    def clear_cache(cls):
+        cls._agents.clear()
+
+    def _get_agent(
+        self, output_type_str: str, output_type: type[KernelBaseModel] | None
+    ) -> ChatCompletionAgent:
+        structured_output_model = (
+            AppConfig().snapshot().get_str(TA_STRUCTURED_OUTPUT_TRANSFORMER_MODEL.env_name)
+        )
 
-        app_config = AppConfig()
-        structured_output_model = app_config.get(TA_STRUCTURED_OUTPUT_TRANSFORMER_MODEL.env_name)
+        key = (structured_output_model, output_type_str)
+        agent = OutputTransformer._agents.get(key)
+        if agent is not None:
+            return agent
 
         kernel = self.kernel_builder.build_kernel(
             model_name=structured_output_model,
@@ -47,6 +61,14 @@ class OutputTransformer:
             instructions=self.SYSTEM_PROMPT,
             arguments=KernelArguments(settings=settings),
         )
+        OutputTransformer._agents[key] = agent
+        return agent
+
+    async def transform_output(self, output: str, output_type_str: str) -> InvokeResponse:
+        type_loader = get_type_loader()
+        output_type = type_loader.get_type(output_type_str)
+
+        agent = self._get_agent(output_type_str, output_type)
 
         history = ChatHistory()
         history.add_user_message(output)
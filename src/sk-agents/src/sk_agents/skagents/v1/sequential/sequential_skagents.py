@@ -1,12 +1,13 @@
-import json
+import asyncio
 import logging
 import time
 import uuid
 from collections.abc import AsyncIterable
 from contextlib import nullcontext
-from copy import deepcopy
 from typing import Any
 
+from pydantic import ValidationError
+from semantic_kernel.contents import ChatMessageContent, ImageContent
 from semantic_kernel.contents.chat_history import ChatHistory
 from ska_utils import get_telemetry
 
@@ -23,7 +24,10 @@ from sk_agents.ska_types import (
 from sk_agents.skagents.kernel_builder import KernelBuilder
 from sk_agents.skagents.v1.sequential.config import Config
 from sk_agents.skagents.v1.sequential.output_transformer import OutputTransformer
+from sk_agents.skagents.v1.sequential.task import Task
 from sk_agents.skagents.v1.sequential.task_builder import TaskBuilder
+from sk_agents.skagents.v1.sequential.task_graph import TaskGraph
+from sk_agents.skagents.v1.sequential.task_inputs import TaskInputs
 from sk_agents.skagents.v1.utils import get_token_usage_for_response, parse_chat_history
 from sk_agents.type_loader import get_type_loader
 
@@ -36,6 +40,7 @@ class SequentialSkagents(BaseHandler):
         config: BaseConfig,
         kernel_builder: KernelBuilder,
         task_builder: TaskBuilder,
+        legacy_extra_data: bool = True,
     ):
         if hasattr(config, "spec"):
             self.config = Config(config=config)
@@ -48,6 +53,7 @@ class SequentialSkagents(BaseHandler):
         self.version = config.version
 
         self.kernel_builder = kernel_builder
+        self.legacy_extra_data = legacy_extra_data
 
         task_configs = self.config.get_tasks()
         if not task_configs:
@@ -66,15 +72,29 @@ class SequentialSkagents(BaseHandler):
                 self.config.config.output_type,
             )
         )
+        self.task_graph = TaskGraph(
+            [task.name for task in self.tasks], [task.instructions for task in self.tasks]
+        )
+        self.max_parallel_tasks = self.config.get_max_parallel_tasks()
 
     async def _transform_output_if_required(self, response: InvokeResponse) -> InvokeResponse:
+        output_type_str = self.config.config.output_type
         if self.tasks[-1].agent.so_supported():
+            # The final task requested the output type as its response_format, so the
+            # response normally validates as is and no second LLM call is needed
             type_loader = get_type_loader()
-            output_type = type_loader.get_type(self.config.config.output_type)
-            response.output_pydantic = output_type(**json.loads(response.output_raw))
-            return response
-        else:
-            return await self._transform_output(response, self.config.config.output_type)
+            output_type = type_loader.get_type(output_type_str)
+            if output_type is None:
+                raise ValueError(f"Unknown output type: {output_type_str}")
+            try:
+                response.output_pydantic = output_type.model_validate_json(response.output_raw)
+                return response
+            except ValidationError as e:
+                logger.warning(
+                    f"Structured output of {self.name}:{self.version} does not match "
+                    f"{output_type_str}, falling back to the output transformer. - {e}"
+                )
+        return await self._transform_output(response, output_type_str)
 
     async def _transform_output(
         self, current_response: InvokeResponse, output_type_str: str
@@ -105,14 +125,124 @@ class SequentialSkagents(BaseHandler):
     @staticmethod
     def _parse_task_inputs(
         inputs: dict[str, Any] | None = None,
-    ) -> dict[str, Any] | None:
-        if inputs is not None:
-            task_inputs = deepcopy(inputs)
-            if "chat_history" in task_inputs:
-                del task_inputs["chat_history"]
-        else:
-            task_inputs = None
-        return task_inputs
+    ) -> TaskInputs:
+        # The tasks share the request's input values rather than a deep copy of
+        # them; the chat history is passed to the tasks as a ChatHistory instead
+        return TaskInputs(inputs or {}, hidden=("chat_history",))
+
+    def _task_error(
+        self, task: Task, session_id: str, request_id: str, e: Exception
+    ) -> AgentInvokeException:
+        return AgentInvokeException(
+            f"Error invoking {self.name}:{self.version} "
+            f"for Session-id {session_id}, Request-id {request_id}, "
+            f"Task description {task.description}. Error: {str(e)}"
+        )
+
+    def _runs_in_parallel(self) -> bool:
+        return self.max_parallel_tasks > 1 and not self.task_graph.is_sequential()
+
+    async def _invoke_tasks_in_parallel(
+        self,
+        task_count: int,
+        chat_history: ChatHistory,
+        task_inputs: TaskInputs,
+        session_id: str,
+        request_id: str,
+    ) -> AsyncIterable[tuple[Task, InvokeResponse, float]]:
+        """Invoke the first ``task_count`` tasks as their dependencies allow.
+
+        Each task sees the request's chat history followed by the messages of the
+        tasks it depends on (directly or not), and only those tasks' outputs. The
+        embedded image is sent with every task without dependencies, as the others
+        see it in the messages of the tasks they depend on.
+        Results are yielded in declaration order together with the task's response
+        time in ms; as each one is yielded its messages are appended to
+        ``chat_history`` and its output to ``task_inputs``, as in a sequential run.
+        """
+        base_messages = list(chat_history.messages)
+        base_inputs = task_inputs.copy()
+        semaphore = asyncio.Semaphore(self.max_parallel_tasks)
+        task_messages: list[list] = [[] for _ in range(task_count)]
+        outputs: list[str | None] = [None] * task_count
+        runs: list[asyncio.Task] = []
+
+        async def run(index: int) -> tuple[InvokeResponse, float]:
+            task = self.tasks[index]
+            await asyncio.gather(*(runs[d] for d in self.task_graph.dependencies[index]))
+            ancestors = self.task_graph.ancestors(index)
+            history = ChatHistory(
+                messages=base_messages + [m for a in ancestors for m in task_messages[a]]
+            )
+            history_length = len(history.messages)
+            inputs = base_inputs.copy()
+            if ancestors:
+                inputs.pop("embedded_image", None)
+            inputs.update({f"_{self.tasks[a].name}": outputs[a] for a in ancestors})
+            async with semaphore:
+                start_time = time.time()
+                try:
+                    response = await task.invoke(history=history, inputs=inputs)
+                except Exception as e:
+                    raise self._task_error(task, session_id, request_id, e) from e
+                response_time_ms = (time.time() - start_time) * 1000
+            task_messages[index] = history.messages[history_length:]
+            outputs[index] = response.output_raw
+            return response, response_time_ms
+
+        for index in range(task_count):
+            runs.append(asyncio.create_task(run(index)))
+        try:
+            for index, task_run in enumerate(runs):
+                i_response, response_time_ms = await task_run
+                for message in task_messages[index]:
+                    # As in a sequential run, only the first task's message has the image
+                    if index and not self.task_graph.dependencies[index]:
+                        message = self._without_images(message)
+                    chat_history.add_message(message)
+                task_inputs[f"_{self.tasks[index].name}"] = i_response.output_raw
+                yield self.tasks[index], i_response, response_time_ms
+        finally:
+            for task_run in runs:
+                task_run.cancel()
+            await asyncio.gather(*runs, return_exceptions=True)
+
+    @staticmethod
+    def _without_images(message: ChatMessageContent) -> ChatMessageContent:
+        items = [item for item in message.items if not isinstance(item, ImageContent)]
+        if len(items) == len(message.items):
+            return message
+        return message.model_copy(update={"items": items})
+
+    async def _invoke_tasks(
+        self,
+        task_count: int,
+        chat_history: ChatHistory,
+        task_inputs: TaskInputs,
+        session_id: str,
+        request_id: str,
+    ) -> AsyncIterable[tuple[Task, InvokeResponse, float]]:
+        """Invoke the first ``task_count`` tasks, yielding each response in declaration order.
+
+        When parallel execution is enabled the intermediate tasks run concurrently
+        as their dependencies allow. The last task, which produces the agent's
+        response, always runs after all others.
+        """
+        parallel_count = min(task_count, len(self.tasks) - 1) if self._runs_in_parallel() else 0
+        if parallel_count:
+            async for result in self._invoke_tasks_in_parallel(
+                parallel_count, chat_history, task_inputs, session_id, request_id
+            ):
+                yield result
+            task_inputs.pop("embedded_image", None)
+        for task in self.tasks[parallel_count:task_count]:
+            start_time = time.time()
+            try:
+                i_response = await task.invoke(history=chat_history, inputs=task_inputs)
+            except Exception as e:
+                raise self._task_error(task, session_id, request_id, e) from e
+            task_inputs[f"_{task.name}"] = i_response.output_raw
+            yield task, i_response, (time.time() - start_time) * 1000
 
     async def invoke_stream(
         self, inputs: dict[str, Any] | None = None
@@ -145,40 +275,25 @@ class SequentialSkagents(BaseHandler):
             logger.info("Beginning processing invoke stream")
 
             # Process and stream back intermediate tasks results
-            for task in self.tasks[:-1]:
-                try:
-                    logger.info("Creating IntermediateTaskResponse")
-                    first_token_received = False
-                    start_time = time.time()
-                    i_response: InvokeResponse = await task.invoke(
-                        history=chat_history, inputs=task_inputs
-                    )
-                    if not first_token_received:
-                        first_token_time = time.time()
-                        ttft_ms = (first_token_time - start_time) * 1000
-                        average_ttft_ms.append(ttft_ms)
-                        first_token_received = True
-                    i_response.session_id = session_id
-                    i_response.source = f"{self.name}:{self.version}"
-                    i_response.request_id = request_id
+            async for task, i_response, response_time_ms in self._invoke_tasks(
+                len(self.tasks) - 1, chat_history, task_inputs, session_id, request_id
+            ):
+                logger.info("Creating IntermediateTaskResponse")
+                average_ttft_ms.append(response_time_ms)
+                i_response.session_id = session_id
+                i_response.source = f"{self.name}:{self.version}"
+                i_response.request_id = request_id
 
-                    task_inputs[f"_{task.name}"] = i_response.output_raw
-                    completion_tokens += i_response.token_usage.completion_tokens
-                    prompt_tokens += i_response.token_usage.prompt_tokens
-                    total_tokens += i_response.token_usage.total_tokens
-                    collector.add_extra_data_items(i_response.extra_data)
-                    task_no += 1
-                    yield IntermediateTaskResponse(
-                        task_no=task_no,
-                        task_name=task.name,
-                        response=i_response,
-                    )
-                except Exception as e:
-                    raise AgentInvokeException(
-                        f"Error invoking {self.name}:{self.version} "
-                        f"for Session-id {session_id}, Request-id {request_id}, "
-                        f"Task description {task.description}. Error: {str(e)}"
-                    ) from e
+                completion_tokens += i_response.token_usage.completion_tokens
+                prompt_tokens += i_response.token_usage.prompt_tokens
+                total_tokens += i_response.token_usage.total_tokens
+                collector.add_extra_data_items(i_response.extra_data)
+                task_no += 1
+                yield IntermediateTaskResponse(
+                    task_no=task_no,
+                    task_name=task.name,
+                    response=i_response,
+                )
             logger.info("Beginning final processing")
             # Process and stream back final task results
             first_token_received = False
@@ -191,6 +306,10 @@ class SequentialSkagents(BaseHandler):
                     ttft_ms = (first_token_time - start_time) * 1000
                     average_ttft_ms.append(ttft_ms)
                     first_token_received = True
+                extra_data_partial = ExtraDataPartial.from_chunk(chunk, self.legacy_extra_data)
+                if extra_data_partial is not None:
+                    collector.add_extra_data_items(extra_data_partial.extra_data)
+                    continue
                 # Initialize content as the partial message in chunk
                 content = chunk.content
                 # Calculate usage metrics if chunk contains usage metadata
@@ -200,19 +319,14 @@ class SequentialSkagents(BaseHandler):
                 completion_tokens += call_usage.completion_tokens
                 prompt_tokens += call_usage.prompt_tokens
                 total_tokens += call_usage.total_tokens
-                try:
-                    # Attempt to parse as ExtraDataPartial
-                    extra_data_partial: ExtraDataPartial = ExtraDataPartial.new_from_json(content)
-                    collector.add_extra_data_items(extra_data_partial.extra_data)
-                except Exception:
-                    # Handle and return partial response
-                    final_response.append(content)
-                    yield PartialResponse(
-                        session_id=session_id,
-                        source=f"{self.name}:{self.version}",
-                        request_id=request_id,
-                        output_partial=content,
-                    )
+                # Handle and return partial response
+                final_response.append(content)
+                yield PartialResponse(
+                    session_id=session_id,
+                    source=f"{self.name}:{self.version}",
+                    request_id=request_id,
+                    output_partial=content,
+                )
             if stream_span:
                 stream_span.set_attribute("completion_tokens", completion_tokens)
                 stream_span.set_attribute("prompt_tokens", prompt_tokens)
@@ -275,25 +389,15 @@ class SequentialSkagents(BaseHandler):
         ) as invoke_span:
             average_ttft_ms = []
             logger.info("Beginning processing invoke")
-            for task in self.tasks:
-                try:
-                    start_time = time.time()
-                    i_response = await task.invoke(history=chat_history, inputs=task_inputs)
-                    response_time = time.time()
-                    ttft_ms = (response_time - start_time) * 1000
-                    average_ttft_ms.append(ttft_ms)
-                    task_inputs[f"_{task.name}"] = i_response.output_raw
-                    completion_tokens += i_response.token_usage.completion_tokens
-                    prompt_tokens += i_response.token_usage.prompt_tokens
-                    total_tokens += i_response.token_usage.total_tokens
-                    collector.add_extra_data_items(i_response.extra_data)
-                    task_no += 1
-                except Exception as e:
-                    raise AgentInvokeException(
-                        f"Error invoking {self.name}:{self.version} "
-                        f"for Session-id {session_id}, Request-id {request_id}, "
-                        f"Task description {task.description}. Error: {str(e)}"
-                    ) from e
+            async for _, i_response, response_time_ms in self._invoke_tasks(
+                len(self.tasks), chat_history, task_inputs, session_id, request_id
+            ):
+                average_ttft_ms.append(response_time_ms)
+                completion_tokens += i_response.token_usage.completion_tokens
+                prompt_tokens += i_response.token_usage.prompt_tokens
+                total_tokens += i_response.token_usage.total_tokens
+                collector.add_extra_data_items(i_response.extra_data)
+                task_no += 1
             if invoke_span:
                 invoke_span.set_attribute("completion_tokens", completion_tokens)
                 invoke_span.set_attribute("prompt_tokens", prompt_tokens)
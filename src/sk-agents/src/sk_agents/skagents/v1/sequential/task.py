@@ -1,7 +1,6 @@
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Mapping, MutableMapping
 from typing import Any
 
-from jinja2 import Template
 from semantic_kernel.contents import (
     AuthorRole,
     ChatMessageContent,
@@ -16,6 +15,8 @@ from semantic_kernel.kernel_pydantic import KernelBaseModel
 
 from sk_agents.extra_data_collector import ExtraDataCollector, ExtraDataPartial
 from sk_agents.ska_types import EmbeddedImage, InvokeResponse, TokenUsage
+from sk_agents.skagents.v1.image_store import get_image_store
+from sk_agents.skagents.v1.sequential.template_cache import get_template_cache
 from sk_agents.skagents.v1.sk_agent import SKAgent
 from sk_agents.skagents.v1.utils import get_token_usage_for_response
 
@@ -32,31 +33,32 @@ class Task:
         instructions: str,
         agent: SKAgent,
         extra_data_collector: ExtraDataCollector | None = None,
+        strict_undefined: bool = False,
     ):
         self.name = name
         self.description = description
         self.instructions = instructions
         self.agent = agent
+        self.template = get_template_cache().get_template(instructions, strict_undefined)
         if extra_data_collector:
             self.extra_data_collector = extra_data_collector
         else:
             self.extra_data_collector = ExtraDataCollector()
 
-    def _get_user_message_with_inputs(self, inputs: dict[str, Any] | None = None) -> str:
-        return self.instructions if inputs is None else Template(self.instructions).render(inputs)
+    def _get_user_message_with_inputs(self, inputs: Mapping[str, Any] | None = None) -> str:
+        return self.instructions if inputs is None else self.template.render(inputs)
 
     @staticmethod
     def _embedded_image_to_image_content(
         embedded_image: EmbeddedImage | None,
     ) -> ImageContent | None:
         if embedded_image:
-            data_uri = f"data:{embedded_image.format};base64,{embedded_image.data}"
-            return ImageContent(data_uri=data_uri)
+            return get_image_store().reference(embedded_image.data, embedded_image.format)
         return None
 
     @staticmethod
     def _parse_image_input(
-        inputs: dict[str, Any] | None = None,
+        inputs: MutableMapping[str, Any] | None = None,
     ) -> EmbeddedImage | None:
         if not inputs:
             return None
@@ -65,11 +67,11 @@ class Task:
             return inputs.pop("embedded_image")
         return None
 
-    def _parse_text_input(self, inputs: dict[str, Any] | None = None) -> TextContent:
+    def _parse_text_input(self, inputs: Mapping[str, Any] | None = None) -> TextContent:
         content = self._get_user_message_with_inputs(inputs)
         return TextContent(text=content)
 
-    def _get_message(self, inputs: dict[str, Any] | None = None) -> ChatMessageContent:
+    def _get_message(self, inputs: MutableMapping[str, Any] | None = None) -> ChatMessageContent:
         embedded_image = Task._parse_image_input(inputs)
         image_content = Task._embedded_image_to_image_content(embedded_image)
         text_content = self._parse_text_input(inputs)
@@ -81,8 +83,8 @@ class Task:
     async def invoke_stream(
         self,
         history: ChatHistory,
-        inputs: dict[str, Any] | None = None,
-    ) -> AsyncIterable[StreamingChatMessageContent | str]:
+        inputs: MutableMapping[str, Any] | None = None,
+    ) -> AsyncIterable[StreamingChatMessageContent | ExtraDataPartial]:
         message = self._get_message(inputs)
         history.add_message(message)
         contents = []
@@ -90,16 +92,15 @@ class Task:
             contents.append(content)
             yield content
         if not self.extra_data_collector.is_empty():
-            yield ExtraDataPartial(
-                extra_data=self.extra_data_collector.get_extra_data()
-            ).model_dump_json()
+            # Sent as a typed item rather than a text chunk, see ExtraDataPartial.from_chunk
+            yield ExtraDataPartial(extra_data=self.extra_data_collector.get_extra_data())
         message_content = "".join([content.content for content in contents])
         history.add_assistant_message(message_content)
 
     async def invoke(
         self,
         history: ChatHistory,
-        inputs: dict[str, Any] | None = None,
+        inputs: MutableMapping[str, Any] | None = None,
     ) -> InvokeResponse:
         message = self._get_message(inputs)
         history.add_message(message)
@@ -44,4 +44,5 @@ class TaskBuilder:
             instructions=task_config.instructions,
             agent=agent,
             extra_data_collector=extra_data_collector,
+            strict_undefined=task_config.strict_undefined,
         )
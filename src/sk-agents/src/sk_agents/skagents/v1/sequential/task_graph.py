@@ -0,0 +1,41 @@
+from sk_agents.skagents.v1.sequential.template_cache import get_template_cache
+
+
+def get_template_variables(instructions: str) -> frozenset[str]:
+    return get_template_cache().get_variables(instructions)
+
+
+class TaskGraph:
+    """Dependencies between the tasks of a sequential agent.
+
+    A task depends on an earlier task when its instructions reference that
+    task's output variable (``_<task name>``). References to later tasks are
+    ignored, as those outputs are never available when the task runs.
+    """
+
+    def __init__(self, task_names: list[str], task_instructions: list[str]):
+        output_variables = {f"_{name}": index for index, name in enumerate(task_names)}
+        self.dependencies: list[frozenset[int]] = []
+        for index, instructions in enumerate(task_instructions):
+            self.dependencies.append(
+                frozenset(
+                    output_variables[variable]
+                    for variable in get_template_variables(instructions)
+                    if output_variables.get(variable, index) < index
+                )
+            )
+
+    def ancestors(self, index: int) -> list[int]:
+        """All tasks the task at ``index`` transitively depends on, in declaration order."""
+        ancestors: set[int] = set()
+        pending = list(self.dependencies[index])
+        while pending:
+            dependency = pending.pop()
+            if dependency not in ancestors:
+                ancestors.add(dependency)
+                pending.extend(self.dependencies[dependency])
+        return sorted(ancestors)
+
+    def is_sequential(self) -> bool:
+        """Whether every task depends on the one before it, leaving nothing to parallelize."""
+        return all(index - 1 in deps for index, deps in enumerate(self.dependencies) if index)
@@ -0,0 +1,56 @@
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from typing import Any
+
+
+class TaskInputs(MutableMapping[str, Any]):
+    """Copy-on-write view of a request's inputs, as passed to each task.
+
+    Values are read from the request inputs without copying them. Keys set or
+    removed while the tasks run (task outputs, the embedded image once it has
+    been sent) are recorded on the view only, so the request inputs are never
+    modified and a ``copy()`` only duplicates those changes.
+    """
+
+    def __init__(self, inputs: Mapping[str, Any], hidden: Iterable[str] = ()):
+        self._inputs = inputs
+        self._changes: dict[str, Any] = {}
+        self._removed: set[str] = {key for key in hidden if key in inputs}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._changes:
+            return self._changes[key]
+        if key in self._removed:
+            raise KeyError(key)
+        return self._inputs[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self._changes[key] = value
+        self._removed.discard(key)
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        self._changes.pop(key, None)
+        if key in self._inputs:
+            self._removed.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._changes or (key in self._inputs and key not in self._removed)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._inputs:
+            if key not in self._removed and key not in self._changes:
+                yield key
+        yield from self._changes
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"TaskInputs({dict(self)!r})"
+
+    def copy(self) -> "TaskInputs":
+        task_inputs = TaskInputs(self._inputs)
+        task_inputs._changes = dict(self._changes)
+        task_inputs._removed = set(self._removed)
+        return task_inputs
@@ -0,0 +1,90 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from jinja2 import Environment, StrictUndefined, Template, Undefined, meta
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class TemplateCache:
+    """Bounded LRU cache of compiled task instruction templates.
+
+    Templates are keyed by a hash of their source, so tasks sharing the same
+    instructions (or handlers rebuilt per request) reuse one compiled template
+    instead of recompiling it on every render. The variables a template reads
+    are cached the same way.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self.environments = {
+            False: Environment(undefined=Undefined),
+            True: Environment(undefined=StrictUndefined),
+        }
+        self._templates: OrderedDict[tuple[str, bool], Template] = OrderedDict()
+        self._variables: OrderedDict[str, frozenset[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(source: str, strict_undefined: bool) -> tuple[str, bool]:
+        return hashlib.sha256(source.encode()).hexdigest(), strict_undefined
+
+    def get_template(self, source: str, strict_undefined: bool = False) -> Template:
+        """Return the compiled template, compiling it on a cache miss.
+
+        Raises ``jinja2.TemplateSyntaxError`` if the source is not a valid template.
+        """
+        key = self._key(source, strict_undefined)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                return template
+        template = self.environments[strict_undefined].from_string(source)
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+        return template
+
+    def get_variables(self, source: str) -> frozenset[str]:
+        """Return the undeclared variables of the template, parsing it on a cache miss.
+
+        Raises ``jinja2.TemplateSyntaxError`` if the source is not a valid template.
+        """
+        key = self._key(source, False)[0]
+        with self._lock:
+            variables = self._variables.get(key)
+            if variables is not None:
+                self._variables.move_to_end(key)
+                return variables
+        variables = frozenset(
+            meta.find_undeclared_variables(self.environments[False].parse(source))
+        )
+        with self._lock:
+            self._variables[key] = variables
+            self._variables.move_to_end(key)
+            while len(self._variables) > self.max_size:
+                self._variables.popitem(last=False)
+        return variables
+
+    def render(self, source: str, inputs: dict[str, Any], strict_undefined: bool = False) -> str:
+        return self.get_template(source, strict_undefined).render(inputs)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+            self._variables.clear()
+
+
+_template_cache = TemplateCache()
+
+
+def get_template_cache() -> TemplateCache:
+    return _template_cache
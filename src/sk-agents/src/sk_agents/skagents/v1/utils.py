@@ -9,6 +9,7 @@ from sk_agents.ska_types import (
     MultiModalItem,
     TokenUsage,
 )
+from sk_agents.skagents.v1.image_store import get_image_store
 
 
 def item_to_content(item: MultiModalItem) -> TextContent | ImageContent | None:
@@ -16,7 +17,7 @@ def item_to_content(item: MultiModalItem) -> TextContent | ImageContent | None:
         case ContentType.TEXT:
             return TextContent(text=item.content)
         case ContentType.IMAGE:
-            return ImageContent(data_uri=item.content)
+            return get_image_store().reference_data_uri(item.content)
         case _:
             return None
 
@@ -0,0 +1,172 @@
+import importlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, Field
+from ska_utils import AppConfig, strtobool
+
+from sk_agents.configs import TA_LAZY_INIT, TA_STARTUP_PROFILING
+from sk_agents.plugin_loader import get_plugin_loader
+
+# This module is imported before anything else on the startup path so that
+# the heavier imports (Semantic Kernel, OpenAI) can be profiled.
+if TYPE_CHECKING:
+    from sk_agents.ska_types import BaseConfig
+
+logger = logging.getLogger(__name__)
+
+
+def is_lazy_init_enabled(app_config: AppConfig) -> bool:
+    return strtobool(app_config.get(TA_LAZY_INIT.env_name) or TA_LAZY_INIT.default_value)
+
+
+class StartupPhase(BaseModel):
+    name: str
+    category: str
+    duration_ms: float
+
+
+class StartupReport(BaseModel):
+    phases: list[StartupPhase] = Field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(phase.duration_ms for phase in self.phases)
+
+    def by_category(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        for phase in self.phases:
+            totals[phase.category] = totals.get(phase.category, 0.0) + phase.duration_ms
+        return totals
+
+    def format(self) -> str:
+        lines = [f"{'phase':<50} {'category':<10} {'ms':>10}"]
+        for phase in self.phases:
+            lines.append(f"{phase.name:<50} {phase.category:<10} {phase.duration_ms:>10.1f}")
+        lines.append(f"{'total':<50} {'':<10} {self.total_ms:>10.1f}")
+        return "\n".join(lines)
+
+
+class StartupProfiler:
+    """Records how long each startup phase takes (imports, config, plugins, routes).
+
+    Phases are only timed when the profiler is enabled, so the context managers
+    can stay in place on the normal startup path at no cost.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.report = StartupReport()
+
+    @contextmanager
+    def phase(self, name: str, category: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.report.phases.append(
+                StartupPhase(
+                    name=name,
+                    category=category,
+                    duration_ms=(time.perf_counter() - start) * 1000,
+                )
+            )
+
+    def import_module(self, module_name: str) -> Any:
+        with self.phase(f"import {module_name}", "import"):
+            return importlib.import_module(module_name)
+
+    def log_report(self):
+        if self.enabled:
+            logger.info(f"Startup profile:\n{self.report.format()}")
+
+
+_startup_profiler: StartupProfiler | None = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    global _startup_profiler
+    if not _startup_profiler:
+        enabled = os.environ.get(TA_STARTUP_PROFILING.env_name, TA_STARTUP_PROFILING.default_value)
+        _startup_profiler = StartupProfiler(strtobool(enabled))
+    return _startup_profiler
+
+
+class StartupWarmup:
+    """Resolves the lazily initialized dependencies of an agent ahead of its first request.
+
+    With lazy initialization enabled, plugin modules and chat completion clients
+    are only resolved on first use; running the warm-up (e.g. from a readiness
+    probe) moves that cost out of the first user request. Readiness only depends
+    on the plugins: a chat completion client which cannot be built is reported
+    in ``checks`` and built again by the requests.
+    """
+
+    def __init__(
+        self,
+        config: "BaseConfig",
+        app_config: AppConfig,
+        profiler: StartupProfiler | None = None,
+    ):
+        self.config = config
+        self.app_config = app_config
+        self.profiler = profiler or StartupProfiler()
+        self.lazy = is_lazy_init_enabled(app_config)
+        self.ready = False
+        self.checks: dict[str, Any] = {}
+        self.completed_at: datetime | None = None
+        self._lock = threading.Lock()
+
+    def _model_name(self) -> str | None:
+        agent = getattr(getattr(self.config, "spec", None), "agent", None)
+        return getattr(agent, "model", None)
+
+    def _warm_plugins(self):
+        with self.profiler.phase("plugin module", "warmup"):
+            get_plugin_loader().load()
+
+    def _warm_chat_completion(self, model_name: str):
+        from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
+
+        with self.profiler.phase(f"chat completion client {model_name}", "warmup"):
+            ChatCompletionBuilder(self.app_config).get_chat_completion_for_model(
+                service_id="warmup", model_name=model_name
+            )
+
+    def run(self) -> bool:
+        """Run the warm-up once; concurrent and repeated calls wait for the first run."""
+        if self.ready:
+            return True
+        with self._lock:
+            if self.ready:
+                return True
+            checks: dict[str, Any] = {}
+            try:
+                self._warm_plugins()
+                checks["plugins"] = "loaded"
+            except Exception as e:
+                logger.exception(f"Warm-up failed: {e}")
+                checks["error"] = str(e)
+                self.checks = checks
+                return False
+            model_name = self._model_name()
+            if model_name:
+                try:
+                    self._warm_chat_completion(model_name)
+                    checks["chat_completion"] = model_name
+                except Exception as e:
+                    logger.warning(f"Chat completion client warm-up failed: {e}")
+                    checks["chat_completion_error"] = str(e)
+            self.checks = checks
+            self.completed_at = datetime.now()
+            self.ready = True
+            return True
@@ -3,12 +3,11 @@ Redis implementation of the StateManager interface.
 This implementation uses Redis as the persistent store for task state management.
 """
 
-import json
-
 from redis.asyncio import Redis
 
 from sk_agents.ska_types import HistoryMultiModalMessage
 from sk_agents.state.state_manager import StateManager
+from sk_agents.stateful import StateSerializer
 
 
 class RedisStateManager(StateManager):
@@ -22,16 +21,20 @@ class RedisStateManager(StateManager):
         redis_client: Redis,
         ttl: int | None = None,
         key_prefix: str = "task_state:",
+        serializer: StateSerializer | None = None,
     ):
         """Initialize the RedisStateManager with a Redis client.
 
         Args:
             redis_client: An instance of Redis client
             key_prefix: Prefix used for Redis keys (default: "task_state:")
+            serializer: Encodes the messages, plain JSON by default. Messages
+                written with any encoding are read back whatever this one is.
         """
         self._redis = redis_client
         self._key_prefix = key_prefix
         self._ttl = ttl
+        self._serializer = serializer or StateSerializer()
 
     def _get_message_key(self, task_id: str) -> str:
         """Generate a Redis key for a task's messages.
@@ -73,21 +76,15 @@ class RedisStateManager(StateManager):
         # Get the Redis key for this task's messages
         message_key = self._get_message_key(task_id)
 
-        # Serialize the new message to JSON with mode='json' to ensure enums are properly serialized
-        message_json = json.dumps(new_message.model_dump(mode="json"))
-
         # Add the new message to the list in Redis
-        await self._redis.rpush(message_key, message_json)
+        await self._redis.rpush(message_key, self._serializer.dumps(new_message))
         if self._ttl:
             await self._redis.expire(message_key, int(self._ttl))
 
         # Retrieve all messages for the task
-        message_jsons = await self._redis.lrange(message_key, 0, -1)
+        records = await self._redis.lrange(message_key, 0, -1)
 
-        # Deserialize each message from JSON
-        messages = [
-            HistoryMultiModalMessage.model_validate(json.loads(msg)) for msg in message_jsons
-        ]
+        messages = [self._serializer.loads(HistoryMultiModalMessage, record) for record in records]
 
         return messages
 
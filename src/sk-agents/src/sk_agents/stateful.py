@@ -1,10 +1,13 @@
+import importlib
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import cache
+from types import ModuleType
+from typing import Any, TypeVar
 
-from pydantic import UUID4, BaseModel, Field, field_validator
+from pydantic import UUID4, BaseModel, Field, TypeAdapter, field_validator
 from redis.asyncio import Redis
 
 from sk_agents.ska_types import InvokeResponse
@@ -145,12 +148,112 @@ class InMemoryStateManager(StateManager):
         self.requests[request_state.request_id] = request_state
 
 
+StateModel = TypeVar("StateModel", bound=BaseModel)
+
+
+class StateEncoding(Enum):
+    JSON = "json"
+    MSGPACK = "msgpack"
+    ZSTD = "zstd"
+
+
+_type_adapters: dict[type[BaseModel], TypeAdapter] = {}
+
+
+def _type_adapter(model_type: type[BaseModel]) -> TypeAdapter:
+    adapter = _type_adapters.get(model_type)
+    if adapter is None:
+        adapter = _type_adapters[model_type] = TypeAdapter(model_type)
+    return adapter
+
+
+@cache
+def _optional_module(name: str) -> ModuleType:
+    try:
+        return importlib.import_module(name)
+    except ImportError as err:
+        raise ImportError(
+            f"State encoding requires the optional '{name}' package. Install it to use it."
+        ) from err
+
+
+class StateSerializer:
+    """Encodes state models to versioned bytes and decodes any supported version.
+
+    JSON records are written as plain JSON documents, as before versioning
+    was introduced, so instances not yet upgraded can read them. Binary
+    encodings start with a format version byte identifying the encoding;
+    JSON is recognised by its leading ``{``. Decoding does not depend on the
+    configured encoding, which allows the encoding to be changed without
+    migrating existing records, once every reader has been upgraded.
+    """
+
+    FORMAT_JSON = 1
+    FORMAT_MSGPACK = 2
+    FORMAT_ZSTD_JSON = 3
+
+    _FORMATS = {
+        StateEncoding.MSGPACK: FORMAT_MSGPACK,
+        StateEncoding.ZSTD: FORMAT_ZSTD_JSON,
+    }
+
+    def __init__(self, encoding: StateEncoding | str = StateEncoding.JSON, zstd_level: int = 3):
+        self.encoding = StateEncoding(encoding)
+        self.zstd_level = zstd_level
+        # Fail at construction rather than on the first write
+        if self.encoding == StateEncoding.MSGPACK:
+            _optional_module("msgpack")
+        elif self.encoding == StateEncoding.ZSTD:
+            _optional_module("zstandard")
+
+    def dumps(self, state: BaseModel) -> bytes:
+        adapter = _type_adapter(type(state))
+        match self.encoding:
+            case StateEncoding.MSGPACK:
+                payload = _optional_module("msgpack").packb(adapter.dump_python(state, mode="json"))
+            case StateEncoding.ZSTD:
+                compressor = _optional_module("zstandard").ZstdCompressor(level=self.zstd_level)
+                payload = compressor.compress(adapter.dump_json(state))
+            case _:
+                return adapter.dump_json(state)
+        return bytes([self._FORMATS[self.encoding]]) + payload
+
+    def loads(self, model_type: type[StateModel], data: bytes | str) -> StateModel:
+        if isinstance(data, str):
+            data = data.encode()
+        adapter = _type_adapter(model_type)
+        if not data or data[:1] == b"{":
+            return adapter.validate_json(data)
+
+        version, payload = data[0], data[1:]
+        match version:
+            case StateSerializer.FORMAT_JSON:
+                return adapter.validate_json(payload)
+            case StateSerializer.FORMAT_MSGPACK:
+                return adapter.validate_python(_optional_module("msgpack").unpackb(payload))
+            case StateSerializer.FORMAT_ZSTD_JSON:
+                decompressor = _optional_module("zstandard").ZstdDecompressor()
+                return adapter.validate_json(decompressor.decompress(payload))
+            case _:
+                raise ValueError(f"Unsupported state format version: {version}")
+
+
 class RedisStateManager(StateManager):
-    """Redis implementation of state manager"""
+    """Redis implementation of state manager
+
+    Binary encodings (msgpack, zstd) require a Redis client created without
+    ``decode_responses``.
+    """
 
-    def __init__(self, redis_client: Redis, ttl: int | None = None):
+    def __init__(
+        self,
+        redis_client: Redis,
+        ttl: int | None = None,
+        encoding: StateEncoding | str = StateEncoding.JSON,
+    ):
         self.redis = redis_client
         self.ttl = ttl  # Time-to-live in seconds
+        self.serializer = StateSerializer(encoding)
 
     async def create_task(self, session_id: UUID4 | None, user_id: str) -> tuple[UUID4, UUID4]:
         session_id = session_id or uuid.uuid4()
@@ -164,7 +267,7 @@ class RedisStateManager(StateManager):
         data = await self.redis.get(key)
         if not data:
             raise ValueError(f"Task not found: {task_id}")
-        return TaskState.parse_raw(data)
+        return self.serializer.loads(TaskState, data)
 
     async def update_task(self, task_state: TaskState) -> None:
         task_state.updated_at = datetime.utcnow()
@@ -172,7 +275,7 @@ class RedisStateManager(StateManager):
 
     async def _set_task(self, task_state: TaskState) -> None:
         key = f"task:{task_state.task_id}"
-        await self.redis.set(key, task_state.json(), ex=self.ttl)
+        await self.redis.set(key, self.serializer.dumps(task_state), ex=self.ttl)
 
     async def create_request(self, task_id: UUID4) -> UUID4:
         request_id = uuid.uuid4()
@@ -185,7 +288,7 @@ class RedisStateManager(StateManager):
         data = await self.redis.get(key)
         if not data:
             raise ValueError(f"Request not found: {request_id}")
-        return RequestState.parse_raw(data)
+        return self.serializer.loads(RequestState, data)
 
     async def update_request(self, request_state: RequestState) -> None:
         request_state.updated_at = datetime.utcnow()
@@ -193,7 +296,7 @@ class RedisStateManager(StateManager):
 
     async def _set_request(self, request_state: RequestState) -> None:
         key = f"request:{request_state.request_id}"
-        await self.redis.set(key, request_state.json(), ex=self.ttl)
+        await self.redis.set(key, self.serializer.dumps(request_state), ex=self.ttl)
 
 
 class AuthenticationManager(ABC):
@@ -9,6 +9,7 @@ from sk_agents.authorization.authorizer_factory import AuthorizerFactory
 from sk_agents.authorization.request_authorizer import RequestAuthorizer
 from sk_agents.extra_data_collector import ExtraDataCollector
 from sk_agents.plugin_loader import get_plugin_loader
+from sk_agents.prompt_prefix import canonicalize_kernel
 from sk_agents.ska_types import ModelType
 from sk_agents.tealagents.chat_completion_builder import ChatCompletionBuilder
 from sk_agents.tealagents.remote_plugin_loader import RemotePluginLoader
@@ -54,7 +55,7 @@ class KernelBuilder:
             # MCP plugins will be loaded separately in async context by handler
             # Remove sync MCP loading to avoid event loop conflicts
 
-            return kernel
+            return canonicalize_kernel(kernel)
         except Exception as e:
             self.logger.exception(f"Could build kernel with service ID {service_id}. - {e}")
             raise
@@ -167,7 +168,7 @@ class KernelBuilder:
             self.logger.info(
                 f"Loaded {len(server_tools)} MCP plugins for user {user_id}, session {session_id}"
             )
-            return kernel
+            return canonicalize_kernel(kernel)
 
         except Exception as e:
             self.logger.exception(
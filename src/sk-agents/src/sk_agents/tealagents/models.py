@@ -36,6 +36,22 @@ class AgentTask(BaseModel):
     status: Literal["Running", "Paused", "Completed", "Failed", "Canceled"] = "Running"
 
 
+class ModelTokenUsage(TokenUsage):
+    model: str
+    calls: int
+
+
+class TokenBudgetUsage(BaseModel):
+    """Token usage of a request across all of its model calls."""
+
+    status: Literal["ok", "soft_limit", "max_depth", "hard_limit"]
+    steps: int
+    soft_limit: int | None = None
+    hard_limit: int | None = None
+    max_recursion_depth: int | None = None
+    models: list[ModelTokenUsage]
+
+
 class TealAgentsResponse(BaseModel):
     task_id: str
     session_id: str
@@ -45,6 +61,7 @@ class TealAgentsResponse(BaseModel):
     source: str | None = None
     token_usage: TokenUsage
     extra_data: ExtraData | None = None
+    token_budget: TokenBudgetUsage | None = None
 
 
 class TealAgentsPartialResponse(BaseModel):
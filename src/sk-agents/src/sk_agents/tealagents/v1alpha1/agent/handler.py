@@ -14,7 +14,7 @@ from semantic_kernel.contents.function_result_content import FunctionResultConte
 from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
 from semantic_kernel.kernel import Kernel
-from ska_utils import AppConfig
+from ska_utils import AppConfig, get_service_metrics
 
 from sk_agents.authorization.dummy_authorizer import DummyAuthorizer
 from sk_agents.exceptions import (
@@ -26,6 +26,7 @@ from sk_agents.exceptions import (
 from sk_agents.extra_data_collector import ExtraDataCollector, ExtraDataPartial
 from sk_agents.hitl import hitl_manager
 from sk_agents.persistence.task_persistence_manager import TaskPersistenceManager
+from sk_agents.prompt_prefix import record_prefix
 from sk_agents.ska_types import BaseConfig, BaseHandler, ContentType, TokenUsage
 from sk_agents.tealagents.models import (
     AgentTask,
@@ -41,6 +42,8 @@ from sk_agents.tealagents.models import (
 )
 from sk_agents.tealagents.v1alpha1.agent.config import Config
 from sk_agents.tealagents.v1alpha1.agent_builder import AgentBuilder
+from sk_agents.tealagents.v1alpha1.history_reducer import build_history_reducer
+from sk_agents.tealagents.v1alpha1.token_budget import BUDGET_EXHAUSTED_MESSAGE, TokenBudget
 from sk_agents.tealagents.v1alpha1.utils import get_token_usage_for_response, item_to_content
 
 logger = logging.getLogger(__name__)
@@ -63,6 +66,7 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
         else:
             raise ValueError("Invalid config")
         self.agent_builder = agent_builder
+        self.history_reducer = build_history_reducer(self.config.get_agent().history_reducer)
         self.state = state_manager
         self.authorizer = DummyAuthorizer()
         self.discovery_manager = discovery_manager  # Store discovery manager (optional)
@@ -248,7 +252,9 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             fc_content.function_name,
         )
         kernel_argument = fc_content.to_kernel_arguments()
-        function_result = await function.invoke(kernel, kernel_argument)
+        tool = f"{fc_content.plugin_name}-{fc_content.function_name}"
+        with get_service_metrics().track_tool_call(tool):
+            function_result = await function.invoke(kernel, kernel_argument)
         return FunctionResultContent.from_function_call_content_and_result(
             fc_content, function_result
         )
@@ -259,8 +265,14 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             content = "The following user context was provided:\n"
             for key, value in inputs.user_context.items():
                 content += f"  {key}: {value}\n"
-            chat_history.add_message(
-                ChatMessageContent(role=AuthorRole.USER, items=[TextContent(text=content)])
+            messages = chat_history.messages
+            # Directly before the current user turn: after the earlier history,
+            # which is the same on every turn, but ahead of what the model answers
+            index = len(messages)
+            if messages and messages[-1].role == AuthorRole.USER:
+                index -= 1
+            messages.insert(
+                index, ChatMessageContent(role=AuthorRole.USER, items=[TextContent(text=content)])
             )
 
     @staticmethod
@@ -429,11 +441,21 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
 
     @staticmethod
     def _build_chat_history(agent_task: AgentTask, chat_history: ChatHistory) -> ChatHistory:
+        # One message per role and request, so a message with several items
+        # (e.g. text and an image) stays together
         chat_message_items: list[TextContent | ImageContent] = []
-        for task_item in agent_task.items:
+        for index, task_item in enumerate(agent_task.items):
             chat_message_items.append(item_to_content(task_item.item))
-            message_content = ChatMessageContent(role=task_item.role, items=chat_message_items)
-            chat_history.add_message(message_content)
+            next_item = agent_task.items[index + 1] if index + 1 < len(agent_task.items) else None
+            if (
+                next_item is None
+                or next_item.role != task_item.role
+                or next_item.request_id != task_item.request_id
+            ):
+                chat_history.add_message(
+                    ChatMessageContent(role=task_item.role, items=chat_message_items)
+                )
+                chat_message_items = []
         return chat_history
 
     @staticmethod
@@ -527,6 +549,41 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             logger.info(f"Intervention required for{len(intervention_calls)} function calls.")
             raise hitl_manager.HitlInterventionRequired(intervention_calls)
 
+    async def _request_history(
+        self,
+        chat_history: ChatHistory,
+        task_id: str,
+        chat_completion_service: ChatCompletionClientBase,
+        kernel: Kernel,
+    ) -> ChatHistory:
+        """The chat history to send to the model.
+
+        The agent's system prompt comes first so that, with the tool definitions,
+        the start of every request is the same and provider prompt caches hit.
+        The conversation follows, reduced per the agent's history reducer.
+        """
+        agent = self.config.get_agent()
+        # The service name is optional in the configuration, the agent's name is not
+        record_prefix(self.name or agent.name, agent.system_prompt, kernel)
+        messages = [ChatMessageContent(role=AuthorRole.SYSTEM, content=agent.system_prompt)]
+        messages.extend(chat_history.messages)
+        if self.history_reducer is not None:
+            messages = await self.history_reducer.reduce(messages, task_id, chat_completion_service)
+        return ChatHistory(messages=messages)
+
+    def _model_name(self, chat_completion_service: ChatCompletionClientBase) -> str:
+        return (
+            getattr(chat_completion_service, "ai_model_id", None) or self.config.get_agent().model
+        )
+
+    @staticmethod
+    def _partial_response(response_list: list[ChatMessageContent]) -> ChatMessageContent:
+        """The text the model returned alongside the tool calls it may no longer make."""
+        content = "".join(response.content for response in response_list if response.content)
+        return ChatMessageContent(
+            role=AuthorRole.ASSISTANT, content=content or BUDGET_EXHAUSTED_MESSAGE
+        )
+
     async def prepare_agent_response(
         self,
         agent_task: AgentTask,
@@ -534,6 +591,7 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
         response: ChatMessageContent | list[str],
         token_usage: TokenUsage,
         extra_data_collector: ExtraDataCollector,
+        token_budget: TokenBudget | None = None,
     ):
         if isinstance(response, list):
             agent_output = "".join(response)
@@ -553,6 +611,7 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             source=f"{self.name}:{self.version}",
             token_usage=token_usage,
             extra_data=extra_data_collector.get_extra_data(),
+            token_budget=token_budget.usage() if token_budget else None,
         )
         await self._manage_agent_response_task(agent_task, agent_response)
         logger.info(
@@ -736,10 +795,10 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             return auth_challenge
 
         chat_history = ChatHistory()
+        TealAgentsV1Alpha1Handler._build_chat_history(agent_task, chat_history)
         TealAgentsV1Alpha1Handler._augment_with_user_context(
             inputs=inputs, chat_history=chat_history
         )
-        TealAgentsV1Alpha1Handler._build_chat_history(agent_task, chat_history)
         logger.info("Building the final response")
 
         # Create request-scoped connection manager for MCP connection reuse
@@ -845,11 +904,11 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             return
 
         chat_history = ChatHistory()
+        TealAgentsV1Alpha1Handler._build_chat_history(agent_task, chat_history)
         TealAgentsV1Alpha1Handler._augment_with_user_context(
             inputs=inputs, chat_history=chat_history
         )
         logger.info("Building the final response")
-        TealAgentsV1Alpha1Handler._build_chat_history(agent_task, chat_history)
 
         # Create request-scoped connection manager for MCP connection reuse
         connection_manager = await self._create_mcp_connection_manager(user_id, session_id)
@@ -878,6 +937,7 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
         task_id: str,
         request_id: str,
         connection_manager=None,
+        token_budget: TokenBudget | None = None,
     ) -> TealAgentsResponse | HitlResponse:
         # Initial setup
 
@@ -887,6 +947,9 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             raise PersistenceLoadError(f"Agent task with ID {task_id} not found in state.")
 
         user_id = agent_task.user_id
+        if token_budget is None:
+            token_budget = TokenBudget(self.config.get_agent().token_budget)
+        wrapping_up = token_budget.wrapping_up
         extra_data_collector = ExtraDataCollector()
         agent = await self.agent_builder.build_agent(
             self.config.get_agent(), extra_data_collector, user_id=user_id
@@ -913,15 +976,23 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             )
 
             assert isinstance(chat_completion_service, ChatCompletionClientBase)
+            if wrapping_up:
+                # Out of budget for more tool calls, answer with what the agent has
+                chat_history.add_user_message(token_budget.config.summary_prompt)
+                settings = token_budget.wrap_up_settings(settings)
 
             # Initial call to the LLM
             response_list = []
-            responses = await chat_completion_service.get_chat_message_contents(
-                chat_history=chat_history,
-                settings=settings,
-                kernel=kernel,
-                arguments=arguments,
+            request_history = await self._request_history(
+                chat_history, task_id, chat_completion_service, kernel
             )
+            with get_service_metrics().track_llm_call(self._model_name(chat_completion_service)):
+                responses = await chat_completion_service.get_chat_message_contents(
+                    chat_history=request_history,
+                    settings=settings,
+                    kernel=kernel,
+                    arguments=arguments,
+                )
             for response_chunk in responses:
                 # response_list.extend(response_chunk)
                 chat_history.add_message(response_chunk)
@@ -955,8 +1026,12 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
                 prompt_tokens=prompt_tokens,
                 total_tokens=total_tokens,
             )
+            token_budget.record(self._model_name(chat_completion_service), token_usage)
             # If tool calls were returned, execute them
-            if function_calls:
+            if function_calls and (wrapping_up or token_budget.exhausted):
+                # No budget left for the tool calls, stop with the partial answer
+                final_response = self._partial_response(response_list)
+            elif function_calls:
                 await self._manage_function_calls(function_calls, chat_history, kernel)
 
                 # Make a recursive call to get the final response from the LLM
@@ -966,6 +1041,7 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
                     task_id=task_id,
                     request_id=request_id,
                     connection_manager=connection_manager,
+                    token_budget=token_budget,
                 )
                 return recursive_response
 
@@ -998,7 +1074,12 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
 
         # Persist and return response
         return await self.prepare_agent_response(
-            agent_task, request_id, final_response, token_usage, extra_data_collector
+            agent_task,
+            request_id,
+            final_response,
+            token_budget.token_usage,
+            extra_data_collector,
+            token_budget,
         )
 
     async def recursion_invoke_stream(
@@ -1008,6 +1089,7 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
         task_id: str,
         request_id: str,
         connection_manager=None,
+        token_budget: TokenBudget | None = None,
     ) -> AsyncIterable[TealAgentsResponse | TealAgentsPartialResponse | HitlResponse]:
         chat_history = inputs
         agent_task = await self.state.load_by_request_id(request_id)
@@ -1015,6 +1097,9 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             raise PersistenceLoadError(f"Agent task with ID {task_id} not found in state.")
 
         user_id = agent_task.user_id
+        if token_budget is None:
+            token_budget = TokenBudget(self.config.get_agent().token_budget)
+        wrapping_up = token_budget.wrapping_up
         extra_data_collector = ExtraDataCollector()
         agent = await self.agent_builder.build_agent(
             self.config.get_agent(), extra_data_collector, user_id=user_id
@@ -1041,16 +1126,24 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             )
             chat_completion_service, settings = kernel_configs
             assert isinstance(chat_completion_service, ChatCompletionClientBase)
+            if wrapping_up:
+                # Out of budget for more tool calls, answer with what the agent has
+                chat_history.add_user_message(token_budget.config.summary_prompt)
+                settings = token_budget.wrap_up_settings(settings)
 
             all_responses = []
             # Stream the initial response from the LLM
             response_list = []
-            responses = await chat_completion_service.get_chat_message_contents(
-                chat_history=chat_history,
-                settings=settings,
-                kernel=kernel,
-                arguments=arguments,
+            request_history = await self._request_history(
+                chat_history, task_id, chat_completion_service, kernel
             )
+            with get_service_metrics().track_llm_call(self._model_name(chat_completion_service)):
+                responses = await chat_completion_service.get_chat_message_contents(
+                    chat_history=request_history,
+                    settings=settings,
+                    kernel=kernel,
+                    arguments=arguments,
+                )
             for response_chunk in responses:
                 chat_history.add_message(response_chunk)
                 response_list.append(response_chunk)
@@ -1063,24 +1156,19 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
                 prompt_tokens += call_usage.prompt_tokens
                 total_tokens += call_usage.total_tokens
 
-                if response.content:
-                    try:
-                        # Attempt to parse as ExtraDataPartial
-                        extra_data_partial: ExtraDataPartial = ExtraDataPartial.new_from_json(
-                            response.content
-                        )
-                        extra_data_collector.add_extra_data_items(extra_data_partial.extra_data)
-                    except Exception:
-                        if len(response.content) > 0:
-                            # Handle and return partial response
-                            final_response.append(response.content)
-                            yield TealAgentsPartialResponse(
-                                session_id=session_id,
-                                task_id=task_id,
-                                request_id=request_id,
-                                output_partial=response.content,
-                                source=f"{self.name}:{self.version}",
-                            )
+                extra_data_partial = ExtraDataPartial.from_chunk(response)
+                if extra_data_partial is not None:
+                    extra_data_collector.add_extra_data_items(extra_data_partial.extra_data)
+                elif response.content:
+                    # Handle and return partial response
+                    final_response.append(response.content)
+                    yield TealAgentsPartialResponse(
+                        session_id=session_id,
+                        task_id=task_id,
+                        request_id=request_id,
+                        output_partial=response.content,
+                        source=f"{self.name}:{self.version}",
+                    )
 
             token_usage = TokenUsage(
                 completion_tokens=completion_tokens,
@@ -1090,6 +1178,7 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             # Aggregate the full response to check for tool calls
             if not all_responses:
                 return
+            token_budget.record(self._model_name(chat_completion_service), token_usage)
 
             full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_responses)
             function_calls = [
@@ -1097,7 +1186,18 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             ]
 
             # If tool calls are present, execute them
-            if function_calls:
+            if function_calls and (wrapping_up or token_budget.exhausted):
+                # No budget left for the tool calls, stop with the partial answer
+                if not final_response:
+                    final_response.append(BUDGET_EXHAUSTED_MESSAGE)
+                    yield TealAgentsPartialResponse(
+                        session_id=session_id,
+                        task_id=task_id,
+                        request_id=request_id,
+                        output_partial=BUDGET_EXHAUSTED_MESSAGE,
+                        source=f"{self.name}:{self.version}",
+                    )
+            elif function_calls:
                 await self._manage_function_calls(function_calls, chat_history, kernel)
                 # Make a recursive call to get the final streamed response
                 async for final_response_chunk in self.recursion_invoke_stream(
@@ -1106,6 +1206,7 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
                     task_id,
                     request_id,
                     connection_manager=connection_manager,
+                    token_budget=token_budget,
                 ):
                     yield final_response_chunk
                 return
@@ -1130,5 +1231,10 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
 
         # # Persist and return response
         yield await self.prepare_agent_response(
-            agent_task, request_id, final_response, token_usage, extra_data_collector
+            agent_task,
+            request_id,
+            final_response,
+            token_budget.token_usage,
+            extra_data_collector,
+            token_budget,
         )
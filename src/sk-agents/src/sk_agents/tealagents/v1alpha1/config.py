@@ -194,6 +194,61 @@ class McpServerConfig(BaseModel):
         return self
 
 
+class TokenBudgetConfig(BaseModel):
+    """Per-request limits on the tokens an agent may spend calling tools.
+
+    Limits apply to the total (prompt and completion) tokens of every model
+    call made while answering one request, including the tool calling rounds.
+    """
+
+    # Once exceeded, the pending tool calls are completed and the model is asked
+    # to answer with what it has, without calling any more tools
+    soft_limit: int | None = Field(None, gt=0)
+    # Once exceeded, the request stops and returns the partial answer
+    hard_limit: int | None = Field(None, gt=0)
+    # Maximum number of tool calling rounds before the model is asked to answer
+    max_recursion_depth: int | None = Field(None, gt=0)
+    summary_prompt: str = (
+        "The token budget for this request is nearly used up. Do not call any more "
+        "tools. Answer the user now, summarizing what you have found so far."
+    )
+
+    @model_validator(mode="after")
+    def validate_limits(self):
+        if self.soft_limit and self.hard_limit and self.soft_limit > self.hard_limit:
+            raise ValueError("soft_limit must not be greater than hard_limit")
+        return self
+
+
+class HistoryReducerConfig(BaseModel):
+    """Limits on the chat history sent to the model on each call.
+
+    The full history is kept (and persisted); only the messages of each
+    request to the model are reduced.
+    """
+
+    # Keep the most recent messages which fit in this many (approximate) tokens
+    max_tokens: int | None = Field(None, gt=0)
+    # Replace the results of tool calls made before the last N user turns
+    elide_tool_results_after_turns: int | None = Field(None, ge=0)
+    # Replace the messages dropped from the window with a summary, refreshed in
+    # the background once this many tokens have been dropped since the last one
+    rolling_summary: bool = False
+    summary_refresh_tokens: int = Field(1000, gt=0)
+    summary_max_tokens: int = Field(500, gt=0)
+    # Custom HistoryReducer subclass used instead of the strategies above
+    module: str | None = None
+    class_name: str | None = None
+
+    @model_validator(mode="after")
+    def validate_strategies(self):
+        if self.rolling_summary and not self.max_tokens:
+            raise ValueError("rolling_summary requires max_tokens")
+        if bool(self.module) != bool(self.class_name):
+            raise ValueError("module and class_name must be provided together")
+        return self
+
+
 class AgentConfig(BaseModel):
     model_config = ConfigDict(extra="allow")
     name: str
@@ -205,3 +260,5 @@ class AgentConfig(BaseModel):
     plugins: list[str] | None = None
     remote_plugins: list[str] | None = None
     mcp_servers: list[McpServerConfig] | None = None
+    token_budget: TokenBudgetConfig | None = None
+    history_reducer: HistoryReducerConfig | None = None
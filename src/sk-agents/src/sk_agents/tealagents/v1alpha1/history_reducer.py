@@ -0,0 +1,304 @@
+import asyncio
+import logging
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.contents import ChatMessageContent, ImageContent, TextContent
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from ska_utils import ModuleLoader
+
+from sk_agents.tealagents.v1alpha1.config import HistoryReducerConfig
+
+logger = logging.getLogger(__name__)
+
+# Rough average for English text and JSON with the GPT and Claude tokenizers
+CHARS_PER_TOKEN = 4
+# Role and separator tokens added to every message
+MESSAGE_OVERHEAD_TOKENS = 4
+# A 512x512 image tile at high detail
+IMAGE_TOKENS = 765
+ELIDED_TOOL_RESULT = "[Tool result removed from the history to save space]"
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+SUMMARY_INSTRUCTIONS = (
+    "You maintain a running summary of a conversation between a user and an AI "
+    "assistant which uses tools. Update the summary with the new messages, keeping "
+    "facts, decisions, tool results and open questions the assistant needs to carry "
+    "on. Reply with the updated summary only, in at most {max_words} words."
+)
+MAX_CACHED_SUMMARIES = 1024
+
+
+def approximate_tokens(message: ChatMessageContent) -> int:
+    """Approximate number of tokens of a message, without a model specific tokenizer."""
+    chars = 0
+    tokens = MESSAGE_OVERHEAD_TOKENS
+    for item in message.items:
+        if isinstance(item, TextContent):
+            chars += len(item.text or "")
+        elif isinstance(item, FunctionCallContent):
+            chars += len(item.name or "") + len(str(item.arguments or ""))
+        elif isinstance(item, FunctionResultContent):
+            chars += len(item.name or "") + len(str(item.result))
+        elif isinstance(item, ImageContent):
+            tokens += IMAGE_TOKENS
+        else:
+            chars += len(str(item))
+    return tokens + -(-chars // CHARS_PER_TOKEN)
+
+
+def _pinned_count(messages: list[ChatMessageContent]) -> int:
+    """Number of leading system messages, which are always sent."""
+    count = 0
+    while count < len(messages) and messages[count].role in (
+        AuthorRole.SYSTEM,
+        AuthorRole.DEVELOPER,
+    ):
+        count += 1
+    return count
+
+
+class HistoryReducer(ABC):
+    """Reduces the chat history sent to the model on each call.
+
+    Reducers return a new list of messages and leave the history itself
+    unchanged, so the full history is still available to persist.
+    """
+
+    @abstractmethod
+    async def reduce(
+        self,
+        messages: list[ChatMessageContent],
+        key: str,
+        chat_completion_service: ChatCompletionClientBase | None = None,
+    ) -> list[ChatMessageContent]:
+        """Return the messages to send for the conversation identified by ``key``."""
+
+
+class ToolResultElision(HistoryReducer):
+    """Replaces the results of tool calls made before the last ``keep_turns`` user turns.
+
+    The elided copies are cached by message, so a long history is not copied
+    again on every model call of a request. A copy is dropped with its
+    message, so the reducer holds no tool results beyond the histories in use.
+    """
+
+    def __init__(self, keep_turns: int):
+        self.keep_turns = keep_turns
+        # id(message) -> (weak reference to the message, elided copy)
+        self._elided: dict[int, tuple[weakref.ref, ChatMessageContent]] = {}
+
+    async def reduce(self, messages, key, chat_completion_service=None):
+        user_turns = 0
+        cutoff = 0
+        for index in range(len(messages) - 1, -1, -1):
+            if messages[index].role == AuthorRole.USER:
+                if user_turns == self.keep_turns:
+                    cutoff = index
+                    break
+                user_turns += 1
+        return [
+            self._elide(message) if message.role == AuthorRole.TOOL else message
+            for message in messages[:cutoff]
+        ] + messages[cutoff:]
+
+    def _elide(self, message: ChatMessageContent) -> ChatMessageContent:
+        key = id(message)
+        cached = self._elided.get(key)
+        if cached is not None and cached[0]() is message:
+            return cached[1]
+        items = [
+            item.model_copy(update={"result": ELIDED_TOOL_RESULT})
+            if isinstance(item, FunctionResultContent)
+            and len(str(item.result)) > len(ELIDED_TOOL_RESULT)
+            else item
+            for item in message.items
+        ]
+        elided = message.model_copy(update={"items": items})
+        # The message's id is only reused once it is collected, which drops the entry first
+        self._elided[key] = (weakref.ref(message, lambda _: self._elided.pop(key, None)), elided)
+        return elided
+
+
+class RollingSummary:
+    """Summaries of the messages dropped from the window, cached per conversation.
+
+    A summary covers a prefix of the dropped messages. Once enough tokens have
+    been dropped since, a refresh is started in the background; until it
+    completes, the previous summary is used, so the model call never waits for
+    the summary.
+    """
+
+    def __init__(self, refresh_tokens: int, max_tokens: int):
+        self.refresh_tokens = refresh_tokens
+        self.max_tokens = max_tokens
+        # key -> (number of dropped messages covered, summary text)
+        self._summaries: OrderedDict[str, tuple[int, str]] = OrderedDict()
+        self._refreshes: dict[str, asyncio.Task] = {}
+
+    def get(
+        self,
+        key: str,
+        dropped: list[ChatMessageContent],
+        chat_completion_service: ChatCompletionClientBase | None,
+    ) -> str | None:
+        covered, summary = self._summaries.get(key, (0, None))
+        if covered > len(dropped):
+            # Not the conversation the summary was made for
+            covered, summary = 0, None
+            del self._summaries[key]
+        elif summary is not None:
+            self._summaries.move_to_end(key)
+
+        new_tokens = sum(approximate_tokens(message) for message in dropped[covered:])
+        if (
+            new_tokens >= self.refresh_tokens
+            and chat_completion_service is not None
+            and key not in self._refreshes
+        ):
+            self._refreshes[key] = asyncio.create_task(
+                self._refresh(key, summary, dropped, covered, chat_completion_service)
+            )
+        return summary
+
+    async def wait(self, key: str) -> None:
+        """Wait for the background refresh of ``key``, if one is running."""
+        refresh = self._refreshes.get(key)
+        if refresh is not None:
+            await asyncio.shield(refresh)
+
+    async def _refresh(
+        self,
+        key: str,
+        summary: str | None,
+        dropped: list[ChatMessageContent],
+        covered: int,
+        chat_completion_service: ChatCompletionClientBase,
+    ) -> None:
+        try:
+            transcript = "\n".join(
+                f"{message.role.value}: {self._message_text(message)}"
+                for message in dropped[covered:]
+            )
+            if summary:
+                transcript = f"Current summary:\n{summary}\n\nNew messages:\n{transcript}"
+            history = ChatHistory(
+                system_message=SUMMARY_INSTRUCTIONS.format(max_words=self.max_tokens * 3 // 4)
+            )
+            history.add_user_message(transcript)
+            settings = chat_completion_service.get_prompt_execution_settings_class()()
+            response = await chat_completion_service.get_chat_message_content(
+                chat_history=history, settings=settings
+            )
+            if response is not None and response.content:
+                self._summaries[key] = (
+                    len(dropped),
+                    response.content[: self.max_tokens * CHARS_PER_TOKEN],
+                )
+                self._summaries.move_to_end(key)
+                while len(self._summaries) > MAX_CACHED_SUMMARIES:
+                    self._summaries.popitem(last=False)
+        except Exception as e:
+            logger.warning(f"Failed to refresh the history summary for {key}: {e}")
+        finally:
+            self._refreshes.pop(key, None)
+
+    @staticmethod
+    def _message_text(message: ChatMessageContent) -> str:
+        parts = []
+        for item in message.items:
+            if isinstance(item, TextContent):
+                parts.append(item.text or "")
+            elif isinstance(item, FunctionCallContent):
+                parts.append(f"[called {item.name}({item.arguments})]")
+            elif isinstance(item, FunctionResultContent):
+                parts.append(f"[{item.name} returned {item.result}]")
+            elif isinstance(item, ImageContent):
+                parts.append("[image]")
+        return " ".join(parts)
+
+
+class TokenWindow(HistoryReducer):
+    """Keeps the most recent messages which fit in ``max_tokens``.
+
+    Leading system messages are always kept. The window never starts with a
+    tool result, whose tool call would have been dropped, and always keeps the
+    last message. With a ``RollingSummary``, the dropped messages are replaced
+    by their summary, for which ``summary.max_tokens`` of the window is reserved.
+    """
+
+    def __init__(self, max_tokens: int, summary: RollingSummary | None = None):
+        self.max_tokens = max_tokens
+        self.summary = summary
+
+    async def reduce(self, messages, key, chat_completion_service=None):
+        pinned = _pinned_count(messages)
+        budget = self.max_tokens - sum(approximate_tokens(m) for m in messages[:pinned])
+        if self.summary is not None:
+            budget -= self.summary.max_tokens
+        start = len(messages)
+        while start > pinned:
+            budget -= approximate_tokens(messages[start - 1])
+            if budget < 0 and start < len(messages):
+                break
+            start -= 1
+        while start < len(messages) - 1 and messages[start].role == AuthorRole.TOOL:
+            start += 1
+        if start == pinned:
+            return messages
+
+        window = messages[:pinned]
+        if self.summary is not None:
+            summary = self.summary.get(key, messages[pinned:start], chat_completion_service)
+            if summary:
+                window.append(
+                    ChatMessageContent(role=AuthorRole.SYSTEM, content=SUMMARY_PREFIX + summary)
+                )
+        return window + messages[start:]
+
+
+class ReducerChain(HistoryReducer):
+    def __init__(self, reducers: list[HistoryReducer]):
+        self.reducers = reducers
+
+    async def reduce(self, messages, key, chat_completion_service=None):
+        for reducer in self.reducers:
+            messages = await reducer.reduce(messages, key, chat_completion_service)
+        return messages
+
+
+def build_history_reducer(config: HistoryReducerConfig | None) -> HistoryReducer | None:
+    """Build the reducer for an agent's ``history_reducer`` configuration."""
+    if config is None:
+        return None
+    if config.module:
+        class_name = config.class_name
+        if not class_name:
+            raise ValueError("module and class_name must be provided together")
+        try:
+            reducer_class = getattr(ModuleLoader.load_module(config.module), class_name)
+        except AttributeError as e:
+            raise ImportError(f"Class '{class_name}' not found in module '{config.module}'") from e
+        # Custom reducers are constructed with their configuration, unlike the base class
+        is_reducer = isinstance(reducer_class, type) and issubclass(reducer_class, HistoryReducer)
+        if not is_reducer:
+            raise TypeError(f"{class_name} is not a subclass of HistoryReducer")
+        return reducer_class(config)
+
+    reducers: list[HistoryReducer] = []
+    if config.elide_tool_results_after_turns is not None:
+        reducers.append(ToolResultElision(config.elide_tool_results_after_turns))
+    if config.max_tokens:
+        summary = (
+            RollingSummary(config.summary_refresh_tokens, config.summary_max_tokens)
+            if config.rolling_summary
+            else None
+        )
+        reducers.append(TokenWindow(config.max_tokens, summary))
+    if not reducers:
+        return None
+    return reducers[0] if len(reducers) == 1 else ReducerChain(reducers)
@@ -0,0 +1,107 @@
+import logging
+from typing import Literal
+
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from ska_utils import get_service_metrics
+
+from sk_agents.ska_types import TokenUsage
+from sk_agents.tealagents.models import ModelTokenUsage, TokenBudgetUsage
+from sk_agents.tealagents.v1alpha1.config import TokenBudgetConfig
+
+logger = logging.getLogger(__name__)
+
+BudgetStatus = Literal["ok", "soft_limit", "max_depth", "hard_limit"]
+
+BUDGET_EXHAUSTED_MESSAGE = (
+    "The request was stopped because it used up its token budget before the agent could finish."
+)
+
+
+class TokenBudget:
+    """Token usage and limits of one request across its tool calling rounds.
+
+    Each call to the model while answering a request (the first call and one
+    per round of tool calls) is a step. The budget accumulates the usage of
+    every step, per model, and reports whether the request may keep calling
+    tools (``ok``), should be wrapped up without more tool calls
+    (``soft_limit`` or ``max_depth``) or has to stop (``hard_limit``).
+    """
+
+    def __init__(self, config: TokenBudgetConfig | None = None):
+        self.config = config or TokenBudgetConfig()
+        self.status: BudgetStatus = "ok"
+        self.steps = 0
+        self._models: dict[str, ModelTokenUsage] = {}
+
+    @property
+    def token_usage(self) -> TokenUsage:
+        return TokenUsage(
+            completion_tokens=sum(u.completion_tokens for u in self._models.values()),
+            prompt_tokens=sum(u.prompt_tokens for u in self._models.values()),
+            total_tokens=sum(u.total_tokens for u in self._models.values()),
+        )
+
+    @property
+    def wrapping_up(self) -> bool:
+        """Whether the next step should answer without calling more tools."""
+        return self.status in ("soft_limit", "max_depth")
+
+    @property
+    def exhausted(self) -> bool:
+        return self.status == "hard_limit"
+
+    def record(self, model: str, usage: TokenUsage) -> BudgetStatus:
+        """Add the usage of one step and return the resulting status."""
+        self.steps += 1
+        model_usage = self._models.get(model)
+        if model_usage is None:
+            model_usage = self._models[model] = ModelTokenUsage(
+                model=model, calls=0, completion_tokens=0, prompt_tokens=0, total_tokens=0
+            )
+        model_usage.calls += 1
+        model_usage.completion_tokens += usage.completion_tokens
+        model_usage.prompt_tokens += usage.prompt_tokens
+        model_usage.total_tokens += usage.total_tokens
+        get_service_metrics().record_tokens(model, usage.prompt_tokens, usage.completion_tokens)
+
+        status = self._check()
+        if status != self.status:
+            logger.warning(
+                f"Token budget {status} reached after {self.steps} steps and "
+                f"{self.token_usage.total_tokens} tokens"
+            )
+            get_service_metrics().record_token_budget_limit(status)
+            self.status = status
+        return status
+
+    def _check(self) -> BudgetStatus:
+        total_tokens = sum(u.total_tokens for u in self._models.values())
+        config = self.config
+        if config.hard_limit and total_tokens >= config.hard_limit:
+            return "hard_limit"
+        if self.status != "ok":
+            return self.status
+        if config.max_recursion_depth and self.steps >= config.max_recursion_depth:
+            return "max_depth"
+        if config.soft_limit and total_tokens >= config.soft_limit:
+            return "soft_limit"
+        return "ok"
+
+    def wrap_up_settings(self, settings: PromptExecutionSettings) -> PromptExecutionSettings:
+        """Copy the execution settings so that the model answers without calling tools."""
+        if not isinstance(settings, PromptExecutionSettings):
+            return settings
+        settings = settings.model_copy()
+        settings.function_choice_behavior = FunctionChoiceBehavior.NoneInvoke()
+        return settings
+
+    def usage(self) -> TokenBudgetUsage:
+        return TokenBudgetUsage(
+            status=self.status,
+            steps=self.steps,
+            soft_limit=self.config.soft_limit,
+            hard_limit=self.config.hard_limit,
+            max_recursion_depth=self.config.max_recursion_depth,
+            models=[u.model_copy() for u in self._models.values()],
+        )
@@ -1,12 +1,14 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 from pydantic import BaseModel
-from ska_utils import AppConfig
+from ska_utils import AppConfig, Telemetry, metrics_router
 
 from sk_agents.ska_types import BaseConfig
+from sk_agents.startup import StartupWarmup
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +41,18 @@ class LivenessStatus(BaseModel):
 class UtilityRoutes:
     """Utility routes for health checks and system monitoring."""
 
-    def __init__(self, start_time: datetime | None = None):
+    def __init__(self, start_time: datetime | None = None, warmup: StartupWarmup | None = None):
         self.start_time = start_time or datetime.now()
+        self.warmup = warmup
+
+    def _readiness(self) -> ReadinessStatus:
+        if self.warmup is None:
+            return ReadinessStatus(ready=True, timestamp=datetime.now().isoformat(), checks={})
+        return ReadinessStatus(
+            ready=self.warmup.ready,
+            timestamp=datetime.now().isoformat(),
+            checks=self.warmup.checks,
+        )
 
     def get_health_routes(
         self,
@@ -106,4 +118,49 @@ class UtilityRoutes:
                     status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Service not alive"
                 ) from e
 
+        @router.get(
+            "/health/ready",
+            response_model=ReadinessStatus,
+            summary="Readiness probe",
+            description="Kubernetes readiness probe endpoint",
+            tags=["Health"],
+            responses={503: {"model": ReadinessStatus}},
+        )
+        async def readiness_check(response: Response) -> ReadinessStatus:
+            """
+            Readiness probe for Kubernetes deployments.
+            Returns 503 until the warm-up has completed when lazy initialization is enabled.
+            """
+            readiness = self._readiness()
+            if not readiness.ready:
+                response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            return readiness
+
+        @router.get(
+            "/health/warmup",
+            response_model=ReadinessStatus,
+            summary="Warm-up and readiness probe",
+            description="Resolves lazily initialized dependencies and reports readiness",
+            tags=["Health"],
+            responses={503: {"model": ReadinessStatus}},
+        )
+        async def warmup(response: Response) -> ReadinessStatus:
+            """
+            Loads plugin modules and chat completion clients that are initialized lazily,
+            then reports readiness. Safe to use directly as a readiness probe.
+            """
+            if self.warmup is not None and not self.warmup.ready:
+                await asyncio.to_thread(self.warmup.run)
+            readiness = self._readiness()
+            if not readiness.ready:
+                response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            return readiness
+
         return router
+
+    @staticmethod
+    def get_metrics_routes(telemetry: Telemetry) -> APIRouter:
+        """
+        Get the Prometheus scrape endpoint, found only with TA_METRICS_PROMETHEUS enabled.
+        """
+        return metrics_router(telemetry)
@@ -10,6 +10,7 @@ from sk_agents.ska_types import (
     InvokeResponse,
     PartialResponse,
 )
+from sk_agents.startup import is_lazy_init_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,7 @@ def initialize_plugin_loader(agents_path: str, app_config: AppConfig):
             if os.path.exists(custom_plugins):
                 app_config.props[TA_PLUGIN_MODULE.env_name] = custom_plugins
                 plugin_module = custom_plugins
-        get_plugin_loader(plugin_module)
+        get_plugin_loader(plugin_module, lazy=is_lazy_init_enabled(app_config))
     except Exception as e:
         logger.exception(f"Failed to initialize plugin loader: {e}")
         raise
@@ -0,0 +1,37 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sk_agents.a2a.a2a_agent_executor import A2AAgentExecutor
+from sk_agents.configs import configs
+from sk_agents.ska_types import BaseConfig
+
+
+@pytest.mark.asyncio
+async def test_execute_shares_builders_between_requests(mocker):
+    config = BaseConfig(
+        apiVersion="skagents/v1",
+        kind="Agent",
+        name="TestAgent",
+        version=0.1,
+        spec={"agent": {"name": "TestAgent", "model": "gpt-4o", "system_prompt": "prompt"}},
+    )
+    app_config = MagicMock()
+    app_config.get.side_effect = {c.env_name: c.default_value for c in configs}.get
+    chat_completion_builder = MagicMock()
+    mocker.patch("sk_agents.a2a.a2a_agent_executor.A2AResponseClassifier")
+    processor_class = mocker.patch("sk_agents.a2a.a2a_agent_executor.RequestProcessor")
+    processor_class.return_value.process_request = AsyncMock()
+    executor = A2AAgentExecutor(config, app_config, chat_completion_builder, MagicMock())
+
+    await executor.execute(MagicMock(), MagicMock())
+    await executor.execute(MagicMock(), MagicMock())
+
+    handlers = [call.args[0] for call in processor_class.call_args_list]
+    assert len(handlers) == 2
+    assert handlers[0] is not handlers[1]
+    kernel_builders = {id(handler.agent_builder.kernel_builder) for handler in handlers}
+    assert kernel_builders == {id(executor.handler_factory.kernel_builder)}
+    assert executor.handler_factory.kernel_builder.chat_completion_builder is (
+        chat_completion_builder
+    )
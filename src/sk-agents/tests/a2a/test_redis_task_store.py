@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+from a2a.types import Task, TaskState, TaskStatus
+
+from sk_agents.a2a.redis_task_store import RedisTaskStore
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value, ex))
+        return self
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        if self.redis.fail:
+            raise ConnectionError("redis is down")
+        for key, value, ex in self.commands:
+            self.redis.store[key] = value
+            self.redis.ttls[key] = ex
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.round_trips = 0
+        self.fail = False
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    async def delete(self, key):
+        self.round_trips += 1
+        self.store.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def _task(state: TaskState, task_id: str = "task-1") -> Task:
+    return Task(id=task_id, contextId="context-1", status=TaskStatus(state=state))
+
+
+@pytest.mark.asyncio
+async def test_working_updates_are_written_together():
+    redis = FakeRedis()
+    store = RedisTaskStore(redis, ttl=60, flush_interval=0.01)
+
+    await store.save(_task(TaskState.submitted))
+    await store.save(_task(TaskState.working))
+    await store.save(_task(TaskState.working, "task-2"))
+
+    # Not written yet, but visible to this store
+    assert redis.round_trips == 0
+    assert (await store.get("task-1")).status.state == TaskState.working
+    assert redis.round_trips == 0
+
+    await asyncio.sleep(0.05)
+    assert redis.round_trips == 1
+    assert set(redis.store) == {"task:task-1", "task:task-2"}
+    assert redis.ttls["task:task-1"] == 60
+
+
+@pytest.mark.asyncio
+async def test_final_update_is_written_immediately_with_pending_updates():
+    redis = FakeRedis()
+    store = RedisTaskStore(redis, flush_interval=10)
+
+    await store.save(_task(TaskState.working, "task-2"))
+    await store.save(_task(TaskState.working))
+    await store.save(_task(TaskState.completed))
+
+    assert redis.round_trips == 1
+    assert Task.model_validate_json(redis.store["task:task-1"]).status.state == (
+        TaskState.completed
+    )
+    assert "task:task-2" in redis.store
+
+
+@pytest.mark.asyncio
+async def test_without_flush_interval_every_save_is_written():
+    redis = FakeRedis()
+    store = RedisTaskStore(redis, flush_interval=0)
+
+    await store.save(_task(TaskState.working))
+    await store.save(_task(TaskState.working))
+
+    assert redis.round_trips == 2
+    assert (await store.get("task-1")).status.state == TaskState.working
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_updates_for_the_next_one():
+    redis = FakeRedis()
+    store = RedisTaskStore(redis, flush_interval=10)
+    await store.save(_task(TaskState.working, "task-2"))
+
+    redis.fail = True
+    with pytest.raises(ConnectionError):
+        await store.save(_task(TaskState.failed))
+    redis.fail = False
+    await store.flush()
+
+    assert set(redis.store) == {"task:task-1", "task:task-2"}
+
+
+@pytest.mark.asyncio
+async def test_delete_drops_pending_update():
+    redis = FakeRedis()
+    store = RedisTaskStore(redis, flush_interval=10)
+    await store.save(_task(TaskState.working))
+
+    await store.delete("task-1")
+    await store.flush()
+
+    assert await store.get("task-1") is None
+    assert redis.store == {}
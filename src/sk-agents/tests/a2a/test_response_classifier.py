@@ -0,0 +1,193 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from sk_agents.a2a.response_classifier import (
+    A2AResponseClassifier,
+    A2AResponseStatus,
+    classify_heuristic,
+    classify_signals,
+)
+from sk_agents.chat_completion.fake_chat_completion_factory import (
+    FakeChatCompletion,
+    FakeLlmScript,
+    FakeScenario,
+    FakeStep,
+)
+from sk_agents.configs import (
+    TA_A2A_CLASSIFIER_CACHE_SIZE,
+    TA_A2A_CLASSIFIER_MIN_CONFIDENCE,
+    TA_A2A_OUTPUT_CLASSIFIER_MODEL,
+)
+from sk_agents.extra_data_collector import ExtraData, ExtraDataElement
+from sk_agents.ska_types import InvokeResponse, TokenUsage
+
+AMBIGUOUS = "I could not finish the report. Do you want me to try again with a smaller date range?"
+
+
+class CountingChatCompletion(FakeChatCompletion):
+    calls: int = 0
+
+    async def _inner_get_chat_message_contents(self, chat_history, settings):
+        self.calls += 1
+        return await super()._inner_get_chat_message_contents(chat_history, settings)
+
+
+class Report(BaseModel):
+    total: int
+
+
+def _classifier(
+    min_confidence: str = "0.8",
+) -> tuple[A2AResponseClassifier, CountingChatCompletion]:
+    service = CountingChatCompletion(
+        service_id=A2AResponseClassifier.NAME,
+        ai_model_id="classifier-model",
+        script=FakeLlmScript(
+            scenarios=[
+                FakeScenario(
+                    steps=[
+                        FakeStep(
+                            content='{"status": "input-required", "message": "Retry smaller?"}'
+                        )
+                    ]
+                )
+            ]
+        ),
+    )
+    app_config = MagicMock()
+    app_config.get.side_effect = {
+        TA_A2A_OUTPUT_CLASSIFIER_MODEL.env_name: "classifier-model",
+        TA_A2A_CLASSIFIER_MIN_CONFIDENCE.env_name: min_confidence,
+        TA_A2A_CLASSIFIER_CACHE_SIZE.env_name: "16",
+    }.get
+    chat_completion_builder = MagicMock()
+    chat_completion_builder.get_chat_completion_for_model.return_value = service
+    return A2AResponseClassifier(app_config, chat_completion_builder), service
+
+
+def _invoke_response(**kwargs) -> InvokeResponse:
+    return InvokeResponse(
+        token_usage=TokenUsage(completion_tokens=1, prompt_tokens=1, total_tokens=2), **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    "invoke_response,response,status",
+    [
+        (
+            _invoke_response(
+                extra_data=ExtraData(items=[ExtraDataElement(key="a2a_status", value="failed")])
+            ),
+            "Here is your report.",
+            A2AResponseStatus.failed,
+        ),
+        (None, "Which region? [A2A-Status: input-required]", A2AResponseStatus.input_required),
+        (_invoke_response(output_pydantic=Report(total=3)), AMBIGUOUS, A2AResponseStatus.completed),
+    ],
+)
+def test_classify_signals(invoke_response, response, status):
+    assert classify_signals(response, invoke_response).status == status
+
+
+def test_classify_signals_without_signal():
+    invoke_response = _invoke_response(
+        extra_data=ExtraData(items=[ExtraDataElement(key="a2a_status", value="unknown")])
+    )
+    assert classify_signals("Here is your report.", invoke_response) is None
+
+
+@pytest.mark.parametrize(
+    "response,status",
+    [
+        ("I've finished generating the report you asked for.", A2AResponseStatus.completed),
+        (
+            "I'm sorry, I encountered an unexpected error and cannot process your request.",
+            A2AResponseStatus.failed,
+        ),
+        (
+            "Could you please tell me which date range you are interested in?",
+            A2AResponseStatus.input_required,
+        ),
+        (
+            "Access to this API requires authentication. Please provide a valid bearer token.",
+            A2AResponseStatus.auth_required,
+        ),
+        ("You need to sign in to continue.", A2AResponseStatus.auth_required),
+    ],
+)
+def test_classify_heuristic_keyword_matches(response, status):
+    classification, confidence = classify_heuristic(response)
+
+    assert classification.status == status
+    assert confidence < 0.8
+
+
+# Completed answers whose wording matches the keywords of another status
+@pytest.mark.parametrize(
+    "response",
+    [
+        "Here is the summary of the quarter. Please let me know if you have questions.",
+        "I have saved the report to your drive. Would you like me to also email it?",
+        "HTTP 401 Unauthorized means the request lacked valid credentials for the resource.",
+        "The pricing service could not return the rate, so I used the cached value of 1.08.",
+    ],
+)
+@pytest.mark.asyncio
+async def test_keyword_matches_are_left_to_the_model(response):
+    classifier, service = _classifier()
+
+    classification = await classifier.classify_response(response)
+
+    assert classification.status == A2AResponseStatus.input_required
+    assert service.calls == 1
+
+
+def test_classify_heuristic_is_not_confident_about_mixed_signals():
+    _, confidence = classify_heuristic(AMBIGUOUS)
+
+    assert confidence < 0.8
+
+
+@pytest.mark.asyncio
+async def test_classifier_only_calls_the_model_without_a_signal():
+    classifier, service = _classifier()
+
+    marked = await classifier.classify_response("Here is the summary. [a2a-status: completed]")
+    assert marked.status == A2AResponseStatus.completed
+    pydantic = await classifier.classify_response(
+        AMBIGUOUS, _invoke_response(output_pydantic=Report(total=3))
+    )
+    assert pydantic.status == A2AResponseStatus.completed
+    assert service.calls == 0
+
+    first = await classifier.classify_response(AMBIGUOUS)
+    second = await classifier.classify_response(AMBIGUOUS)
+
+    assert first.status == A2AResponseStatus.input_required
+    assert first.message == "Retry smaller?"
+    assert second == first
+    assert service.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_classifier_cache_is_bounded():
+    classifier, service = _classifier(min_confidence="1.1")
+
+    for index in range(20):
+        await classifier.classify_response(f"response {index}")
+    await classifier.classify_response("response 0")
+
+    assert len(classifier._cache) == 16
+    assert service.calls == 21
+
+
+@pytest.mark.asyncio
+async def test_heuristic_decides_with_a_lower_min_confidence():
+    classifier, service = _classifier(min_confidence="0.7")
+
+    classification = await classifier.classify_response("Here is the summary you asked for.")
+
+    assert classification.status == A2AResponseStatus.completed
+    assert service.calls == 0
@@ -0,0 +1,174 @@
+import os
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.cases import build_cases
+from benchmarks.runner import (
+    BenchmarkReport,
+    compare_with_baseline,
+    measure,
+    parse_thresholds,
+    summarize,
+)
+from benchmarks.stubs import StubAppConfig, benchmark_environment
+from sk_agents.configs import TA_API_KEY, TA_PLUGIN_CATALOG_FILE
+
+
+def _report(**medians: float) -> BenchmarkReport:
+    return BenchmarkReport(
+        results=[summarize(name, [median / 1000]) for name, median in medians.items()]
+    )
+
+
+def test_summarize_computes_statistics():
+    result = summarize("bench", [0.001, 0.002, 0.003, 0.004])
+
+    assert result.iterations == 4
+    assert result.median_ms == pytest.approx(2.5)
+    assert result.min_ms == pytest.approx(1.0)
+    assert result.max_ms == pytest.approx(4.0)
+    assert result.ops_per_sec == pytest.approx(400.0)
+
+
+def test_compare_with_baseline_flags_regressions_over_threshold():
+    baseline = _report(fast=1.0, slow=1.0, gone=1.0)
+    current = _report(fast=1.1, slow=1.5, new=9.0)
+
+    regressions = compare_with_baseline(current, baseline, 0.2)
+
+    assert [r.name for r in regressions] == ["slow"]
+    assert regressions[0].change == pytest.approx(0.5)
+
+
+def test_compare_with_baseline_uses_per_benchmark_thresholds():
+    regressions = compare_with_baseline(
+        _report(slow=1.5), _report(slow=1.0), 0.2, parse_thresholds(["slow=0.6"])
+    )
+
+    assert regressions == []
+
+
+def test_parse_thresholds_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        parse_thresholds(["no-separator"])
+
+
+@pytest.mark.asyncio
+async def test_measure_runs_warmup_and_iterations():
+    calls = []
+
+    async def fn():
+        calls.append(1)
+
+    result = await measure("bench", fn, iterations=3, warmup=2)
+
+    assert len(calls) == 5
+    assert result.iterations == 3
+
+
+@pytest.mark.asyncio
+async def test_all_cases_run_against_stubs():
+    with benchmark_environment():
+        cases = await build_cases(StubAppConfig())
+
+        assert {"handler.invoke[tool_rounds=0]", "handler.invoke[tool_rounds=5]"} <= set(cases)
+        for name, fn in cases.items():
+            result = await fn()
+            if name.startswith("handler.invoke"):
+                assert result.output == "The benchmark is complete."
+
+
+def test_benchmark_environment_is_restored(monkeypatch):
+    monkeypatch.delenv(TA_API_KEY.env_name, raising=False)
+    monkeypatch.setenv(TA_PLUGIN_CATALOG_FILE.env_name, "catalog.json")
+
+    with benchmark_environment():
+        assert os.environ[TA_API_KEY.env_name] == "unused"
+        assert os.environ[TA_PLUGIN_CATALOG_FILE.env_name] == "catalog.json"
+
+    assert TA_API_KEY.env_name not in os.environ
+    assert os.environ[TA_PLUGIN_CATALOG_FILE.env_name] == "catalog.json"
+
+
+def test_main_writes_report_and_detects_regression(tmp_path):
+    output = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    _report(**{"sse.serialize[final-response]": 1e-9}).save(baseline)
+
+    status = main(
+        [
+            "--iterations",
+            "2",
+            "--warmup",
+            "0",
+            "--filter",
+            "sse.",
+            "--output",
+            str(output),
+            "--baseline",
+            str(baseline),
+        ]
+    )
+
+    assert status == 1
+    assert BenchmarkReport.load(output).get("sse.serialize[final-response]") is not None
+
+
+def test_state_serialization_benchmark_reports_every_available_encoding():
+    from benchmarks.state_serialization import run
+
+    results = run((10,), iterations=1)
+
+    encodings = {result.encoding for result in results}
+    assert {"legacy-pydantic-v1", "json"} <= encodings
+    assert all(result.bytes > 0 for result in results)
+
+
+def test_template_render_benchmark_reports_both_variants():
+    from benchmarks.template_render import SECTION_COUNTS, run
+
+    results = run(iterations=5, uncached_iterations=1)
+
+    assert [sections for sections, _, _ in results] == list(SECTION_COUNTS)
+    assert all(uncached > 0 and cached > 0 for _, uncached, cached in results)
+
+
+def test_image_references_benchmark_retains_one_copy_of_a_repeated_image():
+    from benchmarks.image_references import run, sample_data_uri
+
+    results = {
+        (result.variant, result.turns): result
+        for result in run((1, 10), sample_data_uri((256, 256)))
+    }
+
+    assert results["data-uri", 10].retained_bytes > 5 * results["reference", 10].retained_bytes
+    assert results["data-uri", 10].request_bytes == results["reference", 10].request_bytes
+
+
+def test_extra_data_stream_benchmark_reports_every_variant():
+    from benchmarks.extra_data_stream import run
+
+    results = dict(run(token_count=100, iterations=1))
+
+    assert set(results) == {"parse-every-chunk", "typed+legacy-json", "typed"}
+    assert all(us_per_token > 0 for us_per_token in results.values())
+
+
+def test_a2a_classifier_benchmark_calls_the_model_less_when_tiered():
+    from benchmarks.a2a_classifier import RESPONSES, run
+
+    results = {name: (ms, calls) for name, ms, calls in run(iterations=2, model_latency_ms=0)}
+
+    assert results["model-only"][1] == 2 * len(RESPONSES)
+    # Once per distinct response without a signal, then from the cache
+    assert results["tiered"][1] == len(RESPONSES) - 1
+    assert results["tiered+keywords"][1] == 1
+
+
+def test_a2a_request_benchmark_pipelines_task_updates():
+    from benchmarks.a2a_request import run
+
+    results = {name: round_trips for name, _, round_trips in run(iterations=2, rtt_ms=0)}
+
+    assert results["shared"] < results["per-request"]
@@ -0,0 +1,224 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.exceptions import ServiceResponseException
+
+from sk_agents.chat_completion.fake_chat_completion_factory import (
+    FakeChatCompletion,
+    FakeChatCompletionFactory,
+    FakeLlmScript,
+    FakeLlmSettings,
+    FakeScenario,
+    FakeStep,
+    FakeToolCall,
+)
+from sk_agents.configs import (
+    TA_CUSTOM_CHAT_COMPLETION_FACTORY_CLASS_NAME,
+    TA_CUSTOM_CHAT_COMPLETION_FACTORY_MODULE,
+)
+from sk_agents.ska_types import ModelType
+from sk_agents.tealagents.chat_completion_builder import ChatCompletionBuilder
+from sk_agents.tealagents.v1alpha1.utils import get_token_usage_for_response
+
+FACTORY_MODULE = "src/sk_agents/chat_completion/fake_chat_completion_factory.py"
+
+
+def _app_config(values: dict[str, str | None]) -> MagicMock:
+    defaults = {c.env_name: c.default_value for c in FakeChatCompletionFactory.get_configs()}
+    defaults.update(values)
+    config = MagicMock()
+    config.get.side_effect = lambda key: defaults.get(key)
+    return config
+
+
+def _tool_script() -> FakeLlmScript:
+    return FakeLlmScript(
+        scenarios=[
+            FakeScenario(
+                match="weather",
+                steps=[
+                    FakeStep(
+                        tool_calls=[
+                            FakeToolCall(
+                                plugin_name="WeatherPlugin",
+                                function_name="get_weather",
+                                arguments={"city": "Paris"},
+                            )
+                        ]
+                    ),
+                    FakeStep(content="It is sunny in Paris."),
+                ],
+            ),
+            FakeScenario(steps=[FakeStep(content="Default answer", completion_tokens=7)]),
+        ]
+    )
+
+
+def _history(message: str) -> ChatHistory:
+    history = ChatHistory()
+    history.add_user_message(message)
+    return history
+
+
+@pytest.mark.asyncio
+async def test_default_response_has_configured_token_count():
+    client = FakeChatCompletion("svc", "fake", fake_settings=FakeLlmSettings(completion_tokens=5))
+
+    responses = await client.get_chat_message_contents(_history("hi"), PromptExecutionSettings())
+
+    assert len(responses) == 1
+    assert responses[0].content == "token0 token1 token2 token3 token4"
+    usage = get_token_usage_for_response(ModelType.OPENAI, responses[0])
+    assert usage.completion_tokens == 5
+    assert usage.prompt_tokens == 1
+
+
+@pytest.mark.asyncio
+async def test_scripted_tool_call_round_then_answer():
+    client = FakeChatCompletion("svc", "fake", script=_tool_script())
+    history = _history("What is the weather?")
+
+    first = (await client.get_chat_message_contents(history, PromptExecutionSettings()))[0]
+    calls = [item for item in first.items if isinstance(item, FunctionCallContent)]
+    assert len(calls) == 1
+    assert calls[0].plugin_name == "WeatherPlugin"
+    assert calls[0].parse_arguments() == {"city": "Paris"}
+
+    history.add_message(first)
+    second = (await client.get_chat_message_contents(history, PromptExecutionSettings()))[0]
+    assert second.content == "It is sunny in Paris."
+
+    history.add_user_message("And the weather tomorrow?")
+    third = (await client.get_chat_message_contents(history, PromptExecutionSettings()))[0]
+    assert any(isinstance(item, FunctionCallContent) for item in third.items)
+
+
+@pytest.mark.asyncio
+async def test_scenario_falls_through_to_unmatched():
+    client = FakeChatCompletion("svc", "fake", script=_tool_script())
+
+    response = (
+        await client.get_chat_message_contents(_history("hello"), PromptExecutionSettings())
+    )[0]
+
+    assert response.content == "Default answer"
+    assert get_token_usage_for_response(ModelType.OPENAI, response).completion_tokens == 7
+
+
+@pytest.mark.asyncio
+async def test_streaming_emits_tokens_with_delays():
+    settings = FakeLlmSettings(first_token_delay_ms=30, inter_token_delay_ms=5)
+    script = FakeLlmScript(scenarios=[FakeScenario(steps=[FakeStep(content="one two three")])])
+    client = FakeChatCompletion("svc", "fake", script=script, fake_settings=settings)
+
+    start = time.perf_counter()
+    first_token_at = None
+    chunks = []
+    async for messages in client.get_streaming_chat_message_contents(
+        _history("hi"), PromptExecutionSettings()
+    ):
+        if first_token_at is None:
+            first_token_at = time.perf_counter() - start
+        chunks.extend(messages)
+
+    assert first_token_at >= 0.03
+    assert "".join(str(chunk) for chunk in chunks) == "one two three"
+    assert chunks[-1].inner_content.usage.completion_tokens == 3
+
+
+@pytest.mark.asyncio
+async def test_streaming_emits_tool_calls():
+    client = FakeChatCompletion("svc", "fake", script=_tool_script())
+
+    chunks = []
+    async for messages in client.get_streaming_chat_message_contents(
+        _history("weather?"), PromptExecutionSettings()
+    ):
+        chunks.extend(messages)
+
+    calls = [
+        item for chunk in chunks for item in chunk.items if isinstance(item, FunctionCallContent)
+    ]
+    assert [call.function_name for call in calls] == ["get_weather"]
+
+
+@pytest.mark.asyncio
+async def test_scripted_error_is_raised():
+    script = FakeLlmScript(scenarios=[FakeScenario(steps=[FakeStep(error="rate limited")])])
+    client = FakeChatCompletion("svc", "fake", script=script)
+
+    with pytest.raises(ServiceResponseException, match="rate limited"):
+        await client.get_chat_message_contents(_history("hi"), PromptExecutionSettings())
+
+
+@pytest.mark.asyncio
+async def test_failure_injection_is_reproducible_for_seed():
+    async def outcomes(seed: int) -> list[bool]:
+        client = FakeChatCompletion(
+            "svc", "fake", fake_settings=FakeLlmSettings(failure_rate=0.5, seed=seed)
+        )
+        results = []
+        for _ in range(20):
+            try:
+                await client.get_chat_message_contents(_history("hi"), PromptExecutionSettings())
+                results.append(True)
+            except ServiceResponseException:
+                results.append(False)
+        return results
+
+    first = await outcomes(42)
+    assert first == await outcomes(42)
+    assert True in first and False in first
+
+
+def test_factory_reads_configs_and_script(tmp_path):
+    script_file = tmp_path / "script.yaml"
+    script_file.write_text(
+        "scenarios:\n  - steps:\n      - content: recorded answer\n",
+    )
+    factory = FakeChatCompletionFactory(
+        _app_config(
+            {
+                FakeChatCompletionFactory.TA_FAKE_LLM_SCRIPT.env_name: str(script_file),
+                FakeChatCompletionFactory.TA_FAKE_LLM_MODELS.env_name: "fake-a, fake-b",
+                FakeChatCompletionFactory.TA_FAKE_LLM_FIRST_TOKEN_DELAY_MS.env_name: "12.5",
+            }
+        )
+    )
+
+    client = factory.get_chat_completion_for_model_name("fake-a", "svc")
+
+    assert isinstance(client, FakeChatCompletion)
+    assert client.script.scenarios[0].steps[0].content == "recorded answer"
+    assert client.fake_settings.first_token_delay_ms == 12.5
+    assert factory.get_model_type_for_name("fake-b") == ModelType.OPENAI
+    assert factory.model_supports_structured_output("fake-a") is False
+    with pytest.raises(ValueError):
+        factory.get_chat_completion_for_model_name("gpt-4o", "svc")
+
+
+def test_factory_serves_any_model_when_unrestricted():
+    factory = FakeChatCompletionFactory(_app_config({}))
+
+    client = factory.get_chat_completion_for_model_name("gpt-4o", "svc")
+
+    assert client.ai_model_id == "gpt-4o"
+
+
+def test_loadable_through_chat_completion_builder_hook():
+    values = {
+        TA_CUSTOM_CHAT_COMPLETION_FACTORY_MODULE.env_name: FACTORY_MODULE,
+        TA_CUSTOM_CHAT_COMPLETION_FACTORY_CLASS_NAME.env_name: "FakeChatCompletionFactory",
+    }
+    with patch("sk_agents.tealagents.chat_completion_builder.AppConfig.add_configs") as add_configs:
+        builder = ChatCompletionBuilder(_app_config(values))
+    add_configs.assert_called_once_with(FakeChatCompletionFactory.get_configs())
+
+    client = builder.get_chat_completion_for_model("svc", "gpt-4o")
+
+    assert type(client).__name__ == "FakeChatCompletion"
+    assert builder.get_model_type_for_name("gpt-4o") == ModelType.OPENAI
@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock
+
+import pytest
+from semantic_kernel.contents import AuthorRole, StreamingChatMessageContent
+
+from sk_agents.extra_data_collector import (
+    ExtraData,
+    ExtraDataElement,
+    ExtraDataPartial,
+)
+from sk_agents.ska_types import BaseConfig, InvokeResponse, ModelType, PartialResponse
+from sk_agents.skagents.v1 import AgentBuilder
+from sk_agents.skagents.v1.chat.chat_agents import ChatAgents
+from sk_agents.skagents.v1.chat.config import Spec
+from sk_agents.skagents.v1.config import AgentConfig
+
+EXTRA_DATA = ExtraData(items=[ExtraDataElement(key="source", value="plugin")])
+LEGACY_CHUNK = ExtraDataPartial(extra_data=EXTRA_DATA).model_dump_json()
+
+
+class StreamingAgent:
+    def __init__(self, chunks: list[str | ExtraDataPartial]):
+        self.chunks = chunks
+
+    def get_model_type(self) -> ModelType:
+        return ModelType.OPENAI
+
+    async def invoke_stream(self, history):
+        for chunk in self.chunks:
+            if isinstance(chunk, ExtraDataPartial):
+                yield chunk
+                continue
+            yield StreamingChatMessageContent(
+                role=AuthorRole.ASSISTANT, content=chunk, choice_index=0
+            )
+
+
+@pytest.fixture(autouse=True)
+def no_telemetry(mocker):
+    telemetry = MagicMock()
+    telemetry.telemetry_enabled.return_value = False
+    mocker.patch("sk_agents.skagents.v1.chat.chat_agents.get_telemetry", return_value=telemetry)
+
+
+def _chat_agents(
+    chunks: list[str | ExtraDataPartial], legacy_extra_data: bool = True
+) -> ChatAgents:
+    config = BaseConfig(
+        apiVersion="skagents/v1",
+        description="chat test agent",
+        service_name="ChatAgent",
+        version=0.1,
+        input_type="BaseInput",
+        spec=Spec(agent=AgentConfig(name="stub", model="stub-model", system_prompt="stub")),
+    )
+    agent_builder = MagicMock(spec=AgentBuilder)
+    agent_builder.build_agent.return_value = StreamingAgent(chunks)
+    return ChatAgents(config, agent_builder, legacy_extra_data=legacy_extra_data)
+
+
+async def _stream(chat_agents: ChatAgents) -> tuple[list[str], InvokeResponse]:
+    results = [r async for r in chat_agents.invoke_stream({"chat_history": []})]
+    partials = [r.output_partial for r in results if isinstance(r, PartialResponse)]
+    return partials, results[-1]
+
+
+@pytest.mark.asyncio
+async def test_invoke_stream_collects_typed_extra_data():
+    partial = ExtraDataPartial(extra_data=EXTRA_DATA)
+
+    partials, response = await _stream(_chat_agents(["Hello", " world", partial], False))
+
+    assert partials == ["Hello", " world"]
+    assert response.output_raw == "Hello world"
+    assert response.extra_data == EXTRA_DATA
+
+
+@pytest.mark.asyncio
+async def test_invoke_stream_streams_json_output():
+    partials, response = await _stream(_chat_agents(["{", '"answer": 42', "}", '{"answer": 42}']))
+
+    assert partials == ["{", '"answer": 42', "}", '{"answer": 42}']
+    assert response.extra_data is None
+
+
+@pytest.mark.asyncio
+async def test_invoke_stream_legacy_extra_data_compatibility():
+    partials, response = await _stream(_chat_agents(["Hi", LEGACY_CHUNK]))
+
+    assert partials == ["Hi"]
+    assert response.extra_data == EXTRA_DATA
+
+    partials, response = await _stream(_chat_agents(["Hi", LEGACY_CHUNK], False))
+
+    assert partials == ["Hi", LEGACY_CHUNK]
+    assert response.extra_data is None
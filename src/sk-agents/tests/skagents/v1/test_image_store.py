@@ -0,0 +1,164 @@
+import base64
+import io
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+from semantic_kernel.contents import AuthorRole, ChatMessageContent, ImageContent, TextContent
+
+from sk_agents.configs import TA_IMAGE_CACHE_MAX_BYTES, TA_IMAGE_MAX_PIXELS
+from sk_agents.ska_types import EmbeddedImage
+from sk_agents.skagents.v1 import image_store
+from sk_agents.skagents.v1.image_store import (
+    ImageReference,
+    ImageStore,
+    get_image_store,
+    initialize_image_store,
+)
+from sk_agents.skagents.v1.sequential.task import Task
+
+IMAGE_DATA = base64.b64encode(b"\x89PNG fake image bytes").decode()
+DATA_URI = f"data:image/png;base64,{IMAGE_DATA}"
+
+
+def _png(width: int, height: int) -> str:
+    image_module = pytest.importorskip("PIL.Image")
+    output = io.BytesIO()
+    image = image_module.frombytes("RGB", (width, height), os.urandom(width * height * 3))
+    image.save(output, format="PNG")
+    return base64.b64encode(output.getvalue()).decode()
+
+
+@pytest.fixture
+def fresh_store(monkeypatch):
+    store = ImageStore()
+    monkeypatch.setattr(image_store, "_image_store", store)
+    return store
+
+
+def test_reference_resolves_to_the_original_data_uri():
+    reference = ImageStore().reference(IMAGE_DATA, "image/png")
+
+    assert reference.data_uri == DATA_URI
+    assert str(reference) == DATA_URI
+    assert reference.mime_type == "image/png"
+    message = ChatMessageContent(role=AuthorRole.USER, items=[TextContent(text="look"), reference])
+    assert message.to_dict()["content"][1] == {"type": "image_url", "image_url": {"url": DATA_URI}}
+
+
+def test_same_image_is_stored_once():
+    store = ImageStore()
+
+    first = store.reference(IMAGE_DATA, "image/png")
+    second = store.reference_data_uri(DATA_URI)
+
+    assert isinstance(second, ImageReference)
+    assert first.blob_hash == second.blob_hash
+    assert len(store) == 1
+    assert store.size == len(base64.b64decode(IMAGE_DATA))
+
+
+def test_eviction_keeps_referenced_images_readable():
+    store = ImageStore(max_bytes=40)
+    first = store.reference(base64.b64encode(b"a" * 30).decode(), "image/png")
+    store.reference(base64.b64encode(b"b" * 30).decode(), "image/png")
+
+    assert store.get(first.blob_hash) is None
+    assert len(store) == 1
+    assert first.data == b"a" * 30
+
+
+def test_reference_resolves_from_the_store_by_hash(fresh_store):
+    blob = fresh_store.reference(IMAGE_DATA, "image/png")
+
+    assert ImageReference(blob_hash=blob.blob_hash).data_uri == DATA_URI
+    assert ImageReference(blob_hash="unknown").data_uri == ""
+
+
+def test_non_base64_data_uris_are_not_referenced():
+    store = ImageStore()
+
+    content = store.reference_data_uri("data:text/plain;charset=utf-8,hello")
+
+    assert type(content) is ImageContent
+    assert content.data_uri == "data:text/plain;charset=utf-8,hello"
+    assert len(store) == 0
+
+
+def test_base64_with_line_breaks_is_referenced():
+    image = b"\x89PNG fake image bytes" * 10
+    wrapped = base64.encodebytes(image).decode()
+    assert "\n" in wrapped.rstrip()
+
+    reference = ImageStore().reference(wrapped, "image/png")
+
+    assert reference.data == image
+    assert reference.data_uri == f"data:image/png;base64,{base64.b64encode(image).decode()}"
+
+
+def test_invalid_base64_raises():
+    with pytest.raises(ValueError, match="Invalid base64 image data"):
+        ImageStore().reference("not base64!", "image/png")
+
+
+def test_downscale_to_pixel_budget():
+    image_module = pytest.importorskip("PIL.Image")
+    store = ImageStore(max_pixels=100 * 50)
+
+    reference = store.reference(_png(400, 200), "image/png")
+
+    with image_module.open(io.BytesIO(reference.data)) as image:
+        assert image.size == (100, 50)
+        assert image.format == "PNG"
+    assert reference.mime_type == "image/png"
+
+
+def test_recompress_to_configured_format():
+    image_module = pytest.importorskip("PIL.Image")
+    store = ImageStore(image_format="jpeg", quality=70)
+
+    reference = store.reference(_png(64, 64), "image/png")
+
+    with image_module.open(io.BytesIO(reference.data)) as image:
+        assert image.format == "JPEG"
+    assert reference.mime_type == "image/jpeg"
+
+
+def test_small_image_is_kept_as_is():
+    pytest.importorskip("PIL.Image")
+    data = _png(10, 10)
+
+    reference = ImageStore(max_pixels=1000).reference(data, "image/png")
+
+    assert reference.data == base64.b64decode(data)
+
+
+def test_initialize_image_store_reads_app_config(monkeypatch):
+    monkeypatch.setattr(image_store, "_image_store", None)
+    app_config = MagicMock()
+    app_config.get.side_effect = {
+        TA_IMAGE_CACHE_MAX_BYTES.env_name: "1024",
+        TA_IMAGE_MAX_PIXELS.env_name: None,
+    }.get
+
+    store = initialize_image_store(app_config)
+
+    assert get_image_store() is store
+    assert store.max_bytes == 1024
+    assert store.max_pixels is None
+    assert store.image_format is None
+    assert store.quality == 85
+
+
+def test_task_message_references_embedded_image(fresh_store):
+    task = Task(name="t", description="t", instructions="Describe", agent=MagicMock())
+
+    message = task._get_message(
+        {"embedded_image": EmbeddedImage(format="image/png", data=IMAGE_DATA)}
+    )
+
+    image = message.items[1]
+    assert isinstance(image, ImageReference)
+    assert len(fresh_store) == 1
+    assert json.loads(json.dumps(message.to_dict()))["content"][1]["image_url"]["url"] == DATA_URI
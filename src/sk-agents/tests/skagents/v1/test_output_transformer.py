@@ -0,0 +1,166 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+from semantic_kernel.contents import AuthorRole, ChatMessageContent
+from semantic_kernel.kernel import Kernel
+
+from sk_agents.chat_completion.fake_chat_completion_factory import (
+    FakeChatCompletion,
+    FakeLlmScript,
+    FakeLlmSettings,
+    FakeScenario,
+    FakeStep,
+)
+from sk_agents.ska_types import BaseConfig, ModelType
+from sk_agents.skagents.kernel_builder import KernelBuilder
+from sk_agents.skagents.v1.config import AgentConfig
+from sk_agents.skagents.v1.sequential.config import Spec, TaskConfig
+from sk_agents.skagents.v1.sequential.output_transformer import OutputTransformer
+from sk_agents.skagents.v1.sequential.sequential_skagents import SequentialSkagents
+from sk_agents.skagents.v1.sequential.task import Task
+from sk_agents.skagents.v1.sequential.task_builder import TaskBuilder
+
+LLM_DELAY_MS = 50
+
+
+class AnswerOutput(BaseModel):
+    answer: str
+
+
+class StubAgent:
+    """Final-task agent returning a fixed response after a delay."""
+
+    def __init__(self, content: str, so_supported: bool = True):
+        self.content = content
+        self.supports_structured_output = so_supported
+
+    def get_model_type(self) -> ModelType:
+        return ModelType.OPENAI
+
+    def so_supported(self) -> bool:
+        return self.supports_structured_output
+
+    async def invoke(self, history):
+        await asyncio.sleep(LLM_DELAY_MS / 1000)
+        yield ChatMessageContent(role=AuthorRole.ASSISTANT, content=self.content)
+
+
+def _transformer_kernel(*args, **kwargs) -> Kernel:
+    kernel = Kernel()
+    kernel.add_service(
+        FakeChatCompletion(
+            service_id=OutputTransformer.NAME,
+            ai_model_id="transformer-model",
+            script=FakeLlmScript(
+                scenarios=[
+                    FakeScenario(
+                        match=".*",
+                        steps=[FakeStep(content='{"answer": "42"}', completion_tokens=5)],
+                    )
+                ]
+            ),
+            fake_settings=FakeLlmSettings(first_token_delay_ms=LLM_DELAY_MS),
+        )
+    )
+    return kernel
+
+
+@pytest.fixture(autouse=True)
+def environment(mocker):
+    OutputTransformer.clear_cache()
+    telemetry = MagicMock()
+    telemetry.telemetry_enabled.return_value = False
+    mocker.patch(
+        "sk_agents.skagents.v1.sequential.sequential_skagents.get_telemetry",
+        return_value=telemetry,
+    )
+    type_loader = MagicMock()
+    type_loader.get_type.return_value = AnswerOutput
+    for module in ("sequential_skagents", "output_transformer"):
+        mocker.patch(
+            f"sk_agents.skagents.v1.sequential.{module}.get_type_loader",
+            return_value=type_loader,
+        )
+    app_config = MagicMock()
+    app_config.snapshot.return_value.get_str.return_value = "transformer-model"
+    mocker.patch(
+        "sk_agents.skagents.v1.sequential.output_transformer.AppConfig", return_value=app_config
+    )
+    yield
+    OutputTransformer.clear_cache()
+
+
+@pytest.fixture
+def kernel_builder():
+    builder = MagicMock(spec=KernelBuilder)
+    builder.build_kernel.side_effect = _transformer_kernel
+    return builder
+
+
+def _skagents(agent: StubAgent, kernel_builder) -> SequentialSkagents:
+    config = BaseConfig(
+        apiVersion="skagents/v1",
+        description="typed agent",
+        service_name="TypedAgent",
+        version=0.1,
+        input_type="BaseInput",
+        output_type="AnswerOutput",
+        spec=Spec(
+            agents=[AgentConfig(name="stub", model="stub-model", system_prompt="stub")],
+            tasks=[
+                TaskConfig(
+                    name="answer", task_no=1, description="d", instructions="Q", agent="stub"
+                )
+            ],
+        ),
+    )
+    task_builder = MagicMock(spec=TaskBuilder)
+    task_builder.build_task.return_value = Task(
+        name="answer", description="d", instructions="Q", agent=agent
+    )
+    return SequentialSkagents(config, kernel_builder, task_builder)
+
+
+@pytest.mark.asyncio
+async def test_valid_structured_output_skips_transformer(kernel_builder):
+    skagents = _skagents(StubAgent('{"answer": "42"}'), kernel_builder)
+
+    response = await skagents.invoke({"session_id": "s1"})
+
+    assert response.output_pydantic == AnswerOutput(answer="42")
+    kernel_builder.build_kernel.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalid_structured_output_falls_back_to_transformer(kernel_builder):
+    skagents = _skagents(StubAgent('{"answer": 42, "extra": '), kernel_builder)
+
+    response = await skagents.invoke({"session_id": "s1"})
+
+    assert response.output_pydantic == AnswerOutput(answer="42")
+    assert response.output_raw == '{"answer": 42, "extra": '
+    assert response.token_usage.completion_tokens == 5
+
+
+@pytest.mark.asyncio
+async def test_models_without_structured_output_use_cached_transformer(kernel_builder):
+    for _ in range(3):
+        skagents = _skagents(StubAgent("The answer is 42", so_supported=False), kernel_builder)
+        response = await skagents.invoke({"session_id": "s1"})
+        assert response.output_pydantic == AnswerOutput(answer="42")
+
+    kernel_builder.build_kernel.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_native_structured_output_saves_a_round_trip(kernel_builder, mocker):
+    transform_output = mocker.spy(OutputTransformer, "transform_output")
+    fast = _skagents(StubAgent('{"answer": "42"}'), kernel_builder)
+    fallback = _skagents(StubAgent("The answer is 42", so_supported=False), kernel_builder)
+
+    await fast.invoke({"session_id": "s1"})
+    assert transform_output.call_count == 0
+    await fallback.invoke({"session_id": "s1"})
+    assert transform_output.call_count == 1
@@ -0,0 +1,262 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from semantic_kernel.contents import (
+    AuthorRole,
+    ChatMessageContent,
+    ImageContent,
+    StreamingChatMessageContent,
+)
+
+from sk_agents.exceptions import AgentInvokeException
+from sk_agents.ska_types import (
+    BaseConfig,
+    EmbeddedImage,
+    IntermediateTaskResponse,
+    InvokeResponse,
+    ModelType,
+)
+from sk_agents.skagents.kernel_builder import KernelBuilder
+from sk_agents.skagents.v1.config import AgentConfig
+from sk_agents.skagents.v1.sequential.config import Spec, TaskConfig
+from sk_agents.skagents.v1.sequential.sequential_skagents import SequentialSkagents
+from sk_agents.skagents.v1.sequential.task import Task
+from sk_agents.skagents.v1.sequential.task_builder import TaskBuilder
+from sk_agents.skagents.v1.sequential.task_graph import TaskGraph, get_template_variables
+
+TASK_DELAY_S = 0.1
+
+
+class StubAgent:
+    """Answers with the last user message after a fixed delay."""
+
+    def __init__(self, delay_s: float = TASK_DELAY_S, fail: bool = False):
+        self.delay_s = delay_s
+        self.fail = fail
+        self.running = 0
+        self.max_running = 0
+        self.images_seen: dict[str, int] = {}
+
+    def get_model_type(self) -> ModelType:
+        return ModelType.OPENAI
+
+    def so_supported(self) -> bool:
+        return False
+
+    async def invoke(self, history):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay_s)
+            if self.fail:
+                raise RuntimeError("stub failure")
+            user_messages = [m for m in history.messages if m.role == AuthorRole.USER]
+            self.images_seen[user_messages[-1].content] = sum(
+                isinstance(item, ImageContent) for m in history.messages for item in m.items
+            )
+            yield ChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                content=f"answer({user_messages[-1].content}) after {len(history.messages)}",
+            )
+        finally:
+            self.running -= 1
+
+    async def invoke_stream(self, history):
+        async for message in self.invoke(history):
+            for token in message.content.split(" "):
+                yield StreamingChatMessageContent(
+                    role=AuthorRole.ASSISTANT, content=f"{token} ", choice_index=0
+                )
+
+
+# research_a, research_b and research_c only use the request input; summary uses all three
+TASKS = [
+    ("research_a", "Research A about {{ topic }}"),
+    ("research_b", "Research B about {{ topic }}"),
+    ("research_c", "Research C about {{ topic }}"),
+    ("summary", "Summarize {{ _research_a }} / {{ _research_b }} / {{ _research_c }}"),
+]
+
+
+def _config(max_parallel_tasks: int, tasks=TASKS) -> BaseConfig:
+    agent = AgentConfig(name="stub", model="stub-model", system_prompt="stub")
+    return BaseConfig(
+        apiVersion="skagents/v1",
+        description="parallel test agent",
+        service_name="ParallelAgent",
+        version=0.1,
+        input_type="BaseInput",
+        output_type=None,
+        spec=Spec(
+            agents=[agent],
+            tasks=[
+                TaskConfig(name=name, task_no=no, description=name, instructions=text, agent="stub")
+                for no, (name, text) in enumerate(tasks, start=1)
+            ],
+            max_parallel_tasks=max_parallel_tasks,
+        ),
+    )
+
+
+def _skagents(max_parallel_tasks: int, agent: StubAgent, tasks=TASKS) -> SequentialSkagents:
+    task_builder = MagicMock(spec=TaskBuilder)
+    task_builder.build_task.side_effect = lambda task_config, *_: Task(
+        name=task_config.name,
+        description=task_config.description,
+        instructions=task_config.instructions,
+        agent=agent,
+    )
+    return SequentialSkagents(
+        _config(max_parallel_tasks, tasks), MagicMock(spec=KernelBuilder), task_builder
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_telemetry(mocker):
+    telemetry = MagicMock()
+    telemetry.telemetry_enabled.return_value = False
+    mocker.patch(
+        "sk_agents.skagents.v1.sequential.sequential_skagents.get_telemetry",
+        return_value=telemetry,
+    )
+
+
+def test_template_variables():
+    assert get_template_variables("{{ a }} {% for x in items %}{{ x.b }}{% endfor %}") == {
+        "a",
+        "items",
+    }
+
+
+def test_task_graph_dependencies_and_ancestors():
+    graph = TaskGraph(
+        ["a", "b", "c", "d"],
+        ["{{ topic }}", "{{ _a }}", "{{ topic }} {{ _d }}", "{{ _b }} {{ _c }}"],
+    )
+
+    assert graph.dependencies == [
+        frozenset(),
+        frozenset({0}),
+        frozenset(),  # the reference to a later task is ignored
+        frozenset({1, 2}),
+    ]
+    assert graph.ancestors(3) == [0, 1, 2]
+    assert graph.is_sequential() is False
+    assert TaskGraph(["a", "b"], ["x", "{{ _a }}"]).is_sequential() is True
+
+
+@pytest.mark.asyncio
+async def test_parallel_invoke_matches_sequential_output_and_is_faster():
+    sequential = _skagents(1, StubAgent())
+    parallel_agent = StubAgent()
+    parallel = _skagents(3, parallel_agent)
+    inputs = {"topic": "caching", "session_id": "s1"}
+
+    start = time.perf_counter()
+    sequential_response = await sequential.invoke(dict(inputs))
+    sequential_s = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel_response = await parallel.invoke(dict(inputs))
+    parallel_s = time.perf_counter() - start
+
+    # The stub answer only depends on the rendered instructions, which are identical
+    assert (
+        parallel_response.output_raw.split(" after ")[0]
+        == (sequential_response.output_raw.split(" after ")[0])
+    )
+    assert "Research A about caching" in parallel_response.output_raw
+    assert parallel_agent.max_running == 3
+    # 4 sequential tasks vs. one parallel round of 3 followed by the summary
+    assert sequential_s >= 4 * TASK_DELAY_S
+    assert parallel_s < 3 * TASK_DELAY_S
+
+
+@pytest.mark.asyncio
+async def test_parallelism_limit_is_respected():
+    agent = StubAgent()
+    skagents = _skagents(2, agent)
+
+    await skagents.invoke({"topic": "caching"})
+
+    assert agent.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_intermediate_results_in_declaration_order():
+    tasks = [
+        ("slow", "Slow {{ topic }}"),
+        ("fast", "Fast {{ topic }}"),
+        ("summary", "Summarize {{ _slow }} {{ _fast }}"),
+    ]
+    agent = StubAgent()
+    skagents = _skagents(2, agent, tasks)
+
+    results = [r async for r in skagents.invoke_stream({"topic": "caching"})]
+
+    intermediate = [r for r in results if isinstance(r, IntermediateTaskResponse)]
+    assert [(r.task_no, r.task_name) for r in intermediate] == [(1, "slow"), (2, "fast")]
+    assert intermediate[0].response.output_raw.startswith("answer(Slow caching)")
+    assert isinstance(results[-1], InvokeResponse)
+
+
+@pytest.mark.asyncio
+async def test_dependent_tasks_see_only_their_dependencies_history():
+    tasks = [
+        ("first", "First {{ topic }}"),
+        ("independent", "Independent {{ topic }}"),
+        ("dependent", "Dependent on {{ _first }}"),
+        ("summary", "Summarize {{ _independent }} {{ _dependent }}"),
+    ]
+    skagents = _skagents(4, StubAgent(), tasks)
+
+    results = [r async for r in skagents.invoke_stream({"topic": "caching"})]
+
+    outputs = {r.task_name: r.response.output_raw for r in results[:3]}
+    assert outputs["first"] == "answer(First caching) after 1"
+    assert outputs["independent"] == "answer(Independent caching) after 1"
+    # The dependent task sees the first task's user and assistant messages
+    assert outputs["dependent"] == "answer(Dependent on answer(First caching) after 1) after 3"
+
+
+@pytest.mark.asyncio
+async def test_every_task_sees_the_embedded_image_once():
+    tasks = [
+        ("first", "First {{ topic }}"),
+        ("independent", "Independent {{ topic }}"),
+        ("dependent", "Dependent on {{ _first }}"),
+        ("summary", "Summarize {{ _independent }} {{ _dependent }}"),
+    ]
+    agent = StubAgent(delay_s=0)
+    skagents = _skagents(4, agent, tasks)
+    image = EmbeddedImage(format="image/png", data="iVBORw0KGgo=")
+
+    await skagents.invoke({"topic": "caching", "embedded_image": image})
+
+    assert agent.images_seen == {
+        "First caching": 1,
+        "Independent caching": 1,
+        "Dependent on answer(First caching) after 1": 1,
+        "Summarize answer(Independent caching) after 1 answer(Dependent on answer(First "
+        "caching) after 1) after 3": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_parallel_task_failure_raises_agent_invoke_exception():
+    skagents = _skagents(3, StubAgent(fail=True))
+
+    with pytest.raises(AgentInvokeException, match="Task description research_a"):
+        await skagents.invoke({"topic": "caching"})
+
+
+@pytest.mark.asyncio
+async def test_invoke_stream_collects_final_task_extra_data():
+    skagents = _skagents(1, StubAgent(delay_s=0))
+    skagents.tasks[-1].extra_data_collector.add_extra_data("source", "plugin")
+
+    results = [r async for r in skagents.invoke_stream({"topic": "caching"})]
+
+    assert results[-1].extra_data.items[0].key == "source"
+    assert "extra_data" not in results[-1].output_raw
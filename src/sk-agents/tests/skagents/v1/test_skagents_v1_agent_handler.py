@@ -1,8 +1,10 @@
+from unittest.mock import MagicMock
+
 import pytest
 from ska_utils import AppConfig
 
 from sk_agents.ska_types import BaseConfig, BaseHandler
-from sk_agents.skagents.v1 import handle
+from sk_agents.skagents.v1 import HandlerFactory, handle
 from sk_agents.skagents.v1.config import AgentConfig
 from sk_agents.skagents.v1.sequential.config import Spec, TaskConfig
 
@@ -137,3 +139,26 @@ def test_handle_missing_kind(config, mock_handle_chat, mock_handle_sequential):
         handle(config, app_config, authorization)
     mock_handle_chat.assert_not_called()
     mock_handle_sequential.assert_not_called()
+
+
+def test_handler_factory_shares_builders_between_requests(config, mock_handle_chat):
+    config.kind = "Agent"
+    app_config = MagicMock()
+    app_config.get.return_value = None
+    chat_completion_builder = MagicMock()
+
+    factory = HandlerFactory(config, app_config, chat_completion_builder)
+    factory.handler("Bearer a")
+    factory.handler("Bearer b")
+
+    assert factory.kernel_builder.chat_completion_builder is chat_completion_builder
+    calls = mock_handle_chat.call_args_list
+    assert [call.args[2] for call in calls] == ["Bearer a", "Bearer b"]
+    assert all(call.args[4] is factory.kernel_builder for call in calls)
+
+
+def test_handler_factory_rejects_invalid_kind(config):
+    config.kind = "Invalid"
+
+    with pytest.raises(ValueError):
+        HandlerFactory(config, MagicMock(), MagicMock())
@@ -0,0 +1,169 @@
+import base64
+import os
+import tracemalloc
+from unittest.mock import MagicMock
+
+import pytest
+from semantic_kernel.contents import AuthorRole, ChatMessageContent
+
+from sk_agents.ska_types import (
+    BaseConfig,
+    ContentType,
+    EmbeddedImage,
+    HistoryMultiModalMessage,
+    ModelType,
+    MultiModalItem,
+)
+from sk_agents.skagents.kernel_builder import KernelBuilder
+from sk_agents.skagents.v1.config import AgentConfig
+from sk_agents.skagents.v1.sequential.config import Spec, TaskConfig
+from sk_agents.skagents.v1.sequential.sequential_skagents import SequentialSkagents
+from sk_agents.skagents.v1.sequential.task import Task
+from sk_agents.skagents.v1.sequential.task_builder import TaskBuilder
+from sk_agents.skagents.v1.sequential.task_inputs import TaskInputs
+
+IMAGE_SIZE = 5 * 1024 * 1024
+
+
+class RecordingAgent:
+    """Answers immediately, recording the user message each task sends."""
+
+    def __init__(self):
+        self.messages: list[ChatMessageContent] = []
+
+    def get_model_type(self) -> ModelType:
+        return ModelType.OPENAI
+
+    def so_supported(self) -> bool:
+        return False
+
+    async def invoke(self, history):
+        self.messages.append(history.messages[-1])
+        yield ChatMessageContent(role=AuthorRole.ASSISTANT, content=f"done {len(self.messages)}")
+
+
+def _skagents(task_count: int, agent: RecordingAgent) -> SequentialSkagents:
+    config = BaseConfig(
+        apiVersion="skagents/v1",
+        description="pipeline test agent",
+        service_name="PipelineAgent",
+        version=0.1,
+        input_type="BaseInput",
+        output_type=None,
+        spec=Spec(
+            agents=[AgentConfig(name="stub", model="stub-model", system_prompt="stub")],
+            tasks=[
+                TaskConfig(
+                    name=f"step_{no}",
+                    task_no=no,
+                    description=f"step {no}",
+                    instructions=f"Step {no} on {{{{ topic }}}} after {{{{ _step_{no - 1} }}}}",
+                    agent="stub",
+                )
+                for no in range(1, task_count + 1)
+            ],
+        ),
+    )
+    task_builder = MagicMock(spec=TaskBuilder)
+    task_builder.build_task.side_effect = lambda task_config, *_: Task(
+        name=task_config.name,
+        description=task_config.description,
+        instructions=task_config.instructions,
+        agent=agent,
+    )
+    return SequentialSkagents(config, MagicMock(spec=KernelBuilder), task_builder)
+
+
+def _image_inputs() -> dict:
+    data = base64.b64encode(os.urandom(IMAGE_SIZE * 3 // 4)).decode()
+    return {
+        "topic": "cats",
+        "embedded_image": EmbeddedImage(format="image/png", data=data),
+        "chat_history": [
+            HistoryMultiModalMessage(
+                role="user",
+                items=[
+                    MultiModalItem(
+                        content_type=ContentType.IMAGE, content=f"data:image/png;base64,{data}"
+                    )
+                ],
+            )
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def no_telemetry(mocker):
+    telemetry = MagicMock()
+    telemetry.telemetry_enabled.return_value = False
+    mocker.patch(
+        "sk_agents.skagents.v1.sequential.sequential_skagents.get_telemetry",
+        return_value=telemetry,
+    )
+
+
+def test_task_inputs_shares_values_and_leaves_inputs_unchanged():
+    image = EmbeddedImage(format="image/png", data="abc")
+    inputs = {"topic": "cats", "embedded_image": image, "chat_history": []}
+    task_inputs = TaskInputs(inputs, hidden=("chat_history",))
+
+    assert dict(task_inputs) == {"topic": "cats", "embedded_image": image}
+    assert task_inputs["embedded_image"] is image
+
+    task_inputs["_first"] = "output"
+    assert task_inputs.pop("embedded_image") is image
+    copy = task_inputs.copy()
+    copy["topic"] = "dogs"
+    del copy["_first"]
+
+    assert dict(task_inputs) == {"topic": "cats", "_first": "output"}
+    assert dict(copy) == {"topic": "dogs"}
+    assert "embedded_image" not in copy
+    assert inputs == {"topic": "cats", "embedded_image": image, "chat_history": []}
+    with pytest.raises(KeyError):
+        del copy["embedded_image"]
+
+
+def test_parse_task_inputs():
+    assert SequentialSkagents._parse_task_inputs(None) == {}
+    inputs = {"topic": "cats", "chat_history": []}
+    assert dict(SequentialSkagents._parse_task_inputs(inputs)) == {"topic": "cats"}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_sends_image_once_and_leaves_inputs_unchanged():
+    agent = RecordingAgent()
+    inputs = _image_inputs()
+    original = dict(inputs)
+
+    await _skagents(10, agent).invoke(inputs)
+
+    assert inputs == original
+    assert [len(message.items) for message in agent.messages] == [2] + [1] * 9
+    assert agent.messages[-1].content == "Step 10 on cats after done 9"
+
+
+@pytest.mark.asyncio
+async def test_task_input_memory_does_not_grow_with_pipeline_length():
+    inputs = _image_inputs()
+
+    tracemalloc.start()
+    try:
+        SequentialSkagents._parse_task_inputs(inputs)
+        _, parse_peak = tracemalloc.get_traced_memory()
+
+        peaks = {}
+        for task_count in (1, 10):
+            handler = _skagents(task_count, RecordingAgent())
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await handler.invoke(inputs)
+            peaks[task_count] = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    # The task inputs reference the request's values instead of copying them, so
+    # the only image-sized allocations are the chat history and the first task's
+    # message, however many tasks read the inputs
+    assert parse_peak < 64 * 1024
+    assert peaks[10] - peaks[1] < IMAGE_SIZE // 5
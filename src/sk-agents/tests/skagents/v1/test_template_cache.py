@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+import pytest
+from jinja2 import UndefinedError
+from pydantic import ValidationError
+
+from sk_agents.skagents.v1.sequential.config import TaskConfig
+from sk_agents.skagents.v1.sequential.task import Task
+from sk_agents.skagents.v1.sequential.template_cache import TemplateCache, get_template_cache
+
+
+def test_templates_are_compiled_once_per_source():
+    cache = TemplateCache()
+
+    first = cache.get_template("Hello {{ name }}")
+    second = cache.get_template("Hello {{ name }}")
+
+    assert first is second
+    assert len(cache) == 1
+    assert cache.render("Hello {{ name }}", {"name": "world"}) == "Hello world"
+
+
+def test_cache_is_bounded_and_evicts_least_recently_used():
+    cache = TemplateCache(max_size=2)
+    a = cache.get_template("a {{ x }}")
+    cache.get_template("b {{ x }}")
+    cache.get_template("a {{ x }}")
+    cache.get_template("c {{ x }}")
+
+    assert len(cache) == 2
+    assert cache.get_template("a {{ x }}") is a
+
+
+def test_template_variables_are_parsed_once_per_source(mocker):
+    cache = TemplateCache()
+    parse = mocker.spy(cache.environments[False], "parse")
+
+    assert cache.get_variables("{{ a }} {{ _b }}") == {"a", "_b"}
+    assert cache.get_variables("{{ a }} {{ _b }}") == {"a", "_b"}
+
+    parse.assert_called_once()
+
+
+def test_strict_undefined_raises_for_missing_inputs():
+    cache = TemplateCache()
+
+    assert cache.render("Hello {{ name }}", {}) == "Hello "
+    with pytest.raises(UndefinedError):
+        cache.render("Hello {{ name }}", {}, strict_undefined=True)
+
+
+def test_task_config_precompiles_instructions():
+    cache = get_template_cache()
+    cache.clear()
+
+    TaskConfig(name="t", task_no=1, description="d", instructions="Do {{ thing }}", agent="default")
+
+    assert len(cache) == 1
+
+
+def test_task_config_rejects_invalid_templates():
+    with pytest.raises(ValidationError, match="Invalid instructions template for task t"):
+        TaskConfig(
+            name="t", task_no=1, description="d", instructions="Do {{ thing ", agent="default"
+        )
+
+
+def test_task_renders_with_cached_template():
+    task = Task(
+        name="t",
+        description="d",
+        instructions="Summarize {{ _previous }}",
+        agent=MagicMock(),
+        strict_undefined=True,
+    )
+
+    assert task._get_user_message_with_inputs({"_previous": "text"}) == "Summarize text"
+    assert task.template is get_template_cache().get_template("Summarize {{ _previous }}", True)
+    with pytest.raises(UndefinedError):
+        task._get_user_message_with_inputs({})
@@ -8,6 +8,7 @@ from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.kernel import Kernel
 
 from sk_agents.configs import TA_PERSISTENCE_CLASS, TA_PERSISTENCE_MODULE
 from sk_agents.exceptions import (
@@ -16,7 +17,7 @@ from sk_agents.exceptions import (
     PersistenceCreateError,
     PersistenceLoadError,
 )
-from sk_agents.extra_data_collector import ExtraDataCollector
+from sk_agents.extra_data_collector import ExtraData, ExtraDataCollector, ExtraDataElement
 from sk_agents.persistence.task_persistence_manager import TaskPersistenceManager
 from sk_agents.ska_types import BaseConfig, ContentType, MultiModalItem, TokenUsage
 from sk_agents.tealagents.models import (
@@ -214,6 +215,24 @@ def test_augment_user_context(user_message):
     assert chat_history.__dict__["messages"][0].items[0].text == expected_content
 
 
+def test_augment_user_context_goes_after_history_before_current_turn(user_message):
+    chat_history = ChatHistory()
+    chat_history.add_user_message("first question")
+    chat_history.add_assistant_message("first answer")
+    chat_history.add_user_message("second question")
+
+    TealAgentsV1Alpha1Handler._augment_with_user_context(
+        inputs=user_message, chat_history=chat_history
+    )
+
+    assert [message.content for message in chat_history.messages[:2]] == [
+        "first question",
+        "first answer",
+    ]
+    assert chat_history.messages[2].content.startswith("The following user context was provided")
+    assert chat_history.messages[3].content == "second question"
+
+
 def test_configure_agent_task(mocker, user_message):
     """
     Test that _configure_agent_task correctly creates an AgentTask
@@ -499,6 +518,45 @@ async def test_invoke_success(
     assert result.token_usage.total_tokens == 150
 
 
+@pytest.mark.asyncio
+async def test_request_history_starts_with_system_prompt(teal_agents_handler, mock_config):
+    chat_history = ChatHistory()
+    chat_history.add_user_message("hello")
+
+    request_history = await teal_agents_handler._request_history(
+        chat_history, "task", MockChatCompletionClient(), Kernel()
+    )
+
+    assert request_history.messages[0].role == AuthorRole.SYSTEM
+    assert request_history.messages[0].content == mock_config.spec.agent.system_prompt
+    assert request_history.messages[1:] == chat_history.messages
+    assert len(chat_history.messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_invoke_adds_user_context_before_the_current_turn(
+    teal_agents_handler, mocker, user_message, agent_task_invoke, agent_response
+):
+    """The per-request user context comes ahead of the current user message."""
+    mocker.patch.object(teal_agents_handler, "authenticate_user", return_value="test-user")
+    mocker.patch.object(
+        teal_agents_handler, "_manage_incoming_task", return_value=agent_task_invoke
+    )
+    recursion_invoke = mocker.patch.object(
+        teal_agents_handler,
+        "recursion_invoke",
+        new_callable=mocker.AsyncMock,
+        return_value=agent_response,
+    )
+
+    await teal_agents_handler.invoke("test_auth_token", user_message)
+
+    messages = recursion_invoke.call_args.kwargs["inputs"].messages
+    assert len(messages) == 2
+    assert messages[0].content.startswith("The following user context was provided")
+    assert messages[1].content == agent_task_invoke.items[0].item.content
+
+
 @pytest.mark.asyncio
 async def test_invoke_intervention_required(
     teal_agents_handler, mocker, user_message, agent_task_invoke
@@ -1142,6 +1200,44 @@ def test_build_chat_history_multiple_items():
     assert result[1].role == AuthorRole.ASSISTANT
 
 
+def test_build_chat_history_does_not_repeat_earlier_items():
+    """
+    Test that each message only holds the items of its own request and role.
+    """
+
+    def task_item(role, content, request_id):
+        return AgentTaskItem(
+            task_id="test-task",
+            role=role,
+            item=MultiModalItem(content_type=ContentType.TEXT, content=content),
+            request_id=request_id,
+            updated=datetime.now(),
+        )
+
+    agent_task = AgentTask(
+        task_id="test-task",
+        session_id="test-session",
+        user_id="test-user",
+        items=[
+            task_item("user", "Hello", "req1"),
+            task_item("user", "Look at this", "req1"),
+            task_item("assistant", "Hi there", "req1"),
+            task_item("user", "Thanks", "req2"),
+        ],
+        created_at=datetime.now(),
+        last_updated=datetime.now(),
+        status="Running",
+    )
+
+    result = TealAgentsV1Alpha1Handler._build_chat_history(agent_task, ChatHistory())
+
+    assert [[item.text for item in message.items] for message in result] == [
+        ["Hello", "Look at this"],
+        ["Hi there"],
+        ["Thanks"],
+    ]
+
+
 @pytest.mark.asyncio
 async def test_process_multiple_function_calls(mocker):
     """
@@ -2021,11 +2117,13 @@ async def test_recursion_invoke_stream_extradata_success():
     # Mock agent selection to return our mock client
     mock_kernel.select_ai_service.return_value = (mock_chat_completion_client, {})
 
-    # Mock ExtraDataPartial.new_from_json to succeed and return data
+    # Mock ExtraDataPartial.from_chunk to recognize the response as extra data
     with patch("sk_agents.tealagents.v1alpha1.agent.handler.ExtraDataPartial") as mock_extra_data:
         mock_extra_data_partial = Mock()
-        mock_extra_data_partial.extra_data = [{"key": "value"}]
-        mock_extra_data.new_from_json.return_value = mock_extra_data_partial
+        mock_extra_data_partial.extra_data = ExtraData(
+            items=[ExtraDataElement(key="key", value="value")]
+        )
+        mock_extra_data.from_chunk.return_value = mock_extra_data_partial
 
         # Mock token usage calculation
         with patch(
@@ -2052,9 +2150,7 @@ async def test_recursion_invoke_stream_extradata_success():
             # Should get a final response since ExtraDataPartial parsing succeeded
             assert len(results) >= 1
             # Verify that extra_data_collector.add_extra_data_items was called
-            mock_extra_data.new_from_json.assert_called_once_with(
-                '{"extra_data": [{"key": "value"}]}'
-            )
+            mock_extra_data.from_chunk.assert_called_once_with(response)
 
 
 @pytest.mark.asyncio
@@ -2119,9 +2215,9 @@ async def test_recursion_invoke_stream_extradata_exception_with_content():
     # Mock agent selection to return our mock client
     mock_kernel.select_ai_service.return_value = (mock_chat_completion_client, {})
 
-    # Mock ExtraDataPartial.new_from_json to raise exception
+    # Mock ExtraDataPartial.from_chunk to treat the response as regular output
     with patch("sk_agents.tealagents.v1alpha1.agent.handler.ExtraDataPartial") as mock_extra_data:
-        mock_extra_data.new_from_json.side_effect = Exception("JSON parse error")
+        mock_extra_data.from_chunk.return_value = None
 
         # Mock token usage calculation
         with patch(
@@ -0,0 +1,269 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from semantic_kernel.connectors.ai.function_choice_behavior import (
+    FunctionChoiceBehavior,
+    FunctionChoiceType,
+)
+from semantic_kernel.connectors.ai.open_ai import OpenAIChatPromptExecutionSettings
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.functions import KernelArguments, kernel_function
+from semantic_kernel.kernel import Kernel
+
+from sk_agents.chat_completion.fake_chat_completion_factory import (
+    FakeChatCompletion,
+    FakeLlmScript,
+    FakeScenario,
+    FakeStep,
+    FakeToolCall,
+)
+from sk_agents.persistence.task_persistence_manager import TaskPersistenceManager
+from sk_agents.ska_types import BaseConfig, ContentType, ModelType, MultiModalItem, TokenUsage
+from sk_agents.tealagents.models import (
+    AgentTask,
+    AgentTaskItem,
+    TealAgentsPartialResponse,
+    TealAgentsResponse,
+)
+from sk_agents.tealagents.v1alpha1.agent.config import Spec
+from sk_agents.tealagents.v1alpha1.agent.handler import TealAgentsV1Alpha1Handler
+from sk_agents.tealagents.v1alpha1.agent_builder import AgentBuilder
+from sk_agents.tealagents.v1alpha1.config import AgentConfig, TokenBudgetConfig
+from sk_agents.tealagents.v1alpha1.token_budget import BUDGET_EXHAUSTED_MESSAGE, TokenBudget
+
+MODEL = "budget-model"
+# Every scripted step uses 100 prompt and 10 completion tokens
+STEP_TOKENS = 110
+SUMMARY = "Here is what I found so far."
+
+
+class LookupPlugin:
+    def __init__(self):
+        self.calls = 0
+
+    @kernel_function(description="Look something up")
+    def lookup(self, query: str) -> str:
+        self.calls += 1
+        return f"result {self.calls} for {query}"
+
+
+class RecordingChatCompletion(FakeChatCompletion):
+    """Fake chat completion which records the function choice of every call."""
+
+    function_choices: list[FunctionChoiceType | None] = []
+
+    async def _inner_get_chat_message_contents(self, chat_history, settings):
+        behavior = settings.function_choice_behavior
+        self.function_choices.append(behavior.type_ if behavior else None)
+        return await super()._inner_get_chat_message_contents(chat_history, settings)
+
+
+def _step(content: str | None = None, tool: bool = False) -> FakeStep:
+    tool_calls = [
+        FakeToolCall(plugin_name="Lookup", function_name="lookup", arguments={"query": "x"})
+    ]
+    return FakeStep(
+        content=content,
+        tool_calls=tool_calls if tool else [],
+        prompt_tokens=100,
+        completion_tokens=10,
+    )
+
+
+def _script(tool_rounds: int | None, summarizes: bool = True) -> FakeLlmScript:
+    """``tool_rounds`` tool steps then an answer, or an endless tool loop for ``None``."""
+    if tool_rounds is None:
+        steps = [_step("Still looking.", tool=True)]
+    else:
+        steps = [_step(tool=True)] * tool_rounds + [_step("All done.")]
+    scenarios = [FakeScenario(steps=steps)]
+    if summarizes:
+        scenarios.insert(
+            0, FakeScenario(match="Do not call any more tools", steps=[_step(SUMMARY)])
+        )
+    return FakeLlmScript(scenarios=scenarios)
+
+
+class BudgetAgent:
+    def __init__(self, script: FakeLlmScript):
+        self.service = RecordingChatCompletion(
+            service_id="BudgetAgent", ai_model_id=MODEL, script=script
+        )
+        self.service.function_choices = []
+        self.plugin = LookupPlugin()
+        kernel = Kernel()
+        kernel.add_service(self.service)
+        kernel.add_plugin(self.plugin, plugin_name="Lookup")
+        settings = OpenAIChatPromptExecutionSettings(service_id="BudgetAgent")
+        settings.function_choice_behavior = FunctionChoiceBehavior.Auto(auto_invoke=False)
+        self.agent = MagicMock()
+        self.agent.kernel = kernel
+        self.agent.arguments = KernelArguments(settings=settings)
+
+    def get_model_type(self) -> ModelType:
+        return ModelType.OPENAI
+
+
+def _agent_task() -> AgentTask:
+    now = datetime.now()
+    return AgentTask(
+        task_id="task-1",
+        session_id="session-1",
+        user_id="test-user",
+        items=[
+            AgentTaskItem(
+                task_id="task-1",
+                role="user",
+                item=MultiModalItem(content_type=ContentType.TEXT, content="Find everything"),
+                request_id="request-1",
+                updated=now,
+            )
+        ],
+        created_at=now,
+        last_updated=now,
+    )
+
+
+def _handler(
+    mocker, script: FakeLlmScript, token_budget: TokenBudgetConfig | None
+) -> tuple[TealAgentsV1Alpha1Handler, BudgetAgent]:
+    mocker.patch(
+        "sk_agents.tealagents.v1alpha1.agent.handler.hitl_manager.check_for_intervention",
+        return_value=False,
+    )
+    config = BaseConfig(
+        apiVersion="tealagents/v1alpha1",
+        name="BudgetAgent",
+        version=0.1,
+        description="token budget test agent",
+        spec=Spec(
+            agent=AgentConfig(
+                name="BudgetAgent",
+                model=MODEL,
+                system_prompt="test prompt",
+                plugins=["Lookup"],
+                token_budget=token_budget,
+            )
+        ),
+    )
+    agent = BudgetAgent(script)
+    agent_builder = MagicMock(spec=AgentBuilder)
+    agent_builder.build_agent = AsyncMock(return_value=agent)
+    state = MagicMock(spec=TaskPersistenceManager)
+    state.load_by_request_id = AsyncMock(return_value=_agent_task())
+    handler = TealAgentsV1Alpha1Handler(
+        config=config, app_config=MagicMock(), agent_builder=agent_builder, state_manager=state
+    )
+    return handler, agent
+
+
+def _chat_history() -> ChatHistory:
+    chat_history = ChatHistory()
+    chat_history.add_user_message("Find everything")
+    return chat_history
+
+
+async def _invoke(handler: TealAgentsV1Alpha1Handler, stream: bool):
+    if not stream:
+        return await handler.recursion_invoke(_chat_history(), "session-1", "task-1", "request-1")
+    results = [
+        r
+        async for r in handler.recursion_invoke_stream(
+            _chat_history(), "session-1", "task-1", "request-1"
+        )
+    ]
+    partials = [r.output_partial for r in results if isinstance(r, TealAgentsPartialResponse)]
+    assert "".join(partials).endswith(results[-1].output)
+    return results[-1]
+
+
+def test_token_budget_statuses():
+    budget = TokenBudget(TokenBudgetConfig(soft_limit=200, hard_limit=400, max_recursion_depth=5))
+    usage = TokenUsage(completion_tokens=10, prompt_tokens=100, total_tokens=110)
+
+    assert budget.record("a", usage) == "ok"
+    assert budget.record("b", usage) == "soft_limit"
+    assert budget.wrapping_up
+    assert budget.record("a", usage) == "soft_limit"
+    assert budget.record("a", usage) == "hard_limit"
+    assert budget.exhausted
+
+    report = budget.usage()
+    assert report.steps == 4
+    assert budget.token_usage == TokenUsage(
+        completion_tokens=40, prompt_tokens=400, total_tokens=440
+    )
+    assert [(m.model, m.calls, m.total_tokens) for m in report.models] == [
+        ("a", 3, 330),
+        ("b", 1, 110),
+    ]
+
+
+def test_token_budget_config_rejects_soft_limit_above_hard_limit():
+    with pytest.raises(ValueError, match="soft_limit"):
+        TokenBudgetConfig(soft_limit=500, hard_limit=100)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_usage_accumulates_across_tool_rounds(mocker, stream):
+    handler, agent = _handler(mocker, _script(3), None)
+
+    response = await _invoke(handler, stream)
+
+    assert isinstance(response, TealAgentsResponse)
+    assert response.output == "All done."
+    assert agent.plugin.calls == 3
+    assert response.token_usage.total_tokens == 4 * STEP_TOKENS
+    assert response.token_usage.completion_tokens == 40
+    assert response.token_budget.status == "ok"
+    assert response.token_budget.steps == 4
+    assert response.token_budget.models[0].model == MODEL
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_soft_limit_asks_for_summary_without_tools(mocker, stream):
+    handler, agent = _handler(mocker, _script(None), TokenBudgetConfig(soft_limit=300))
+
+    response = await _invoke(handler, stream)
+
+    # The third step crosses the soft limit, its tool calls still run
+    assert response.output == SUMMARY
+    assert agent.plugin.calls == 3
+    assert response.token_budget.status == "soft_limit"
+    assert response.token_budget.steps == 4
+    assert agent.service.function_choices == [FunctionChoiceType.AUTO] * 3 + [
+        FunctionChoiceType.NONE
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_max_recursion_depth_stops_runaway_tool_loop(mocker, stream):
+    script = _script(None, summarizes=False)
+    handler, agent = _handler(mocker, script, TokenBudgetConfig(max_recursion_depth=2))
+
+    response = await _invoke(handler, stream)
+
+    # The model keeps asking for tools after being told to answer, so the
+    # request ends with the text it returned alongside the tool calls
+    assert response.output == "Still looking."
+    assert agent.plugin.calls == 2
+    assert response.token_budget.status == "max_depth"
+    assert response.token_budget.steps == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_hard_limit_stops_with_partial_answer(mocker, stream):
+    script = FakeLlmScript(scenarios=[FakeScenario(steps=[_step(tool=True)])])
+    handler, agent = _handler(mocker, script, TokenBudgetConfig(hard_limit=250))
+
+    response = await _invoke(handler, stream)
+
+    assert response.output == BUDGET_EXHAUSTED_MESSAGE
+    assert agent.plugin.calls == 2
+    assert response.token_budget.status == "hard_limit"
+    assert response.token_usage.total_tokens == 3 * STEP_TOKENS
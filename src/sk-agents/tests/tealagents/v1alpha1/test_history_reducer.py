@@ -0,0 +1,313 @@
+import gc
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai.open_ai import OpenAIChatPromptExecutionSettings
+from semantic_kernel.contents import ChatMessageContent, ImageContent, TextContent
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.functions import KernelArguments, kernel_function
+from semantic_kernel.kernel import Kernel
+
+from sk_agents.chat_completion.fake_chat_completion_factory import (
+    FakeChatCompletion,
+    FakeLlmScript,
+    FakeScenario,
+    FakeStep,
+    FakeToolCall,
+)
+from sk_agents.persistence.task_persistence_manager import TaskPersistenceManager
+from sk_agents.ska_types import BaseConfig, ContentType, ModelType, MultiModalItem
+from sk_agents.tealagents.models import AgentTask, AgentTaskItem
+from sk_agents.tealagents.v1alpha1.agent.config import Spec
+from sk_agents.tealagents.v1alpha1.agent.handler import TealAgentsV1Alpha1Handler
+from sk_agents.tealagents.v1alpha1.agent_builder import AgentBuilder
+from sk_agents.tealagents.v1alpha1.config import AgentConfig, HistoryReducerConfig
+from sk_agents.tealagents.v1alpha1.history_reducer import (
+    ELIDED_TOOL_RESULT,
+    SUMMARY_PREFIX,
+    ReducerChain,
+    RollingSummary,
+    TokenWindow,
+    ToolResultElision,
+    approximate_tokens,
+    build_history_reducer,
+)
+
+SUMMARY = "The user asked many questions, all of them were answered."
+TOOL_RESULT = "lorem ipsum " * 200
+
+
+class LookupPlugin:
+    @kernel_function(description="Look something up")
+    def lookup(self, query: str) -> str:
+        return TOOL_RESULT
+
+
+class RecordingChatCompletion(FakeChatCompletion):
+    """Records the size of the agent's requests and counts summary requests."""
+
+    request_sizes: list[int] = []
+    summary_requests: int = 0
+
+    async def _inner_get_chat_message_contents(self, chat_history, settings):
+        if settings.function_choice_behavior is None:
+            self.summary_requests += 1
+        else:
+            payload = json.dumps([message.to_dict() for message in chat_history.messages])
+            self.request_sizes.append(len(payload))
+        return await super()._inner_get_chat_message_contents(chat_history, settings)
+
+
+def _summary_service() -> RecordingChatCompletion:
+    service = RecordingChatCompletion(
+        service_id="summary",
+        ai_model_id="summary-model",
+        script=FakeLlmScript(scenarios=[FakeScenario(steps=[FakeStep(content=SUMMARY)])]),
+    )
+    service.request_sizes = []
+    return service
+
+
+def _turn(turn: int) -> list[ChatMessageContent]:
+    call = FunctionCallContent(
+        id=f"call-{turn}", plugin_name="Lookup", function_name="lookup", arguments="{}"
+    )
+    return [
+        ChatMessageContent(role=AuthorRole.USER, content=f"question {turn}"),
+        ChatMessageContent(role=AuthorRole.ASSISTANT, items=[call]),
+        ChatMessageContent(
+            role=AuthorRole.TOOL,
+            items=[FunctionResultContent.from_function_call_content_and_result(call, TOOL_RESULT)],
+        ),
+        ChatMessageContent(role=AuthorRole.ASSISTANT, content=f"answer {turn}"),
+    ]
+
+
+def _conversation(turns: int) -> list[ChatMessageContent]:
+    messages = [ChatMessageContent(role=AuthorRole.SYSTEM, content="You are helpful.")]
+    for turn in range(turns):
+        messages.extend(_turn(turn))
+    return messages
+
+
+def test_approximate_tokens():
+    assert approximate_tokens(ChatMessageContent(role=AuthorRole.USER, content="a" * 400)) == 104
+    image = ImageContent(data=b"\x89PNG", mime_type="image/png")
+    message = ChatMessageContent(role=AuthorRole.USER, items=[TextContent(text="abc"), image])
+    assert approximate_tokens(message) == 4 + 765 + 1
+
+
+@pytest.mark.asyncio
+async def test_token_window_keeps_recent_messages_within_budget():
+    messages = _conversation(20)
+
+    reduced = await TokenWindow(max_tokens=1500).reduce(messages, "task")
+
+    assert reduced[0] is messages[0]
+    assert reduced[-1] is messages[-1]
+    assert reduced[1].role != AuthorRole.TOOL
+    assert sum(approximate_tokens(m) for m in reduced) <= 1500
+    assert len(messages) == 81
+    assert await TokenWindow(max_tokens=100_000).reduce(messages, "task") is messages
+
+
+@pytest.mark.asyncio
+async def test_token_window_keeps_last_message_over_budget():
+    messages = _conversation(1)
+
+    reduced = await TokenWindow(max_tokens=10).reduce(messages, "task")
+
+    assert reduced == [messages[0], messages[-1]]
+
+
+@pytest.mark.asyncio
+async def test_tool_result_elision_keeps_recent_turns():
+    messages = _conversation(5)
+
+    reduced = await ToolResultElision(keep_turns=1).reduce(messages, "task")
+
+    results = [m.items[0].result for m in reduced if m.role == AuthorRole.TOOL]
+    assert results == [ELIDED_TOOL_RESULT] * 3 + [TOOL_RESULT] * 2
+    assert [m.items[0].id for m in reduced if m.role == AuthorRole.TOOL] == [
+        f"call-{turn}" for turn in range(5)
+    ]
+    # The history itself is unchanged
+    assert all(m.items[0].result == TOOL_RESULT for m in messages if m.role == AuthorRole.TOOL)
+
+
+@pytest.mark.asyncio
+async def test_tool_result_elision_drops_copies_with_the_history():
+    reducer = ToolResultElision(keep_turns=1)
+    messages = _conversation(5)
+
+    first = await reducer.reduce(messages, "task")
+    second = await reducer.reduce(messages, "task")
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert len(reducer._elided) == 3
+
+    del messages, first, second
+    gc.collect()
+
+    assert reducer._elided == {}
+
+
+@pytest.mark.asyncio
+async def test_rolling_summary_refreshes_in_background_and_is_cached():
+    service = _summary_service()
+    window = TokenWindow(max_tokens=2000, summary=RollingSummary(100, 200))
+    messages = _conversation(20)
+
+    # The first request does not wait for the summary
+    reduced = await window.reduce(messages, "task", service)
+    assert all(not (m.content or "").startswith(SUMMARY_PREFIX) for m in reduced)
+    await window.summary.wait("task")
+
+    reduced = await window.reduce(messages, "task", service)
+    assert reduced[1].role == AuthorRole.SYSTEM
+    assert reduced[1].content == SUMMARY_PREFIX + SUMMARY
+    assert sum(approximate_tokens(m) for m in reduced) <= 2000
+    await window.summary.wait("task")
+    assert service.summary_requests == 1
+
+    # Another conversation has its own summary
+    await window.reduce(messages, "other-task", service)
+    await window.summary.wait("other-task")
+    assert service.summary_requests == 2
+
+
+def test_build_history_reducer():
+    assert build_history_reducer(None) is None
+    assert build_history_reducer(HistoryReducerConfig()) is None
+    assert isinstance(build_history_reducer(HistoryReducerConfig(max_tokens=100)), TokenWindow)
+    chain = build_history_reducer(
+        HistoryReducerConfig(max_tokens=100, elide_tool_results_after_turns=2, rolling_summary=True)
+    )
+    assert isinstance(chain, ReducerChain)
+    assert isinstance(chain.reducers[0], ToolResultElision)
+    assert chain.reducers[1].summary is not None
+    with pytest.raises(ValueError, match="rolling_summary requires max_tokens"):
+        HistoryReducerConfig(rolling_summary=True)
+
+
+def test_build_custom_history_reducer_errors(tmp_path):
+    module = tmp_path / "custom_reducer.py"
+    module.write_text("NotAReducer = 1\n")
+
+    with pytest.raises(ImportError, match="Class 'Missing' not found in module"):
+        build_history_reducer(HistoryReducerConfig(module=str(module), class_name="Missing"))
+    with pytest.raises(TypeError, match="NotAReducer is not a subclass of HistoryReducer"):
+        build_history_reducer(HistoryReducerConfig(module=str(module), class_name="NotAReducer"))
+    with pytest.raises(ValueError, match="module and class_name must be provided together"):
+        build_history_reducer(HistoryReducerConfig.model_construct(module=str(module)))
+
+
+def _handler(history_reducer: HistoryReducerConfig | None):
+    config = BaseConfig(
+        apiVersion="tealagents/v1alpha1",
+        name="ReducerAgent",
+        version=0.1,
+        description="history reducer test agent",
+        spec=Spec(
+            agent=AgentConfig(
+                name="ReducerAgent",
+                model="reducer-model",
+                system_prompt="test prompt",
+                plugins=["Lookup"],
+                history_reducer=history_reducer,
+            )
+        ),
+    )
+    tool_call = FakeToolCall(plugin_name="Lookup", function_name="lookup", arguments={"query": "x"})
+    service = RecordingChatCompletion(
+        service_id="ReducerAgent",
+        ai_model_id="reducer-model",
+        script=FakeLlmScript(
+            scenarios=[
+                FakeScenario(
+                    match=r"^question \d+$",
+                    steps=[FakeStep(tool_calls=[tool_call]), FakeStep(content="The answer.")],
+                ),
+                FakeScenario(steps=[FakeStep(content=SUMMARY)]),
+            ]
+        ),
+    )
+    service.request_sizes = []
+    kernel = Kernel()
+    kernel.add_service(service)
+    kernel.add_plugin(LookupPlugin(), plugin_name="Lookup")
+    settings = OpenAIChatPromptExecutionSettings(service_id="ReducerAgent")
+    settings.function_choice_behavior = FunctionChoiceBehavior.Auto(auto_invoke=False)
+    agent = MagicMock()
+    agent.agent.kernel = kernel
+    agent.agent.arguments = KernelArguments(settings=settings)
+    agent.get_model_type.return_value = ModelType.OPENAI
+
+    now = datetime.now()
+    agent_task = AgentTask(
+        task_id="task-1",
+        session_id="session-1",
+        user_id="test-user",
+        items=[
+            AgentTaskItem(
+                task_id="task-1",
+                role="user",
+                item=MultiModalItem(content_type=ContentType.TEXT, content="question 0"),
+                request_id="request-1",
+                updated=now,
+            )
+        ],
+        created_at=now,
+        last_updated=now,
+    )
+    agent_builder = MagicMock(spec=AgentBuilder)
+    agent_builder.build_agent = AsyncMock(return_value=agent)
+    state = MagicMock(spec=TaskPersistenceManager)
+    state.load_by_request_id = AsyncMock(return_value=agent_task)
+    handler = TealAgentsV1Alpha1Handler(
+        config=config, app_config=MagicMock(), agent_builder=agent_builder, state_manager=state
+    )
+    return handler, service
+
+
+async def _run_turns(handler, turns: int) -> ChatHistory:
+    chat_history = ChatHistory()
+    for turn in range(turns):
+        chat_history.add_user_message(f"question {turn}")
+        response = await handler.recursion_invoke(chat_history, "session-1", "task-1", "request-1")
+        assert response.output == "The answer."
+    return chat_history
+
+
+@pytest.mark.asyncio
+async def test_request_size_stays_bounded_over_500_turns(mocker):
+    mocker.patch(
+        "sk_agents.tealagents.v1alpha1.agent.handler.hitl_manager.check_for_intervention",
+        return_value=False,
+    )
+    handler, service = _handler(
+        HistoryReducerConfig(
+            max_tokens=4000,
+            elide_tool_results_after_turns=2,
+            rolling_summary=True,
+            summary_refresh_tokens=1000,
+        )
+    )
+
+    chat_history = await _run_turns(handler, 500)
+
+    # The full history is kept, only the requests are reduced
+    assert len(chat_history.messages) == 500 * 4
+    assert len(service.request_sizes) == 1000
+    assert max(service.request_sizes[100:]) <= 1.1 * max(service.request_sizes[:100])
+    assert max(service.request_sizes) < 30_000
+    assert service.summary_requests > 0
+
+    unbounded, unbounded_service = _handler(None)
+    await _run_turns(unbounded, 50)
+    assert max(unbounded_service.request_sizes) > 5 * max(service.request_sizes)
@@ -1,5 +1,5 @@
 from types import NoneType
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from a2a.types import AgentCapabilities, AgentCard, AgentProvider, AgentSkill
@@ -23,10 +23,12 @@ from sk_agents.configs import (
     TA_REDIS_SSL,
     TA_REDIS_TTL,
     TA_SERVICE_CONFIG,
+    TA_STATE_ENCODING,
     TA_STATE_MANAGEMENT,
 )
 from sk_agents.ska_types import BaseConfig, BaseMultiModalInput
 from sk_agents.state import RedisStateManager
+from sk_agents.stateful import StateEncoding
 
 
 @pytest.fixture
@@ -311,15 +313,17 @@ class TestGetRedisStateManager:
         """Test _get_redis_state_manager with TTL."""
         mock_redis_client = MagicMock(spec=Redis)
         mock_get_redis_client.return_value = mock_redis_client
-        mock_app_config.get.return_value = "7200"
+        mock_app_config.get.side_effect = {TA_REDIS_TTL.env_name: "7200"}.get
 
         result = AppV2._get_redis_state_manager(mock_app_config)
 
-        mock_app_config.get.assert_called_once_with(TA_REDIS_TTL.env_name)
         mock_redis_state_manager_class.assert_called_once_with(
             redis_client=mock_redis_client,
             ttl=7200,
+            serializer=ANY,
         )
+        serializer = mock_redis_state_manager_class.call_args.kwargs["serializer"]
+        assert serializer.encoding == StateEncoding.JSON
         assert result is mock_redis_state_manager_class.return_value
 
     @patch("sk_agents.appv2.RedisStateManager")
@@ -337,8 +341,23 @@ class TestGetRedisStateManager:
         mock_redis_state_manager_class.assert_called_once_with(
             redis_client=mock_redis_client,
             ttl=None,
+            serializer=ANY,
         )
 
+    @patch("sk_agents.appv2.RedisStateManager")
+    @patch("sk_agents.appv2.AppV2._get_redis_client")
+    def test_get_redis_state_manager_with_encoding(
+        self, mock_get_redis_client, mock_redis_state_manager_class, mock_app_config
+    ):
+        """Test _get_redis_state_manager with TA_STATE_ENCODING."""
+        pytest.importorskip("zstandard")
+        mock_app_config.get.side_effect = {TA_STATE_ENCODING.env_name: "zstd"}.get
+
+        AppV2._get_redis_state_manager(mock_app_config)
+
+        serializer = mock_redis_state_manager_class.call_args.kwargs["serializer"]
+        assert serializer.encoding == StateEncoding.ZSTD
+
 
 class TestGetTaskStore:
     """Test AppV2._get_task_store method."""
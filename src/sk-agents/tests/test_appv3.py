@@ -237,6 +237,7 @@ class TestAppV3Run:
         with pytest.raises(ValueError, match="AppV3 only supports 'tealagents/v1alpha1'"):
             AppV3.run("test", "v1", mock_app_config, config, mock_fastapi_app)
 
+    @patch("sk_agents.appv3.StartupWarmup")
     @patch("sk_agents.appv3.initialize_plugin_loader")
     @patch.object(AppV3, "_get_auth_storage_manager")
     @patch.object(AppV3, "_get_auth_manager")
@@ -253,6 +254,7 @@ class TestAppV3Run:
         mock_get_auth_manager,
         mock_get_auth_storage_manager,
         mock_initialize_plugin,
+        mock_startup_warmup,
         mock_app_config,
         mock_base_config,
         mock_fastapi_app,
@@ -326,6 +328,7 @@ class TestAppV3Run:
         assert mock_fastapi_app.state.config == mock_base_config
         assert mock_fastapi_app.state.app_config == mock_app_config
 
+    @patch("sk_agents.appv3.StartupWarmup")
     @patch("sk_agents.appv3.initialize_plugin_loader")
     @patch.object(AppV3, "_get_auth_storage_manager")
     @patch.object(AppV3, "_get_auth_manager")
@@ -342,6 +345,7 @@ class TestAppV3Run:
         mock_get_auth_manager,
         mock_get_auth_storage_manager,
         mock_initialize_plugin,
+        mock_startup_warmup,
         mock_app_config,
         mock_fastapi_app,
     ):
@@ -385,6 +389,7 @@ class TestAppV3Run:
         stateful_call_args = mock_routes.get_stateful_routes.call_args
         assert stateful_call_args.kwargs["description"] == "TestAgent API"
 
+    @patch("sk_agents.appv3.StartupWarmup")
     @patch("sk_agents.appv3.initialize_plugin_loader")
     @patch.object(AppV3, "_get_auth_storage_manager")
     @patch.object(AppV3, "_get_auth_manager")
@@ -401,6 +406,7 @@ class TestAppV3Run:
         mock_get_auth_manager,
         mock_get_auth_storage_manager,
         mock_initialize_plugin,
+        mock_startup_warmup,
         mock_app_config,
         mock_fastapi_app,
     ):
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from sk_agents.extra_data_collector import (
     ExtraData,
     ExtraDataCollector,
@@ -126,3 +128,35 @@ def test_add_extra_data_items_mixed_adds():
     assert collector.num_items() == 3
     keys = [item.key for item in collector.get_extra_data().items]
     assert keys == ["initial", "x", "y"]
+
+
+def test_from_chunk_accepts_typed_items():
+    partial = ExtraDataPartial(
+        extra_data=ExtraData(items=[ExtraDataElement(key="foo", value="bar")])
+    )
+
+    assert ExtraDataPartial.from_chunk(partial) is partial
+    assert ExtraDataPartial.from_chunk(partial, legacy_json=False) is partial
+
+
+def test_from_chunk_reads_chunk_objects():
+    legacy = ExtraDataPartial(extra_data=None).model_dump_json()
+
+    assert ExtraDataPartial.from_chunk(SimpleNamespace(content=legacy)) == ExtraDataPartial()
+    assert ExtraDataPartial.from_chunk(SimpleNamespace(content="Hello")) is None
+
+
+def test_from_chunk_ignores_regular_output():
+    assert ExtraDataPartial.from_chunk("Hello") is None
+    assert ExtraDataPartial.from_chunk("") is None
+    assert ExtraDataPartial.from_chunk(SimpleNamespace(content=None)) is None
+    assert ExtraDataPartial.from_chunk("{") is None
+    assert ExtraDataPartial.from_chunk('{"answer": 42}') is None
+    assert ExtraDataPartial.from_chunk('{"extra_data": "not valid"}') is None
+
+
+def test_from_chunk_legacy_json_compatibility():
+    legacy = '{"extra_data": {"items": [{"key": "foo", "value": "bar"}]}}'
+
+    assert ExtraDataPartial.from_chunk(legacy).extra_data.items[0].key == "foo"
+    assert ExtraDataPartial.from_chunk(legacy, legacy_json=False) is None
@@ -68,3 +68,32 @@ def test_get_plugin_loader_singleton(monkeypatch):
 )
 def test_parse_module_name(input_path, expected):
     assert PluginLoader._parse_module_name(input_path) == expected
+
+
+def test_lazy_loading_defers_module_load_until_first_use():
+    mock_plugin = MagicMock()
+    mock_plugin.ExamplePlugin = object()
+
+    with patch(
+        "sk_agents.plugin_loader.ModuleLoader.load_module", return_value=mock_plugin
+    ) as load_module:
+        loader = PluginLoader("mock_module", lazy=True)
+        assert loader.is_loaded is False
+        load_module.assert_not_called()
+
+        plugins = loader.get_plugins(["ExamplePlugin"])
+        loader.get_plugins(["ExamplePlugin"])
+
+        assert plugins["ExamplePlugin"] is mock_plugin.ExamplePlugin
+        assert loader.is_loaded is True
+        load_module.assert_called_once_with("mock_module")
+
+
+def test_lazy_loading_reports_load_errors_on_first_use():
+    with patch(
+        "sk_agents.plugin_loader.ModuleLoader.load_module",
+        side_effect=FileNotFoundError("Module not found"),
+    ):
+        loader = PluginLoader("bad_path", lazy=True)
+        with pytest.raises(ImportError, match="Cannot load plugin module 'bad_path'"):
+            loader.get_plugins(["Anything"])
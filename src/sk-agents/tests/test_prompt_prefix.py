@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from semantic_kernel.functions import kernel_function
+from semantic_kernel.kernel import Kernel
+
+from sk_agents.prompt_prefix import (
+    canonicalize_kernel,
+    prefix_hash,
+    record_prefix,
+    serialize_prefix,
+)
+from sk_agents.ska_types import BasePlugin, ModelType
+from sk_agents.tealagents.kernel_builder import KernelBuilder
+
+
+class WeatherPlugin(BasePlugin):
+    @kernel_function(description="Get the forecast")
+    def forecast(self, city: str, days: int = 1) -> str:
+        return "sunny"
+
+    @kernel_function(description="Get the current temperature")
+    def temperature(self, city: str) -> str:
+        return "20C"
+
+
+class SearchPlugin(BasePlugin):
+    @kernel_function(description="Search the web")
+    def search(self, query: str) -> str:
+        return "results"
+
+
+def _kernel(plugins: list[tuple[str, type]]) -> Kernel:
+    kernel = Kernel()
+    for name, plugin_class in plugins:
+        kernel.add_plugin(plugin_class(), plugin_name=name)
+    return kernel
+
+
+def test_canonical_prefix_does_not_depend_on_plugin_order():
+    first = _kernel([("Weather", WeatherPlugin), ("Search", SearchPlugin)])
+    second = _kernel([("Search", SearchPlugin), ("Weather", WeatherPlugin)])
+    assert serialize_prefix("prompt", first) != serialize_prefix("prompt", second)
+
+    canonicalize_kernel(first)
+    canonicalize_kernel(second)
+
+    assert serialize_prefix("prompt", first) == serialize_prefix("prompt", second)
+    assert list(first.plugins) == ["Search", "Weather"]
+    assert prefix_hash("prompt", first) == prefix_hash("prompt", second)
+    assert prefix_hash("prompt", first) != prefix_hash("another prompt", first)
+
+
+def test_canonical_prefix_sorts_functions_and_schemas():
+    first = _kernel([("Weather", WeatherPlugin)])
+    second = _kernel([("Weather", WeatherPlugin)])
+    # As returned in any order by remote plugins or MCP servers
+    plugin = second.plugins["Weather"]
+    plugin.functions = dict(reversed(plugin.functions.items()))
+    for function in plugin.functions.values():
+        for parameter in function.metadata.parameters:
+            parameter.schema_data = dict(reversed(parameter.schema_data.items()))
+
+    canonicalize_kernel(first)
+    canonicalize_kernel(second)
+
+    assert serialize_prefix("prompt", first) == serialize_prefix("prompt", second)
+    assert list(second.plugins["Weather"].functions) == ["forecast", "temperature"]
+
+
+@pytest.mark.asyncio
+async def test_kernel_builder_rebuilds_have_identical_prefixes():
+    chat_completion_builder = MagicMock()
+    chat_completion_builder.get_model_type_for_name.return_value = ModelType.OPENAI
+    with (
+        patch("sk_agents.tealagents.kernel_builder.AuthStorageFactory"),
+        patch("sk_agents.tealagents.kernel_builder.AuthorizerFactory"),
+    ):
+        builder = KernelBuilder(chat_completion_builder, MagicMock(), MagicMock())
+
+    prefixes = set()
+    for plugins in (
+        {"Weather": WeatherPlugin, "Search": SearchPlugin},
+        {"Search": SearchPlugin, "Weather": WeatherPlugin},
+    ):
+        plugin_loader = MagicMock()
+        plugin_loader.get_plugins.return_value = plugins
+        with patch(
+            "sk_agents.tealagents.kernel_builder.get_plugin_loader", return_value=plugin_loader
+        ):
+            kernel = await builder.build_kernel("gpt-4o", "agent", list(plugins), [])
+        prefixes.add(serialize_prefix("prompt", kernel))
+
+    assert len(prefixes) == 1
+
+
+def test_record_prefix_counts_requests_by_hash():
+    kernel = canonicalize_kernel(_kernel([("Search", SearchPlugin)]))
+    with patch("sk_agents.prompt_prefix._prefix_counter") as counter:
+        hash_value = record_prefix("agent", "prompt", kernel)
+
+    assert hash_value == prefix_hash("prompt", kernel)
+    counter.add.assert_called_once_with(1, {"agent": "agent", "prefix_hash": hash_value})
+
+
+def test_record_prefix_reuses_the_tool_hash_of_canonical_kernels():
+    kernel = canonicalize_kernel(_kernel([("Search", SearchPlugin)]))
+    expected = prefix_hash("prompt", kernel)
+
+    with patch("sk_agents.prompt_prefix._hash_tools") as hash_tools:
+        assert record_prefix("agent", "prompt", kernel) == expected
+
+    hash_tools.assert_not_called()
@@ -3,12 +3,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.types import AgentCard, AgentProvider, AgentSkill
-from fastapi import FastAPI
+from fastapi import FastAPI, WebSocketDisconnect
 from fastapi.testclient import TestClient
 from pydantic import BaseModel
 
 from sk_agents.configs import TA_AGENT_BASE_URL, TA_PROVIDER_ORG, TA_PROVIDER_URL
-from sk_agents.routes import Routes
+from sk_agents.routes import STREAM_SUBPROTOCOL, Routes
 from sk_agents.ska_types import BaseConfig, ConfigMetadata, ConfigSkill
 
 
@@ -1271,3 +1271,42 @@ def test_websocket_error_scenarios(handler_name, should_succeed):
     assert router is not None
     websocket_routes = [r for r in router.routes if hasattr(r, "path") and r.path == "/stream"]
     assert len(websocket_routes) == 1
+
+
+@patch("sk_agents.routes.skagents_handle")
+@patch("sk_agents.routes.get_telemetry")
+def test_websocket_route_persistent_serves_sequential_invocations(
+    mock_get_telemetry, mock_skagents_handle
+):
+    """With the stream subprotocol, one connection serves an invocation after another."""
+    mock_get_telemetry.return_value = setup_telemetry_mock(telemetry_enabled=False)
+    mock_skagents_handle.side_effect = lambda *args: setup_stream_handler(use_websocket=True)
+    _, client = create_websocket_routes_and_client()
+
+    with client.websocket_connect("/api/stream", subprotocols=[STREAM_SUBPROTOCOL]) as ws:
+        assert ws.accepted_subprotocol == STREAM_SUBPROTOCOL
+        for _ in range(2):
+            ws.send_json({"input": '{"test_field": "test"}', "headers": {}})
+            assert ws.receive_text() == "response1"
+            assert ws.receive_text() == "response2"
+            assert ws.receive_bytes() == b""
+
+    assert mock_skagents_handle.call_count == 2
+
+
+@patch("sk_agents.routes.skagents_handle")
+@patch("sk_agents.routes.get_telemetry")
+def test_websocket_route_closes_after_response_without_subprotocol(
+    mock_get_telemetry, mock_skagents_handle
+):
+    mock_get_telemetry.return_value = setup_telemetry_mock(telemetry_enabled=False)
+    mock_skagents_handle.return_value = setup_stream_handler(use_websocket=True)
+    _, client = create_websocket_routes_and_client()
+
+    with client.websocket_connect("/api/stream") as ws:
+        assert ws.accepted_subprotocol is None
+        ws.send_json({"test_field": "test"})
+        assert ws.receive_text() == "response1"
+        assert ws.receive_text() == "response2"
+        with pytest.raises(WebSocketDisconnect):
+            ws.receive_text()
@@ -0,0 +1,99 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from ska_utils import ServiceMetrics
+
+from sk_agents.middleware import TelemetryMiddleware
+from sk_agents.tealagents.v1alpha1.agent.handler import TealAgentsV1Alpha1Handler
+from sk_agents.utility_routes import UtilityRoutes
+
+
+@pytest.fixture
+def reader(monkeypatch):
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    monkeypatch.setattr(
+        "ska_utils.metrics._service_metrics", ServiceMetrics(meter_provider=provider)
+    )
+    yield reader
+    provider.shutdown()
+
+
+def _points(reader, name):
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                if metric.name == name:
+                    return {
+                        tuple(sorted(point.attributes.items())): point
+                        for point in metric.data.data_points
+                    }
+    return {}
+
+
+@pytest.fixture
+def telemetry():
+    st = MagicMock()
+    st.telemetry_enabled.return_value = False
+    return st
+
+
+def test_middleware_records_requests_by_route(reader, telemetry):
+    app = FastAPI()
+    app.add_middleware(TelemetryMiddleware, st=telemetry)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"item_id": item_id}
+
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    requests = _points(reader, "tealagents.requests")
+    route = (("method", "GET"), ("route", "/items/{item_id}"), ("status_code", 200))
+    unmatched = (("method", "GET"), ("route", "unmatched"), ("status_code", 404))
+    assert requests[route].value == 2
+    assert requests[unmatched].value == 1
+    assert _points(reader, "tealagents.request.duration")[route].count == 2
+
+
+@pytest.mark.asyncio
+async def test_invoke_function_records_tool_calls(reader):
+    fc_content = MagicMock(spec=FunctionCallContent)
+    fc_content.plugin_name = "search"
+    fc_content.function_name = "web"
+    kernel = MagicMock()
+    kernel.get_function.return_value.invoke = AsyncMock(side_effect=RuntimeError("failed"))
+
+    with pytest.raises(RuntimeError):
+        await TealAgentsV1Alpha1Handler._invoke_function(kernel, fc_content)
+
+    calls = _points(reader, "tealagents.tool_calls")
+    assert calls[(("outcome", "error"), ("tool", "search-web"))].value == 1
+
+
+def test_metrics_route_renders_prometheus_text(telemetry):
+    telemetry.render_prometheus_metrics.return_value = "tealagents_requests_total 1\n"
+    app = FastAPI()
+    app.include_router(UtilityRoutes.get_metrics_routes(telemetry))
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert response.text == "tealagents_requests_total 1\n"
+
+
+def test_metrics_route_not_found_without_prometheus(telemetry):
+    telemetry.render_prometheus_metrics.return_value = None
+    app = FastAPI()
+    app.include_router(UtilityRoutes.get_metrics_routes(telemetry))
+
+    assert TestClient(app).get("/metrics").status_code == 404
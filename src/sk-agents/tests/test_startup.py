@@ -0,0 +1,179 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sk_agents.configs import TA_API_KEY, TA_LAZY_INIT, TA_STARTUP_PROFILING
+from sk_agents.plugin_loader import get_plugin_loader
+from sk_agents.ska_types import BaseConfig
+from sk_agents.startup import (
+    StartupProfiler,
+    StartupWarmup,
+    get_startup_profiler,
+    is_lazy_init_enabled,
+)
+from sk_agents.tealagents.v1alpha1.agent.config import Spec
+from sk_agents.tealagents.v1alpha1.config import AgentConfig
+from sk_agents.utility_routes import UtilityRoutes
+from sk_agents.utils import initialize_plugin_loader
+
+PLUGIN_SOURCE = """
+from semantic_kernel.functions import kernel_function
+
+from sk_agents.ska_types import BasePlugin
+
+
+class WarmPlugin(BasePlugin):
+    @kernel_function(description="Say hello")
+    def hello(self) -> str:
+        return "hello"
+"""
+
+
+class DummyAppConfig:
+    def __init__(self, initial=None):
+        self.props = initial or {}
+
+    def get(self, key):
+        return self.props.get(key)
+
+
+@pytest.fixture
+def agent_config():
+    return BaseConfig(
+        apiVersion="tealagents/v1alpha1",
+        name="TestAgent",
+        version=0.1,
+        description="test agent",
+        spec=Spec(agent=AgentConfig(name="TestAgent", model="gpt-4o", system_prompt="test")),
+    )
+
+
+@pytest.fixture
+def plugins_dir(tmp_path, monkeypatch):
+    (tmp_path / "custom_plugins.py").write_text(PLUGIN_SOURCE)
+    monkeypatch.setattr("sk_agents.plugin_loader._plugin_loader", None)
+    return tmp_path
+
+
+def test_profiler_records_phases_when_enabled():
+    profiler = StartupProfiler(enabled=True)
+
+    with profiler.phase("AppConfig", "config"):
+        time.sleep(0.01)
+    profiler.import_module("json")
+
+    assert [p.name for p in profiler.report.phases] == ["AppConfig", "import json"]
+    assert profiler.report.phases[0].duration_ms >= 10
+    assert set(profiler.report.by_category()) == {"config", "import"}
+    assert "total" in profiler.report.format()
+
+
+def test_profiler_is_a_no_op_when_disabled():
+    profiler = StartupProfiler()
+
+    with profiler.phase("AppConfig", "config"):
+        pass
+
+    assert profiler.report.phases == []
+
+
+def test_profiler_enabled_from_environment(monkeypatch):
+    monkeypatch.setattr("sk_agents.startup._startup_profiler", None)
+    monkeypatch.setenv(TA_STARTUP_PROFILING.env_name, "true")
+
+    assert get_startup_profiler().enabled is True
+
+
+def test_lazy_init_defaults_to_disabled():
+    assert is_lazy_init_enabled(DummyAppConfig()) is False
+    assert is_lazy_init_enabled(DummyAppConfig({TA_LAZY_INIT.env_name: "true"})) is True
+
+
+def test_warmup_runs_once_under_concurrency(agent_config, monkeypatch):
+    warmup = StartupWarmup(agent_config, DummyAppConfig())
+    plugins = MagicMock()
+    monkeypatch.setattr(warmup, "_warm_plugins", plugins)
+    monkeypatch.setattr(warmup, "_warm_chat_completion", MagicMock())
+
+    threads = [threading.Thread(target=warmup.run) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert warmup.ready is True
+    plugins.assert_called_once()
+    assert warmup.checks == {"plugins": "loaded", "chat_completion": "gpt-4o"}
+
+
+def test_warmup_failure_reports_not_ready(agent_config):
+    warmup = StartupWarmup(agent_config, DummyAppConfig())
+
+    with patch.object(warmup, "_warm_plugins", side_effect=ImportError("broken plugin")):
+        assert warmup.run() is False
+
+    assert warmup.ready is False
+    assert warmup.checks == {"error": "broken plugin"}
+
+
+def test_chat_completion_warmup_failure_keeps_readiness(agent_config):
+    warmup = StartupWarmup(agent_config, DummyAppConfig())
+    app = FastAPI()
+    app.include_router(
+        UtilityRoutes(warmup=warmup).get_health_routes(agent_config, DummyAppConfig())
+    )
+
+    with (
+        patch.object(warmup, "_warm_plugins"),
+        patch.object(warmup, "_warm_chat_completion", side_effect=ValueError("no api key")),
+    ):
+        assert warmup.run() is True
+
+    response = TestClient(app).get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["checks"] == {
+        "plugins": "loaded",
+        "chat_completion_error": "no api key",
+    }
+
+
+def test_readiness_without_warmup_is_ready(agent_config):
+    app = FastAPI()
+    app.include_router(UtilityRoutes().get_health_routes(agent_config, DummyAppConfig()))
+
+    response = TestClient(app).get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+
+def test_time_to_first_ready_health_check_in_lazy_mode(agent_config, plugins_dir):
+    app_config = DummyAppConfig({TA_LAZY_INIT.env_name: "true", TA_API_KEY.env_name: "test"})
+
+    start = time.perf_counter()
+    initialize_plugin_loader(str(plugins_dir), app_config)
+    warmup = StartupWarmup(agent_config, app_config)
+    app = FastAPI()
+    app.include_router(UtilityRoutes(warmup=warmup).get_health_routes(agent_config, app_config))
+    client = TestClient(app)
+    started = time.perf_counter() - start
+
+    # Nothing has been resolved yet, so the pod must not receive traffic
+    assert get_plugin_loader().is_loaded is False
+    not_ready = client.get("/health/ready")
+    assert not_ready.status_code == 503
+    assert not_ready.json()["ready"] is False
+
+    warmup_response = client.get("/health/warmup")
+    ready = client.get("/health/ready")
+    time_to_ready = time.perf_counter() - start
+
+    assert warmup_response.status_code == 200
+    assert warmup_response.json()["checks"] == {"plugins": "loaded", "chat_completion": "gpt-4o"}
+    assert ready.status_code == 200
+    assert get_plugin_loader().get_plugins(["WarmPlugin"])
+    assert started < time_to_ready < 30
@@ -0,0 +1,190 @@
+import json
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from sk_agents.ska_types import ContentType, HistoryMultiModalMessage, MultiModalItem
+from sk_agents.state import RedisStateManager as MessageStateManager
+from sk_agents.stateful import (
+    RedisStateManager,
+    RequestState,
+    StateEncoding,
+    StateSerializer,
+    TaskState,
+    TaskStatus,
+)
+
+
+def _task_state(message_count: int = 3) -> TaskState:
+    return TaskState(
+        task_id=uuid.uuid4(),
+        session_id=uuid.uuid4(),
+        user_id="user-1",
+        messages=[
+            {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+            for i in range(message_count)
+        ],
+        status=TaskStatus.PAUSED,
+        metadata={"source": "test", "attempt": 2},
+    )
+
+
+def _available_encodings() -> list[StateEncoding]:
+    encodings = [StateEncoding.JSON]
+    for encoding, module in ((StateEncoding.MSGPACK, "msgpack"), (StateEncoding.ZSTD, "zstandard")):
+        try:
+            __import__(module)
+            encodings.append(encoding)
+        except ImportError:
+            pass
+    return encodings
+
+
+@pytest.mark.parametrize("encoding", _available_encodings())
+def test_round_trip_for_each_encoding(encoding):
+    serializer = StateSerializer(encoding)
+    state = _task_state()
+
+    data = serializer.dumps(state)
+
+    if encoding == StateEncoding.JSON:
+        assert data == state.model_dump_json().encode()
+    else:
+        assert data[0] == StateSerializer._FORMATS[encoding]
+    assert serializer.loads(TaskState, data) == state
+
+
+@pytest.mark.parametrize("encoding", _available_encodings())
+def test_any_encoding_reads_records_of_every_other_encoding(encoding):
+    state = RequestState(request_id=uuid.uuid4(), task_id=uuid.uuid4())
+    reader = StateSerializer(StateEncoding.JSON)
+
+    assert reader.loads(RequestState, StateSerializer(encoding).dumps(state)) == state
+
+
+def test_legacy_json_records_remain_readable():
+    state = _task_state()
+    legacy_bytes = state.model_dump_json().encode()
+
+    serializer = StateSerializer()
+
+    assert serializer.loads(TaskState, legacy_bytes) == state
+    assert serializer.loads(TaskState, legacy_bytes.decode()) == state
+
+
+def test_unknown_format_version_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported state format version"):
+        StateSerializer().loads(TaskState, b"\x7f{}")
+
+
+def test_zstd_is_smaller_for_large_states():
+    pytest.importorskip("zstandard")
+    state = _task_state(message_count=2000)
+
+    json_size = len(StateSerializer(StateEncoding.JSON).dumps(state))
+    zstd_size = len(StateSerializer(StateEncoding.ZSTD).dumps(state))
+
+    assert zstd_size < json_size / 4
+
+
+def test_invalid_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        StateSerializer("pickle")
+
+
+class TestRedisMessageStateManager:
+    @pytest.fixture
+    def redis_client(self):
+        lists: dict[str, list[bytes]] = {}
+        client = AsyncMock()
+
+        async def rpush(key, value):
+            lists.setdefault(key, []).append(value)
+
+        async def lrange(key, start, end):
+            return list(lists.get(key, []))
+
+        client.rpush.side_effect = rpush
+        client.lrange.side_effect = lrange
+        client.lists = lists
+        return client
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding", _available_encodings())
+    async def test_messages_round_trip(self, redis_client, encoding):
+        manager = MessageStateManager(redis_client, serializer=StateSerializer(encoding))
+        first = HistoryMultiModalMessage(
+            role="user", items=[MultiModalItem(content_type=ContentType.TEXT, content="hello")]
+        )
+        second = HistoryMultiModalMessage(
+            role="assistant", items=[MultiModalItem(content_type=ContentType.TEXT, content="hi")]
+        )
+
+        await manager.update_task_messages("task-1", first)
+        messages = await manager.update_task_messages("task-1", second)
+
+        assert messages == [first, second]
+
+    @pytest.mark.asyncio
+    async def test_reads_messages_written_as_json_by_previous_versions(self, redis_client):
+        message = HistoryMultiModalMessage(
+            role="user", items=[MultiModalItem(content_type=ContentType.TEXT, content="hello")]
+        )
+        redis_client.lists["task_state:task-1:messages"] = [
+            json.dumps(message.model_dump(mode="json")).encode()
+        ]
+        manager = MessageStateManager(redis_client)
+
+        assert await manager.update_task_messages("task-1", message) == [message, message]
+
+
+class TestRedisStateManager:
+    @pytest.fixture
+    def redis_client(self):
+        store: dict[str, bytes] = {}
+        client = AsyncMock()
+
+        async def set_value(key, value, ex=None):
+            store[key] = value
+
+        async def get_value(key):
+            return store.get(key)
+
+        client.set.side_effect = set_value
+        client.get.side_effect = get_value
+        client.store = store
+        return client
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding", _available_encodings())
+    async def test_task_and_request_round_trip(self, redis_client, encoding):
+        manager = RedisStateManager(redis_client, ttl=60, encoding=encoding)
+
+        session_id, task_id = await manager.create_task(None, "user-1")
+        task = await manager.get_task(task_id)
+        task.messages.append({"role": "user", "content": "hello"})
+        await manager.update_task(task)
+        request_id = await manager.create_request(task_id)
+
+        loaded_task = await manager.get_task(task_id)
+        assert loaded_task.session_id == session_id
+        assert loaded_task.messages == [{"role": "user", "content": "hello"}]
+        assert (await manager.get_request(request_id)).task_id == task_id
+        assert redis_client.set.call_args.kwargs["ex"] == 60
+
+    @pytest.mark.asyncio
+    async def test_reads_records_written_by_previous_versions(self, redis_client):
+        state = _task_state()
+        redis_client.store[f"task:{state.task_id}"] = state.model_dump_json()
+
+        manager = RedisStateManager(redis_client)
+
+        assert await manager.get_task(state.task_id) == state
+
+    @pytest.mark.asyncio
+    async def test_missing_task_raises(self, redis_client):
+        manager = RedisStateManager(redis_client)
+
+        with pytest.raises(ValueError, match="Task not found"):
+            await manager.get_task(uuid.uuid4())
@@ -61,7 +61,7 @@ def test_initialize_plugin_loader_with_defined_plugin():
     config = DummyAppConfig({"TA_PLUGIN_MODULE": "some.plugin"})
     with patch("sk_agents.utils.get_plugin_loader") as mock_loader:
         initialize_plugin_loader("fake_path", config)
-        mock_loader.assert_called_once_with("some.plugin")
+        mock_loader.assert_called_once_with("some.plugin", lazy=False)
 
 
 def test_initialize_plugin_loader_with_custom_plugins_file():
@@ -74,7 +74,7 @@ def test_initialize_plugin_loader_with_custom_plugins_file():
         with patch("sk_agents.utils.get_plugin_loader") as mock_loader:
             initialize_plugin_loader(tmpdir, config)
             assert config.props["TA_PLUGIN_MODULE"] == plugin_path
-            mock_loader.assert_called_once_with(plugin_path)
+            mock_loader.assert_called_once_with(plugin_path, lazy=False)
 
 
 def test_initialize_plugin_loader_raises_exception():